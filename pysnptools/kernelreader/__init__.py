@@ -4,6 +4,8 @@
 from pysnptools.kernelreader.kernelreader import KernelReader
 from pysnptools.kernelreader.kerneldata import KernelData
 from pysnptools.kernelreader.snpkernel import SnpKernel
+from pysnptools.kernelreader.lowrankkernel import LowRankKernel
 from pysnptools.kernelreader.identity import Identity
 from pysnptools.kernelreader.kernelnpz import KernelNpz
-from pysnptools.kernelreader.kernelhdf5 import KernelHdf5
\ No newline at end of file
+from pysnptools.kernelreader.kernelhdf5 import KernelHdf5
+from pysnptools.kernelreader.kernelcache import KernelCache
\ No newline at end of file
@@ -0,0 +1,181 @@
+import numpy as np
+import os
+import hashlib
+import logging
+import cPickle as pickle
+from pysnptools.pstreader import PstReader, PstData
+
+class KernelCache(object):
+    '''
+    A folder of kernels computed by :class:`.SnpKernel`, so that reading the same kernel again loads it from disk instead of recomputing it.
+    Give one to :class:`.SnpKernel` to turn caching on.
+
+    Each kernel is stored as a :class:`.KernelNpz` (or :class:`.KernelHdf5`) file named by a hash of everything that determines its values:
+    the path, size, and modification time of each input file (for example, the \*.bed, \*.bim, and \*.fam files), the iids and sids read
+    (so subsets get their own entries), the standardizer, and the dtype. In-memory SNP data, such as :class:`.SnpData` and :class:`.PackedSnpData`, is identified by a hash of its values.
+    SNP data that can't be identified (its :meth:`copyinputs` isn't defined) is never cached.
+
+    When the cache's files total more than **max_bytes**, the least recently used kernels are deleted.
+
+    **Constructor:**
+        :Parameters: * **folder** (*string*) -- The folder in which to store kernels. It will be created if necessary.
+                     * **max_bytes** (optional, int) -- The most disk space the cache may use. Defaults to 10 GB.
+                     * **format** (optional, string) -- 'npz' (default) or 'hdf5', the format in which to store kernels.
+
+        :Example:
+
+        >>> from pysnptools.snpreader import Bed
+        >>> from pysnptools.standardizer import Unit
+        >>> from pysnptools.kernelreader import SnpKernel, KernelCache
+        >>> cache = KernelCache('tempdir/kernelcache')
+        >>> kernel_on_disk = SnpKernel(Bed('../examples/toydata.bed',count_A1=False),Unit(),cache=cache)
+        >>> print "{0:.6f}".format(kernel_on_disk.read().val[0,0]) # computes the kernel and stores it in the cache
+        9923.069928
+        >>> print "{0:.6f}".format(kernel_on_disk.read().val[0,0]) # loads the kernel from the cache
+        9923.069928
+    '''
+    def __init__(self, folder, max_bytes=10*2**30, format='npz'):
+        if format not in ('npz','hdf5'):
+            raise Exception("format '{0}' not known, only 'npz' and 'hdf5'".format(format))
+        self.folder = folder
+        self.max_bytes = max_bytes
+        self.format = format
+
+    def __repr__(self):
+        return "{0}('{1}')".format(self.__class__.__name__,self.folder)
+
+    def _kernel_file(self, key):
+        return os.path.join(self.folder,"{0}.kernel.{1}".format(key,self.format))
+
+    def _trained_file(self, key):
+        return os.path.join(self.folder,"{0}.trained.pkl".format(key))
+
+    def _key(self, snpreader, standardizer, dtype):
+        '''
+        Returns the hash (a hex string) identifying the kernel of snpreader with this standardizer and dtype, or None if snpreader can't be identified.
+        '''
+        hasher = hashlib.sha1()
+        try:
+            _Hasher(hasher).input(snpreader)
+        except NotImplementedError:
+            return None
+        hasher.update(str(np.dtype(dtype)))
+        hasher.update(np.ascontiguousarray(snpreader.iid).tostring())
+        hasher.update(np.ascontiguousarray(snpreader.sid).tostring())
+        _Hasher(hasher).input(standardizer)
+        return hasher.hexdigest()
+
+    def _contains(self, key):
+        return os.path.exists(self._kernel_file(key))
+
+    def _get(self, key, order, dtype):
+        '''
+        Returns (val, trained_standardizer) from the cache, or None if the key isn't there. trained_standardizer is None if it wasn't stored.
+        '''
+        from pysnptools.kernelreader import KernelNpz, KernelHdf5
+        if not self._contains(key):
+            return None
+        kernel_file = self._kernel_file(key)
+        kernelreader = KernelNpz(kernel_file) if self.format == 'npz' else KernelHdf5(kernel_file)
+        val = kernelreader.read(order=order,dtype=dtype).val
+        del kernelreader
+        trained_file = self._trained_file(key)
+        trained_standardizer = None
+        if os.path.exists(trained_file):
+            with open(trained_file,"rb") as f:
+                trained_standardizer = pickle.load(f)
+        os.utime(kernel_file,None) #mark as most recently used
+        logging.info("read kernel from cache '{0}'".format(kernel_file))
+        return val, trained_standardizer
+
+    def _put(self, key, iid, val, trained_standardizer):
+        '''
+        Stores a kernel (and the standardizer trained while creating it, if not None) in the cache and then evicts least recently used kernels, if needed.
+        '''
+        from pysnptools.kernelreader import KernelData, KernelNpz, KernelHdf5
+        import pysnptools.util as pstutil
+        kernel_file = self._kernel_file(key)
+        pstutil.create_directory_if_necessary(kernel_file)
+        #Write to a temporary name and then rename, so that a partly written file is never read
+        temp_file = os.path.join(self.folder,"{0}.{1}.temp.kernel.{2}".format(key,os.getpid(),self.format))
+        kerneldata = KernelData(iid=iid,val=val)
+        if self.format == 'npz':
+            KernelNpz.write(temp_file,kerneldata)
+        else:
+            KernelHdf5.write(temp_file,kerneldata)
+        if trained_standardizer is not None:
+            with open(self._trained_file(key)+".temp","wb") as f:
+                pickle.dump(trained_standardizer,f,pickle.HIGHEST_PROTOCOL)
+            os.rename(self._trained_file(key)+".temp",self._trained_file(key))
+        os.rename(temp_file,kernel_file)
+        self._evict(keep=key)
+
+    def _evict(self, keep):
+        '''
+        Deletes least recently used kernels until the cache is no bigger than max_bytes. Never deletes the kernel with key 'keep'.
+        '''
+        suffix = ".kernel." + self.format
+        entry_list = []
+        total_bytes = 0
+        for filename in os.listdir(self.folder):
+            if not filename.endswith(suffix) or ".temp." in filename:
+                continue
+            key = filename[:-len(suffix)]
+            file_list = [f for f in [self._kernel_file(key),self._trained_file(key)] if os.path.exists(f)]
+            nbytes = sum(os.path.getsize(f) for f in file_list)
+            total_bytes += nbytes
+            entry_list.append((os.path.getmtime(self._kernel_file(key)),key,file_list,nbytes))
+        for _, key, file_list, nbytes in sorted(entry_list):
+            if total_bytes <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            logging.info("evicting kernel '{0}' from cache".format(key))
+            for f in file_list:
+                os.remove(f)
+            total_bytes -= nbytes
+
+
+class _Hasher(object): #Implements ICopier, adding the identity of each input to a hash
+    _not_hashed = frozenset(['num_threads']) #settings that don't change the values computed
+
+    def __init__(self, hasher):
+        self.hasher = hasher
+
+    def input(self, item):
+        from pysnptools.snpreader import PackedSnpData
+        if isinstance(item, basestring):
+            self.hasher.update(os.path.abspath(item))
+            if os.path.exists(item):
+                stat = os.stat(item)
+                self.hasher.update("{0},{1!r}".format(stat.st_size,stat.st_mtime))
+        elif isinstance(item, PstData):
+            self.hasher.update(np.ascontiguousarray(item.val).tostring())
+        elif isinstance(item, PackedSnpData): #in-memory, like PstData, but its values are packed bytes
+            self.hasher.update("count_A1={0!r}".format(item.count_A1))
+            self.hasher.update(np.ascontiguousarray(item.pos).tostring())
+            self.hasher.update(np.ascontiguousarray(item.packed).tostring())
+        else:
+            self.hasher.update(repr(item)) #for example, "Bed('toydata.bed',count_A1=False)"
+            if hasattr(item,"_internal"): #a subset, so identify what it is a subset of, even if that is in-memory data
+                self.input(item._internal)
+            elif hasattr(item,"copyinputs"):
+                item.copyinputs(self)
+            if not isinstance(item, PstReader) and hasattr(item,"__dict__"): #the values of a trained standardizer, for example, its stats
+                for name, value in sorted(item.__dict__.items()):
+                    if name in self._not_hashed:
+                        continue
+                    if isinstance(value, np.ndarray):
+                        self.hasher.update(name)
+                        self.hasher.update(np.ascontiguousarray(value).tostring())
+                    elif isinstance(value, (int,long,float,str,bool)):
+                        self.hasher.update("{0}={1!r}".format(name,value))
+
+    def output(self, item):
+        pass
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    import doctest
+    doctest.testmod()
@@ -108,6 +108,11 @@ class KernelData(KernelReader,PstData):
         """
         return standardizer.standardize(self, return_trained=return_trained, force_python_only=force_python_only)
 
+    def matvec(self, V, block_size=None):
+        """Returns the kernel times V. See :meth:`.KernelReader.matvec`. Because the kernel values are already in memory, block_size is ignored.
+        """
+        return self.val.dot(self._matvec_check(V))
+
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
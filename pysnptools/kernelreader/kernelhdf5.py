@@ -1,4 +1,11 @@
+try:
+    import h5py
+except:
+    pass
+
 import logging
+import time
+import numpy as np
 import scipy as sp
 from kernelreader import KernelReader
 from pysnptools.pstreader import PstHdf5
@@ -49,6 +56,107 @@ class KernelHdf5(PstHdf5,KernelReader):
         """
         PstHdf5.write(filename,kerneldata,hdf5_dtype=hdf5_dtype,col_major=sid_major)
 
+    @staticmethod
+    def write_tiled(filename, snpreader, standardizer, tile_size=5000, block_size=1000, hdf5_dtype=None, force_python_only=False):
+        """Creates the kernel of a :class:`.SnpReader` directly in KernelHdf5 format, without ever holding the whole kernel in memory.
+
+        The kernel is computed one (tile_size x tile_size) tile at a time. For each tile, the SNP data of the tile's iids is read
+        block_size sids at a time and each block's product is added to the tile. The finished tile is then written to disk.
+        Because the kernel is symmetric, only the tiles on or above the diagonal are computed and stored. :class:`KernelHdf5` fills in the rest when reading.
+
+        :param filename: the name of the file to create
+        :type filename: string
+        :param snpreader: The SNP data from which to create the kernel.
+        :type snpreader: :class:`.SnpReader`
+        :param standardizer: How the SNP data should be standardized. It is trained once, on all iids, before any tile is computed.
+        :type standardizer: :class:`.Standardizer`
+        :param tile_size: optional -- The number of rows (and columns) in each tile. Memory use is about two tiles plus a block of SNP data.
+        :type tile_size: int
+        :param block_size: optional -- The number of sids to read at a time.
+        :type block_size: int
+        :param hdf5_dtype: None (use 'f8') or a Hdf5 dtype, e.g. 'f8','f4',etc.
+        :type hdf5_dtype: string
+        :param force_python_only: optional -- If true, will use pure Python instead of faster C++ libraries.
+        :type force_python_only: bool
+
+        >>> from pysnptools.snpreader import Bed
+        >>> from pysnptools.standardizer import Unit
+        >>> import pysnptools.util as pstutil
+        >>> pstutil.create_directory_if_necessary("tempdir/toydata.tiled.kernel.hdf5")
+        >>> KernelHdf5.write_tiled("tempdir/toydata.tiled.kernel.hdf5",Bed('../examples/toydata.bed',count_A1=False),Unit(),tile_size=200)
+        >>> print "{0:.6f}".format(KernelHdf5("tempdir/toydata.tiled.kernel.hdf5")[450:,:5].read().val[49,0]) # a value from below the diagonal
+        -131.732611
+        """
+        assert hdf5_dtype is None or (isinstance(hdf5_dtype, str) and len(hdf5_dtype) == 2 and  hdf5_dtype[0] == 'f'), "Expect hdf5_dtype to be None or to start with 'f', e.g. 'f4' for single, 'f8' for double"
+        if tile_size < 1:
+            raise Exception("tile_size must be at least 1")
+        t0 = time.time()
+        trained_standardizer = snpreader._train_standardizer(standardizer, block_size=block_size, force_python_only=force_python_only)
+        iid_count = snpreader.iid_count
+        tile_size = max(1,min(tile_size,iid_count))
+
+        with h5py.File(filename, "w") as h5:
+            h5.create_dataset('row', data=snpreader.iid)
+            h5.create_dataset('col', data=snpreader.iid)
+            h5.create_dataset('row_property', data=np.empty([iid_count,0],dtype=str))
+            h5.create_dataset('col_property', data=np.empty([iid_count,0],dtype=str))
+            # With one chunk per tile, the chunks below the diagonal are never written, and so never take disk space
+            h5.create_dataset('val', shape=(iid_count,iid_count), dtype=hdf5_dtype or 'f8', chunks=(tile_size,tile_size) if iid_count > 0 else None)
+            h5['val'].attrs["col-major"] = False
+            h5['val'].attrs["upper-triangle"] = True
+
+            tile_starts = range(0,iid_count,tile_size)
+            logging.info("computing {0} tiles of a {1} x {1} kernel".format(len(tile_starts)*(len(tile_starts)+1)//2,iid_count))
+            for row_start in tile_starts:
+                row_stop = min(row_start+tile_size,iid_count)
+                for col_start in tile_starts:
+                    if col_start < row_start:
+                        continue
+                    col_stop = min(col_start+tile_size,iid_count)
+                    tile = snpreader._read_cross_kernel(trained_standardizer, np.arange(row_start,row_stop), np.arange(col_start,col_stop), block_size=block_size, order='F', force_python_only=force_python_only)
+                    h5['val'][row_start:row_stop,col_start:col_stop] = tile
+
+        logging.info("%.2f seconds elapsed" % (time.time()-t0))
+
+    def matvec(self, V, block_size=None):
+        """Returns the kernel times V. See :meth:`.KernelReader.matvec`. When the kernel is stored on disk by column (the default for :meth:`KernelHdf5.write`),
+        it is read block_size columns at a time, otherwise block_size rows at a time.
+        """
+        self._run_once()
+        if not self.is_col_major:
+            return KernelReader.matvec(self, V, block_size)
+        #K V is the sum, over blocks of columns, of K[:,block] V[block]
+        V = self._matvec_check(V)
+        result = np.zeros((self.iid0_count,)+V.shape[1:],dtype=np.result_type(V.dtype,np.float64))
+        block_size = block_size or max(1,self.iid1_count)
+        for start in xrange(0,self.iid1_count,block_size):
+            stop = min(start+block_size,self.iid1_count)
+            result += self[:,start:stop].read(order='F',view_ok=True).val.dot(V[start:stop])
+        return result
+
+    def _read(self, row_index_or_none, col_index_or_none, order, dtype, force_python_only, view_ok):
+        self._run_once()
+        if not self.val_in_file.attrs.get("upper-triangle",False):
+            return PstHdf5._read(self, row_index_or_none, col_index_or_none, order, dtype, force_python_only, view_ok)
+
+        # Only the upper triangle is stored, so K[i,j] with i > j comes from K[j,i].
+        from pysnptools.snpreader import SnpReader
+        row_index = np.arange(self.row_count) if row_index_or_none is None else np.asarray(row_index_or_none,dtype=np.intp)
+        col_index = np.arange(self.col_count) if col_index_or_none is None else np.asarray(col_index_or_none,dtype=np.intp)
+        val = PstHdf5._read(self, row_index_or_none, col_index_or_none, order, dtype, force_python_only, view_ok)
+        if len(row_index) == 0 or len(col_index) == 0 or row_index.max() <= col_index.min(): # all requested values are on or above the diagonal
+            return val
+        if np.array_equal(row_index,col_index) and PstHdf5._is_sorted_without_repeats(row_index):
+            SnpReader._mirror_upper(val)
+            return val
+        lower_rows, lower_cols = np.nonzero(row_index[:,np.newaxis] > col_index[np.newaxis,:])
+        #Read the mirrored values with sorted, unique indexes, which is both the fast path for Hdf5 and the least to read
+        row_index_needed = np.unique(row_index[lower_rows])
+        col_index_needed = np.unique(col_index[lower_cols])
+        val_transposed = PstHdf5._read(self, col_index_needed, row_index_needed, order, dtype, force_python_only, view_ok)
+        val[lower_rows,lower_cols] = val_transposed[np.searchsorted(col_index_needed,col_index[lower_cols]),np.searchsorted(row_index_needed,row_index[lower_rows])]
+        return val
+
 
 if __name__ == "__main__":
 
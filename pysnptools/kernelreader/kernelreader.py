@@ -71,6 +71,7 @@ class KernelReader(PstReader):
         :class:`.KernelHdf5`               binary             Yes                    .kernel.hdf5       Yes
         :class:`.Identity`                 *n/a*              Yes                    *n/a*              No
         :class:`.SnpKernel`                depends            depends                *n/a*              No
+        :class:`.LowRankKernel`            low-rank factor    Yes                    *n/a*              No
         ================================== ================== ====================== ================== ====================
     
   
@@ -278,6 +279,91 @@ class KernelReader(PstReader):
         ret = KernelData(iid0=self.iid0, iid1=self.iid1, val=val, name=str(self))
         return ret
 
+    def matvec(self, V, block_size=None):
+        """Returns the kernel times V, reading the kernel (or computing it) just block_size rows at a time, so the whole kernel is never in memory.
+        This is all that iterative methods, such as conjugate gradient and Lanczos, need from a kernel.
+
+        :param V: A vector with iid1_count values or a matrix with iid1_count rows.
+        :type V: ndarray
+
+        :param block_size: optional -- Default of None (meaning to read the whole kernel at once). The number of kernel rows to read at a time.
+            For :class:`.SnpKernel`, it is, instead, the number of sids to read at a time and defaults to the SnpKernel's block_size.
+        :type block_size: int or None
+
+        :rtype: ndarray with iid0_count rows (and V's number of columns)
+
+        :Example:
+
+        >>> from pysnptools.kernelreader import KernelNpz
+        >>> import numpy as np
+        >>> kernel_on_disk = KernelNpz('../examples/toydata.kernel.npz')
+        >>> Kv = kernel_on_disk.matvec(np.arange(kernel_on_disk.iid_count),block_size=100) # multiply by the vector 0,1,2,..., reading 100 rows at a time
+        >>> print "{0:.2f}".format(Kv[0])
+        -2092281.66
+        """
+        V = self._matvec_check(V)
+        result = np.empty((self.iid0_count,)+V.shape[1:],dtype=np.result_type(V.dtype,np.float64))
+        block_size = block_size or max(1,self.iid0_count)
+        for start in xrange(0,self.iid0_count,block_size):
+            stop = min(start+block_size,self.iid0_count)
+            result[start:stop] = self[start:stop,:].read(order='C',view_ok=True).val.dot(V)
+        return result
+
+    def top_eigh(self, k, oversampling=10, power_iterations=2, block_size=None, seed=0):
+        """Returns the k largest eigenvalues (and their eigenvectors) of a square, symmetric, positive-semidefinite kernel, found with a randomized
+        range finder (Halko, Martinsson & Tropp, 2011). The kernel is used only through :meth:`matvec`, power_iterations+2 times, so, for example,
+        a :class:`.SnpKernel` reads its SNP data power_iterations+2 times, a block at a time, and never creates the kernel. Memory use is O(iid_count x (k+oversampling)).
+
+        :param k: The number of eigenvalues to find.
+        :type k: int
+
+        :param oversampling: optional -- The number of extra random directions to use. More gives more accuracy. If k+oversampling is at least the rank of the kernel,
+            the result is exact (up to round-off).
+        :type oversampling: int
+
+        :param power_iterations: optional -- The number of extra passes used to sharpen the result. More gives more accuracy when the eigenvalues decrease slowly.
+        :type power_iterations: int
+
+        :param block_size: optional -- Passed to :meth:`matvec`.
+        :type block_size: int or None
+
+        :param seed: optional -- The seed for the random directions.
+        :type seed: int
+
+        :rtype: a tuple of an ndarray of k eigenvalues, from largest to smallest, and an iid_count x k ndarray of the corresponding (unit-length) eigenvectors
+
+        :Example:
+
+        >>> from pysnptools.kernelreader import SnpKernel
+        >>> from pysnptools.snpreader import Bed
+        >>> from pysnptools.standardizer import Unit
+        >>> kernel_on_disk = SnpKernel(Bed('../examples/toydata.bed',count_A1=False)[:,:20], Unit()) # a kernel of rank 20
+        >>> eigenvalues, eigenvectors = kernel_on_disk.top_eigh(3)
+        >>> print ["{0:.4f}".format(value) for value in eigenvalues]
+        ['631.2235', '613.4671', '602.2496']
+        >>> print eigenvectors.shape
+        (500, 3)
+        """
+        if self.iid0_count != self.iid1_count or not np.array_equal(self.iid0,self.iid1):
+            raise Exception("top_eigh requires a square kernel")
+        if k < 1 or k > self.iid_count:
+            raise Exception("Expect k to be between 1 and iid_count ({0}), but it is {1}".format(self.iid_count,k))
+        column_count = min(k+oversampling,self.iid_count)
+        random_state = np.random.RandomState(seed) #a local generator, so the caller's global random stream isn't reseeded
+        Q, _ = np.linalg.qr(self.matvec(random_state.normal(size=(self.iid_count,column_count)),block_size=block_size)) #a basis for the range of K
+        for _ in xrange(power_iterations):
+            Q, _ = np.linalg.qr(self.matvec(Q,block_size=block_size))
+        B = Q.T.dot(self.matvec(Q,block_size=block_size)) # K projected onto the basis
+        eigenvalues, eigenvectors_small = np.linalg.eigh((B+B.T)/2)
+        top = np.argsort(eigenvalues)[::-1][:k]
+        return eigenvalues[top], Q.dot(eigenvectors_small[:,top])
+
+    def _matvec_check(self, V):
+        V = np.asarray(V)
+        if V.ndim not in (1,2) or V.shape[0] != self.iid1_count:
+            raise Exception("Expect V to be a vector or matrix with {0} rows (the iid1_count), but it has shape {1}".format(self.iid1_count,V.shape))
+        return V
+
     def iid_to_index(self, list):
         """Takes a list of iids and returns a list of index numbers.
         Assumes the kernel is square, so will throw an exception if the row iids are different from the column iids.
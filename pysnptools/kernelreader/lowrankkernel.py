@@ -0,0 +1,127 @@
+import numpy as np
+import logging
+from kernelreader import KernelReader
+from pysnptools.standardizer import Identity as SS_Identity
+
+class LowRankKernel(KernelReader):
+    '''
+    A :class:`.KernelReader` that represents the kernel of a :class:`.SnpReader` by its low-rank factor, G, the standardized SNP values, such that K = G G^T.
+    When sid_count is much less than iid_count, G takes much less memory than K. :meth:`LowRankKernel.matvec` multiplies K by a vector (or matrix) as G (G^T v)
+    without ever creating K, in O(iid_count x sid_count) time and memory.
+    Reading values (or subsets of values) creates just those values. No SNP data is read until needed. It is then read (and standardized) just once.
+
+    See :class:`.KernelReader` for general examples of using KernelReaders.
+
+    **Constructor:**
+        :Parameters: * **snpreader** (:class:`SnpReader`) -- The SNP data
+                     * **standardizer** (:class:`Standardizer`) -- How the SNP data should be standardized. Use :class:`.standardizer.Identity` if it is already standardized.
+
+        :Example:
+
+        >>> from pysnptools.snpreader import Bed
+        >>> from pysnptools.standardizer import Unit
+        >>> from pysnptools.kernelreader import LowRankKernel
+        >>> import numpy as np
+        >>> snp_on_disk = Bed('../examples/toydata.bed',count_A1=False)[:,:100]    # 500 iids, but just 100 sids
+        >>> kernel = LowRankKernel(snp_on_disk, Unit())
+        >>> print kernel.iid_count
+        500
+        >>> Kv = kernel.matvec(np.arange(kernel.iid_count))                       # K times a vector, without creating the 500 x 500 K
+        >>> print "{0:.6f}".format(Kv[0])
+        -11803.159305
+        >>> print "{0:.6f}".format(kernel[:2].read().val[0,1])                    # creates just 2 x 2 values
+        7.678630
+    '''
+    def __init__(self, snpreader, standardizer=None):
+        assert standardizer is not None, "'standardizer' must be provided"
+
+        self.snpreader = snpreader
+        self.standardizer = standardizer
+        self._factor = None
+
+    @property
+    def row(self):
+        return self.snpreader.iid
+
+    @property
+    def col(self):
+        return self.snpreader.iid
+
+    def __repr__(self):
+        return "{0}({1},standardizer={2})".format(self.__class__.__name__,self.snpreader,self.standardizer)
+
+    def copyinputs(self, copier):
+        #Doesn't need run_once
+        copier.input(self.snpreader)
+        copier.input(self.standardizer)
+
+    def read_snps(self, order='F', dtype=np.float64, force_python_only=False, view_ok=False):
+        """Returns the low-rank factor, G, that is, the standardized SNP values, as a :class:`.SnpData`. It is read (and standardized) only the first time this is called.
+
+        :param order: {'F' (default), 'C', 'A'}, optional -- Specify the order of the ndarray.
+        :type order: string or None
+
+        :param dtype: {scipy.float64 (default), scipy.float32}, optional -- The data-type for the :attr:`.SnpData.val` ndarray.
+        :type dtype: data-type
+
+        :param force_python_only: optional -- If False (default), may use outside library code. If True, requests that the read
+            be done without outside library code.
+        :type force_python_only: bool
+
+        :param view_ok: optional -- If False (default), returns a copy of G. If True, may return G itself. In that case, don't change its values.
+        :type view_ok: bool
+
+        :rtype: :class:`.SnpData`
+        """
+        factor = self._read_factor(force_python_only)
+        return factor.read(order=order, dtype=dtype, force_python_only=force_python_only, view_ok=view_ok)
+
+    def _read_factor(self, force_python_only=False):
+        if self._factor is None:
+            self._factor = self.snpreader.read(order='F', force_python_only=force_python_only, standardizer=self.standardizer)
+        return self._factor
+
+    def matvec(self, V, block_size=None):
+        """Returns the kernel times V, computed as G (G^T V), where G is the low-rank factor. The kernel is never created.
+
+        :param V: A vector with iid_count values or a matrix with iid_count rows.
+        :type V: ndarray
+
+        :param block_size: ignored, because G is already in memory. See :meth:`.KernelReader.matvec`.
+        :type block_size: int or None
+
+        :rtype: ndarray with the shape of V
+        """
+        V = self._matvec_check(V)
+        G = self._read_factor().val
+        return G.dot(G.T.dot(V))
+
+    def _read(self, row_index_or_none, col_index_or_none, order, dtype, force_python_only, view_ok):
+        factor = self._read_factor(force_python_only)
+        row_index = np.arange(self.iid_count) if row_index_or_none is None else row_index_or_none
+        col_index = np.arange(self.iid_count) if col_index_or_none is None else col_index_or_none
+        return factor._read_cross_kernel(SS_Identity(), row_index, col_index, order=order, dtype=dtype, force_python_only=force_python_only)
+
+    def __getitem__(self, iid_indexer_and_snp_indexer):
+        if isinstance(iid_indexer_and_snp_indexer,tuple):
+            row_index_or_none, col_index_or_none = iid_indexer_and_snp_indexer
+        else:
+            row_index_or_none = iid_indexer_and_snp_indexer
+            col_index_or_none = row_index_or_none
+
+        #Special case: If square, the subset is the low-rank kernel of a subset of the SNP data
+        if (row_index_or_none is not None and col_index_or_none is not None and np.array_equal(row_index_or_none,col_index_or_none)):
+            if self._factor is not None:
+                return LowRankKernel(self._factor[row_index_or_none,:], SS_Identity())
+            if self.standardizer.is_constant:
+                return LowRankKernel(self.snpreader[row_index_or_none,:], self.standardizer)
+            #The standardizer must learn from all the iids, not just the subset. For Unit and Beta, this reads just genotype counts.
+            return LowRankKernel(self.snpreader[row_index_or_none,:], self.snpreader._train_standardizer(self.standardizer))
+        else:
+            return KernelReader.__getitem__(self,iid_indexer_and_snp_indexer)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    import doctest
+    doctest.testmod()
@@ -21,6 +21,8 @@ class SnpKernel(KernelReader):
         :Parameters: * **snpreader** (:class:`SnpReader`) -- The SNP data
                      * **standardizer** (:class:`Standardizer`) -- How the SNP data should be standardized
                      * **block_size** (optional, int) -- The number of SNPs to read at a time.
+                     * **num_processes** (optional, int) -- The number of worker processes among which to split the SNPs. See :meth:`.SnpReader.read_kernel`.
+                     * **cache** (optional, :class:`.KernelCache`) -- If given, kernels are stored in, and, when the inputs haven't changed, read from, this cache.
 
         If **block_size** is not given, then all SNP data will be read at once.
 
@@ -38,12 +40,14 @@ class SnpKernel(KernelReader):
         >>> print kerneldata.val[0,0]
         0.992306992842
     '''
-    def __init__(self, snpreader, standardizer=None, block_size=None):
+    def __init__(self, snpreader, standardizer=None, block_size=None, num_processes=None, cache=None):
         assert standardizer is not None, "'standardizer' must be provided"
 
         self.snpreader = snpreader
         self.standardizer = standardizer
         self.block_size = block_size
+        self.num_processes = num_processes
+        self.cache = cache
 
     @property
     def row(self):
@@ -63,6 +67,10 @@ class SnpKernel(KernelReader):
         s = "SnpKernel({0},standardizer={1}".format(self.snpreader,standardizer)
         if self.block_size is not None:
             s += ",block_size={0}".format(self.block_size)
+        if self.num_processes is not None:
+            s += ",num_processes={0}".format(self.num_processes)
+        if self.cache is not None:
+            s += ",cache={0}".format(self.cache)
         s += ")"
         return s
 
@@ -72,16 +80,50 @@ class SnpKernel(KernelReader):
         copier.input(self.standardizer)
 
     def _read(self, row_index_or_none, col_index_or_none, order, dtype, force_python_only, view_ok):
+        if row_index_or_none is None and col_index_or_none is None:
+            return self._read_kernel_cached(self.snpreader, order, dtype, force_python_only, view_ok)
+
         #Special case: If square and constant, can push the subsetting into the SnpReader
         if (self.standardizer.is_constant and row_index_or_none is not None and col_index_or_none is not None and np.array_equal(row_index_or_none,col_index_or_none)):
-            return self.snpreader[row_index_or_none,:]._read_kernel(self.standardizer,self.block_size,order, dtype, force_python_only, view_ok)
-        else:
-            #LATER: If it was often that case that we wanted to standardize on all the data, but then only return a slice of the result,
-            #       that could be done with less memory by working in blocks but not tabulating for all the iids.
-            whole = self.snpreader._read_kernel(self.standardizer,self.block_size,order, dtype, force_python_only, view_ok)
+            return self._read_kernel_cached(self.snpreader[row_index_or_none,:], order, dtype, force_python_only, view_ok)
+
+        #If the whole kernel is already cached, just slice it
+        key = self.cache._key(self.snpreader, self.standardizer, dtype) if self.cache is not None else None
+        if key is not None and self.cache._contains(key):
+            whole = self._read_kernel_cached(self.snpreader, order, dtype, force_python_only, view_ok)
             val, shares_memory = self._apply_sparray_or_slice_to_val(whole, row_index_or_none, col_index_or_none, order, dtype, force_python_only)
             return val
 
+        #Otherwise, train the standardizer on all the iids (without reading all the SNP data at once) and then compute just the requested rows x cols.
+        trained_standardizer = self.snpreader._train_standardizer(self.standardizer, self.block_size, dtype, force_python_only)
+        row_index = np.arange(self.snpreader.iid_count) if row_index_or_none is None else row_index_or_none
+        col_index = np.arange(self.snpreader.iid_count) if col_index_or_none is None else col_index_or_none
+        return self.snpreader._read_cross_kernel(trained_standardizer, row_index, col_index, self.block_size, order, dtype, force_python_only)
+
+    def _read_kernel_cached(self, snpreader, order='A', dtype=np.float64, force_python_only=False, view_ok=False, return_trained=False):
+        '''
+        Like snpreader._read_kernel with this SnpKernel's standardizer, but, if there is a cache, first looks for the kernel there and, if it is not found, stores it there.
+        '''
+        key = self.cache._key(snpreader, self.standardizer, dtype) if self.cache is not None else None
+        if key is None:
+            return snpreader._read_kernel(self.standardizer, self.block_size, order, dtype, force_python_only, view_ok, return_trained=return_trained, num_processes=self.num_processes)
+
+        found = self.cache._get(key, order, dtype)
+        if found is not None and (found[1] is not None or not return_trained):
+            val, trained_standardizer = found
+        else:
+            if self.standardizer.is_constant:
+                val = snpreader._read_kernel(self.standardizer, self.block_size, order, dtype, force_python_only, view_ok, num_processes=self.num_processes)
+                trained_standardizer = self.standardizer
+            else:
+                val, trained_standardizer = snpreader._read_kernel(self.standardizer, self.block_size, order, dtype, force_python_only, view_ok, return_trained=True, num_processes=self.num_processes)
+            self.cache._put(key, snpreader.iid, val, trained_standardizer)
+
+        if return_trained:
+            return val, trained_standardizer
+        else:
+            return val
+
     def __getitem__(self, iid_indexer_and_snp_indexer):
         if isinstance(iid_indexer_and_snp_indexer,tuple):
             row_index_or_none, col_index_or_none = iid_indexer_and_snp_indexer
@@ -91,7 +133,7 @@ class SnpKernel(KernelReader):
 
         #Special case: If square and constant, can push the subsetting into the SnpReader
         if (self.standardizer.is_constant and row_index_or_none is not None and col_index_or_none is not None and np.array_equal(row_index_or_none,col_index_or_none)):
-            return SnpKernel(self.snpreader[row_index_or_none,:], self.standardizer, block_size=self.block_size)
+            return SnpKernel(self.snpreader[row_index_or_none,:], self.standardizer, block_size=self.block_size, num_processes=self.num_processes, cache=self.cache)
         else:
             return KernelReader.__getitem__(self,iid_indexer_and_snp_indexer)
 
@@ -107,11 +149,11 @@ class SnpKernel(KernelReader):
 
         '''
         if to_kerneldata:
-            val, snp_trained = self.snpreader._read_kernel(self.standardizer,block_size=self.block_size,return_trained=True)
+            val, snp_trained = self._read_kernel_cached(self.snpreader,return_trained=True)
             kernel = KernelData(iid=self.snpreader.iid, val=val, name=str(self))
             kernel, kernel_trained = kernel.standardize(kernel_standardizer,return_trained=True)
         else:
-            snpdata, snp_trained = self.snpreader.read().standardize(self.standardizer, return_trained=True)
+            snpdata, snp_trained = self.snpreader._read_standardized(self.standardizer)
             snpdata, kernel_trained = snpdata.standardize(kernel_standardizer, return_trained=True)
             kernel = SnpKernel(snpdata, SS_Identity())
 
@@ -120,6 +162,35 @@ class SnpKernel(KernelReader):
         else:
             return kernel
 
+    def matvec(self, V, block_size=None):
+        """Returns the kernel times V, computed as the sum, over blocks of SNPs, of G (G^T V), where G is a block of standardized SNP values.
+        The SNP data is read (and standardized) once, a block at a time, and the kernel is never created.
+
+        :param V: A vector with iid_count values or a matrix with iid_count rows.
+        :type V: ndarray
+
+        :param block_size: optional -- The number of sids to read at a time. Defaults to the SnpKernel's block_size. If both are None, all SNP data is read at once.
+        :type block_size: int or None
+
+        :rtype: ndarray with the shape of V
+
+        >>> from pysnptools.snpreader import Bed
+        >>> from pysnptools.standardizer import Unit
+        >>> import numpy as np
+        >>> kernel_on_disk = SnpKernel(Bed('../examples/toydata.bed',count_A1=False), Unit())
+        >>> Kv = kernel_on_disk.matvec(np.arange(kernel_on_disk.iid_count),block_size=1000) # reads 1000 SNPs at a time
+        >>> print "{0:.2f}".format(Kv[0])
+        -2092281.66
+        """
+        V = self._matvec_check(V)
+        result = np.zeros(V.shape,dtype=np.result_type(V.dtype,np.float64))
+        block_size = block_size or self.block_size or self.sid_count
+        #Train on all the SNP data first, because some standardizers, for example, DiagKtoN, can't standardize a block of sids on its own.
+        trained_standardizer = self.snpreader._train_standardizer(self.standardizer, block_size, np.float64, False)
+        for snpdata, _ in self.snpreader._iter_blocks_prefetched(max(1,block_size),order='F',dtype=np.float64,standardizer=trained_standardizer,force_python_only=False):
+            result += snpdata.val.dot(snpdata.val.T.dot(V))
+        return result
+
     @property
     def sid(self):
         '''The :attr:`.SnpReader.sid` property of the SNP data.
@@ -167,7 +238,7 @@ class SnpKernel(KernelReader):
         :rtype: :class:`.SnpData`
 
         """
-        return self.snpreader.read(order=order, dtype=dtype, force_python_only=force_python_only, view_ok=view_ok).standardize(self.standardizer)
+        return self.snpreader.read(order=order, dtype=dtype, force_python_only=force_python_only, view_ok=view_ok, standardizer=self.standardizer)
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
@@ -199,6 +199,85 @@ class TestLoader(unittest.TestCase):
         np.testing.assert_array_almost_equal(kerneldata1.val, kerneldata2.val, decimal=10)
         logging.info("done with test")
 
+    def test_tiled_hdf5(self):
+        logging.info("in test_tiled_hdf5")
+        snpreader = Bed(self.currentFolder + "/../examples/toydata",count_A1=False)[:,:1000]
+        output = "tempdir/kernelreader/toydata.tiled.kernel.hdf5"
+        create_directory_if_necessary(output)
+        for std in [stdizer.Unit(),stdizer.Beta(1,25)]:
+            expected = snpreader.read_kernel(std)
+            for tile_size,block_size in [(500,None),(128,300),(37,1000)]:
+                KernelHdf5.write_tiled(output,snpreader,std,tile_size=tile_size,block_size=block_size)
+                kernelreader = KernelHdf5(output)
+                assert np.array_equal(kernelreader.iid,snpreader.iid)
+                np.testing.assert_array_almost_equal(kernelreader.read().val/expected.val.max(), expected.val/expected.val.max(), decimal=10)
+                for order in ['F','C']:
+                    for row_index,col_index in [(slice(None,None,2),slice(None,None,2)),(slice(400,None),slice(None,100)),(slice(None,100),slice(400,None)),([5,499,3,3],[400,2,10]),(slice(0,0),slice(None))]:
+                        val = kernelreader[row_index,col_index].read(order=order).val
+                        np.testing.assert_array_almost_equal(val/expected.val.max(), expected.val[row_index,:][:,col_index]/expected.val.max(), decimal=10)
+                del kernelreader
+        logging.info("done with test")
+
+    def test_kernel_cache(self):
+        logging.info("in test_kernel_cache")
+        import shutil
+        folder = "tempdir/kernelreader/kernelcache"
+        if os.path.exists(folder):
+            shutil.rmtree(folder)
+        snpreader = Bed(self.currentFolder + "/../examples/toydata",count_A1=False)[:,:1000]
+        expected = snpreader.read_kernel(stdizer.Unit()).val
+        def cache_files(format='npz'):
+            return sorted(f for f in os.listdir(folder) if f.endswith(".kernel."+format))
+
+        for format in ['npz','hdf5']:
+            cache = KernelCache(folder,format=format)
+            snpkernel = SnpKernel(snpreader,stdizer.Unit(),cache=cache)
+            for order in ['F','C']:
+                np.testing.assert_array_almost_equal(snpkernel.read(order=order).val, expected, decimal=10) #first read computes, later ones load
+            assert len(cache_files(format)) == 1
+            np.testing.assert_array_almost_equal(snpkernel[::2,1:5].read().val, expected[::2,1:5], decimal=10) #a subset of the whole cached kernel
+            assert len(cache_files(format)) == 1
+
+            kerneldata, snp_trained, kernel_trained = snpkernel._read_with_standardizing(to_kerneldata=True,return_trained=True)
+            kerneldata2, snp_trained2, kernel_trained2 = SnpKernel(snpreader,stdizer.Unit())._read_with_standardizing(to_kerneldata=True,return_trained=True)
+            np.testing.assert_array_almost_equal(kerneldata.val, kerneldata2.val, decimal=10)
+            np.testing.assert_array_almost_equal(snp_trained.stats, snp_trained2.stats, decimal=10)
+
+        #Different inputs get different entries
+        cache = KernelCache(folder)
+        key = cache._key(snpreader,stdizer.Unit(),np.float64)
+        assert key == cache._key(Bed(self.currentFolder + "/../examples/toydata",count_A1=False)[:,:1000],stdizer.Unit(),np.float64)
+        assert key != cache._key(snpreader,stdizer.Unit(),np.float32)
+        assert key != cache._key(snpreader,stdizer.Beta(1,25),np.float64)
+        assert key == cache._key(snpreader,stdizer.Unit(num_threads=4),np.float64) #the number of threads doesn't change the kernel
+        _, unittrained = snpreader[:,:5].read().standardize(stdizer.Unit(num_threads=1),return_trained=True)
+        assert cache._key(snpreader[:,:5],unittrained,np.float64) == cache._key(snpreader[:,:5],stdizer.UnitTrained(unittrained.sid,unittrained.stats,num_threads=4),np.float64)
+        assert key != cache._key(snpreader[1:,:],stdizer.Unit(),np.float64)
+        assert key != cache._key(Bed(self.currentFolder + "/../examples/toydata",count_A1=True)[:,:1000],stdizer.Unit(),np.float64)
+        snpdata = snpreader[:,:5].read()
+        key_snpdata = cache._key(snpdata,stdizer.Unit(),np.float64)
+        snpdata.val[0,0] += 1
+        assert key_snpdata != cache._key(snpdata,stdizer.Unit(),np.float64)
+
+        #Packed data is identified by its bytes, not just its iids and sids
+        from pysnptools.snpreader import PackedSnpData
+        packed_a = PackedSnpData(snpreader.iid, snpreader.sid[:20], Bed(self.currentFolder + "/../examples/toydata",count_A1=False).read_packed().packed[:20])
+        packed_b = PackedSnpData(packed_a.iid, packed_a.sid, packed_a.packed[::-1])
+        assert cache._key(packed_a,stdizer.Unit(),np.float64) != cache._key(packed_b,stdizer.Unit(),np.float64)
+        assert cache._key(packed_a[::2,:],stdizer.Unit(),np.float64) != cache._key(packed_b[::2,:],stdizer.Unit(),np.float64)
+        shutil.rmtree(folder)
+        cache = KernelCache(folder)
+        for packed in [packed_a,packed_b]:
+            np.testing.assert_array_almost_equal(SnpKernel(packed,stdizer.Unit(),cache=cache).read().val, packed.read().read_kernel(stdizer.Unit()).val, decimal=10)
+
+        #Least recently used kernels are evicted
+        shutil.rmtree(folder)
+        cache = KernelCache(folder,max_bytes=1) #room for just the latest kernel
+        for sid_count in [10,20]:
+            np.testing.assert_array_almost_equal(SnpKernel(snpreader[:,:sid_count],stdizer.Unit(),cache=cache).read().val, snpreader[:,:sid_count].read_kernel(stdizer.Unit()).val, decimal=10)
+            assert cache_files() == [cache._key(snpreader[:,:sid_count],stdizer.Unit(),np.float64)+".kernel.npz"]
+        logging.info("done with test")
+
     def test_subset(self):
         logging.info("in test_subset")
         snpreader = Bed(self.currentFolder + "/../examples/toydata",count_A1=False)
@@ -213,6 +292,139 @@ class TestLoader(unittest.TestCase):
         np.testing.assert_array_almost_equal(kerneldata2.val, expected.val, decimal=10)
         logging.info("done with test")
 
+    def test_subset_cross(self):
+        logging.info("in test_subset_cross")
+        snpreader = Bed(self.currentFolder + "/../examples/toydata",count_A1=False)[:,:1000]
+        for std in [stdizer.Unit(),stdizer.Beta(1,25)]:
+            expected = snpreader.read_kernel(std).val
+            snpreader2 = Bed(self.currentFolder + "/../examples/toydata",count_A1=False)[:,:1000]
+            def fail(*args,**kwargs):
+                raise Exception("the whole kernel should not be computed")
+            snpreader2._read_kernel = fail
+            for block_size in [None,300]:
+                snpkernel = SnpKernel(snpreader2,std,block_size=block_size)
+                for order in ['F','C']:
+                    for row_index,col_index in [(slice(None,10),slice(None)),(slice(None),[3,1,1]),([5,499,3,3],[400,2,10]),(slice(None,None,2),slice(None,None,2)),(slice(0,0),slice(None))]:
+                        val = snpkernel[row_index,col_index].read(order=order).val
+                        assert val.flags[order+"_CONTIGUOUS"]
+                        np.testing.assert_array_almost_equal(val/expected.max(), expected[row_index,:][:,col_index]/expected.max(), decimal=10)
+        logging.info("done with test")
+
+    def test_subset_float(self):
+        logging.info("in test_subset_float")
+        np.random.seed(0)
+        snpdata = SnpData(iid=[["fam",str(i)] for i in xrange(6)],sid=[str(i) for i in xrange(5)],val=np.random.rand(6,5)*2) #not genotypes
+        output = "tempdir/kernelreader/float.tiled.kernel.hdf5"
+        create_directory_if_necessary(output)
+        for std in [stdizer.Unit(),stdizer.Beta(1,25)]:
+            expected = snpdata.read_kernel(std).val
+            for block_size in [None,2]:
+                val = SnpKernel(snpdata,std,block_size=block_size)[[0,1],[2,3,4]].read().val
+                np.testing.assert_array_almost_equal(val, expected[[0,1],:][:,[2,3,4]], decimal=10)
+            np.testing.assert_array_almost_equal(LowRankKernel(snpdata,std)[::2].read().val, expected[::2,::2], decimal=10)
+            KernelHdf5.write_tiled(output,snpdata,std,tile_size=4)
+            kernelhdf5 = KernelHdf5(output)
+            np.testing.assert_array_almost_equal(kernelhdf5.read().val, expected, decimal=10)
+            del kernelhdf5
+        logging.info("done with test")
+
+    def test_low_rank(self):
+        logging.info("in test_low_rank")
+        snpreader = Bed(self.currentFolder + "/../examples/toydata",count_A1=False)[:,:100]
+        for std in [stdizer.Unit(),stdizer.Beta(1,25)]:
+            expected = snpreader.read_kernel(std).val
+            kernel = LowRankKernel(snpreader,std)
+            np.testing.assert_array_almost_equal(kernel.read().val/expected.max(), expected/expected.max(), decimal=10)
+            for order in ['F','C']:
+                for row_index,col_index in [(slice(None,10),slice(None)),([5,499,3,3],[400,2,10]),(slice(0,0),slice(None))]:
+                    val = kernel[row_index,col_index].read(order=order).val
+                    assert val.flags[order+"_CONTIGUOUS"]
+                    np.testing.assert_array_almost_equal(val/expected.max(), expected[row_index,:][:,col_index]/expected.max(), decimal=10)
+
+            np.random.seed(0)
+            V = np.random.normal(size=(snpreader.iid_count,3))
+            np.testing.assert_array_almost_equal(kernel.matvec(V)/expected.max(), expected.dot(V)/expected.max(), decimal=10)
+            np.testing.assert_array_almost_equal(kernel.matvec(V[:,0])/expected.max(), expected.dot(V[:,0])/expected.max(), decimal=10)
+
+            #Square subsets are themselves low-rank and standardized on all the iids, whether or not the factor has been read
+            for kernel in [LowRankKernel(snpreader,std), kernel]:
+                sub = kernel[::2]
+                assert isinstance(sub,LowRankKernel)
+                np.testing.assert_array_almost_equal(sub.matvec(V[::2])/expected.max(), expected[::2,::2].dot(V[::2])/expected.max(), decimal=10)
+        logging.info("done with test")
+
+    def test_matvec(self):
+        logging.info("in test_matvec")
+        snpreader = Bed(self.currentFolder + "/../examples/toydata",count_A1=False)[:,:1000]
+        kerneldata = snpreader.read_kernel(stdizer.Unit())
+        expected = kerneldata.val
+        output = "tempdir/kernelreader/toydata.matvec.kernel.hdf5"
+        create_directory_if_necessary(output)
+        np.random.seed(0)
+        V = np.random.normal(size=(snpreader.iid_count,3))
+
+        kernelreader_list = [kerneldata, SnpKernel(snpreader,stdizer.Unit()), SnpKernel(snpreader,stdizer.Unit(),block_size=300), LowRankKernel(snpreader,stdizer.Unit())]
+        for sid_major in [True,False]:
+            KernelHdf5.write(output.replace(".kernel.",".{0}.kernel.".format(sid_major)),kerneldata,sid_major=sid_major)
+            kernelreader_list.append(KernelHdf5(output.replace(".kernel.",".{0}.kernel.".format(sid_major))))
+        KernelHdf5.write_tiled(output.replace(".kernel.",".tiled.kernel."),snpreader,stdizer.Unit(),tile_size=128)
+        kernelreader_list.append(KernelHdf5(output.replace(".kernel.",".tiled.kernel.")))
+
+        for kernelreader in kernelreader_list:
+            for block_size in [None,1,77]:
+                np.testing.assert_array_almost_equal(kernelreader.matvec(V,block_size=block_size)/expected.max(), expected.dot(V)/expected.max(), decimal=10)
+                np.testing.assert_array_almost_equal(kernelreader.matvec(V[:,0],block_size=block_size)/expected.max(), expected.dot(V[:,0])/expected.max(), decimal=10)
+            np.testing.assert_array_almost_equal(kernelreader[10:,:5].matvec(V[:5],block_size=50)/expected.max(), expected[10:,:5].dot(V[:5])/expected.max(), decimal=10)
+            did_fail = True
+            try:
+                kernelreader.matvec(V[1:])
+                did_fail = False
+            except:
+                pass
+            assert did_fail, "matvec should fail because V has the wrong number of rows"
+        del kernelreader_list
+
+        #DiagKtoN depends on all the sids, so a matvec in blocks must not standardize each block on its own
+        snpdata = SnpData(iid=[["fam",str(i)] for i in xrange(6)],sid=[str(i) for i in xrange(5)],val=np.random.randint(0,3,size=(6,5)).astype(np.float64))
+        for std in [stdizer.DiagKtoN(),stdizer.Unit()]:
+            expected = snpdata.read_kernel(std).val
+            for block_size in [1,2,100]:
+                np.testing.assert_array_almost_equal(SnpKernel(snpdata,std).matvec(V[:6],block_size=block_size), expected.dot(V[:6]), decimal=10)
+        logging.info("done with test")
+
+    def test_top_eigh(self):
+        logging.info("in test_top_eigh")
+        snpreader = Bed(self.currentFolder + "/../examples/toydata",count_A1=False)[:,:30] #rank 30
+        expected = snpreader.read_kernel(stdizer.Unit()).val
+        expected_values, expected_vectors = np.linalg.eigh(expected)
+        expected_values, expected_vectors = expected_values[::-1], expected_vectors[:,::-1]
+        for kernelreader in [SnpKernel(snpreader,stdizer.Unit(),block_size=7), LowRankKernel(snpreader,stdizer.Unit()), KernelData(iid=snpreader.iid,val=expected)]:
+            for k, oversampling in [(5,25),(1,40)]: #k+oversampling is at least the rank, so the result is exact
+                values, vectors = kernelreader.top_eigh(k,oversampling=oversampling,power_iterations=0)
+                assert vectors.shape == (snpreader.iid_count,k)
+                np.testing.assert_array_almost_equal(values/expected_values[0], expected_values[:k]/expected_values[0], decimal=10)
+                np.testing.assert_array_almost_equal(np.abs(vectors.T.dot(expected_vectors[:,:k])), np.identity(k), decimal=8) #same vectors, up to sign
+
+        #The seed doesn't change numpy's global random stream
+        np.random.seed(1)
+        expected_draw = np.random.uniform()
+        np.random.seed(1)
+        KernelData(iid=snpreader.iid,val=expected).top_eigh(2,seed=0)
+        assert np.random.uniform() == expected_draw
+
+        #With fewer directions than the rank, power iterations make the top eigenvalues close
+        values, vectors = SnpKernel(snpreader,stdizer.Unit()).top_eigh(3,oversampling=10,power_iterations=6)
+        np.testing.assert_array_almost_equal(values/expected_values[0], expected_values[:3]/expected_values[0], decimal=2)
+
+        did_fail = True
+        try:
+            SnpKernel(snpreader,stdizer.Unit())[:10,:20].top_eigh(3)
+            did_fail = False
+        except:
+            pass
+        assert did_fail, "top_eigh should fail because the kernel isn't square"
+        logging.info("done with test")
+
     def test_identity(self):
         logging.info("in test_identity")
         snpreader = Bed(self.currentFolder + "/../examples/toydata",count_A1=False)
@@ -305,6 +517,22 @@ class TestDocStrings(unittest.TestCase):
         os.chdir(old_dir)
         assert result.failed == 0, "failed doc test: " + __file__
 
+    def test_kernelcache(self):
+        import pysnptools.kernelreader.kernelcache
+        old_dir = os.getcwd()
+        os.chdir(os.path.dirname(os.path.realpath(__file__)))
+        result = doctest.testmod(pysnptools.kernelreader.kernelcache)
+        os.chdir(old_dir)
+        assert result.failed == 0, "failed doc test: " + __file__
+
+    def test_lowrankkernel(self):
+        import pysnptools.kernelreader.lowrankkernel
+        old_dir = os.getcwd()
+        os.chdir(os.path.dirname(os.path.realpath(__file__)))
+        result = doctest.testmod(pysnptools.kernelreader.lowrankkernel)
+        os.chdir(old_dir)
+        assert result.failed == 0, "failed doc test: " + __file__
+
     def test_snpnpz(self):
         import pysnptools.kernelreader.kernelnpz
         old_dir = os.getcwd()
@@ -38,6 +38,10 @@
 #include <stdio.h>
 #include <math.h> 
 #include <stdlib.h>
+#include <algorithm>
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 
 #ifdef _WIN32
 #define isinf(x) (!_finite(x))
@@ -65,6 +69,25 @@ REAL SUFFIX(mapBedGenotypeToRealAlleleNoCountA1)[4] = {
 	SUFFIX(homozygousSecondaryAllele),       // look-up 3
 };
 
+// Genotype j (0..3) of a .bed byte b is (b >> 2*j) & 0x03, so these tables give all four values of a byte with one look-up.
+REAL SUFFIX(mapBedByteToRealAlleleCountA1)[256][4];
+REAL SUFFIX(mapBedByteToRealAlleleNoCountA1)[256][4];
+
+bool SUFFIX(initMapBedByteToRealAllele)()
+{
+	for (int b = 0; b < 256; ++b)
+	{
+		for (int j = 0; j < 4; ++j)
+		{
+			int genotype = (b >> (2 * j)) & 0x03;
+			SUFFIX(mapBedByteToRealAlleleCountA1)[b][j] = SUFFIX(mapBedGenotypeToRealAlleleCountA1)[genotype];
+			SUFFIX(mapBedByteToRealAlleleNoCountA1)[b][j] = SUFFIX(mapBedGenotypeToRealAlleleNoCountA1)[genotype];
+		}
+	}
+	return true;
+}
+bool SUFFIX(mapBedByteToRealAlleleIsInitialized) = SUFFIX(initMapBedByteToRealAllele)(); // runs at load time, after the tables above are initialized
+
 SUFFIX(CBedFile)::SUFFIX(CBedFile)()
 {
 	layout = LayoutUnknown;    // layout describes the matrix layout on disk
@@ -73,7 +96,7 @@ SUFFIX(CBedFile)::SUFFIX(CBedFile)()
 	cIndividuals = 0;
 	cSnps        = 0;
 	cbStride     = 0;
-
+	pFile        = NULL;
 }
 
 SUFFIX(CBedFile)::SUFFIX(~CBedFile)()
@@ -133,7 +156,6 @@ void SUFFIX(CBedFile)::Open( const string& filename_, size_t cIndividuals_, size
 
 	// allocate the read buffer for a SNP
 	rgBytes.resize( cbStride );
-	rgBedGenotypes.resize( cIndividuals, bedMissingGenotype );
 }
 
 LayoutMode  SUFFIX(CBedFile)::GetLayoutMode()
@@ -170,6 +192,11 @@ size_t SUFFIX(CBedFile)::Read( BYTE *pb, size_t cbToRead )
 }
 
 size_t SUFFIX(CBedFile)::ReadLine(BYTE *pb, size_t idx)
+{
+	return(ReadLines(pb, idx, 1));
+}
+
+size_t SUFFIX(CBedFile)::ReadLines(BYTE *pb, size_t idx, size_t cSnpsToRead)
 {
 	long long fpos = cbHeader + (idx*cbStride);
 #ifdef _WIN32
@@ -190,7 +217,7 @@ size_t SUFFIX(CBedFile)::ReadLine(BYTE *pb, size_t idx)
 #endif
 	}
 
-	size_t cbRead = Read(pb, cbStride);
+	size_t cbRead = Read(pb, cbStride * cSnpsToRead);
 	return(cbRead);
 }
 
@@ -198,40 +225,70 @@ size_t SUFFIX(CBedFile)::ReadLine(BYTE *pb, size_t idx)
 * Read the genotype for all the individuals in iidList at the SNP specified by iSNP
 *   and store the results in pvOut
 */
-void SUFFIX(CBedFile)::ReadGenotypes(size_t iSnp, bool count_A1, const vector< size_t >& idxIndividualList, REAL* pvOut, uint64_t_ startpos, uint64_t_  outputNumSNPs)
+void SUFFIX(CBedFile)::ReadGenotypes(size_t iSnp, bool count_A1, const vector< size_t >& idxIndividualList, bool allIndividualsInOrder, REAL* pvOut, uint64_t_ startpos, uint64_t_  outputNumSNPs)
 {
 	//fprintf(stdout,"reading iSnp=%d w/ cIndividuals=%d and startpos=%d\n",iSnp,cIndividuals,startpos);
 	ReadLine( &rgBytes[0], iSnp );
-	// 'decompress' the genotype information
-	size_t iIndividual = 0;
-	for ( size_t ib = 0; ib < cbStride; ++ib )
-	{
-		BYTE genotypeByte = rgBytes[ ib ];
+	SUFFIX(DecodeBedSnp)(&rgBytes[0], count_A1, idxIndividualList, allIndividualsInOrder, pvOut, startpos, outputNumSNPs);
+}
 
-		// manually unrolled loop to decompress this byte
-		if ( iIndividual < cIndividuals ) rgBedGenotypes[ iIndividual++ ] = (BedGenotype)( genotypeByte       & 0x03);
-		if ( iIndividual < cIndividuals ) rgBedGenotypes[ iIndividual++ ] = (BedGenotype)((genotypeByte >> 2) & 0x03);
-		if ( iIndividual < cIndividuals ) rgBedGenotypes[ iIndividual++ ] = (BedGenotype)((genotypeByte >> 4) & 0x03);
-		if ( iIndividual < cIndividuals ) rgBedGenotypes[ iIndividual++ ] = (BedGenotype)((genotypeByte >> 6) & 0x03);
-	}
-	for ( size_t i=0; i<idxIndividualList.size(); ++i )
-	{
-		size_t idx = idxIndividualList[ i ];
-		//fprintf(stdout,"iSnp=%d, iIID=%d\n",iSnp,idx);
+/*
+* Decode the genotypes of the individuals in idxIndividualList from one SNP record and store the results in pvOut.
+*   Each genotype is one look-up into a byte-to-four-values table. When all the individuals are wanted, in order,
+*   each byte is looked up just once and its four values copied out.
+*/
+void SUFFIX(DecodeBedSnp)(const BYTE* snpBytes, bool count_A1, const vector< size_t >& idxIndividualList, bool allIndividualsInOrder, REAL* pvOut, uint64_t_ startpos, uint64_t_  outputNumSNPs)
+{
+	REAL (*mapBedByteToReal)[4] = count_A1 ? SUFFIX(mapBedByteToRealAlleleCountA1) : SUFFIX(mapBedByteToRealAlleleNoCountA1);
 #ifdef ORDERF
-		uint64_t_ out_idx = startpos + i;
+	const uint64_t_ outStride = 1;
 #else
-		uint64_t_ out_idx = startpos + i * outputNumSNPs;
+	const uint64_t_ outStride = outputNumSNPs;
 #endif
-		if (count_A1)
+	REAL* out = pvOut + startpos;
+	size_t cIndividualsOut = idxIndividualList.size();
+
+	if (allIndividualsInOrder)
+	{
+		size_t cFullBytes = cIndividualsOut / 4;
+		for ( size_t ib = 0; ib < cFullBytes; ++ib )
+		{
+			const REAL* values = mapBedByteToReal[ snpBytes[ ib ] ];
+			REAL* outByte = out + (4 * ib) * outStride;
+			outByte[ 0 ]             = values[ 0 ];
+			outByte[ outStride ]     = values[ 1 ];
+			outByte[ 2 * outStride ] = values[ 2 ];
+			outByte[ 3 * outStride ] = values[ 3 ];
+		}
+		for ( size_t i = cFullBytes * 4; i < cIndividualsOut; ++i )
 		{
-			pvOut[out_idx] = SUFFIX(mapBedGenotypeToRealAlleleCountA1)[rgBedGenotypes[idx]];
+			out[ i * outStride ] = mapBedByteToReal[ snpBytes[ i >> 2 ] ][ i & 0x03 ];
 		}
-		else {
-			pvOut[out_idx] = SUFFIX(mapBedGenotypeToRealAlleleNoCountA1)[rgBedGenotypes[idx]];
+	}
+	else
+	{
+		for ( size_t i = 0; i < cIndividualsOut; ++i )
+		{
+			size_t idx = idxIndividualList[ i ];
+			out[ i * outStride ] = mapBedByteToReal[ snpBytes[ idx >> 2 ] ][ idx & 0x03 ];
 		}
+	}
+}
 
+bool SUFFIX(IsAllIndividualsInOrder)(const vector< size_t >& idxIndividualList, size_t cIndividuals)
+{
+	if ( idxIndividualList.size() != cIndividuals )
+	{
+		return false;
 	}
+	for ( size_t i = 0; i < cIndividuals; ++i )
+	{
+		if ( idxIndividualList[ i ] != i )
+		{
+			return false;
+		}
+	}
+	return true;
 }
 
 const REAL SUFFIX(_PI) = 2.0*acos(0.0);
@@ -334,14 +391,20 @@ void SUFFIX(ImputeAndZeroMeanSNPs)(
 	const REAL betaB,
 	const bool apply_in_place,
 	const bool use_stats,
-	REAL *stats
+	REAL *stats,
+	int num_threads
 	)
 {
 	bool seenSNC = false; //Keep track of this so that only one warning message is reported
+	int threadCount = SUFFIX(threadCount)(num_threads);
 #ifdef ORDERF
 
-	for ( size_t iSnp = 0; iSnp < nSNPs; ++iSnp )
+	// Each SNP is a contiguous column, independent of the others, so the SNPs are split among the threads
+#pragma omp parallel for num_threads(threadCount) schedule(static) if(nSNPs > 1)
+	for ( long long iSnpSigned = 0; iSnpSigned < (long long)nSNPs; ++iSnpSigned )
 	{
+		size_t iSnp = (size_t)iSnpSigned;
+		REAL* snp = SNPs + iSnp * nIndividuals;
 		REAL mean_s;
 		REAL std;
 		REAL freq = 0;
@@ -364,11 +427,11 @@ void SUFFIX(ImputeAndZeroMeanSNPs)(
 
 			for (size_t ind = 0; ind < end; ind += delta)
 			{
-				if (SNPs[ind] == SNPs[ind])
+				if (snp[ind] == snp[ind])
 				{
 					//check for not NaN
-					sum_s += SNPs[ind];
-					sum2_s += SNPs[ind] * SNPs[ind];
+					sum_s += snp[ind];
+					sum2_s += snp[ind] * snp[ind];
 					++n_observed;
 				}
 			}
@@ -384,6 +447,7 @@ void SUFFIX(ImputeAndZeroMeanSNPs)(
 
 			if ((mean_s != mean_s) || betaNotUnitVariance && ((mean_s > (REAL)2.0) || (mean_s < (REAL)0.0)))
 			{
+#pragma omp critical
 				if (!seenSNC)
 				{
 					seenSNC = true;
@@ -401,6 +465,7 @@ void SUFFIX(ImputeAndZeroMeanSNPs)(
 				//   however ALL SNCs should have been removed in previous filtering steps
 				//   This test now prevents a divide by zero error below
 				isSNC = true;
+#pragma omp critical
 				if (!seenSNC)
 				{
 					seenSNC = true;
@@ -420,13 +485,13 @@ void SUFFIX(ImputeAndZeroMeanSNPs)(
 			for (size_t ind = 0; ind < end; ind += delta)
 			{
 				//check for NaN
-				if ((SNPs[ind] != SNPs[ind]) || isSNC)
+				if ((snp[ind] != snp[ind]) || isSNC)
 				{
-					SNPs[ind] = 0.0;
+					snp[ind] = 0.0;
 				}
 				else
 				{
-					SNPs[ind] -= mean_s;     //subtract the mean from the data
+					snp[ind] -= mean_s;     //subtract the mean from the data
 					if (betaNotUnitVariance) //compute snp-freq as in the Visscher Height paper (Nat Gen, Yang et al 2010).
 					{
 						REAL freq = mean_s / 2.0;
@@ -436,17 +501,15 @@ void SUFFIX(ImputeAndZeroMeanSNPs)(
 						}
 						REAL rT = SUFFIX(BetaPdf)(freq, betaA, betaB);
 						//fprintf(stderr, "BetaPdf(%f,%f,%f)=%f\n",  freq, betaA, betaB, rT);
-						SNPs[ind] *= rT;
+						snp[ind] *= rT;
 					}
 					else
 					{
-						SNPs[ind] /= std;        //unit variance as well
+						snp[ind] /= std;        //unit variance as well
 					}
 				}
 			}
 		}
-
-		SNPs += nIndividuals;
 	}
 
 #else //Order C
@@ -470,17 +533,30 @@ void SUFFIX(ImputeAndZeroMeanSNPs)(
 		std::vector<REAL> sum_s(nSNPs);      //the sum of a SNP over all observed individuals. C++ inits to 0's
 		std::vector<REAL> sum2_s(nSNPs);     //the sum of the squares of the SNP over all observed individuals.     C++ inits to 0's
 
-		for( size_t ind = 0; ind < nIndividuals; ++ind)
+		// Each thread collects the statistics of its own contiguous range of SNPs, so the sums are added in the same order as with one thread
+#pragma omp parallel num_threads(threadCount) if(nSNPs > 1)
 		{
-			size_t rowStart = ind * nSNPs;
-			for ( size_t iSnp = 0; iSnp < nSNPs; ++iSnp )
+#ifdef _OPENMP
+			size_t threadNum = (size_t)omp_get_thread_num();
+			size_t threadTotal = (size_t)omp_get_num_threads();
+#else
+			size_t threadNum = 0;
+			size_t threadTotal = 1;
+#endif
+			size_t snpStart = nSNPs * threadNum / threadTotal;
+			size_t snpEnd = nSNPs * (threadNum + 1) / threadTotal;
+			for( size_t ind = 0; ind < nIndividuals; ++ind)
 			{
-				REAL value = SNPs[rowStart+iSnp];
-				if ( value == value )
+				size_t rowStart = ind * nSNPs;
+				for ( size_t iSnp = snpStart; iSnp < snpEnd; ++iSnp )
 				{
-					sum_s[iSnp] += value;
-					sum2_s[iSnp] += value * value;
-					++n_observed[iSnp];
+					REAL value = SNPs[rowStart+iSnp];
+					if ( value == value )
+					{
+						sum_s[iSnp] += value;
+						sum2_s[iSnp] += value * value;
+						++n_observed[iSnp];
+					}
 				}
 			}
 		}
@@ -531,8 +607,11 @@ void SUFFIX(ImputeAndZeroMeanSNPs)(
 
 	if (apply_in_place)
 	{
-		for (size_t ind = 0; ind < nIndividuals; ++ind)
+		// Each individual is a contiguous row, so the individuals are split among the threads
+#pragma omp parallel for num_threads(threadCount) schedule(static) if(nIndividuals > 1)
+		for (long long indSigned = 0; indSigned < (long long)nIndividuals; ++indSigned)
 		{
+			size_t ind = (size_t)indSigned;
 			size_t rowStart = ind * nSNPs;
 			for (size_t iSnp = 0; iSnp < nSNPs; ++iSnp)
 			{
@@ -570,27 +649,274 @@ void SUFFIX(ImputeAndZeroMeanSNPs)(
 #endif
 }
 
+// Returns the number of threads to use. A num_threads of 0 or less means 'use OpenMP's default'.
+int SUFFIX(threadCount)(int num_threads)
+{
+#ifdef _OPENMP
+	if (num_threads <= 0)
+	{
+		return omp_get_max_threads();
+	}
+	return num_threads;
+#else
+	return 1;
+#endif
+}
+
+const uint64_t_ SUFFIX(cbRunMax) = 1 << 23; // the most bytes read from a .bed file with one fread
+
+// Sort the requested SNPs into file order, as (SNP index, output column) pairs
+void SUFFIX(SortSnps)(const std::vector<int>& snpIdxList, std::vector< std::pair<int, size_t> >& sortedSnps)
+{
+	sortedSnps.resize(snpIdxList.size());
+	for (size_t i = 0; i < snpIdxList.size(); i++)
+	{
+		sortedSnps[i] = std::make_pair(snpIdxList[i], i);
+	}
+	std::sort(sortedSnps.begin(), sortedSnps.end());
+}
+
+/*
+* Sort the requested SNPs into file order and split them into runs of adjacent (or repeated) SNPs.
+*   Run r is sortedSnps[runStarts[r]] to sortedSnps[runStarts[r+1]-1] and spans at most snpsPerRunMax SNPs.
+*/
+void SUFFIX(SortedSnpRuns)(const std::vector<int>& snpIdxList, size_t snpsPerRunMax, std::vector< std::pair<int, size_t> >& sortedSnps, std::vector<size_t>& runStarts)
+{
+	SUFFIX(SortSnps)(snpIdxList, sortedSnps);
+
+	runStarts.clear();
+	for (size_t k = 0; k < sortedSnps.size(); k++)
+	{
+		if (k == 0 || sortedSnps[k].first > sortedSnps[k - 1].first + 1 || (size_t)(sortedSnps[k].first - sortedSnps[runStarts.back()].first) >= snpsPerRunMax)
+		{
+			runStarts.push_back(k);
+		}
+	}
+	runStarts.push_back(sortedSnps.size());
+}
+
+// wrapper to be used from cython
+// The SNPs are visited in file order and each run of adjacent SNPs is read with one fread, then decoded into the output
+// columns that asked for it. The runs are split into contiguous blocks, one per thread. Each thread has its own file pointer
+// and writes to a disjoint set of columns in 'out', so the result doesn't depend on num_threads.
+void SUFFIX(readPlinkBedFile)(std::string bed_fn, int inputNumIndividuals, int inputNumSNPs, bool count_A1, std::vector<size_t> individuals_idx, std::vector<int> snpIdxList, REAL* out, int num_threads)
+{
+	uint64_t_ outputNumSNPs = snpIdxList.size();
+	uint64_t_ cbStride = ((uint64_t_)inputNumIndividuals + 3) / 4;
+	size_t snpsPerRunMax = (size_t)std::max((uint64_t_)1, SUFFIX(cbRunMax) / std::max((uint64_t_)1, cbStride));
+	int threadCount = SUFFIX(threadCount)(num_threads);
+	bool allIndividualsInOrder = SUFFIX(IsAllIndividualsInOrder)(individuals_idx, inputNumIndividuals);
+
+	std::vector< std::pair<int, size_t> > sortedSnps;
+	std::vector<size_t> runStarts;
+	SUFFIX(SortedSnpRuns)(snpIdxList, snpsPerRunMax, sortedSnps, runStarts);
+	long long runCount = (long long)runStarts.size() - 1;
+
+#pragma omp parallel num_threads(threadCount) if(runCount > 1)
+	{
+		SUFFIX(CBedFile) bedFile;
+		bedFile.Open(bed_fn, inputNumIndividuals, inputNumSNPs);
+		std::vector<BYTE> runBytes;
+
+#pragma omp for schedule(static)
+		for (long long r = 0; r < runCount; r++){
+			int firstSnp = sortedSnps[runStarts[r]].first;
+			size_t cSnpsInRun = (size_t)(sortedSnps[runStarts[r + 1] - 1].first - firstSnp + 1);
+			runBytes.resize(cSnpsInRun * cbStride + 1); // +1 so that &runBytes[0] is valid even if cbStride is 0
+			bedFile.ReadLines(&runBytes[0], firstSnp, cSnpsInRun);
+
+			for (size_t k = runStarts[r]; k < runStarts[r + 1]; k++){
+				uint64_t_ i = sortedSnps[k].second;
+#ifdef ORDERF
+				uint64_t_ startpos = i * individuals_idx.size();
+#else
+				uint64_t_ startpos = i;
+#endif
+				SUFFIX(DecodeBedSnp)(&runBytes[(sortedSnps[k].first - firstSnp) * cbStride], count_A1, individuals_idx, allIndividualsInOrder, out, startpos, outputNumSNPs);
+			}
+		}
+	}
+}
+
 // wrapper to be used from cython
-void SUFFIX(readPlinkBedFile)(std::string bed_fn, int inputNumIndividuals, int inputNumSNPs, bool count_A1, std::vector<size_t> individuals_idx, std::vector<int> snpIdxList, REAL* out)
+// bedBytes points at the first SNP record of a .bed image (that is, just past the 3-byte header), for example, a memory-mapped file.
+// The genotypes are decoded straight from those bytes, so no file reads or intermediate buffers are needed.
+// Like readPlinkBedFile, the SNPs are decoded in file order, in contiguous blocks, one per thread.
+void SUFFIX(readPlinkBedBytes)(const BYTE* bedBytes, int inputNumIndividuals, bool count_A1, std::vector<size_t> individuals_idx, std::vector<int> snpIdxList, REAL* out, int num_threads)
 {
-	uint64_t_ N = inputNumIndividuals;
+	uint64_t_ cbStride = ((uint64_t_)inputNumIndividuals + 3) / 4;
 	uint64_t_ outputNumSNPs = snpIdxList.size();
+	long long snpCount = (long long)snpIdxList.size();
+	int threadCount = SUFFIX(threadCount)(num_threads);
+	bool allIndividualsInOrder = SUFFIX(IsAllIndividualsInOrder)(individuals_idx, inputNumIndividuals);
 
-	SUFFIX(CBedFile) bedFile = SUFFIX(CBedFile)();
-	bedFile.Open(bed_fn, inputNumIndividuals, inputNumSNPs);
+	std::vector< std::pair<int, size_t> > sortedSnps;
+	SUFFIX(SortSnps)(snpIdxList, sortedSnps);
 
-	for (size_t i = 0; i != snpIdxList.size(); i++){
-		int idx = snpIdxList[i];
+#pragma omp parallel for num_threads(threadCount) schedule(static) if(snpCount > 1)
+	for (long long k = 0; k < snpCount; k++){
+		const BYTE* snpBytes = bedBytes + cbStride * (uint64_t_)sortedSnps[k].first;
+		uint64_t_ i = sortedSnps[k].second;
 
 #ifdef ORDERF
-		uint64_t_ startpos = ((uint64_t_)i) * individuals_idx.size();
+		uint64_t_ startpos = i * individuals_idx.size();
 #else
-		uint64_t_ startpos = ((uint64_t_)i);
+		uint64_t_ startpos = i;
 #endif
-		bedFile.ReadGenotypes(idx, count_A1, individuals_idx, out, startpos, outputNumSNPs);
+		SUFFIX(DecodeBedSnp)(snpBytes, count_A1, individuals_idx, allIndividualsInOrder, out, startpos, outputNumSNPs);
 	}
 }
 
+// wrapper to be used from cython
+// Like readPlinkBedBytes followed by ImputeAndZeroMeanSNPs, but in one pass over the output: each SNP record is standardized as it is decoded.
+// The mean and stddev of a SNP come from counting the record's 2-bit genotype codes, so every standardized value is one of just four
+// values (one per code) and the output is written once and never re-read. The results are the same as from ImputeAndZeroMeanSNPs.
+// stats is laid out as in ImputeAndZeroMeanSNPs. If use_stats, it gives the mean and stddev of each output SNP; otherwise, they are stored there.
+void SUFFIX(readPlinkBedBytesStandardize)(const BYTE* bedBytes, int inputNumIndividuals, bool count_A1, std::vector<size_t> individuals_idx, std::vector<int> snpIdxList, REAL* out, int num_threads,
+	const bool betaNotUnitVariance, const REAL betaA, const REAL betaB, const bool use_stats, REAL* stats)
+{
+	uint64_t_ cbStride = ((uint64_t_)inputNumIndividuals + 3) / 4;
+	uint64_t_ outputNumSNPs = snpIdxList.size();
+	long long snpCount = (long long)snpIdxList.size();
+	int threadCount = SUFFIX(threadCount)(num_threads);
+	bool allIndividualsInOrder = SUFFIX(IsAllIndividualsInOrder)(individuals_idx, inputNumIndividuals);
+	const REAL* mapBedGenotypeToReal = count_A1 ? SUFFIX(mapBedGenotypeToRealAlleleCountA1) : SUFFIX(mapBedGenotypeToRealAlleleNoCountA1);
+	size_t cIndividualsOut = individuals_idx.size();
+#ifdef ORDERF
+	const uint64_t_ outStride = 1;
+#else
+	const uint64_t_ outStride = outputNumSNPs;
+#endif
+
+	std::vector< std::pair<int, size_t> > sortedSnps;
+	SUFFIX(SortSnps)(snpIdxList, sortedSnps);
+
+#pragma omp parallel for num_threads(threadCount) schedule(static) if(snpCount > 1)
+	for (long long k = 0; k < snpCount; k++){
+		const BYTE* snpBytes = bedBytes + cbStride * (uint64_t_)sortedSnps[k].first;
+		uint64_t_ i = sortedSnps[k].second;
+#ifdef ORDERF
+		REAL* meanOut = &stats[i];
+		REAL* stdOut = &stats[i + outputNumSNPs];
+		REAL* snpOut = out + i * cIndividualsOut;
+#else
+		REAL* meanOut = &stats[i * 2];
+		REAL* stdOut = &stats[i * 2 + 1];
+		REAL* snpOut = out + i;
+#endif
+
+		REAL mean_s;
+		REAL std;
+		if (use_stats)
+		{
+			mean_s = *meanOut;
+			std = *stdOut;
+		}
+		else
+		{
+			size_t codeCount[4] = { 0, 0, 0, 0 };
+			if (allIndividualsInOrder)
+			{
+				for (size_t ind = 0; ind < cIndividualsOut; ++ind)
+				{
+					++codeCount[(snpBytes[ind >> 2] >> ((ind & 0x03) * 2)) & 0x03];
+				}
+			}
+			else
+			{
+				for (size_t ind = 0; ind < cIndividualsOut; ++ind)
+				{
+					size_t idx = individuals_idx[ind];
+					++codeCount[(snpBytes[idx >> 2] >> ((idx & 0x03) * 2)) & 0x03];
+				}
+			}
+
+			REAL n_observed = 0.0;
+			REAL sum_s = 0.0;
+			REAL sum2_s = 0.0;
+			for (int code = 0; code < 4; ++code)
+			{
+				REAL value = mapBedGenotypeToReal[code];
+				if (value == value) //check for not NaN
+				{
+					n_observed += (REAL)codeCount[code];
+					sum_s += value * (REAL)codeCount[code];
+					sum2_s += value * value * (REAL)codeCount[code];
+				}
+			}
+			mean_s = sum_s / n_observed;
+			REAL mean2_s = sum2_s / n_observed;
+			std = sqrt(mean2_s - mean_s * mean_s);
+			if ((std != std) || (std <= (REAL)0.0))
+			{
+				std = std::numeric_limits<REAL>::infinity(); // a Single Nucleotide Constant (SNC), so all its values become 0.0
+			}
+			*meanOut = mean_s;
+			*stdOut = std;
+		}
+
+		// The standardized value of each genotype code
+		REAL codeValue[4];
+		bool isSNC = isinf(std);
+		REAL rT = 0.0;
+		if (betaNotUnitVariance) //compute snp-freq as in the Visscher Height paper (Nat Gen, Yang et al 2010).
+		{
+			REAL freq = mean_s / 2.0;
+			if (freq > .5)
+			{
+				freq = 1.0 - freq;
+			}
+			rT = SUFFIX(BetaPdf)(freq, betaA, betaB);
+		}
+		for (int code = 0; code < 4; ++code)
+		{
+			REAL value = mapBedGenotypeToReal[code];
+			if ((value != value) || isSNC)
+			{
+				codeValue[code] = 0.0;
+			}
+			else
+			{
+				value -= mean_s;
+				if (betaNotUnitVariance)
+				{
+					value *= rT;
+				}
+				else
+				{
+					value /= std;
+				}
+				codeValue[code] = value;
+			}
+		}
+
+		if (allIndividualsInOrder)
+		{
+			size_t cFullBytes = cIndividualsOut / 4;
+			for (size_t ib = 0; ib < cFullBytes; ++ib)
+			{
+				BYTE b = snpBytes[ib];
+				REAL* outByte = snpOut + (4 * ib) * outStride;
+				outByte[0]             = codeValue[b & 0x03];
+				outByte[outStride]     = codeValue[(b >> 2) & 0x03];
+				outByte[2 * outStride] = codeValue[(b >> 4) & 0x03];
+				outByte[3 * outStride] = codeValue[(b >> 6) & 0x03];
+			}
+			for (size_t ind = cFullBytes * 4; ind < cIndividualsOut; ++ind)
+			{
+				snpOut[ind * outStride] = codeValue[(snpBytes[ind >> 2] >> ((ind & 0x03) * 2)) & 0x03];
+			}
+		}
+		else
+		{
+			for (size_t ind = 0; ind < cIndividualsOut; ++ind)
+			{
+				size_t idx = individuals_idx[ind];
+				snpOut[ind * outStride] = codeValue[(snpBytes[idx >> 2] >> ((idx & 0x03) * 2)) & 0x03];
+			}
+		}
+	}
+}
 
 // wrapper to be used from cython
 void SUFFIX(writePlinkBedFile)(std::string bed_fn, int iid_count, int sid_count, bool count_A1, REAL* in)
@@ -42,6 +42,7 @@
 #include <vector>
 #include <string>
 #include <limits>
+#include <utility>
 //#include <inttypes.h>
  
 using namespace std;
@@ -79,6 +80,8 @@ extern REAL SUFFIX(heterozygousAllele);
 extern REAL SUFFIX(homozygousSecondaryAllele);
 extern REAL SUFFIX(mapBedGenotypeToRealAlleleCountA1)[4];
 extern REAL SUFFIX(mapBedGenotypeToRealAlleleNoCountA1)[4];
+extern REAL SUFFIX(mapBedByteToRealAlleleCountA1)[256][4];    // a whole .bed byte (four genotypes) to four values, in one table load
+extern REAL SUFFIX(mapBedByteToRealAlleleNoCountA1)[256][4];
 
 class SUFFIX(CBedFile)
    {
@@ -102,8 +105,11 @@ public:
    // read the data for one SNP (idxSnp) into the BYTE buffer pb
    size_t   ReadLine( BYTE *pb, size_t idxSnp );
 
+   // read the data for cSnpsToRead adjacent SNPs, starting at idxSnp, into the BYTE buffer pb with one read
+   size_t   ReadLines( BYTE *pb, size_t idxSnp, size_t cSnpsToRead );
+
    // read the genotype for all the individuals in 'list' at the SNP specified by iSNP
-   void     ReadGenotypes(size_t iSnp, bool count_A1, const vector< size_t >& iIndividualList, REAL* pvOutSNP, uint64_t_ startpos, uint64_t_  outputNumSNPs);
+   void     ReadGenotypes(size_t iSnp, bool count_A1, const vector< size_t >& iIndividualList, bool allIndividualsInOrder, REAL* pvOutSNP, uint64_t_ startpos, uint64_t_  outputNumSNPs);
 
 private:
    int      NextChar();
@@ -113,7 +119,6 @@ private:
    string   filename;
    FILE     *pFile;
    vector< BYTE > rgBytes;
-   vector< BedGenotype > rgBedGenotypes;
    
    LayoutMode  layout;        // 0=RowMajor(all snps per individual together);
                               // 1=ColumnMajor(all individuals per SNP together in memory)
@@ -124,6 +129,12 @@ private:
    };
 
 
+// decode one SNP record (the cbStride bytes at snpBytes) for the individuals in 'list' into pvOutSNP
+void SUFFIX(DecodeBedSnp)(const BYTE* snpBytes, bool count_A1, const vector< size_t >& iIndividualList, bool allIndividualsInOrder, REAL* pvOutSNP, uint64_t_ startpos, uint64_t_  outputNumSNPs);
+
+// true if 'list' is 0,1,...,cIndividuals-1
+bool SUFFIX(IsAllIndividualsInOrder)(const vector< size_t >& iIndividualList, size_t cIndividuals);
+
 void SUFFIX(ImputeAndZeroMeanSNPs)( 
 	REAL *SNPs, 
 	const size_t nIndividuals, 
@@ -133,11 +144,18 @@ void SUFFIX(ImputeAndZeroMeanSNPs)(
 	const REAL betaB,
 	const bool apply_in_place,
 	const bool use_stats,
-	REAL *stats
+	REAL *stats,
+	int num_threads
    );
 
+// the number of threads to use for a num_threads argument (0 or less means OpenMP's default)
+int SUFFIX(threadCount)(int num_threads);
+
 // to be used by cython wrapper
-void SUFFIX(readPlinkBedFile)(std::string bed_fn, int inputNumIndividuals, int inputNumSNPs, bool count_A1, std::vector<size_t> individuals_idx, std::vector<int> snpIdxList, REAL* out);
+void SUFFIX(readPlinkBedFile)(std::string bed_fn, int inputNumIndividuals, int inputNumSNPs, bool count_A1, std::vector<size_t> individuals_idx, std::vector<int> snpIdxList, REAL* out, int num_threads);
+void SUFFIX(readPlinkBedBytes)(const BYTE* bedBytes, int inputNumIndividuals, bool count_A1, std::vector<size_t> individuals_idx, std::vector<int> snpIdxList, REAL* out, int num_threads);
+void SUFFIX(readPlinkBedBytesStandardize)(const BYTE* bedBytes, int inputNumIndividuals, bool count_A1, std::vector<size_t> individuals_idx, std::vector<int> snpIdxList, REAL* out, int num_threads,
+	const bool betaNotUnitVariance, const REAL betaA, const REAL betaB, const bool use_stats, REAL* stats);
 void SUFFIX(writePlinkBedFile)(std::string bed_fn, int iid_count, int sid_count, bool count_A1, REAL* in);
 
 /*#endif      // CPlinkBedFile_h
@@ -2,4 +2,30 @@ from snpreader import SnpReader
 from pysnptools.pstreader._subset import _Subset as PstSubset
 
 class _Subset(PstSubset,SnpReader):
-    pass
+
+    @property
+    def _holds_packed_bytes(self):
+        return self._internal._holds_packed_bytes
+
+    def _sids_reader(self, sid_indexer):
+        self.run_once()
+        composed_sid_indexer = PstSubset.compose_indexer_with_indexer(self._internal.sid_count, self._col_indexer, self.sid_count, sid_indexer)
+        return self._internal._sids_reader(composed_sid_indexer)[self._row_indexer,:]
+
+    def _genotype_counts(self, iid_index_or_none, sid_index_or_none):
+        self.run_once()
+        composed_iid_index_or_none = PstSubset.compose_indexer_with_index_or_none(self._internal.iid_count, self._row_indexer, self.iid_count, iid_index_or_none)
+        composed_sid_index_or_none = PstSubset.compose_indexer_with_index_or_none(self._internal.sid_count, self._col_indexer, self.sid_count, sid_index_or_none)
+        return self._internal._genotype_counts(composed_iid_index_or_none, composed_sid_index_or_none)
+
+    def _read_into(self, iid_index_or_none, sid_index_or_none, val, force_python_only):
+        self.run_once()
+        composed_iid_index_or_none = PstSubset.compose_indexer_with_index_or_none(self._internal.iid_count, self._row_indexer, self.iid_count, iid_index_or_none)
+        composed_sid_index_or_none = PstSubset.compose_indexer_with_index_or_none(self._internal.sid_count, self._col_indexer, self.sid_count, sid_index_or_none)
+        self._internal._read_into(composed_iid_index_or_none, composed_sid_index_or_none, val, force_python_only)
+
+    def _read_standardized_into(self, iid_index_or_none, sid_index_or_none, val, standardizer, force_python_only):
+        self.run_once()
+        composed_iid_index_or_none = PstSubset.compose_indexer_with_index_or_none(self._internal.iid_count, self._row_indexer, self.iid_count, iid_index_or_none)
+        composed_sid_index_or_none = PstSubset.compose_indexer_with_index_or_none(self._internal.sid_count, self._col_indexer, self.sid_count, sid_index_or_none)
+        return self._internal._read_standardized_into(composed_iid_index_or_none, composed_sid_index_or_none, val, standardizer, force_python_only)
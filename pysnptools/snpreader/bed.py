@@ -27,19 +27,25 @@ class Bed(SnpReader):
                      * **sid** (an array of strings) -- The :attr:`.SnpReader.sid` information. If not given, reads info from '.bim' file.
                      * **pos** (optional, an array of strings) -- The :attr:`.SnpReader.pos` information.  If not given, reads info from '.bim' file.
                      * **skip_format_check** (*bool*) -- If False (default), will check that '.bed' file has expected starting bytes.
+                     * **num_threads** (optional, *int*) -- The number of threads the C++ reader uses to decode SNPs. The SNPs are split into contiguous blocks,
+                       one per thread, so the values read do not depend on this setting. If not given, uses OpenMP's default (usually, the number of processors).
 
     **Methods beyond** :class:`.SnpReader`
     '''
     _ran_once = False
     _file_pointer = None
+    _mmap = None
+    _python_block_bytes = 2**21 # The pure python reader decodes at most this many .bed bytes at once
+    _holds_packed_bytes = True
 
-    def __init__(self, filename, count_A1=None, iid=None, sid=None, pos=None, skip_format_check=False): #!!!document these new optionals. they are here
+    def __init__(self, filename, count_A1=None, iid=None, sid=None, pos=None, skip_format_check=False, num_threads=None): #!!!document these new optionals. they are here
         self.filename = filename
         if count_A1 is None:
              warnings.warn("'count_A1' was not set. For now it will default to 'False', but in the future it will default to 'True'", FutureWarning)
              count_A1 = False
         self.count_A1 =count_A1
         self.skip_format_check = skip_format_check
+        self.num_threads = num_threads
         if iid is not None:
             self._row = PstData._fixup_input(iid,empty_creator=lambda ignore:np.empty([0,2],dtype=str))
         if sid is not None:
@@ -83,8 +89,123 @@ class Bed(SnpReader):
         if mode != '\x01': raise Exception('only SNP-major is implemented')
         logging.info("bed file is open {0}".format(bedfile))
     def _close_bed(self):
-        self.__del__()
-        self.file_pointer = None
+        if hasattr(self,'_filepointer') and self._filepointer is not None:
+            self._filepointer.close()
+            self._filepointer = None
+
+    def _open_mmap(self):
+        '''
+        Returns the SNP records of the '.bed' file (everything after the 3-byte header) as a read-only np.memmap of bytes.
+        The mapping is kept open across reads and is only re-created if the file on disk changes.
+        '''
+        bedfile = SnpReader._name_of_other_file(self.filename,"bed","bed")
+        stat = os.stat(bedfile)
+        file_key = (stat.st_size, stat.st_mtime)
+        if self._mmap is not None and self._mmap_file_key == file_key:
+            return self._mmap
+
+        self._mmap = None
+        mmap = np.memmap(bedfile, dtype=np.uint8, mode='r')
+        if mmap[0] != 0b01101100 or mmap[1] != 0b00011011: raise Exception('No valid binary BED file')
+        if mmap[2] != 0b00000001: raise Exception('only SNP-major is implemented')
+        iid_count_div4 = (self.iid_count+3)//4
+        if len(mmap) < 3 + iid_count_div4 * self.sid_count: raise Exception("bed file '{0}' is shorter than expected for {1} iids and {2} sids".format(bedfile,self.iid_count,self.sid_count))
+        self._mmap = mmap[3:3 + iid_count_div4 * self.sid_count]
+        self._mmap_file_key = file_key
+        logging.info("bed file is memory mapped {0}".format(bedfile))
+        return self._mmap
+
+    @staticmethod
+    def _consecutive_runs(sorted_sid_index, run_count_max):
+        '''
+        Yields (start,stop) pairs that split sorted_sid_index into runs in which each value is the same as, or one more than, the previous value.
+        Each run spans at most run_count_max SNPs.
+        '''
+        if len(sorted_sid_index) == 0:
+            return
+        breaks = np.flatnonzero(np.diff(sorted_sid_index) > 1) + 1
+        for start, stop in izip(np.r_[0,breaks],np.r_[breaks,len(sorted_sid_index)]):
+            while start < stop:
+                sub_stop = start + np.searchsorted(sorted_sid_index[start:stop], sorted_sid_index[start]+run_count_max)
+                yield start, sub_stop
+                start = sub_stop
+
+    _byte_lookup_cache = {}
+    @staticmethod
+    def _byte_lookup(count_A1, dtype, int8_missing=SnpReader.int8_missing):
+        '''
+        Returns a (256 x 4) array that maps a .bed byte to the values of its four genotypes (genotype j is bits 2j and 2j+1).
+        Missing genotypes are NaN, or, for dtype numpy.int8, int8_missing.
+        '''
+        dtype = np.dtype(dtype)
+        missing = int8_missing if dtype == np.int8 else np.nan
+        key = (count_A1, dtype, missing if dtype == np.int8 else None)
+        byte_lookup = Bed._byte_lookup_cache.get(key)
+        if byte_lookup is None:
+            if not count_A1:
+                code_to_value = np.array([0, missing, 1, 2], dtype=dtype)
+            else:
+                code_to_value = np.array([2, missing, 1, 0], dtype=dtype)
+            codes = (np.arange(256)[:,np.newaxis] >> np.array([0,2,4,6])) & 0b11
+            byte_lookup = code_to_value[codes]
+            Bed._byte_lookup_cache[key] = byte_lookup
+        return byte_lookup
+
+    _popcount_lookup = np.array([bin(byte).count('1') for byte in xrange(256)],dtype=np.uint8)
+
+    @staticmethod
+    def _iid_byte_mask(iid_count, iid_index_or_none):
+        '''
+        Returns the (iid_count+3)//4 bytes whose set bits select the genotypes of the given iids (all iids, if None) in a .bed SNP record.
+        '''
+        iid_index = np.arange(iid_count) if iid_index_or_none is None else np.asarray(iid_index_or_none,dtype=np.intp)
+        byte_mask = np.zeros((iid_count+3)//4,dtype=np.uint8)
+        np.bitwise_or.at(byte_mask, iid_index >> 2, (0b11 << 2*(iid_index & 0b11)).astype(np.uint8))
+        return byte_mask
+
+    @staticmethod
+    def _count_genotypes(records, byte_mask, count_A1):
+        '''
+        Given .bed SNP records (one row of bytes per SNP), returns for each SNP the number of 0's, 1's, 2's, and missing values among the genotypes selected by byte_mask.
+        It works on the bytes directly: the low and high bit of each genotype are masked out and counted with a popcount look-up table, so no values are decoded.
+        '''
+        popcount = Bed._popcount_lookup
+        low_bits = byte_mask & 0b01010101
+        lo = records & low_bits
+        hi = (records >> 1) & low_bits
+        lo_count = popcount[lo].sum(axis=1,dtype=np.int64)
+        hi_count = popcount[hi].sum(axis=1,dtype=np.int64)
+        code3_count = popcount[lo & hi].sum(axis=1,dtype=np.int64) # code 0b11
+        code2_count = hi_count - code3_count                       # code 0b10 (heterozygous)
+        code1_count = lo_count - code3_count                       # code 0b01 (missing)
+        code0_count = popcount[low_bits].sum(dtype=np.int64) - code1_count - code2_count - code3_count
+        if not count_A1:
+            return np.column_stack([code0_count, code2_count, code3_count, code1_count])
+        else:
+            return np.column_stack([code3_count, code2_count, code0_count, code1_count])
+
+    def _genotype_counts(self, iid_index_or_none, sid_index_or_none):
+        self._run_once()
+        if iid_index_or_none is not None and len(np.unique(iid_index_or_none)) != len(iid_index_or_none): # A byte mask can't count an iid twice
+            return SnpReader._genotype_counts(self, iid_index_or_none, sid_index_or_none)
+        try:
+            records = self._open_mmap().reshape(self.sid_count,(self.iid_count+3)//4)
+        except EnvironmentError as e:
+            logging.warn("Can't memory map '{0}', so will decode its values instead ({1})".format(self.filename,e))
+            return SnpReader._genotype_counts(self, iid_index_or_none, sid_index_or_none)
+        return Bed._count_genotypes_in_blocks(records, self.iid_count, iid_index_or_none, sid_index_or_none, self.count_A1, self._python_block_bytes)
+
+    @staticmethod
+    def _count_genotypes_in_blocks(records, iid_count, iid_index_or_none, sid_index_or_none, count_A1, block_bytes):
+        byte_mask = Bed._iid_byte_mask(iid_count, iid_index_or_none)
+        sid_count = records.shape[0] if sid_index_or_none is None else len(sid_index_or_none)
+        sid_count_max = max(1,block_bytes // max(1,records.shape[1]))
+        counts = np.empty((sid_count,4),dtype=np.int64)
+        for start in xrange(0,sid_count,sid_count_max):
+            stop = min(start+sid_count_max,sid_count)
+            block = records[start:stop] if sid_index_or_none is None else records[np.asarray(sid_index_or_none[start:stop],dtype=np.intp)]
+            counts[start:stop] = Bed._count_genotypes(block, byte_mask, count_A1)
+        return counts
 
     def _run_once(self):
         if self._ran_once:
@@ -106,6 +227,14 @@ class Bed(SnpReader):
         if hasattr(self,'_filepointer') and self._filepointer is not None:  # we need to test this because Python doesn't guarantee that __init__ was fully run
             self._filepointer.close()
             self._filepointer = None
+        self._mmap = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop('_mmap', None) # memory maps and file pointers can't be pickled. They are re-opened on demand.
+        state.pop('_mmap_file_key', None)
+        state.pop('_filepointer', None)
+        return state
 
     def copyinputs(self, copier):
         # doesn't need to self.run_once() because only uses original inputs
@@ -114,6 +243,29 @@ class Bed(SnpReader):
         copier.input(SnpReader._name_of_other_file(self.filename,remove_suffix="bed", add_suffix="fam"))
 
 
+    def read_packed(self):
+        """Reads all the SNP values into memory, keeping them in the packed 2-bit format of the '.bed' file.
+
+        :rtype: :class:`.PackedSnpData`
+
+        >>> from pysnptools.snpreader import Bed
+        >>> packed = Bed('../examples/toydata',count_A1=False).read_packed() # 1/32 the memory of a float64 SnpData
+        >>> snpdata = packed[:,::2].read() # decodes from memory, without going back to the disk
+        >>> print snpdata.iid_count, snpdata.sid_count
+        500 5000
+        """
+        from pysnptools.snpreader.packedsnpdata import PackedSnpData
+        self._run_once()
+        nbyte = (self.iid_count+3)//4
+        try:
+            packed = np.array(self._open_mmap()).reshape(self.sid_count,nbyte)
+        except EnvironmentError as e:
+            logging.warn("Can't memory map '{0}', so will read it from disk instead ({1})".format(self.filename,e))
+            self._open_bed()
+            packed = np.fromfile(self._filepointer, dtype=np.uint8, count=nbyte*self.sid_count).reshape(self.sid_count,nbyte)
+            self._close_bed()
+        return PackedSnpData(self.iid, self.sid, packed, pos=self.pos, count_A1=self.count_A1, name=str(self), num_threads=self.num_threads)
+
     @staticmethod
     def write(filename, snpdata, count_A1=False, force_python_only=False):
         """Writes a :class:`SnpData` to Bed format.
@@ -212,6 +364,17 @@ class Bed(SnpReader):
         if order=='A':
             order='F'
 
+        iid_count_out = self.iid_count if iid_index_or_none is None else len(iid_index_or_none)
+        sid_count_out = self.sid_count if sid_index_or_none is None else len(sid_index_or_none)
+        val = np.empty((iid_count_out, sid_count_out), order=order, dtype=dtype)
+        self._read_into(iid_index_or_none, sid_index_or_none, val, force_python_only)
+        return val
+
+    def _read_into(self, iid_index_or_none, sid_index_or_none, val, force_python_only):
+        self._run_once()
+        order = 'F' if val.flags['F_CONTIGUOUS'] else 'C'
+        dtype = val.dtype
+
         assert not hasattr(self, 'ind_used'), "A SnpReader should not have a 'ind_used' attribute"
 
         iid_count_in = self.iid_count
@@ -231,75 +394,137 @@ class Bed(SnpReader):
             sid_count_out = sid_count_in
             sid_index_out = range(sid_count_in)
 
-        if not force_python_only:
+        if not force_python_only and np.dtype(dtype) != np.int8:
             from pysnptools.snpreader import wrap_plink_parser
-            val = np.zeros((iid_count_out, sid_count_out), order=order, dtype=dtype)
-            bed_fn = SnpReader._name_of_other_file(self.filename,"bed","bed")
+            num_threads = self.num_threads or 0 # 0 means use OpenMP's default
+
+            try:
+                bed_bytes = self._open_mmap()
+            except EnvironmentError as e: # e.g. not enough address space, so read the file with fseek/fread instead
+                logging.warn("Can't memory map '{0}', so will read it from disk instead ({1})".format(self.filename,e))
+                bed_bytes = None
 
-            if dtype == np.float64:
+            if bed_bytes is not None and dtype == np.float64:
+                if order=="F":
+                    wrap_plink_parser.readPlinkBedBytes2doubleFAAA(bed_bytes, iid_count_in, self.count_A1, iid_index_out, sid_index_out, val, num_threads)
+                elif order=="C":
+                    wrap_plink_parser.readPlinkBedBytes2doubleCAAA(bed_bytes, iid_count_in, self.count_A1, iid_index_out, sid_index_out, val, num_threads)
+                else:
+                    raise Exception("order '{0}' not known, only 'F' and 'C'".format(order));
+            elif bed_bytes is not None and dtype == np.float32:
                 if order=="F":
-                    wrap_plink_parser.readPlinkBedFile2doubleFAAA(bed_fn, iid_count_in, sid_count_in, self.count_A1, iid_index_out, sid_index_out, val)
+                    wrap_plink_parser.readPlinkBedBytes2floatFAAA(bed_bytes, iid_count_in, self.count_A1, iid_index_out, sid_index_out, val, num_threads)
                 elif order=="C":
-                    wrap_plink_parser.readPlinkBedFile2doubleCAAA(bed_fn, iid_count_in, sid_count_in, self.count_A1, iid_index_out, sid_index_out, val)
+                    wrap_plink_parser.readPlinkBedBytes2floatCAAA(bed_bytes, iid_count_in, self.count_A1, iid_index_out, sid_index_out, val, num_threads)
+                else:
+                    raise Exception("order '{0}' not known, only 'F' and 'C'".format(order));
+            elif dtype == np.float64:
+                bed_fn = SnpReader._name_of_other_file(self.filename,"bed","bed")
+                if order=="F":
+                    wrap_plink_parser.readPlinkBedFile2doubleFAAA(bed_fn, iid_count_in, sid_count_in, self.count_A1, iid_index_out, sid_index_out, val, num_threads)
+                elif order=="C":
+                    wrap_plink_parser.readPlinkBedFile2doubleCAAA(bed_fn, iid_count_in, sid_count_in, self.count_A1, iid_index_out, sid_index_out, val, num_threads)
                 else:
                     raise Exception("order '{0}' not known, only 'F' and 'C'".format(order));
             elif dtype == np.float32:
+                bed_fn = SnpReader._name_of_other_file(self.filename,"bed","bed")
                 if order=="F":
-                    wrap_plink_parser.readPlinkBedFile2floatFAAA(bed_fn, iid_count_in, sid_count_in, self.count_A1, iid_index_out, sid_index_out, val)
+                    wrap_plink_parser.readPlinkBedFile2floatFAAA(bed_fn, iid_count_in, sid_count_in, self.count_A1, iid_index_out, sid_index_out, val, num_threads)
                 elif order=="C":
-                    wrap_plink_parser.readPlinkBedFile2floatCAAA(bed_fn, iid_count_in, sid_count_in, self.count_A1, iid_index_out, sid_index_out, val)
+                    wrap_plink_parser.readPlinkBedFile2floatCAAA(bed_fn, iid_count_in, sid_count_in, self.count_A1, iid_index_out, sid_index_out, val, num_threads)
                 else:
                     raise Exception("order '{0}' not known, only 'F' and 'C'".format(order));
             else:
                 raise Exception("dtype '{0}' not known, only float64 and float32".format(dtype))
             
         else:
-            if not self.count_A1:
-                byteZero = 0
-                byteThree = 2
+            # The C++ reader only knows float64 and float32, so numpy.int8 values are always decoded here, with the look-up table.
+            if np.dtype(dtype) not in (np.float64, np.float32, np.int8):
+                raise Exception("dtype '{0}' not known, only float64, float32, and int8".format(dtype))
+            if force_python_only:
+                logging.warn("using pure python plink parser (might be much slower!!)")
+            byte_lookup = Bed._byte_lookup(self.count_A1, dtype, self.int8_missing)
+            nbyte = (iid_count_in+3)//4
+            iid_index = slice(0,iid_count_in) if iid_index_or_none is None else np.asarray(iid_index_out,dtype=np.intp)
+            sid_index = np.asarray(sid_index_out,dtype=np.intp)
+            run_count_max = max(1,self._python_block_bytes // max(1,nbyte))
+
+            records = None
+            if iid_index_or_none is not None:
+                byte_index = np.unique(iid_index >> 2) # The bytes (of each SNP record) that hold the requested iids
+                if 0 < len(byte_index) < nbyte // 8: # If few are needed, fetch just those bytes from the memory map
+                    try:
+                        records = self._open_mmap().reshape(sid_count_in,nbyte)
+                    except EnvironmentError as e:
+                        logging.warn("Can't memory map '{0}', so will read it from disk instead ({1})".format(self.filename,e))
+
+            if records is not None:
+                byte_position = np.searchsorted(byte_index, iid_index >> 2)
+                genotype_position = iid_index & 0b11
+                sid_count_max = max(1,self._python_block_bytes // len(byte_index))
+                for start in xrange(0,sid_count_out,sid_count_max):
+                    stop = min(start+sid_count_max,sid_count_out)
+                    bytes = records[np.ix_(sid_index[start:stop],byte_index)]
+                    val[:,start:stop] = byte_lookup[bytes][:,byte_position,genotype_position].T
             else:
-                byteZero = 2
-                byteThree = 0
-            # An earlier version of this code had a way to read consecutive SNPs of code in one read. May want
-            # to add that ability back to the code. 
-            # Also, note that reading with python will often result in non-contiguous memory, so the python standardizers will automatically be used, too.       
-            self._open_bed()
-            logging.warn("using pure python plink parser (might be much slower!!)")
-            val = np.zeros(((int(np.ceil(0.25*iid_count_in))*4),sid_count_out),order=order, dtype=dtype) #allocate it a little big
-            for SNPsIndex, bimIndex in enumerate(sid_index_out):
-
-                startbit = int(np.ceil(0.25*iid_count_in)*bimIndex+3)
-                self._filepointer.seek(startbit)
-                nbyte = int(np.ceil(0.25*iid_count_in))
-                bytes = np.array(bytearray(self._filepointer.read(nbyte))).reshape((int(np.ceil(0.25*iid_count_in)),1),order='F')
-
-                val[3::4,SNPsIndex:SNPsIndex+1]=byteZero
-                val[3::4,SNPsIndex:SNPsIndex+1][bytes>=64]=np.nan
-                val[3::4,SNPsIndex:SNPsIndex+1][bytes>=128]=1
-                val[3::4,SNPsIndex:SNPsIndex+1][bytes>=192]=byteThree
-                bytes=np.mod(bytes,64)
-                val[2::4,SNPsIndex:SNPsIndex+1]=byteZero
-                val[2::4,SNPsIndex:SNPsIndex+1][bytes>=16]=np.nan
-                val[2::4,SNPsIndex:SNPsIndex+1][bytes>=32]=1
-                val[2::4,SNPsIndex:SNPsIndex+1][bytes>=48]=byteThree
-                bytes=np.mod(bytes,16)
-                val[1::4,SNPsIndex:SNPsIndex+1]=byteZero
-                val[1::4,SNPsIndex:SNPsIndex+1][bytes>=4]=np.nan
-                val[1::4,SNPsIndex:SNPsIndex+1][bytes>=8]=1
-                val[1::4,SNPsIndex:SNPsIndex+1][bytes>=12]=byteThree
-                bytes=np.mod(bytes,4)
-                val[0::4,SNPsIndex:SNPsIndex+1]=byteZero
-                val[0::4,SNPsIndex:SNPsIndex+1][bytes>=1]=np.nan
-                val[0::4,SNPsIndex:SNPsIndex+1][bytes>=2]=1
-                val[0::4,SNPsIndex:SNPsIndex+1][bytes>=3]=byteThree
-            val = val[iid_index_out,:] #reorder or trim any extra allocation
-
-
-            #!!LATER this can fail because the trim statement above messes up the order
-            #assert(SnpReader._array_properties_are_ok(val, order, dtype)) #!!
-            self._close_bed()
-
-        return val
+                # Visit the SNPs in file order, so that each run of adjacent SNPs can be read with one read. Then scatter the values to the requested columns.
+                sort_order = np.argsort(sid_index, kind='mergesort')
+                sorted_sid_index = sid_index[sort_order]
+
+                self._open_bed()
+                for start, stop in Bed._consecutive_runs(sorted_sid_index, run_count_max):
+                    first_sid_index = sorted_sid_index[start]
+                    run_count = sorted_sid_index[stop-1] - first_sid_index + 1
+                    self._filepointer.seek(nbyte*first_sid_index+3)
+                    bytes = np.fromfile(self._filepointer, dtype=np.uint8, count=nbyte*run_count).reshape(run_count,nbyte)
+                    block = byte_lookup[bytes].reshape(run_count,nbyte*4) #each byte becomes four values with one look-up
+                    if stop-start == run_count and np.all(sort_order[start:stop] == np.arange(sort_order[start],sort_order[start]+run_count)): #common case of SNPs requested in file order
+                        val[:,sort_order[start]:sort_order[start]+run_count] = block[:,iid_index].T
+                    else:
+                        val[:,sort_order[start:stop]] = block[sorted_sid_index[start:stop]-first_sid_index][:,iid_index].T
+                self._close_bed()
+
+    def _read_standardized_into(self, iid_index_or_none, sid_index_or_none, val, standardizer, force_python_only):
+        self._run_once()
+        dtype = val.dtype
+        sid_index_out = sid_index_or_none if sid_index_or_none is not None else range(self.sid_count)
+        sid = self.sid[sid_index_out]
+        args = None if force_python_only or dtype not in (np.float64, np.float32) else standardizer._unit_and_beta_args(sid)
+        bed_bytes = None
+        if args is not None:
+            try:
+                bed_bytes = self._open_mmap()
+            except EnvironmentError as e:
+                logging.warn("Can't memory map '{0}', so will read and then standardize ({1})".format(self.filename,e))
+        if bed_bytes is None:
+            return SnpReader._read_standardized_into(self, iid_index_or_none, sid_index_or_none, val, standardizer, force_python_only)
+
+        # Decode and standardize each SNP in one pass. The mean and stddev come from counting the SNP's genotypes in its packed bytes.
+        from pysnptools.snpreader import wrap_plink_parser
+        from pysnptools.standardizer import Standardizer
+        is_beta, a, b, use_stats, stats = args
+        stats = Standardizer._stats_like(val, stats)
+        iid_index_out = iid_index_or_none if iid_index_or_none is not None else range(self.iid_count)
+        num_threads = self.num_threads or 0 # 0 means use OpenMP's default
+        if dtype == np.float64:
+            if val.flags['F_CONTIGUOUS']:
+                wrap_plink_parser.readPlinkBedBytesStandardize2doubleFAAA(bed_bytes, self.iid_count, self.count_A1, iid_index_out, sid_index_out, val, num_threads, is_beta, a, b, use_stats, stats)
+            else:
+                wrap_plink_parser.readPlinkBedBytesStandardize2doubleCAAA(bed_bytes, self.iid_count, self.count_A1, iid_index_out, sid_index_out, val, num_threads, is_beta, a, b, use_stats, stats)
+        else:
+            if val.flags['F_CONTIGUOUS']:
+                wrap_plink_parser.readPlinkBedBytesStandardize2floatFAAA(bed_bytes, self.iid_count, self.count_A1, iid_index_out, sid_index_out, val, num_threads, is_beta, a, b, use_stats, stats)
+            else:
+                wrap_plink_parser.readPlinkBedBytesStandardize2floatCAAA(bed_bytes, self.iid_count, self.count_A1, iid_index_out, sid_index_out, val, num_threads, is_beta, a, b, use_stats, stats)
+        if not use_stats: #Report what the C++ standardizer that runs after a plain read would report
+            mean = stats[:,0]
+            for index in np.flatnonzero(np.isnan(mean))[:1]:
+                logging.warn("No individual observed for the SNP (SNPs[:][{0}]), so its values are set to zero".format(index))
+            for index in np.flatnonzero(np.isnan(mean) | (is_beta & ((mean > 2.0) | (mean < 0.0))))[:1]:
+                logging.warn("Illegal SNP mean: {0:.2f} for SNPs[:][{1}]".format(mean[index],index))
+            if np.isinf(stats[:,1]).any():
+                logging.warn("A least one snps has only one value, that is, its standard deviation is zero")
+        return standardizer._trained_from_stats(sid, stats)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,152 @@
+import numpy as np
+import logging
+from snpreader import SnpReader
+from bed import Bed
+from pysnptools.pstreader import PstData
+
+class PackedSnpData(SnpReader):
+    '''
+    A :class:`.SnpReader` for holding SNP values in-memory in PLINK's packed 2-bit format, that is, as the bytes of a \*.bed file.
+    It uses 1/32 of the memory of a float64 :class:`.SnpData`. Reading from it (including reading subsets) decodes the bytes on demand, so
+    repeated reads do not go back to the disk. It is usually created by calling the :meth:`.Bed.read_packed` method. It can also be constructed.
+
+    See :class:`.SnpReader` for general examples of using SnpReaders.
+
+    **Constructor:**
+        :Parameters: * **iid** (an array of strings) -- The :attr:`.SnpReader.iid` information
+                     * **sid** (an array of strings) -- The :attr:`.SnpReader.sid` information
+                     * **packed** (a 2-D array of numpy.uint8) -- The SNP values, one row per sid, each row being that SNP's record from a \*.bed file (that is, (iid_count+3)//4 bytes
+                       with four genotypes per byte, the first iid in the lowest two bits).
+                     * **pos** (optional, an array of strings) -- The :attr:`.SnpReader.pos` information
+                     * **count_A1** (*bool*) -- Tells if the bytes should be decoded as the number of A1 alleles (the PLINK standard) or the number of A2 alleles. Defaults to False, like :class:`.Bed`.
+                     * **name** (optional, string) -- Information to be display about the origin of this data
+                     * **num_threads** (optional, *int*) -- The number of threads the C++ decoder uses, as with :class:`.Bed`. If not given, uses OpenMP's default (usually, the number of processors).
+
+        :Example:
+
+        >>> from pysnptools.snpreader import Bed
+        >>> packed = Bed('../examples/toydata',count_A1=False).read_packed()
+        >>> print packed.iid_count, packed.sid_count, packed.packed.nbytes
+        500 10000 1250000
+        >>> snpdata = packed[:3,0].read() # decodes just the requested values to float64
+        >>> print snpdata.val[0,0], snpdata.val[2,0]
+        1.0 2.0
+
+    **Methods beyond** :class:`.SnpReader`
+    '''
+    _block_bytes = 2**21 # The pure python decoder decodes at most this many bytes at once
+    _holds_packed_bytes = True
+
+    def __init__(self, iid, sid, packed, pos=None, count_A1=False, name=None, num_threads=None):
+        self._row = PstData._fixup_input(iid,empty_creator=lambda ignore:np.empty([0,2],dtype=str))
+        self._col = PstData._fixup_input(sid,empty_creator=lambda ignore:np.empty([0],dtype=str))
+        self._col_property = PstData._fixup_input(pos,count=len(self._col),empty_creator=lambda count:np.array([[np.nan, np.nan, np.nan]]*count))
+        self.packed = np.ascontiguousarray(packed,dtype=np.uint8)
+        if self.packed.shape != (len(self._col),(len(self._row)+3)//4):
+            raise Exception("Expect packed to have shape ({0},{1}), that is, sid_count by (iid_count+3)//4 bytes, but it has shape {2}".format(len(self._col),(len(self._row)+3)//4,self.packed.shape))
+        self.count_A1 = count_A1
+        self.num_threads = num_threads
+        self._name = name or ""
+        self._assert_iid_sid_pos()
+
+    packed = None
+    """The 2D NumPy array of numpy.uint8 that holds the SNP values, one row of packed \*.bed bytes per sid.
+
+    >>> from pysnptools.snpreader import Bed
+    >>> packed = Bed('../examples/toydata',count_A1=False).read_packed()
+    >>> print packed.packed.shape, packed.packed.dtype
+    (10000, 125) uint8
+    """
+
+    def __repr__(self):
+        if self._name == "":
+            return "{0}()".format(self.__class__.__name__)
+        else:
+            return "{0}({1})".format(self.__class__.__name__,self._name)
+
+    @property
+    def row(self):
+        """*same as* :attr:`iid`
+        """
+        return self._row
+
+    @property
+    def col(self):
+        """*same as* :attr:`sid`
+        """
+        return self._col
+
+    @property
+    def col_property(self):
+        """*same as* :attr:`pos`
+        """
+        return self._col_property
+
+    def copyinputs(self, copier):
+        pass
+
+    def _sids_reader(self, sid_indexer):
+        return PackedSnpData(self.iid, self.sid[sid_indexer], self.packed[sid_indexer], pos=self.pos[sid_indexer], count_A1=self.count_A1, name=self._name, num_threads=self.num_threads)
+
+    def _genotype_counts(self, iid_index_or_none, sid_index_or_none):
+        if iid_index_or_none is not None and len(np.unique(iid_index_or_none)) != len(iid_index_or_none): # A byte mask can't count an iid twice
+            return SnpReader._genotype_counts(self, iid_index_or_none, sid_index_or_none)
+        return Bed._count_genotypes_in_blocks(self.packed, self.iid_count, iid_index_or_none, sid_index_or_none, self.count_A1, self._block_bytes)
+
+    def _read(self, iid_index_or_none, sid_index_or_none, order, dtype, force_python_only, view_ok):
+        if order=='A':
+            order='F'
+
+        iid_count_out = self.iid_count if iid_index_or_none is None else len(iid_index_or_none)
+        sid_count_out = self.sid_count if sid_index_or_none is None else len(sid_index_or_none)
+        val = np.empty((iid_count_out, sid_count_out), order=order, dtype=dtype)
+        self._read_into(iid_index_or_none, sid_index_or_none, val, force_python_only)
+        return val
+
+    def _read_into(self, iid_index_or_none, sid_index_or_none, val, force_python_only):
+        order = 'F' if val.flags['F_CONTIGUOUS'] else 'C'
+        dtype = val.dtype
+
+        iid_count_in = self.iid_count
+        iid_index_out = iid_index_or_none if iid_index_or_none is not None else range(iid_count_in)
+        sid_index_out = sid_index_or_none if sid_index_or_none is not None else range(self.sid_count)
+        sid_count_out = len(sid_index_out)
+
+        if not force_python_only and np.dtype(dtype) != np.int8:
+            from pysnptools.snpreader import wrap_plink_parser
+            bed_bytes = self.packed.reshape(-1)
+            num_threads = self.num_threads or 0 # 0 means use OpenMP's default
+            if dtype == np.float64:
+                if order=="F":
+                    wrap_plink_parser.readPlinkBedBytes2doubleFAAA(bed_bytes, iid_count_in, self.count_A1, iid_index_out, sid_index_out, val, num_threads)
+                elif order=="C":
+                    wrap_plink_parser.readPlinkBedBytes2doubleCAAA(bed_bytes, iid_count_in, self.count_A1, iid_index_out, sid_index_out, val, num_threads)
+                else:
+                    raise Exception("order '{0}' not known, only 'F' and 'C'".format(order));
+            elif dtype == np.float32:
+                if order=="F":
+                    wrap_plink_parser.readPlinkBedBytes2floatFAAA(bed_bytes, iid_count_in, self.count_A1, iid_index_out, sid_index_out, val, num_threads)
+                elif order=="C":
+                    wrap_plink_parser.readPlinkBedBytes2floatCAAA(bed_bytes, iid_count_in, self.count_A1, iid_index_out, sid_index_out, val, num_threads)
+                else:
+                    raise Exception("order '{0}' not known, only 'F' and 'C'".format(order));
+            else:
+                raise Exception("dtype '{0}' not known, only float64 and float32".format(dtype))
+        else:
+            if np.dtype(dtype) not in (np.float64, np.float32, np.int8):
+                raise Exception("dtype '{0}' not known, only float64, float32, and int8".format(dtype))
+            byte_lookup = Bed._byte_lookup(self.count_A1, dtype, self.int8_missing)
+            nbyte = self.packed.shape[1]
+            iid_index = slice(0,iid_count_in) if iid_index_or_none is None else np.asarray(iid_index_out,dtype=np.intp)
+            sid_index = np.asarray(sid_index_out,dtype=np.intp)
+            sid_count_max = max(1,self._block_bytes // max(1,nbyte))
+            for start in xrange(0,sid_count_out,sid_count_max):
+                stop = min(start+sid_count_max,sid_count_out)
+                block = byte_lookup[self.packed[sid_index[start:stop]]].reshape(stop-start,nbyte*4) #each byte becomes four values with one look-up
+                val[:,start:stop] = block[:,iid_index].T
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    import doctest
+    doctest.testmod()
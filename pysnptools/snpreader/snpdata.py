@@ -130,7 +130,10 @@ class SnpData(PstData,SnpReader):
         else:
             return self
 
-    def _read_kernel(train, standardizer, block_size=None, order='A', dtype=np.float64, force_python_only=False, view_ok=False, return_trained=False):
+    def _sids_reader(self, sid_indexer):
+        return SnpData(iid=self.iid, sid=self.sid[sid_indexer], val=self.val[:,sid_indexer], pos=self.pos[sid_indexer], name=self._name)
+
+    def _read_kernel(train, standardizer, block_size=None, order='A', dtype=np.float64, force_python_only=False, view_ok=False, return_trained=False, num_processes=None):
         '''
         The method creates a kernel for the in-memory SNP data. It handles these cases
                 * No standardization is needed & everything is in memory  OR uses the FROM-DISK method
@@ -143,10 +146,9 @@ class SnpData(PstData,SnpReader):
             ts = time.time()
             #is_worth_logging = train.val.shape[0] * train.val.shape[1] * test.val.shape[0] > 1e9
             #if is_worth_logging: logging.info("  _read_kernel about to multiply train{0} x test{1}".format(train.val.shape,test.val.shape))
-            if order == 'F': #numpy's 'dot' always returns 'C' order
-                K = (train.val.dot(train.val.T)).T
-            else:
-                K = train.val.dot(train.val.T)
+            K = SnpReader._mirror_upper(SnpReader._syrk(train.val)) #syrk computes just one triangle of the symmetric product and returns 'F' order
+            if order != 'F':
+                K = K.T #K is symmetric, so its transpose is the same kernel in 'C' order
             assert PstReader._array_properties_are_ok(K,order,dtype), "internal error: K is not of the expected order or dtype"
             #if is_worth_logging: logging.info("  _read_kernel took %.2f seconds" % (time.time()-ts))
             if return_trained:
@@ -154,7 +156,13 @@ class SnpData(PstData,SnpReader):
             else:
                 return K
         else: #Do things the more general SnpReader way.
-            return SnpReader._read_kernel(train, standardizer, block_size=block_size, order=order, dtype=dtype, force_python_only=force_python_only,view_ok=view_ok, return_trained=return_trained)
+            return SnpReader._read_kernel(train, standardizer, block_size=block_size, order=order, dtype=dtype, force_python_only=force_python_only,view_ok=view_ok, return_trained=return_trained, num_processes=num_processes)
+
+    def _read(self, iid_index_or_none, sid_index_or_none, order, dtype, force_python_only, view_ok):
+        if dtype is not None and (np.dtype(dtype) == np.int8) != (self.val.dtype == np.int8): #Converting to or from int8, so missing values must be translated
+            val = PstData._read(self, iid_index_or_none, sid_index_or_none, order, self.val.dtype, force_python_only, view_ok=True)
+            return SnpReader._astype(val, order, dtype, self.int8_missing)
+        return PstData._read(self, iid_index_or_none, sid_index_or_none, order, dtype, force_python_only, view_ok)
 
     def __repr__(self):
         if self._name == "":
@@ -403,7 +403,7 @@ class SnpReader(PstReader):
         raise NotImplementedError
     
     #!!check that views always return contiguous memory by default
-    def read(self, order='F', dtype=np.float64, force_python_only=False, view_ok=False):
+    def read(self, order='F', dtype=np.float64, force_python_only=False, view_ok=False, standardizer=None):
         """Reads the SNP values and returns a :class:`.SnpData` (with :attr:`.SnpData.val` property containing a new ndarray of the SNP values).
 
         :param order: {'F' (default), 'C', 'A'}, optional -- Specify the order of the ndarray. If order is 'F' (default),
@@ -413,7 +413,9 @@ class SnpReader(PstReader):
             ndarray may be in any order (either C-, Fortran-contiguous).
         :type order: string or None
 
-        :param dtype: {scipy.float64 (default), scipy.float32}, optional -- The data-type for the :attr:`.SnpData.val` ndarray.
+        :param dtype: {scipy.float64 (default), scipy.float32, numpy.int8}, optional -- The data-type for the :attr:`.SnpData.val` ndarray.
+            With numpy.int8, missing values are given as :attr:`int8_missing` rather than NaN. (Only some readers, for example :class:`.Bed` and
+            :class:`.SnpData`, support numpy.int8.)
         :type dtype: data-type
 
         :param force_python_only: optional -- If False (default), may use outside library code. If True, requests that the read
@@ -429,6 +431,12 @@ class SnpReader(PstReader):
             share memory and so it may ignore your suggestion and allocate a new ndarray anyway.
         :type view_ok: bool
 
+        :param standardizer: optional -- If given, the values are standardized with this :class:`.Standardizer` as they are read. The result
+            is the same as from "read().standardize(standardizer)", but :class:`.Bed` (with :class:`.Unit`, :class:`.Beta`, and their trained
+            versions) decodes and standardizes each SNP in one pass, so the ndarray is written once rather than written and then swept twice more.
+            Memory is never shared (view_ok is ignored).
+        :type standardizer: :class:`.Standardizer`
+
         :rtype: :class:`.SnpData`
 
         Calling the method again causes the SNP values to be re-read and creates a new in-memory :class:`.SnpData` with a new ndarray of SNP values.
@@ -448,12 +456,217 @@ class SnpReader(PstReader):
         >>> subsub_snpdata = subset_snpdata[:10,:].read(order='A',view_ok=True) # Create an in-memory subset of the subset with SNP values for the first ten iids. Share memory if practical.
         >>> import numpy as np
         >>> # print np.may_share_memory(subset_snpdata.val, subsub_snpdata.val) # Do the two ndarray's share memory? They could. Currently they won't.       
+        >>> from pysnptools.standardizer import Unit
+        >>> snpdata3 = snp_on_disk.read(standardizer=Unit()) # Read and standardize in one pass
+        >>> print "{0:.6f}".format(snpdata3.val[0,0])
+        0.229416
         """
+        if standardizer is not None:
+            snpdata, _ = self._read_standardized(standardizer, order=order, dtype=dtype, force_python_only=force_python_only)
+            return snpdata
         val = self._read(None, None, order, dtype, force_python_only, view_ok)
         from snpdata import SnpData
         ret = SnpData(self.iid,self.sid,val,pos=self.pos,name=str(self))
         return ret
 
+    def iter_blocks(self, block_size, order='F', dtype=np.float64, standardizer=None, force_python_only=False):
+        """Reads the SNP values a block of sids at a time. Yields a :class:`.SnpData` for each block.
+
+        :param block_size: The number of sids in each block (the last block may be smaller).
+        :type block_size: int
+
+        :param order: {'F' (default), 'C', 'A'}, optional -- The order of each block's ndarray. 'A' means 'F'.
+        :type order: string
+
+        :param dtype: {scipy.float64 (default), scipy.float32, numpy.int8}, optional -- The data-type of each block's ndarray.
+        :type dtype: data-type
+
+        :param standardizer: optional -- If given, each block will be standardized, in place, with this :class:`.Standardizer`.
+        :type standardizer: :class:`.Standardizer`
+
+        :param force_python_only: optional -- If true, will use pure Python instead of faster C++ libraries.
+        :type force_python_only: bool
+
+        :rtype: generator of :class:`.SnpData`
+
+        All the blocks share one preallocated ndarray, so memory use does not grow with the number of sids. However, this means that
+        each block's :attr:`.SnpData.val` is overwritten by the next block. To keep a block, copy it, for example, with :meth:`.SnpData.read`.
+
+        :Example:
+
+        >>> from pysnptools.snpreader import Bed
+        >>> from pysnptools.standardizer import Unit
+        >>> snp_on_disk = Bed('../examples/toydata',count_A1=False)
+        >>> for snpdata in snp_on_disk.iter_blocks(block_size=4000,standardizer=Unit()):
+        ...     print snpdata.sid_count, snpdata.sid[0]
+        4000 null_0
+        4000 null_4000
+        2000 null_8000
+        """
+        if block_size < 1:
+            raise Exception("block_size must be at least 1")
+        if order == 'A':
+            order = 'F'
+        buffer = np.empty(self.iid_count * min(block_size,self.sid_count), dtype=dtype)
+        for start in xrange(0, self.sid_count, block_size):
+            if standardizer is not None:
+                snpdata, _ = self._read_block_standardized(start, min(start+block_size,self.sid_count), buffer, order, standardizer, force_python_only)
+            else:
+                snpdata = self._read_block(start, min(start+block_size,self.sid_count), buffer, order, force_python_only)
+            yield snpdata
+
+    def _read_block(self, start, stop, buffer, order, force_python_only):
+        '''
+        Reads sids start to stop into a contiguous view of the front of buffer (a 1-D ndarray) and returns them as a :class:`.SnpData`.
+        '''
+        from snpdata import SnpData
+        val = buffer[:self.iid_count*(stop-start)].reshape((self.iid_count,stop-start),order=order)
+        self._read_into(None, np.arange(start,stop), val, force_python_only)
+        return SnpData(self.iid, self.sid[start:stop], val, pos=self.pos[start:stop], name="{0}[:,{1}:{2}]".format(self,start,stop))
+
+    def _read_block_standardized(self, start, stop, buffer, order, standardizer, force_python_only):
+        '''
+        Like _read_block, but also standardizes the block (see :meth:`_read_standardized_into`). Returns (snpdata, trained_standardizer).
+        '''
+        from snpdata import SnpData
+        val = buffer[:self.iid_count*(stop-start)].reshape((self.iid_count,stop-start),order=order)
+        trained_standardizer = self._read_standardized_into(None, np.arange(start,stop), val, standardizer, force_python_only)
+        snpdata = SnpData(self.iid, self.sid[start:stop], val, pos=self.pos[start:stop], name="{0}[:,{1}:{2}]".format(self,start,stop))
+        snpdata._std_string_list.append(str(standardizer))
+        return snpdata, trained_standardizer
+
+    def _read_standardized(self, standardizer, order='F', dtype=np.float64, force_python_only=False):
+        '''
+        Like read(standardizer=standardizer), but returns (snpdata, trained_standardizer).
+        '''
+        from snpdata import SnpData
+        if order == 'A':
+            order = 'F'
+        val = np.empty((self.iid_count, self.sid_count), order=order, dtype=dtype)
+        trained_standardizer = self._read_standardized_into(None, None, val, standardizer, force_python_only)
+        snpdata = SnpData(self.iid, self.sid, val, pos=self.pos, name=str(self))
+        snpdata._std_string_list.append(str(standardizer))
+        return snpdata, trained_standardizer
+
+    def _iter_blocks_prefetched(self, block_size, order, dtype, standardizer, force_python_only):
+        '''
+        Yields (snpdata, trained_standardizer) for each block of sids. A background thread reads and standardizes the next block into a second
+        buffer while the caller works on the current block, so, for example, reading from disk overlaps with matrix multiplication.
+        (The C++ reader and standardizer release the GIL.) Each block's buffer is reused after the caller asks for the block after next.
+        '''
+        import threading
+        import Queue
+        free_queue = Queue.Queue()
+        ready_queue = Queue.Queue()
+        for _ in xrange(2): # double buffering
+            free_queue.put(np.empty(self.iid_count * min(block_size,self.sid_count), dtype=dtype))
+        stop_event = threading.Event()
+
+        def prefetch():
+            try:
+                for start in xrange(0, self.sid_count, block_size):
+                    buffer = free_queue.get()
+                    if stop_event.is_set():
+                        return
+                    snpdata, trained_standardizer = self._read_block_standardized(start, min(start+block_size,self.sid_count), buffer, order, standardizer, force_python_only)
+                    ready_queue.put((buffer, snpdata, trained_standardizer))
+            except:
+                ready_queue.put((None, sys.exc_info(), None))
+
+        thread = threading.Thread(target=prefetch, name="prefetch {0}".format(self))
+        thread.daemon = True
+        thread.start()
+        try:
+            for _ in xrange(0, self.sid_count, block_size):
+                buffer, snpdata, trained_standardizer = ready_queue.get()
+                if buffer is None: # the prefetch thread failed, so re-raise its exception here
+                    exc_type, exc_value, exc_traceback = snpdata
+                    raise exc_type, exc_value, exc_traceback
+                yield snpdata, trained_standardizer
+                free_queue.put(buffer)
+        finally:
+            stop_event.set()
+            free_queue.put(None) # wake the prefetch thread if it is waiting for a buffer
+            thread.join()
+
+    def _read_into(self, iid_index_or_none, sid_index_or_none, val, force_python_only):
+        '''
+        Like _read, but puts the values into val, an existing 'C' or 'F' contiguous ndarray. Readers that can decode directly into val, such as :class:`.Bed`, override this.
+        '''
+        val[:,:] = self._read(iid_index_or_none, sid_index_or_none, 'F' if val.flags['F_CONTIGUOUS'] else 'C', val.dtype, force_python_only, True)
+
+    def _read_standardized_into(self, iid_index_or_none, sid_index_or_none, val, standardizer, force_python_only):
+        '''
+        Like _read_into, but also standardizes val, in place, with standardizer. Returns the trained standardizer. Readers that can
+        standardize values as they decode them, such as :class:`.Bed`, override this.
+        '''
+        from snpdata import SnpData
+        self._read_into(iid_index_or_none, sid_index_or_none, val, force_python_only)
+        iid = self.iid if iid_index_or_none is None else self.iid[iid_index_or_none]
+        sid = self.sid if sid_index_or_none is None else self.sid[sid_index_or_none]
+        _, trained_standardizer = standardizer.standardize(SnpData(iid, sid, val), return_trained=True, force_python_only=force_python_only)
+        return trained_standardizer
+
+    int8_missing = -127
+    '''The value that stands for a missing SNP value when values are read with dtype numpy.int8 (float dtypes use NaN).
+    It can be changed for a particular reader (or for all readers, by setting :attr:`SnpReader.int8_missing`).
+
+    >>> from pysnptools.snpreader import Bed
+    >>> snp_on_disk = Bed('../examples/toydata',count_A1=False)
+    >>> snpdata = snp_on_disk.read(dtype='int8') # 1 byte per value
+    >>> print snpdata.val.dtype, snpdata.val[0,:3]
+    int8 [1 2 2]
+    >>> print snpdata.read(dtype='float32').val[0,:3] # in-memory conversion to a float dtype
+    [ 1.  2.  2.]
+    '''
+
+    @staticmethod
+    def _astype(val, order, dtype, int8_missing):
+        '''
+        Like val.astype(dtype,order), but when converting between numpy.int8 and a float dtype, also translates missing values between int8_missing and NaN.
+        '''
+        dtype = np.dtype(dtype)
+        with np.errstate(invalid='ignore'):
+            result = val.astype(dtype, order=order)
+        if dtype == np.int8 and val.dtype != np.int8:
+            result[np.isnan(val)] = int8_missing
+        elif dtype != np.int8 and val.dtype == np.int8:
+            result[val == int8_missing] = np.nan
+        return result
+
+    def genotype_counts(self):
+        """Returns, for each sid, the number of iids with SNP value 0, 1, 2, and missing.
+
+        :rtype: ndarray of int with size :attr:`.sid_count` x 4
+
+        Readers of packed 2-bit data, such as :class:`.Bed` and :class:`.PackedSnpData` (and subsets of them), count the genotypes directly from the packed
+        bytes, without decoding them to floats. Other readers decode their values a block of sids at a time. Either way, the values must be 0, 1, 2, or missing.
+
+        :Example:
+
+        >>> from pysnptools.snpreader import Bed
+        >>> snp_on_disk = Bed('../examples/toydata',count_A1=False)
+        >>> print snp_on_disk[:,:3].genotype_counts() # the number of 0's, 1's, 2's, and missing values for the first three sids
+        [[ 79 236 185   0]
+         [ 17 142 341   0]
+         [ 21 161 318   0]]
+        """
+        return self._genotype_counts(None, None)
+
+    _holds_packed_bytes = False # True for readers, such as Bed and PackedSnpData, that count genotypes from packed bytes
+
+    def _genotype_counts(self, iid_index_or_none, sid_index_or_none):
+        iid_count = self.iid_count if iid_index_or_none is None else len(iid_index_or_none)
+        sid_index = np.arange(self.sid_count) if sid_index_or_none is None else np.asarray(sid_index_or_none,dtype=np.intp)
+        sid_count_max = max(1,2**21 // max(1,iid_count)) # Decode about 8 MB of float32 values at a time
+        counts = np.empty((len(sid_index),4),dtype=np.int64)
+        for start in xrange(0,len(sid_index),sid_count_max):
+            val = self._read(iid_index_or_none, sid_index[start:start+sid_count_max], 'F', np.float32, False, True)
+            counts[start:start+sid_count_max] = np.column_stack([(val==0).sum(axis=0), (val==1).sum(axis=0), (val==2).sum(axis=0), np.isnan(val).sum(axis=0)])
+        if not np.all(counts.sum(axis=1) == iid_count):
+            raise Exception("Can only count genotypes if every value is 0, 1, 2, or missing")
+        return counts
+
     def iid_to_index(self, list):
         """Takes a list of iids and returns a list of index numbers
 
@@ -497,7 +710,15 @@ class SnpReader(PstReader):
         iid_indexer, snp_indexer = iid_indexer_and_snp_indexer
         return _Subset(self, iid_indexer, snp_indexer)
 
-    def read_kernel(self, standardizer=None, block_size=None, order='A', dtype=np.float64, force_python_only=False, view_ok=False):
+    def _sids_reader(self, sid_indexer):
+        '''
+        Returns a reader of just these sids (and all iids) that is cheap to send to another process. A reader of a file pickles as little
+        more than its file name, so this is just a subset. In-memory readers, such as :class:`.SnpData`, instead return a copy of just these sids,
+        so that their other values are not sent, too.
+        '''
+        return self[:,sid_indexer]
+
+    def read_kernel(self, standardizer=None, block_size=None, order='A', dtype=np.float64, force_python_only=False, view_ok=False, num_processes=None):
         """Returns a :class:`KernelData` such that the :meth:`KernelData.val` property will be a ndarray of the standardized SNP values multiplied with their transposed selves.
 
         :param standardizer: -- (required) Specify standardization to be applied before the matrix multiply. Any :class:`.Standardizer` may be used. Some choices include :class:`Standardizer.Identity` 
@@ -507,6 +728,12 @@ class SnpReader(PstReader):
         :param block_size: optional -- Default of None (meaning to load all). Suggested number of sids to read into memory at a time.
         :type block_size: int or None
 
+        :param num_processes: optional -- Default of None (meaning to use just this process). If greater than 1, the sids are split into this many ranges,
+            and each range is given to its own worker process, which adds the product of each of its blocks directly into one kernel in shared memory.
+            Workers are sent just their range of sids (for in-memory SNP data such as :class:`.SnpData`, a copy of just those values). Unit and Beta are
+            trained by each worker on its range. Standardizers, such as :class:`.DiagKtoN`, that depend on all the sids are first trained in this process.
+        :type num_processes: int or None
+
         :rtype: class:`KernelData`
 
         Calling the method again causes the SNP values to be re-read and allocates a new class:`KernelData`.
@@ -525,7 +752,7 @@ class SnpReader(PstReader):
         assert standardizer is not None, "'standardizer' must be provided"
 
         from pysnptools.kernelreader import SnpKernel
-        snpkernel = SnpKernel(self,standardizer=standardizer,block_size=block_size)
+        snpkernel = SnpKernel(self,standardizer=standardizer,block_size=block_size,num_processes=num_processes)
         kerneldata = snpkernel.read(order, dtype, force_python_only, view_ok)
         return kerneldata
 
@@ -564,6 +791,41 @@ class SnpReader(PstReader):
             block_size = blocksize
         return self._read_kernel(standardizer, block_size=block_size)
 
+    @staticmethod
+    def _syrk(val, K=None):
+        '''
+        Returns val.dot(val.T), in 'F' order, computed with BLAS ?syrk. Because the result is symmetric, ?syrk computes just its upper triangle,
+        which is half the work of a general matrix multiply. Call :meth:`_mirror_upper` before using the lower triangle.
+
+        If K (an 'F' order ndarray with val's dtype) is given, the product is instead added to the upper triangle of K, in place, and K is returned.
+        '''
+        import scipy.linalg.blas as blas
+        if val.shape[0] == 0:
+            return np.zeros((0,0),dtype=val.dtype,order='F') if K is None else K
+        if val.flags['F_CONTIGUOUS']:
+            a, trans = val, 0
+        else:
+            a, trans = val.T, 1 # val.T.T.dot(val.T) is the same product and, when val is 'C' order, val.T is 'F' order and needs no copy
+        syrk = blas.get_blas_funcs('syrk', (a,))
+        if K is None:
+            return syrk(alpha=1.0, a=a, trans=trans)
+        else:
+            assert K.flags['F_CONTIGUOUS'] and K.dtype == val.dtype, "Expect K to be 'F' order with the same dtype as val"
+            return syrk(alpha=1.0, a=a, beta=1.0, c=K, trans=trans, overwrite_c=True) # C = A A^T + C, with no temporary
+
+    @staticmethod
+    def _mirror_upper(K, block_size=1000):
+        '''
+        Copies the upper triangle of the square ndarray K to its lower triangle, in place, a block of rows at a time.
+        '''
+        for start in xrange(0, K.shape[0], block_size):
+            stop = min(start+block_size, K.shape[0])
+            K[start:stop,:start] = K[:start,start:stop].T
+            diagonal_block = K[start:stop,start:stop]
+            lower = np.tril_indices(stop-start,-1)
+            diagonal_block[lower] = diagonal_block.T[lower]
+        return K
+
     @staticmethod
     def _as_snpdata(snpreader, standardizer, force_python_only, dtype):
         '''
@@ -573,9 +835,28 @@ class SnpReader(PstReader):
         if isinstance(snpreader,SnpData) and snpreader.val.dtype==dtype and isinstance(standardizer,stdizer.Identity):
             return snpreader, stdizer.Identity()
         else:
-            return snpreader.read(order='A',dtype=dtype).standardize(standardizer,return_trained=True,force_python_only=force_python_only)
+            return snpreader._read_standardized(standardizer,order='A',dtype=dtype,force_python_only=force_python_only)
     
-    def _read_kernel(self, standardizer, block_size=None, order='A', dtype=np.float64, force_python_only=False, view_ok=False, return_trained=False):
+    def _train_standardizer(self, standardizer, block_size=None, dtype=np.float64, force_python_only=False):
+        '''
+        Returns a constant (trained) version of standardizer, learned from all the SNP data. On readers of packed bytes, Unit and Beta train from
+        genotype counts. Otherwise, standardizers are trained one block of sids at a time (never the whole SNP matrix at once) and then merged.
+        (Genotype counts can't be used in general, because other readers may have values other than 0, 1, 2, and missing.)
+        '''
+        if standardizer.is_constant:
+            return standardizer
+        if hasattr(standardizer,'train') and self._holds_packed_bytes:
+            return standardizer.train(self)
+        block_size = block_size or self.sid_count
+        trained_standardizer_list = [trained_standardizer for _, trained_standardizer in self._iter_blocks_prefetched(max(1,block_size),order='F',dtype=dtype,standardizer=standardizer,force_python_only=force_python_only)]
+        if len(trained_standardizer_list) == 1:
+            return trained_standardizer_list[0]
+        return standardizer._merge_trained(trained_standardizer_list)
+
+    def _read_kernel(self, standardizer, block_size=None, order='A', dtype=np.float64, force_python_only=False, view_ok=False, return_trained=False, num_processes=None):
+        if num_processes is not None and num_processes > 1 and self.sid_count > 1:
+            return self._read_kernel_in_processes(standardizer, block_size, order, dtype, force_python_only, return_trained, num_processes)
+
         #Do all-at-once (not in blocks) if 1. No block size is given or 2. The #ofSNPs < Min(block_size,iid_count)
         if block_size is None or (self.sid_count <= block_size or self.sid_count <= self.iid_count):
             train_data,trained_standardizer  = SnpReader._as_snpdata(self,standardizer=standardizer,dtype=dtype,force_python_only=force_python_only)
@@ -586,11 +867,9 @@ class SnpReader(PstReader):
                 return kernel
 
         else: #Do in blocks
-            #Set the default order to 'C' because with kernels any order is fine and the Python .dot method likes 'C' best.
-            if order=='A':
-                order = 'C'
+            #Each block's product is added, in place, to the upper triangle of one 'F' order kernel, so the only large allocations are the kernel and two blocks.
             t0 = time.time()
-            K = np.zeros([self.iid_count,self.iid_count],dtype=dtype,order=order)
+            K = np.zeros([self.iid_count,self.iid_count],dtype=dtype,order='F')
             trained_standardizer_list = []
 
             logging.info("reading {0} SNPs in blocks of {1} and adding up kernels (for {2} individuals)".format(self.sid_count, block_size, self.iid_count))
@@ -598,15 +877,18 @@ class SnpReader(PstReader):
             ct = 0
             ts = time.time()
 
-            for start in xrange(0, self.sid_count, block_size):
+            for train_data,trained_standardizer in self._iter_blocks_prefetched(block_size,order='F',dtype=dtype,standardizer=standardizer,force_python_only=force_python_only):
                 ct += block_size
-                train_data,trained_standardizer = SnpReader._as_snpdata(self[:,start:start+block_size],standardizer=standardizer,dtype=dtype,force_python_only=force_python_only)
                 trained_standardizer_list.append(trained_standardizer)
-                K += train_data._read_kernel(stdizer.Identity(),block_size=None,order=order,dtype=dtype,force_python_only=force_python_only,view_ok=False)
+                K = SnpReader._syrk(train_data.val, K)
                 if ct % block_size==0:
                     diff = time.time()-ts
                     if diff > 1: logging.info("read %s SNPs in %.2f seconds" % (ct, diff))
 
+            SnpReader._mirror_upper(K)
+            if order=='C':
+                K = K.T #K is symmetric, so its transpose is the same kernel in 'C' order
+
             t1 = time.time()
             logging.info("%.2f seconds elapsed" % (t1-t0))
 
@@ -615,6 +897,83 @@ class SnpReader(PstReader):
             else:
                 return K
 
+    def _read_cross_kernel(self, standardizer, row_index, col_index, block_size=None, order='A', dtype=np.float64, force_python_only=False):
+        '''
+        Returns X[row_index] X[col_index]^T, where X is the SNP data standardized with standardizer, a constant (that is, trained) :class:`.Standardizer`.
+        Only the SNP data of the requested iids is read, block_size sids at a time, so the work is proportional to the size of the result, not the whole kernel.
+        If row_index and col_index are the same, the rows are read just once and the product is computed with syrk.
+        '''
+        import scipy.linalg.blas as blas
+        assert standardizer.is_constant, "Expect standardizer to be trained"
+        row_index = np.asarray(row_index,dtype=np.intp)
+        col_index = np.asarray(col_index,dtype=np.intp)
+        row_count = len(row_index)
+        is_square = np.array_equal(row_index,col_index)
+        K = np.zeros((row_count,len(col_index)),dtype=dtype,order='F')
+        if row_count > 0 and len(col_index) > 0 and self.sid_count > 0:
+            snpreader = self[row_index,:] if is_square else self[np.r_[row_index,col_index],:]
+            # 'C' order blocks make the rows for row_index and col_index each a contiguous slice, so BLAS can use them without copying
+            for snpdata, _ in snpreader._iter_blocks_prefetched(max(1,block_size or self.sid_count),order='C',dtype=dtype,standardizer=standardizer,force_python_only=force_python_only):
+                if is_square:
+                    K = SnpReader._syrk(snpdata.val, K)
+                else:
+                    a, b = snpdata.val[:row_count].T, snpdata.val[row_count:].T
+                    gemm = blas.get_blas_funcs('gemm', (a,b))
+                    K = gemm(alpha=1.0, a=a, b=b, trans_a=1, beta=1.0, c=K, overwrite_c=True) # K += A B^T, with no temporary
+            if is_square:
+                SnpReader._mirror_upper(K)
+        if order == 'C':
+            K = np.array(K,order='C')
+        return K
+
+    def _read_kernel_in_processes(self, standardizer, block_size, order, dtype, force_python_only, return_trained, num_processes):
+        '''
+        Splits the sids into num_processes contiguous ranges and gives each range to a worker process. Each worker gets a reader of just its range
+        (for a :class:`.Bed`, its own file handle) and, for each block of block_size sids, adds the block's partial kernel to the upper triangle of
+        one kernel in shared memory. The kernel's columns are split into stripes, each with its own lock. A worker computes a stripe's partial product
+        without holding any lock and then adds it in under just that stripe's lock, so workers compute concurrently. Workers start at different stripes.
+
+        Unit and Beta standardize each SNP on its own, so each worker trains on its own range and the trained standardizers are merged. Other standardizers
+        that still need training, for example, :class:`.DiagKtoN`, depend on all the sids, so they are trained (in this process) before the workers start.
+        '''
+        import multiprocessing
+        import multiprocessing.sharedctypes
+
+        t0 = time.time()
+        iid_count = self.iid_count
+        workers_train = not standardizer.is_constant and standardizer._unit_and_beta_args(self.sid) is not None
+        if workers_train or standardizer.is_constant:
+            worker_standardizer = standardizer
+        else:
+            worker_standardizer = self._train_standardizer(standardizer, block_size=block_size, dtype=dtype, force_python_only=force_python_only)
+        sid_start_list = [sid_index[0] for sid_index in np.array_split(np.arange(self.sid_count), min(num_processes,self.sid_count))] + [self.sid_count]
+        worker_count = len(sid_start_list)-1
+        stripe_list = [(stripe[0],stripe[-1]+1) for stripe in np.array_split(np.arange(iid_count), min(iid_count,4*worker_count)) if len(stripe) > 0]
+        task_list = [(self._sids_reader(slice(sid_start_list[i],sid_start_list[i+1])),worker_standardizer,workers_train,block_size,dtype,force_python_only,i*len(stripe_list)//worker_count) for i in xrange(worker_count)]
+        logging.info("reading {0} SNPs in {1} processes and adding up kernels (for {2} individuals)".format(self.sid_count, worker_count, iid_count))
+
+        shared_kernel = multiprocessing.sharedctypes.RawArray(np.dtype(dtype).char, iid_count*iid_count) #starts as all zeros
+        pool = multiprocessing.Pool(worker_count, initializer=_kernel_worker_init, initargs=(shared_kernel,stripe_list,[multiprocessing.Lock() for _ in stripe_list]))
+        try:
+            trained_standardizer_list = pool.map(_kernel_worker, task_list, chunksize=1)
+            pool.close()
+        except:
+            pool.terminate()
+            raise
+        finally:
+            pool.join()
+
+        K = SnpReader._mirror_upper(np.frombuffer(shared_kernel, dtype=dtype).reshape((iid_count,iid_count),order='F'))
+        if order=='C':
+            K = K.T #K is symmetric, so its transpose is the same kernel in 'C' order
+
+        logging.info("%.2f seconds elapsed" % (time.time()-t0))
+
+        if return_trained:
+            return K, standardizer._merge_trained(trained_standardizer_list) if workers_train else worker_standardizer
+        else:
+            return K
+
     def copyinputs(self, copier):
         raise NotImplementedError
 
@@ -673,6 +1032,36 @@ class SnpReader(PstReader):
             pos = fields.as_matrix([0,2,3])
             return sid,pos
 
+_shared_kernel = None
+_shared_kernel_stripe_list = None
+_shared_kernel_lock_list = None
+
+def _kernel_worker_init(shared_kernel, stripe_list, lock_list):
+    global _shared_kernel, _shared_kernel_stripe_list, _shared_kernel_lock_list
+    _shared_kernel = shared_kernel
+    _shared_kernel_stripe_list = stripe_list
+    _shared_kernel_lock_list = lock_list
+
+def _kernel_worker(task):
+    '''
+    Run in a worker process by :meth:`SnpReader._read_kernel_in_processes`. Adds the partial kernel of each block of one range of sids, a column stripe at
+    a time, to the upper triangle of the shared kernel. If train is True, returns the standardizer trained on the range. Otherwise, returns None.
+    '''
+    snpreader, standardizer, train, block_size, dtype, force_python_only, first_stripe = task
+    K = np.frombuffer(_shared_kernel, dtype=dtype).reshape((snpreader.iid_count,snpreader.iid_count),order='F')
+    stripe_count = len(_shared_kernel_stripe_list)
+    trained_standardizer_list = []
+    # 'C' order blocks make the rows of each stripe a contiguous slice, so BLAS can use them without copying
+    for snpdata, trained_standardizer in snpreader._iter_blocks_prefetched(max(1,block_size or snpreader.sid_count),order='C',dtype=dtype,standardizer=standardizer,force_python_only=force_python_only):
+        trained_standardizer_list.append(trained_standardizer)
+        for stripe_index in [(first_stripe + i) % stripe_count for i in xrange(stripe_count)]:
+            start, stop = _shared_kernel_stripe_list[stripe_index]
+            partial = snpdata.val[:stop].dot(snpdata.val[start:stop].T) #the stripe's columns, down to (and including) the diagonal
+            with _shared_kernel_lock_list[stripe_index]:
+                K[:stop,start:stop] += partial
+    if not train:
+        return None
+    return trained_standardizer_list[0] if len(trained_standardizer_list) == 1 else standardizer._merge_trained(trained_standardizer_list)
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
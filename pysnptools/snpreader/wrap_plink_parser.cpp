@@ -953,10 +953,14 @@ typedef struct {
 static Py_ssize_t __Pyx_zeros[] = {0, 0, 0, 0, 0, 0, 0, 0};
 static Py_ssize_t __Pyx_minusones[] = {-1, -1, -1, -1, -1, -1, -1, -1};
 
-static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *);
-
 static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *);
 
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *);
+
 #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
     #define __Pyx_CREAL(z) ((z).real())
@@ -1121,6 +1125,7 @@ static std::vector<int>  __pyx_convert_vector_from_py_int(PyObject *); /*proto*/
 static std::string __pyx_convert_string_from_py_std__in_string(PyObject *); /*proto*/
 static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t = { "float32_t", NULL, sizeof(__pyx_t_5numpy_float32_t), { 0 }, 0, 'R', 0, 0 };
 static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t = { "float64_t", NULL, sizeof(__pyx_t_5numpy_float64_t), { 0 }, 0, 'R', 0, 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5numpy_uint8_t = { "uint8_t", NULL, sizeof(__pyx_t_5numpy_uint8_t), { 0 }, 0, IS_UNSIGNED(__pyx_t_5numpy_uint8_t) ? 'U' : 'I', IS_UNSIGNED(__pyx_t_5numpy_uint8_t), 0 };
 #define __Pyx_MODULE_NAME "pysnptools.snpreader.wrap_plink_parser"
 int __pyx_module_is_main_pysnptools__snpreader__wrap_plink_parser = 0;
 
@@ -1152,24 +1157,36 @@ static char __pyx_k_main[] = "__main__";
 static char __pyx_k_test[] = "__test__";
 static char __pyx_k_betaA[] = "betaA";
 static char __pyx_k_betaB[] = "betaB";
+static char __pyx_k_c_out[] = "c_out";
 static char __pyx_k_numpy[] = "numpy";
 static char __pyx_k_range[] = "range";
 static char __pyx_k_stats[] = "stats";
 static char __pyx_k_bed_fn[] = "bed_fn";
 static char __pyx_k_import[] = "__import__";
+static char __pyx_k_c_stats[] = "c_stats";
 static char __pyx_k_num_ind[] = "num_ind";
+static char __pyx_k_c_bed_fn[] = "c_bed_fn";
 static char __pyx_k_count_A1[] = "count_A1";
 static char __pyx_k_num_snps[] = "num_snps";
+static char __pyx_k_bed_bytes[] = "bed_bytes";
+static char __pyx_k_c_num_ind[] = "c_num_ind";
 static char __pyx_k_use_stats[] = "use_stats";
 static char __pyx_k_ValueError[] = "ValueError";
+static char __pyx_k_c_count_A1[] = "c_count_A1";
+static char __pyx_k_c_num_snps[] = "c_num_snps";
 static char __pyx_k_iidIdxList[] = "iidIdxList";
 static char __pyx_k_snpIdxList[] = "snpIdxList";
+static char __pyx_k_c_bed_bytes[] = "c_bed_bytes";
+static char __pyx_k_num_threads[] = "num_threads";
 static char __pyx_k_RuntimeError[] = "RuntimeError";
 static char __pyx_k_iid_idx_list[] = "iid_idx_list";
 static char __pyx_k_sid_idx_list[] = "sid_idx_list";
+static char __pyx_k_c_num_threads[] = "c_num_threads";
 static char __pyx_k_input_num_ind[] = "input_num_ind";
 static char __pyx_k_apply_in_place[] = "apply_in_place";
 static char __pyx_k_input_num_snps[] = "input_num_snps";
+static char __pyx_k_c_input_num_ind[] = "c_input_num_ind";
+static char __pyx_k_c_input_num_snps[] = "c_input_num_snps";
 static char __pyx_k_betaNotUnitVariance[] = "betaNotUnitVariance";
 static char __pyx_k_standardizefloatCAAA[] = "standardizefloatCAAA";
 static char __pyx_k_standardizefloatFAAA[] = "standardizefloatFAAA";
@@ -1184,32 +1201,50 @@ static char __pyx_k_readPlinkBedFiledoubleFAAA[] = "readPlinkBedFiledoubleFAAA";
 static char __pyx_k_writePlinkBedFilefloatCAAA[] = "writePlinkBedFilefloatCAAA";
 static char __pyx_k_writePlinkBedFilefloatFAAA[] = "writePlinkBedFilefloatFAAA";
 static char __pyx_k_ndarray_is_not_C_contiguous[] = "ndarray is not C contiguous";
+static char __pyx_k_readPlinkBedBytes2floatCAAA[] = "readPlinkBedBytes2floatCAAA";
+static char __pyx_k_readPlinkBedBytes2floatFAAA[] = "readPlinkBedBytes2floatFAAA";
 static char __pyx_k_readPlinkBedFile2doubleCAAA[] = "readPlinkBedFile2doubleCAAA";
 static char __pyx_k_readPlinkBedFile2doubleFAAA[] = "readPlinkBedFile2doubleFAAA";
 static char __pyx_k_writePlinkBedFile2floatCAAA[] = "writePlinkBedFile2floatCAAA";
 static char __pyx_k_writePlinkBedFile2floatFAAA[] = "writePlinkBedFile2floatFAAA";
 static char __pyx_k_writePlinkBedFiledoubleCAAA[] = "writePlinkBedFiledoubleCAAA";
 static char __pyx_k_writePlinkBedFiledoubleFAAA[] = "writePlinkBedFiledoubleFAAA";
+static char __pyx_k_readPlinkBedBytes2doubleCAAA[] = "readPlinkBedBytes2doubleCAAA";
+static char __pyx_k_readPlinkBedBytes2doubleFAAA[] = "readPlinkBedBytes2doubleFAAA";
 static char __pyx_k_writePlinkBedFile2doubleCAAA[] = "writePlinkBedFile2doubleCAAA";
 static char __pyx_k_writePlinkBedFile2doubleFAAA[] = "writePlinkBedFile2doubleFAAA";
 static char __pyx_k_pysnptools_snpreader_wrap_plink[] = "pysnptools.snpreader.wrap_plink_parser";
+static char __pyx_k_c_Source_carlk_pysnptools_pysnpt[] = "c:\\Source\\carlk\\pysnptools\\pysnptools\\snpreader\\wrap_plink_parser.pyx";
 static char __pyx_k_unknown_dtype_code_in_numpy_pxd[] = "unknown dtype code in numpy.pxd (%d)";
 static char __pyx_k_Format_string_allocated_too_shor[] = "Format string allocated too short, see comment in numpy.pxd";
 static char __pyx_k_Non_native_byte_order_not_suppor[] = "Non-native byte order not supported";
-static char __pyx_k_c_Source_carlk_pysnptools_pysnpt[] = "c:\\Source\\carlk\\pysnptools\\pysnptools\\snpreader\\wrap_plink_parser.pyx";
 static char __pyx_k_ndarray_is_not_Fortran_contiguou[] = "ndarray is not Fortran contiguous";
+static char __pyx_k_readPlinkBedBytesStandardize2dou[] = "readPlinkBedBytesStandardize2doubleFAAA";
+static char __pyx_k_readPlinkBedBytesStandardize2flo[] = "readPlinkBedBytesStandardize2floatFAAA";
 static char __pyx_k_Format_string_allocated_too_shor_2[] = "Format string allocated too short.";
+static char __pyx_k_readPlinkBedBytesStandardize2dou_2[] = "readPlinkBedBytesStandardize2doubleCAAA";
+static char __pyx_k_readPlinkBedBytesStandardize2flo_2[] = "readPlinkBedBytesStandardize2floatCAAA";
 static PyObject *__pyx_kp_u_Format_string_allocated_too_shor;
 static PyObject *__pyx_kp_u_Format_string_allocated_too_shor_2;
 static PyObject *__pyx_kp_u_Non_native_byte_order_not_suppor;
 static PyObject *__pyx_n_s_RuntimeError;
 static PyObject *__pyx_n_s_ValueError;
 static PyObject *__pyx_n_s_apply_in_place;
+static PyObject *__pyx_n_s_bed_bytes;
 static PyObject *__pyx_n_s_bed_fn;
 static PyObject *__pyx_n_s_betaA;
 static PyObject *__pyx_n_s_betaB;
 static PyObject *__pyx_n_s_betaNotUnitVariance;
-static PyObject *__pyx_kp_s_c_Source_carlk_pysnptools_pysnpt;
+static PyObject *__pyx_n_s_c_bed_bytes;
+static PyObject *__pyx_n_s_c_bed_fn;
+static PyObject *__pyx_n_s_c_count_A1;
+static PyObject *__pyx_n_s_c_input_num_ind;
+static PyObject *__pyx_n_s_c_input_num_snps;
+static PyObject *__pyx_n_s_c_num_ind;
+static PyObject *__pyx_n_s_c_num_snps;
+static PyObject *__pyx_n_s_c_num_threads;
+static PyObject *__pyx_n_s_c_out;
+static PyObject *__pyx_n_s_c_stats;
 static PyObject *__pyx_n_s_count_A1;
 static PyObject *__pyx_n_s_iidIdxList;
 static PyObject *__pyx_n_s_iid_idx_list;
@@ -1223,10 +1258,19 @@ static PyObject *__pyx_kp_u_ndarray_is_not_Fortran_contiguou;
 static PyObject *__pyx_n_s_np;
 static PyObject *__pyx_n_s_num_ind;
 static PyObject *__pyx_n_s_num_snps;
+static PyObject *__pyx_n_s_num_threads;
 static PyObject *__pyx_n_s_numpy;
 static PyObject *__pyx_n_s_out;
 static PyObject *__pyx_n_s_pysnptools_snpreader_wrap_plink;
 static PyObject *__pyx_n_s_range;
+static PyObject *__pyx_n_s_readPlinkBedBytes2doubleCAAA;
+static PyObject *__pyx_n_s_readPlinkBedBytes2doubleFAAA;
+static PyObject *__pyx_n_s_readPlinkBedBytes2floatCAAA;
+static PyObject *__pyx_n_s_readPlinkBedBytes2floatFAAA;
+static PyObject *__pyx_n_s_readPlinkBedBytesStandardize2dou;
+static PyObject *__pyx_n_s_readPlinkBedBytesStandardize2dou_2;
+static PyObject *__pyx_n_s_readPlinkBedBytesStandardize2flo;
+static PyObject *__pyx_n_s_readPlinkBedBytesStandardize2flo_2;
 static PyObject *__pyx_n_s_readPlinkBedFile2doubleCAAA;
 static PyObject *__pyx_n_s_readPlinkBedFile2doubleFAAA;
 static PyObject *__pyx_n_s_readPlinkBedFile2floatCAAA;
@@ -1243,6 +1287,7 @@ static PyObject *__pyx_n_s_standardizefloatCAAA;
 static PyObject *__pyx_n_s_standardizefloatFAAA;
 static PyObject *__pyx_n_s_stats;
 static PyObject *__pyx_n_s_test;
+static PyObject *__pyx_kp_s_c_Source_carlk_pysnptools_pysnpt;
 static PyObject *__pyx_kp_u_unknown_dtype_code_in_numpy_pxd;
 static PyObject *__pyx_n_s_use_stats;
 static PyObject *__pyx_n_s_writePlinkBedFile2doubleCAAA;
@@ -1253,28 +1298,37 @@ static PyObject *__pyx_n_s_writePlinkBedFiledoubleCAAA;
 static PyObject *__pyx_n_s_writePlinkBedFiledoubleFAAA;
 static PyObject *__pyx_n_s_writePlinkBedFilefloatCAAA;
 static PyObject *__pyx_n_s_writePlinkBedFilefloatFAAA;
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_standardizefloatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, float __pyx_v_betaA, float __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_2standardizedoubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, double __pyx_v_betaA, double __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_4standardizefloatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, float __pyx_v_betaA, float __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_6standardizedoubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, double __pyx_v_betaA, double __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_8readPlinkBedFile2floatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_10readPlinkBedFile2floatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_12readPlinkBedFile2doubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_14readPlinkBedFile2doubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_16writePlinkBedFile2floatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_18writePlinkBedFile2floatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_20writePlinkBedFile2doubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_22writePlinkBedFile2doubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_24readPlinkBedFilefloatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_26readPlinkBedFilefloatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_28readPlinkBedFiledoubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_30readPlinkBedFiledoubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_32writePlinkBedFilefloatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_34writePlinkBedFilefloatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_36writePlinkBedFiledoubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx); /* proto */
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_38writePlinkBedFiledoubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_standardizefloatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, float __pyx_v_betaA, float __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats, PyObject *__pyx_v_num_threads); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_2standardizedoubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, double __pyx_v_betaA, double __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats, PyObject *__pyx_v_num_threads); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_4standardizefloatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, float __pyx_v_betaA, float __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats, PyObject *__pyx_v_num_threads); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_6standardizedoubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, double __pyx_v_betaA, double __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats, PyObject *__pyx_v_num_threads); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_8readPlinkBedFile2floatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_10readPlinkBedFile2floatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_12readPlinkBedFile2doubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_14readPlinkBedFile2doubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_16readPlinkBedBytes2floatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_18readPlinkBedBytes2floatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_20readPlinkBedBytes2doubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_22readPlinkBedBytes2doubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_24readPlinkBedBytesStandardize2floatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads, bool __pyx_v_betaNotUnitVariance, float __pyx_v_betaA, float __pyx_v_betaB, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_26readPlinkBedBytesStandardize2floatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads, bool __pyx_v_betaNotUnitVariance, float __pyx_v_betaA, float __pyx_v_betaB, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_28readPlinkBedBytesStandardize2doubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads, bool __pyx_v_betaNotUnitVariance, double __pyx_v_betaA, double __pyx_v_betaB, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_30readPlinkBedBytesStandardize2doubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads, bool __pyx_v_betaNotUnitVariance, double __pyx_v_betaA, double __pyx_v_betaB, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_32writePlinkBedFile2floatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_34writePlinkBedFile2floatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_36writePlinkBedFile2doubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_38writePlinkBedFile2doubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_40readPlinkBedFilefloatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_42readPlinkBedFilefloatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_44readPlinkBedFiledoubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_46readPlinkBedFiledoubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_48writePlinkBedFilefloatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_50writePlinkBedFilefloatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_52writePlinkBedFiledoubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx); /* proto */
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_54writePlinkBedFiledoubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx); /* proto */
 static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
 static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
+static PyObject *__pyx_int_1;
 static PyObject *__pyx_tuple_;
 static PyObject *__pyx_tuple__2;
 static PyObject *__pyx_tuple__3;
@@ -1301,6 +1355,14 @@ static PyObject *__pyx_tuple__39;
 static PyObject *__pyx_tuple__41;
 static PyObject *__pyx_tuple__43;
 static PyObject *__pyx_tuple__45;
+static PyObject *__pyx_tuple__47;
+static PyObject *__pyx_tuple__49;
+static PyObject *__pyx_tuple__51;
+static PyObject *__pyx_tuple__53;
+static PyObject *__pyx_tuple__55;
+static PyObject *__pyx_tuple__57;
+static PyObject *__pyx_tuple__59;
+static PyObject *__pyx_tuple__61;
 static PyObject *__pyx_codeobj__8;
 static PyObject *__pyx_codeobj__10;
 static PyObject *__pyx_codeobj__12;
@@ -1321,11 +1383,19 @@ static PyObject *__pyx_codeobj__40;
 static PyObject *__pyx_codeobj__42;
 static PyObject *__pyx_codeobj__44;
 static PyObject *__pyx_codeobj__46;
+static PyObject *__pyx_codeobj__48;
+static PyObject *__pyx_codeobj__50;
+static PyObject *__pyx_codeobj__52;
+static PyObject *__pyx_codeobj__54;
+static PyObject *__pyx_codeobj__56;
+static PyObject *__pyx_codeobj__58;
+static PyObject *__pyx_codeobj__60;
+static PyObject *__pyx_codeobj__62;
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":69
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":83
  * 
  * 
- * def standardizefloatFAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizefloatFAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
@@ -1341,6 +1411,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_1standardi
   bool __pyx_v_apply_in_place;
   bool __pyx_v_use_stats;
   PyArrayObject *__pyx_v_stats = 0;
+  PyObject *__pyx_v_num_threads = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -1348,12 +1419,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_1standardi
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("standardizefloatFAAA (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_out,&__pyx_n_s_betaNotUnitVariance,&__pyx_n_s_betaA,&__pyx_n_s_betaB,&__pyx_n_s_apply_in_place,&__pyx_n_s_use_stats,&__pyx_n_s_stats,0};
-    PyObject* values[7] = {0,0,0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_out,&__pyx_n_s_betaNotUnitVariance,&__pyx_n_s_betaA,&__pyx_n_s_betaB,&__pyx_n_s_apply_in_place,&__pyx_n_s_use_stats,&__pyx_n_s_stats,&__pyx_n_s_num_threads,0};
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    values[7] = ((PyObject *)__pyx_int_1);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
         case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
         case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
         case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
@@ -1372,67 +1445,76 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_1standardi
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaNotUnitVariance)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizefloatFAAA", 1, 7, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizefloatFAAA", 0, 7, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaA)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizefloatFAAA", 1, 7, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizefloatFAAA", 0, 7, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaB)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizefloatFAAA", 1, 7, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizefloatFAAA", 0, 7, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_apply_in_place)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizefloatFAAA", 1, 7, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizefloatFAAA", 0, 7, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_use_stats)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizefloatFAAA", 1, 7, 7, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizefloatFAAA", 0, 7, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  6:
         if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stats)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizefloatFAAA", 1, 7, 7, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizefloatFAAA", 0, 7, 8, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads);
+          if (value) { values[7] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "standardizefloatFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "standardizefloatFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
     }
     __pyx_v_out = ((PyArrayObject *)values[0]);
-    __pyx_v_betaNotUnitVariance = __Pyx_PyObject_IsTrue(values[1]); if (unlikely((__pyx_v_betaNotUnitVariance == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_betaA = __pyx_PyFloat_AsFloat(values[2]); if (unlikely((__pyx_v_betaA == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_betaB = __pyx_PyFloat_AsFloat(values[3]); if (unlikely((__pyx_v_betaB == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_apply_in_place = __Pyx_PyObject_IsTrue(values[4]); if (unlikely((__pyx_v_apply_in_place == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_use_stats = __Pyx_PyObject_IsTrue(values[5]); if (unlikely((__pyx_v_use_stats == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaNotUnitVariance = __Pyx_PyObject_IsTrue(values[1]); if (unlikely((__pyx_v_betaNotUnitVariance == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaA = __pyx_PyFloat_AsFloat(values[2]); if (unlikely((__pyx_v_betaA == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaB = __pyx_PyFloat_AsFloat(values[3]); if (unlikely((__pyx_v_betaB == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_apply_in_place = __Pyx_PyObject_IsTrue(values[4]); if (unlikely((__pyx_v_apply_in_place == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_use_stats = __Pyx_PyObject_IsTrue(values[5]); if (unlikely((__pyx_v_use_stats == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     __pyx_v_stats = ((PyArrayObject *)values[6]);
+    __pyx_v_num_threads = values[7];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("standardizefloatFAAA", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("standardizefloatFAAA", 0, 7, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.standardizefloatFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_stats), __pyx_ptype_5numpy_ndarray, 1, "stats", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_standardizefloatFAAA(__pyx_self, __pyx_v_out, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, __pyx_v_stats);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_stats), __pyx_ptype_5numpy_ndarray, 1, "stats", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_standardizefloatFAAA(__pyx_self, __pyx_v_out, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, __pyx_v_stats, __pyx_v_num_threads);
 
   /* function exit code */
   goto __pyx_L0;
@@ -1443,16 +1525,22 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_1standardi
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_standardizefloatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, float __pyx_v_betaA, float __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_standardizefloatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, float __pyx_v_betaA, float __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats, PyObject *__pyx_v_num_threads) {
   npy_intp __pyx_v_num_ind;
   npy_intp __pyx_v_num_snps;
+  size_t __pyx_v_c_num_ind;
+  size_t __pyx_v_c_num_snps;
+  float *__pyx_v_c_out;
+  float *__pyx_v_c_stats;
+  int __pyx_v_c_num_threads;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
   __Pyx_Buffer __pyx_pybuffer_out;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_stats;
   __Pyx_Buffer __pyx_pybuffer_stats;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -1467,73 +1555,144 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_standardiz
   __pyx_pybuffernd_stats.rcbuffer = &__pyx_pybuffer_stats;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_stats.rcbuffer->pybuffer, (PyObject*)__pyx_v_stats, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_stats.rcbuffer->pybuffer, (PyObject*)__pyx_v_stats, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_stats.diminfo[0].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_stats.diminfo[0].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_stats.diminfo[1].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_stats.diminfo[1].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":71
- * def standardizefloatFAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":85
+ * def standardizefloatFAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats, num_threads=1):
  * 
  * 	num_ind = out.shape[0]             # <<<<<<<<<<<<<<
  * 	num_snps = out.shape[1]
- * 
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
  */
   __pyx_v_num_ind = (__pyx_v_out->dimensions[0]);
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":72
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":86
  * 
  * 	num_ind = out.shape[0]
  * 	num_snps = out.shape[1]             # <<<<<<<<<<<<<<
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+ * 	cdef float* c_out = <float*> out.data
+ */
+  __pyx_v_num_snps = (__pyx_v_out->dimensions[1]);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":87
+ * 	num_ind = out.shape[0]
+ * 	num_snps = out.shape[1]
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps             # <<<<<<<<<<<<<<
+ * 	cdef float* c_out = <float*> out.data
+ * 	cdef float* c_stats = <float*> stats.data
+ */
+  __pyx_v_c_num_ind = __pyx_v_num_ind;
+  __pyx_v_c_num_snps = __pyx_v_num_snps;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":88
+ * 	num_snps = out.shape[1]
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+ * 	cdef float* c_out = <float*> out.data             # <<<<<<<<<<<<<<
+ * 	cdef float* c_stats = <float*> stats.data
+ * 	cdef int c_num_threads = num_threads
+ */
+  __pyx_v_c_out = ((float *)__pyx_v_out->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":89
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+ * 	cdef float* c_out = <float*> out.data
+ * 	cdef float* c_stats = <float*> stats.data             # <<<<<<<<<<<<<<
+ * 	cdef int c_num_threads = num_threads
+ * 
+ */
+  __pyx_v_c_stats = ((float *)__pyx_v_stats->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":90
+ * 	cdef float* c_out = <float*> out.data
+ * 	cdef float* c_stats = <float*> stats.data
+ * 	cdef int c_num_threads = num_threads             # <<<<<<<<<<<<<<
  * 
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  */
-  __pyx_v_num_snps = (__pyx_v_out->dimensions[1]);
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_1;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":75
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":93
  * 
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
- * 	_ImputeAndZeroMeanSNPsfloatFAAA(<float*> out.data, num_ind, num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, <float *> stats.data)             # <<<<<<<<<<<<<<
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_ImputeAndZeroMeanSNPsfloatFAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
+ * 
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":94
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ * 	with nogil:
+ * 		_ImputeAndZeroMeanSNPsfloatFAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)             # <<<<<<<<<<<<<<
  * 
  * 	return out, stats
  */
-  ImputeAndZeroMeanSNPsfloatFAAA(((float *)__pyx_v_out->data), __pyx_v_num_ind, __pyx_v_num_snps, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, ((float *)__pyx_v_stats->data));
+        ImputeAndZeroMeanSNPsfloatFAAA(__pyx_v_c_out, __pyx_v_c_num_ind, __pyx_v_c_num_snps, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, __pyx_v_c_stats, __pyx_v_c_num_threads);
+      }
+
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":93
+ * 
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_ImputeAndZeroMeanSNPsfloatFAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
+ * 
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":77
- * 	_ImputeAndZeroMeanSNPsfloatFAAA(<float*> out.data, num_ind, num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, <float *> stats.data)
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":96
+ * 		_ImputeAndZeroMeanSNPsfloatFAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
  * 
  * 	return out, stats             # <<<<<<<<<<<<<<
  * 
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 77; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 96; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_v_out));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_out));
-  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_v_out));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_out));
   __Pyx_INCREF(((PyObject *)__pyx_v_stats));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_stats));
-  PyTuple_SET_ITEM(__pyx_t_1, 1, ((PyObject *)__pyx_v_stats));
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_stats));
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":69
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":83
  * 
  * 
- * def standardizefloatFAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizefloatFAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
@@ -1551,10 +1710,10 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_standardiz
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":81
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":100
  * 
  * 
- * def standardizedoubleFAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizedoubleFAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
@@ -1570,6 +1729,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_3standardi
   bool __pyx_v_apply_in_place;
   bool __pyx_v_use_stats;
   PyArrayObject *__pyx_v_stats = 0;
+  PyObject *__pyx_v_num_threads = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -1577,12 +1737,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_3standardi
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("standardizedoubleFAAA (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_out,&__pyx_n_s_betaNotUnitVariance,&__pyx_n_s_betaA,&__pyx_n_s_betaB,&__pyx_n_s_apply_in_place,&__pyx_n_s_use_stats,&__pyx_n_s_stats,0};
-    PyObject* values[7] = {0,0,0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_out,&__pyx_n_s_betaNotUnitVariance,&__pyx_n_s_betaA,&__pyx_n_s_betaB,&__pyx_n_s_apply_in_place,&__pyx_n_s_use_stats,&__pyx_n_s_stats,&__pyx_n_s_num_threads,0};
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    values[7] = ((PyObject *)__pyx_int_1);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
         case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
         case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
         case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
@@ -1601,67 +1763,76 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_3standardi
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaNotUnitVariance)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizedoubleFAAA", 1, 7, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizedoubleFAAA", 0, 7, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaA)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizedoubleFAAA", 1, 7, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizedoubleFAAA", 0, 7, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaB)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizedoubleFAAA", 1, 7, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizedoubleFAAA", 0, 7, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_apply_in_place)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizedoubleFAAA", 1, 7, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizedoubleFAAA", 0, 7, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_use_stats)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizedoubleFAAA", 1, 7, 7, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizedoubleFAAA", 0, 7, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  6:
         if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stats)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizedoubleFAAA", 1, 7, 7, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizedoubleFAAA", 0, 7, 8, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads);
+          if (value) { values[7] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "standardizedoubleFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "standardizedoubleFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
     }
     __pyx_v_out = ((PyArrayObject *)values[0]);
-    __pyx_v_betaNotUnitVariance = __Pyx_PyObject_IsTrue(values[1]); if (unlikely((__pyx_v_betaNotUnitVariance == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_betaA = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_betaA == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_betaB = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_betaB == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_apply_in_place = __Pyx_PyObject_IsTrue(values[4]); if (unlikely((__pyx_v_apply_in_place == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_use_stats = __Pyx_PyObject_IsTrue(values[5]); if (unlikely((__pyx_v_use_stats == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaNotUnitVariance = __Pyx_PyObject_IsTrue(values[1]); if (unlikely((__pyx_v_betaNotUnitVariance == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaA = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_betaA == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaB = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_betaB == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_apply_in_place = __Pyx_PyObject_IsTrue(values[4]); if (unlikely((__pyx_v_apply_in_place == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_use_stats = __Pyx_PyObject_IsTrue(values[5]); if (unlikely((__pyx_v_use_stats == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     __pyx_v_stats = ((PyArrayObject *)values[6]);
+    __pyx_v_num_threads = values[7];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("standardizedoubleFAAA", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("standardizedoubleFAAA", 0, 7, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.standardizedoubleFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_stats), __pyx_ptype_5numpy_ndarray, 1, "stats", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_2standardizedoubleFAAA(__pyx_self, __pyx_v_out, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, __pyx_v_stats);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_stats), __pyx_ptype_5numpy_ndarray, 1, "stats", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_2standardizedoubleFAAA(__pyx_self, __pyx_v_out, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, __pyx_v_stats, __pyx_v_num_threads);
 
   /* function exit code */
   goto __pyx_L0;
@@ -1672,16 +1843,22 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_3standardi
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_2standardizedoubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, double __pyx_v_betaA, double __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_2standardizedoubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, double __pyx_v_betaA, double __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats, PyObject *__pyx_v_num_threads) {
   npy_intp __pyx_v_num_ind;
   npy_intp __pyx_v_num_snps;
+  size_t __pyx_v_c_num_ind;
+  size_t __pyx_v_c_num_snps;
+  double *__pyx_v_c_out;
+  double *__pyx_v_c_stats;
+  int __pyx_v_c_num_threads;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
   __Pyx_Buffer __pyx_pybuffer_out;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_stats;
   __Pyx_Buffer __pyx_pybuffer_stats;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -1696,73 +1873,144 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_2standardi
   __pyx_pybuffernd_stats.rcbuffer = &__pyx_pybuffer_stats;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_stats.rcbuffer->pybuffer, (PyObject*)__pyx_v_stats, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_stats.rcbuffer->pybuffer, (PyObject*)__pyx_v_stats, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_stats.diminfo[0].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_stats.diminfo[0].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_stats.diminfo[1].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_stats.diminfo[1].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":83
- * def standardizedoubleFAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":102
+ * def standardizedoubleFAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats, num_threads=1):
  * 
  * 	num_ind = out.shape[0]             # <<<<<<<<<<<<<<
  * 	num_snps = out.shape[1]
- * 
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
  */
   __pyx_v_num_ind = (__pyx_v_out->dimensions[0]);
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":84
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":103
  * 
  * 	num_ind = out.shape[0]
  * 	num_snps = out.shape[1]             # <<<<<<<<<<<<<<
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+ * 	cdef double* c_out = <double*> out.data
+ */
+  __pyx_v_num_snps = (__pyx_v_out->dimensions[1]);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":104
+ * 	num_ind = out.shape[0]
+ * 	num_snps = out.shape[1]
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps             # <<<<<<<<<<<<<<
+ * 	cdef double* c_out = <double*> out.data
+ * 	cdef double* c_stats = <double*> stats.data
+ */
+  __pyx_v_c_num_ind = __pyx_v_num_ind;
+  __pyx_v_c_num_snps = __pyx_v_num_snps;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":105
+ * 	num_snps = out.shape[1]
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+ * 	cdef double* c_out = <double*> out.data             # <<<<<<<<<<<<<<
+ * 	cdef double* c_stats = <double*> stats.data
+ * 	cdef int c_num_threads = num_threads
+ */
+  __pyx_v_c_out = ((double *)__pyx_v_out->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":106
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+ * 	cdef double* c_out = <double*> out.data
+ * 	cdef double* c_stats = <double*> stats.data             # <<<<<<<<<<<<<<
+ * 	cdef int c_num_threads = num_threads
+ * 
+ */
+  __pyx_v_c_stats = ((double *)__pyx_v_stats->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":107
+ * 	cdef double* c_out = <double*> out.data
+ * 	cdef double* c_stats = <double*> stats.data
+ * 	cdef int c_num_threads = num_threads             # <<<<<<<<<<<<<<
  * 
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  */
-  __pyx_v_num_snps = (__pyx_v_out->dimensions[1]);
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 107; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_1;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":87
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":110
+ * 
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_ImputeAndZeroMeanSNPsdoubleFAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
  * 
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":111
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
- * 	_ImputeAndZeroMeanSNPsdoubleFAAA(<double*> out.data, num_ind, num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, <double *> stats.data)             # <<<<<<<<<<<<<<
+ * 	with nogil:
+ * 		_ImputeAndZeroMeanSNPsdoubleFAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)             # <<<<<<<<<<<<<<
  * 
  * 	return out, stats
  */
-  ImputeAndZeroMeanSNPsdoubleFAAA(((double *)__pyx_v_out->data), __pyx_v_num_ind, __pyx_v_num_snps, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, ((double *)__pyx_v_stats->data));
+        ImputeAndZeroMeanSNPsdoubleFAAA(__pyx_v_c_out, __pyx_v_c_num_ind, __pyx_v_c_num_snps, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, __pyx_v_c_stats, __pyx_v_c_num_threads);
+      }
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":89
- * 	_ImputeAndZeroMeanSNPsdoubleFAAA(<double*> out.data, num_ind, num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, <double *> stats.data)
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":110
+ * 
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_ImputeAndZeroMeanSNPsdoubleFAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
+ * 
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":113
+ * 		_ImputeAndZeroMeanSNPsdoubleFAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
  * 
  * 	return out, stats             # <<<<<<<<<<<<<<
  * 
  * 
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_v_out));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_out));
-  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_v_out));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_out));
   __Pyx_INCREF(((PyObject *)__pyx_v_stats));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_stats));
-  PyTuple_SET_ITEM(__pyx_t_1, 1, ((PyObject *)__pyx_v_stats));
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_stats));
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":81
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":100
  * 
  * 
- * def standardizedoubleFAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizedoubleFAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
@@ -1780,10 +2028,10 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_2standardi
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":93
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":117
  * 
  * 
- * def standardizefloatCAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizefloatCAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
@@ -1799,6 +2047,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_5standardi
   bool __pyx_v_apply_in_place;
   bool __pyx_v_use_stats;
   PyArrayObject *__pyx_v_stats = 0;
+  PyObject *__pyx_v_num_threads = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -1806,12 +2055,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_5standardi
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("standardizefloatCAAA (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_out,&__pyx_n_s_betaNotUnitVariance,&__pyx_n_s_betaA,&__pyx_n_s_betaB,&__pyx_n_s_apply_in_place,&__pyx_n_s_use_stats,&__pyx_n_s_stats,0};
-    PyObject* values[7] = {0,0,0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_out,&__pyx_n_s_betaNotUnitVariance,&__pyx_n_s_betaA,&__pyx_n_s_betaB,&__pyx_n_s_apply_in_place,&__pyx_n_s_use_stats,&__pyx_n_s_stats,&__pyx_n_s_num_threads,0};
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    values[7] = ((PyObject *)__pyx_int_1);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
         case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
         case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
         case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
@@ -1830,67 +2081,76 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_5standardi
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaNotUnitVariance)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizefloatCAAA", 1, 7, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizefloatCAAA", 0, 7, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaA)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizefloatCAAA", 1, 7, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizefloatCAAA", 0, 7, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaB)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizefloatCAAA", 1, 7, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizefloatCAAA", 0, 7, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_apply_in_place)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizefloatCAAA", 1, 7, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizefloatCAAA", 0, 7, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_use_stats)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizefloatCAAA", 1, 7, 7, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizefloatCAAA", 0, 7, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  6:
         if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stats)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizefloatCAAA", 1, 7, 7, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizefloatCAAA", 0, 7, 8, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads);
+          if (value) { values[7] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "standardizefloatCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "standardizefloatCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
     }
     __pyx_v_out = ((PyArrayObject *)values[0]);
-    __pyx_v_betaNotUnitVariance = __Pyx_PyObject_IsTrue(values[1]); if (unlikely((__pyx_v_betaNotUnitVariance == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_betaA = __pyx_PyFloat_AsFloat(values[2]); if (unlikely((__pyx_v_betaA == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_betaB = __pyx_PyFloat_AsFloat(values[3]); if (unlikely((__pyx_v_betaB == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_apply_in_place = __Pyx_PyObject_IsTrue(values[4]); if (unlikely((__pyx_v_apply_in_place == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_use_stats = __Pyx_PyObject_IsTrue(values[5]); if (unlikely((__pyx_v_use_stats == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaNotUnitVariance = __Pyx_PyObject_IsTrue(values[1]); if (unlikely((__pyx_v_betaNotUnitVariance == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaA = __pyx_PyFloat_AsFloat(values[2]); if (unlikely((__pyx_v_betaA == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaB = __pyx_PyFloat_AsFloat(values[3]); if (unlikely((__pyx_v_betaB == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_apply_in_place = __Pyx_PyObject_IsTrue(values[4]); if (unlikely((__pyx_v_apply_in_place == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_use_stats = __Pyx_PyObject_IsTrue(values[5]); if (unlikely((__pyx_v_use_stats == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     __pyx_v_stats = ((PyArrayObject *)values[6]);
+    __pyx_v_num_threads = values[7];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("standardizefloatCAAA", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("standardizefloatCAAA", 0, 7, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.standardizefloatCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_stats), __pyx_ptype_5numpy_ndarray, 1, "stats", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_4standardizefloatCAAA(__pyx_self, __pyx_v_out, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, __pyx_v_stats);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_stats), __pyx_ptype_5numpy_ndarray, 1, "stats", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_4standardizefloatCAAA(__pyx_self, __pyx_v_out, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, __pyx_v_stats, __pyx_v_num_threads);
 
   /* function exit code */
   goto __pyx_L0;
@@ -1901,16 +2161,22 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_5standardi
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_4standardizefloatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, float __pyx_v_betaA, float __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_4standardizefloatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, float __pyx_v_betaA, float __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats, PyObject *__pyx_v_num_threads) {
   npy_intp __pyx_v_num_ind;
   npy_intp __pyx_v_num_snps;
+  size_t __pyx_v_c_num_ind;
+  size_t __pyx_v_c_num_snps;
+  float *__pyx_v_c_out;
+  float *__pyx_v_c_stats;
+  int __pyx_v_c_num_threads;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
   __Pyx_Buffer __pyx_pybuffer_out;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_stats;
   __Pyx_Buffer __pyx_pybuffer_stats;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -1925,73 +2191,144 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_4standardi
   __pyx_pybuffernd_stats.rcbuffer = &__pyx_pybuffer_stats;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_stats.rcbuffer->pybuffer, (PyObject*)__pyx_v_stats, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_stats.rcbuffer->pybuffer, (PyObject*)__pyx_v_stats, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_stats.diminfo[0].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_stats.diminfo[0].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_stats.diminfo[1].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_stats.diminfo[1].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":95
- * def standardizefloatCAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":119
+ * def standardizefloatCAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats, num_threads=1):
  * 
  * 	num_ind = out.shape[0]             # <<<<<<<<<<<<<<
  * 	num_snps = out.shape[1]
- * 
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
  */
   __pyx_v_num_ind = (__pyx_v_out->dimensions[0]);
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":96
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":120
  * 
  * 	num_ind = out.shape[0]
  * 	num_snps = out.shape[1]             # <<<<<<<<<<<<<<
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+ * 	cdef float* c_out = <float*> out.data
+ */
+  __pyx_v_num_snps = (__pyx_v_out->dimensions[1]);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":121
+ * 	num_ind = out.shape[0]
+ * 	num_snps = out.shape[1]
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps             # <<<<<<<<<<<<<<
+ * 	cdef float* c_out = <float*> out.data
+ * 	cdef float* c_stats = <float*> stats.data
+ */
+  __pyx_v_c_num_ind = __pyx_v_num_ind;
+  __pyx_v_c_num_snps = __pyx_v_num_snps;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":122
+ * 	num_snps = out.shape[1]
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+ * 	cdef float* c_out = <float*> out.data             # <<<<<<<<<<<<<<
+ * 	cdef float* c_stats = <float*> stats.data
+ * 	cdef int c_num_threads = num_threads
+ */
+  __pyx_v_c_out = ((float *)__pyx_v_out->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":123
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+ * 	cdef float* c_out = <float*> out.data
+ * 	cdef float* c_stats = <float*> stats.data             # <<<<<<<<<<<<<<
+ * 	cdef int c_num_threads = num_threads
+ * 
+ */
+  __pyx_v_c_stats = ((float *)__pyx_v_stats->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":124
+ * 	cdef float* c_out = <float*> out.data
+ * 	cdef float* c_stats = <float*> stats.data
+ * 	cdef int c_num_threads = num_threads             # <<<<<<<<<<<<<<
  * 
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  */
-  __pyx_v_num_snps = (__pyx_v_out->dimensions[1]);
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 124; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_1;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":99
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":127
+ * 
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_ImputeAndZeroMeanSNPsfloatCAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
  * 
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":128
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
- * 	_ImputeAndZeroMeanSNPsfloatCAAA(<float*> out.data, num_ind, num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, <float *> stats.data)             # <<<<<<<<<<<<<<
+ * 	with nogil:
+ * 		_ImputeAndZeroMeanSNPsfloatCAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)             # <<<<<<<<<<<<<<
  * 
  * 	return out, stats
  */
-  ImputeAndZeroMeanSNPsfloatCAAA(((float *)__pyx_v_out->data), __pyx_v_num_ind, __pyx_v_num_snps, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, ((float *)__pyx_v_stats->data));
+        ImputeAndZeroMeanSNPsfloatCAAA(__pyx_v_c_out, __pyx_v_c_num_ind, __pyx_v_c_num_snps, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, __pyx_v_c_stats, __pyx_v_c_num_threads);
+      }
+
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":127
+ * 
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_ImputeAndZeroMeanSNPsfloatCAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
+ * 
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":101
- * 	_ImputeAndZeroMeanSNPsfloatCAAA(<float*> out.data, num_ind, num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, <float *> stats.data)
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":130
+ * 		_ImputeAndZeroMeanSNPsfloatCAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
  * 
  * 	return out, stats             # <<<<<<<<<<<<<<
  * 
- * def standardizedoubleCAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB,  bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):
+ * def standardizedoubleCAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB,  bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats, num_threads=1):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 101; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_v_out));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_out));
-  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_v_out));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_out));
   __Pyx_INCREF(((PyObject *)__pyx_v_stats));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_stats));
-  PyTuple_SET_ITEM(__pyx_t_1, 1, ((PyObject *)__pyx_v_stats));
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_stats));
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":93
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":117
  * 
  * 
- * def standardizefloatCAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizefloatCAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
@@ -2009,10 +2346,10 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_4standardi
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":103
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":132
  * 	return out, stats
  * 
- * def standardizedoubleCAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB,  bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizedoubleCAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB,  bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
@@ -2028,6 +2365,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_7standardi
   bool __pyx_v_apply_in_place;
   bool __pyx_v_use_stats;
   PyArrayObject *__pyx_v_stats = 0;
+  PyObject *__pyx_v_num_threads = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2035,12 +2373,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_7standardi
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("standardizedoubleCAAA (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_out,&__pyx_n_s_betaNotUnitVariance,&__pyx_n_s_betaA,&__pyx_n_s_betaB,&__pyx_n_s_apply_in_place,&__pyx_n_s_use_stats,&__pyx_n_s_stats,0};
-    PyObject* values[7] = {0,0,0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_out,&__pyx_n_s_betaNotUnitVariance,&__pyx_n_s_betaA,&__pyx_n_s_betaB,&__pyx_n_s_apply_in_place,&__pyx_n_s_use_stats,&__pyx_n_s_stats,&__pyx_n_s_num_threads,0};
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    values[7] = ((PyObject *)__pyx_int_1);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
         case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
         case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
         case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
@@ -2059,67 +2399,76 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_7standardi
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaNotUnitVariance)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizedoubleCAAA", 1, 7, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizedoubleCAAA", 0, 7, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaA)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizedoubleCAAA", 1, 7, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizedoubleCAAA", 0, 7, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaB)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizedoubleCAAA", 1, 7, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizedoubleCAAA", 0, 7, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_apply_in_place)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizedoubleCAAA", 1, 7, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizedoubleCAAA", 0, 7, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_use_stats)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizedoubleCAAA", 1, 7, 7, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizedoubleCAAA", 0, 7, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  6:
         if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stats)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("standardizedoubleCAAA", 1, 7, 7, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("standardizedoubleCAAA", 0, 7, 8, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads);
+          if (value) { values[7] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "standardizedoubleCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "standardizedoubleCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
     }
     __pyx_v_out = ((PyArrayObject *)values[0]);
-    __pyx_v_betaNotUnitVariance = __Pyx_PyObject_IsTrue(values[1]); if (unlikely((__pyx_v_betaNotUnitVariance == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_betaA = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_betaA == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_betaB = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_betaB == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_apply_in_place = __Pyx_PyObject_IsTrue(values[4]); if (unlikely((__pyx_v_apply_in_place == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_use_stats = __Pyx_PyObject_IsTrue(values[5]); if (unlikely((__pyx_v_use_stats == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaNotUnitVariance = __Pyx_PyObject_IsTrue(values[1]); if (unlikely((__pyx_v_betaNotUnitVariance == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaA = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_betaA == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaB = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_betaB == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_apply_in_place = __Pyx_PyObject_IsTrue(values[4]); if (unlikely((__pyx_v_apply_in_place == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_use_stats = __Pyx_PyObject_IsTrue(values[5]); if (unlikely((__pyx_v_use_stats == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
     __pyx_v_stats = ((PyArrayObject *)values[6]);
+    __pyx_v_num_threads = values[7];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("standardizedoubleCAAA", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("standardizedoubleCAAA", 0, 7, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.standardizedoubleCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_stats), __pyx_ptype_5numpy_ndarray, 1, "stats", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_6standardizedoubleCAAA(__pyx_self, __pyx_v_out, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, __pyx_v_stats);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_stats), __pyx_ptype_5numpy_ndarray, 1, "stats", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_6standardizedoubleCAAA(__pyx_self, __pyx_v_out, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, __pyx_v_stats, __pyx_v_num_threads);
 
   /* function exit code */
   goto __pyx_L0;
@@ -2130,16 +2479,22 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_7standardi
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_6standardizedoubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, double __pyx_v_betaA, double __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_6standardizedoubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_out, bool __pyx_v_betaNotUnitVariance, double __pyx_v_betaA, double __pyx_v_betaB, bool __pyx_v_apply_in_place, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats, PyObject *__pyx_v_num_threads) {
   npy_intp __pyx_v_num_ind;
   npy_intp __pyx_v_num_snps;
+  size_t __pyx_v_c_num_ind;
+  size_t __pyx_v_c_num_snps;
+  double *__pyx_v_c_out;
+  double *__pyx_v_c_stats;
+  int __pyx_v_c_num_threads;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
   __Pyx_Buffer __pyx_pybuffer_out;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_stats;
   __Pyx_Buffer __pyx_pybuffer_stats;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2154,73 +2509,144 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_6standardi
   __pyx_pybuffernd_stats.rcbuffer = &__pyx_pybuffer_stats;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_stats.rcbuffer->pybuffer, (PyObject*)__pyx_v_stats, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_stats.rcbuffer->pybuffer, (PyObject*)__pyx_v_stats, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_stats.diminfo[0].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_stats.diminfo[0].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_stats.diminfo[1].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_stats.diminfo[1].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":105
- * def standardizedoubleCAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB,  bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":134
+ * def standardizedoubleCAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB,  bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats, num_threads=1):
  * 
  * 	num_ind = out.shape[0]             # <<<<<<<<<<<<<<
  * 	num_snps = out.shape[1]
- * 
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
  */
   __pyx_v_num_ind = (__pyx_v_out->dimensions[0]);
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":106
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":135
  * 
  * 	num_ind = out.shape[0]
  * 	num_snps = out.shape[1]             # <<<<<<<<<<<<<<
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+ * 	cdef double* c_out = <double*> out.data
+ */
+  __pyx_v_num_snps = (__pyx_v_out->dimensions[1]);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":136
+ * 	num_ind = out.shape[0]
+ * 	num_snps = out.shape[1]
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps             # <<<<<<<<<<<<<<
+ * 	cdef double* c_out = <double*> out.data
+ * 	cdef double* c_stats = <double*> stats.data
+ */
+  __pyx_v_c_num_ind = __pyx_v_num_ind;
+  __pyx_v_c_num_snps = __pyx_v_num_snps;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":137
+ * 	num_snps = out.shape[1]
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+ * 	cdef double* c_out = <double*> out.data             # <<<<<<<<<<<<<<
+ * 	cdef double* c_stats = <double*> stats.data
+ * 	cdef int c_num_threads = num_threads
+ */
+  __pyx_v_c_out = ((double *)__pyx_v_out->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":138
+ * 	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+ * 	cdef double* c_out = <double*> out.data
+ * 	cdef double* c_stats = <double*> stats.data             # <<<<<<<<<<<<<<
+ * 	cdef int c_num_threads = num_threads
+ * 
+ */
+  __pyx_v_c_stats = ((double *)__pyx_v_stats->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":139
+ * 	cdef double* c_out = <double*> out.data
+ * 	cdef double* c_stats = <double*> stats.data
+ * 	cdef int c_num_threads = num_threads             # <<<<<<<<<<<<<<
  * 
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  */
-  __pyx_v_num_snps = (__pyx_v_out->dimensions[1]);
+  __pyx_t_1 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_1;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":109
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":142
+ * 
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_ImputeAndZeroMeanSNPsdoubleCAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
  * 
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":143
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
- * 	_ImputeAndZeroMeanSNPsdoubleCAAA(<double*> out.data, num_ind, num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, <double *> stats.data)             # <<<<<<<<<<<<<<
+ * 	with nogil:
+ * 		_ImputeAndZeroMeanSNPsdoubleCAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)             # <<<<<<<<<<<<<<
  * 
  * 	return out, stats
  */
-  ImputeAndZeroMeanSNPsdoubleCAAA(((double *)__pyx_v_out->data), __pyx_v_num_ind, __pyx_v_num_snps, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, ((double *)__pyx_v_stats->data));
+        ImputeAndZeroMeanSNPsdoubleCAAA(__pyx_v_c_out, __pyx_v_c_num_ind, __pyx_v_c_num_snps, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_apply_in_place, __pyx_v_use_stats, __pyx_v_c_stats, __pyx_v_c_num_threads);
+      }
+
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":142
+ * 
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_ImputeAndZeroMeanSNPsdoubleCAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
+ * 
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":111
- * 	_ImputeAndZeroMeanSNPsdoubleCAAA(<double*> out.data, num_ind, num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, <double *> stats.data)
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":145
+ * 		_ImputeAndZeroMeanSNPsdoubleCAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
  * 
  * 	return out, stats             # <<<<<<<<<<<<<<
  * 
  * #New
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_v_out));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_out));
-  PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_v_out));
+  PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_v_out));
   __Pyx_INCREF(((PyObject *)__pyx_v_stats));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_stats));
-  PyTuple_SET_ITEM(__pyx_t_1, 1, ((PyObject *)__pyx_v_stats));
-  __pyx_r = __pyx_t_1;
-  __pyx_t_1 = 0;
+  PyTuple_SET_ITEM(__pyx_t_2, 1, ((PyObject *)__pyx_v_stats));
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":103
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":132
  * 	return out, stats
  * 
- * def standardizedoubleCAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB,  bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizedoubleCAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB,  bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
   { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
@@ -2238,10 +2664,10 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_6standardi
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":114
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":148
  * 
  * #New
- * def readPlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
@@ -2257,6 +2683,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_9readPlink
   PyObject *__pyx_v_iidIdxList = 0;
   PyObject *__pyx_v_snpIdxList = 0;
   PyArrayObject *__pyx_v_out = 0;
+  PyObject *__pyx_v_num_threads = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2264,12 +2691,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_9readPlink
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("readPlinkBedFile2floatFAAA (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_fn,&__pyx_n_s_input_num_ind,&__pyx_n_s_input_num_snps,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,0};
-    PyObject* values[7] = {0,0,0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_fn,&__pyx_n_s_input_num_ind,&__pyx_n_s_input_num_snps,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,&__pyx_n_s_num_threads,0};
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    values[7] = ((PyObject *)__pyx_int_1);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
         case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
         case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
         case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
@@ -2288,47 +2717,55 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_9readPlink
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatFAAA", 1, 7, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatFAAA", 0, 7, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatFAAA", 1, 7, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatFAAA", 0, 7, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatFAAA", 1, 7, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatFAAA", 0, 7, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatFAAA", 1, 7, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatFAAA", 0, 7, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatFAAA", 1, 7, 7, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatFAAA", 0, 7, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  6:
         if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatFAAA", 1, 7, 7, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatFAAA", 0, 7, 8, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads);
+          if (value) { values[7] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFile2floatFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFile2floatFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
     }
     __pyx_v_bed_fn = values[0];
     __pyx_v_input_num_ind = values[1];
@@ -2337,17 +2774,18 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_9readPlink
     __pyx_v_iidIdxList = values[4];
     __pyx_v_snpIdxList = values[5];
     __pyx_v_out = ((PyArrayObject *)values[6]);
+    __pyx_v_num_threads = values[7];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatFAAA", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatFAAA", 0, 7, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedFile2floatFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_8readPlinkBedFile2floatFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_8readPlinkBedFile2floatFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out, __pyx_v_num_threads);
 
   /* function exit code */
   goto __pyx_L0;
@@ -2358,9 +2796,15 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_9readPlink
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_8readPlinkBedFile2floatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_8readPlinkBedFile2floatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads) {
   std::vector<size_t>  __pyx_v_iid_idx_list;
   std::vector<int>  __pyx_v_sid_idx_list;
+  std::string __pyx_v_c_bed_fn;
+  int __pyx_v_c_input_num_ind;
+  int __pyx_v_c_input_num_snps;
+  int __pyx_v_c_num_threads;
+  bool __pyx_v_c_count_A1;
+  float *__pyx_v_c_out;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
   __Pyx_Buffer __pyx_pybuffer_out;
   PyObject *__pyx_r = NULL;
@@ -2369,8 +2813,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_8readPlink
   std::vector<int>  __pyx_t_2;
   std::string __pyx_t_3;
   int __pyx_t_4;
-  int __pyx_t_5;
-  bool __pyx_t_6;
+  bool __pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2381,59 +2824,131 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_8readPlink
   __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":116
- * def readPlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":150
+ * def readPlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
  * 	cdef vector[int] sid_idx_list = snpIdxList
- * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ * 	cdef string c_bed_fn = bed_fn
  */
-  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 116; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_iid_idx_list = __pyx_t_1;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":117
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":151
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
+ * 	cdef string c_bed_fn = bed_fn
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ */
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 151; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_sid_idx_list = __pyx_t_2;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":152
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef string c_bed_fn = bed_fn             # <<<<<<<<<<<<<<
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ */
+  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_bed_fn = __pyx_t_3;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":153
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef string c_bed_fn = bed_fn
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads             # <<<<<<<<<<<<<<
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef float* c_out = <float*> out.data
+ */
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 153; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_ind = __pyx_t_4;
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 153; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_snps = __pyx_t_4;
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 153; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_4;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":154
+ * 	cdef string c_bed_fn = bed_fn
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1             # <<<<<<<<<<<<<<
+ * 	cdef float* c_out = <float*> out.data
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ */
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_5 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 154; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_count_A1 = __pyx_t_5;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":155
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef float* c_out = <float*> out.data             # <<<<<<<<<<<<<<
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
  */
-  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_sid_idx_list = __pyx_t_2;
+  __pyx_v_c_out = ((float *)__pyx_v_out->data);
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":120
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":158
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
- * 	_readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data)             # <<<<<<<<<<<<<<
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedFilefloatFAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":159
+ * 
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read
+ * 		_readPlinkBedFilefloatFAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)             # <<<<<<<<<<<<<<
  * 	return out
  * 
  */
-  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_6 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 120; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  readPlinkBedFilefloatFAAA(__pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, ((float *)__pyx_v_out->data));
+        readPlinkBedFilefloatFAAA(__pyx_v_c_bed_fn, __pyx_v_c_input_num_ind, __pyx_v_c_input_num_snps, __pyx_v_c_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, __pyx_v_c_out, __pyx_v_c_num_threads);
+      }
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":121
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":158
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
- * 	_readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data)
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedFilefloatFAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":160
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read
+ * 		_readPlinkBedFilefloatFAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
  * 	return out             # <<<<<<<<<<<<<<
  * 
- * def readPlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):
+ * def readPlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(((PyObject *)__pyx_v_out));
   __pyx_r = ((PyObject *)__pyx_v_out);
   goto __pyx_L0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":114
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":148
  * 
  * #New
- * def readPlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
@@ -2455,10 +2970,10 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_8readPlink
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":123
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":162
  * 	return out
  * 
- * def readPlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
@@ -2474,6 +2989,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_11readPlin
   PyObject *__pyx_v_iidIdxList = 0;
   PyObject *__pyx_v_snpIdxList = 0;
   PyArrayObject *__pyx_v_out = 0;
+  PyObject *__pyx_v_num_threads = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2481,12 +2997,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_11readPlin
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("readPlinkBedFile2floatCAAA (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_fn,&__pyx_n_s_input_num_ind,&__pyx_n_s_input_num_snps,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,0};
-    PyObject* values[7] = {0,0,0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_fn,&__pyx_n_s_input_num_ind,&__pyx_n_s_input_num_snps,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,&__pyx_n_s_num_threads,0};
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    values[7] = ((PyObject *)__pyx_int_1);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
         case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
         case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
         case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
@@ -2505,47 +3023,55 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_11readPlin
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatCAAA", 1, 7, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatCAAA", 0, 7, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatCAAA", 1, 7, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatCAAA", 0, 7, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatCAAA", 1, 7, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatCAAA", 0, 7, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatCAAA", 1, 7, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatCAAA", 0, 7, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatCAAA", 1, 7, 7, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatCAAA", 0, 7, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  6:
         if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatCAAA", 1, 7, 7, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatCAAA", 0, 7, 8, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads);
+          if (value) { values[7] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFile2floatCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFile2floatCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
     }
     __pyx_v_bed_fn = values[0];
     __pyx_v_input_num_ind = values[1];
@@ -2554,17 +3080,18 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_11readPlin
     __pyx_v_iidIdxList = values[4];
     __pyx_v_snpIdxList = values[5];
     __pyx_v_out = ((PyArrayObject *)values[6]);
+    __pyx_v_num_threads = values[7];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatCAAA", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2floatCAAA", 0, 7, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedFile2floatCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_10readPlinkBedFile2floatCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_10readPlinkBedFile2floatCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out, __pyx_v_num_threads);
 
   /* function exit code */
   goto __pyx_L0;
@@ -2575,9 +3102,15 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_11readPlin
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_10readPlinkBedFile2floatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_10readPlinkBedFile2floatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads) {
   std::vector<size_t>  __pyx_v_iid_idx_list;
   std::vector<int>  __pyx_v_sid_idx_list;
+  std::string __pyx_v_c_bed_fn;
+  int __pyx_v_c_input_num_ind;
+  int __pyx_v_c_input_num_snps;
+  int __pyx_v_c_num_threads;
+  bool __pyx_v_c_count_A1;
+  float *__pyx_v_c_out;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
   __Pyx_Buffer __pyx_pybuffer_out;
   PyObject *__pyx_r = NULL;
@@ -2586,8 +3119,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_10readPlin
   std::vector<int>  __pyx_t_2;
   std::string __pyx_t_3;
   int __pyx_t_4;
-  int __pyx_t_5;
-  bool __pyx_t_6;
+  bool __pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2598,46 +3130,118 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_10readPlin
   __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":125
- * def readPlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":164
+ * def readPlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
  * 	cdef vector[int] sid_idx_list = snpIdxList
- * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ * 	cdef string c_bed_fn = bed_fn
  */
-  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 125; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_iid_idx_list = __pyx_t_1;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":126
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":165
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
+ * 	cdef string c_bed_fn = bed_fn
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ */
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_sid_idx_list = __pyx_t_2;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":166
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef string c_bed_fn = bed_fn             # <<<<<<<<<<<<<<
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ */
+  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 166; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_bed_fn = __pyx_t_3;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":167
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef string c_bed_fn = bed_fn
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads             # <<<<<<<<<<<<<<
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef float* c_out = <float*> out.data
+ */
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_ind = __pyx_t_4;
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_snps = __pyx_t_4;
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_4;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":168
+ * 	cdef string c_bed_fn = bed_fn
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1             # <<<<<<<<<<<<<<
+ * 	cdef float* c_out = <float*> out.data
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ */
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_5 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_count_A1 = __pyx_t_5;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":169
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef float* c_out = <float*> out.data             # <<<<<<<<<<<<<<
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
  */
-  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 126; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_sid_idx_list = __pyx_t_2;
+  __pyx_v_c_out = ((float *)__pyx_v_out->data);
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":129
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":172
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
- * 	_readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data)             # <<<<<<<<<<<<<<
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedFilefloatCAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":173
+ * 
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read
+ * 		_readPlinkBedFilefloatCAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)             # <<<<<<<<<<<<<<
  * 	return out
  * 
  */
-  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_6 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 129; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  readPlinkBedFilefloatCAAA(__pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, ((float *)__pyx_v_out->data));
+        readPlinkBedFilefloatCAAA(__pyx_v_c_bed_fn, __pyx_v_c_input_num_ind, __pyx_v_c_input_num_snps, __pyx_v_c_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, __pyx_v_c_out, __pyx_v_c_num_threads);
+      }
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":130
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":172
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
- * 	_readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data)
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedFilefloatCAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":174
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read
+ * 		_readPlinkBedFilefloatCAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
  * 	return out             # <<<<<<<<<<<<<<
  * 
  * 
@@ -2647,10 +3251,10 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_10readPlin
   __pyx_r = ((PyObject *)__pyx_v_out);
   goto __pyx_L0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":123
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":162
  * 	return out
  * 
- * def readPlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
@@ -2672,10 +3276,10 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_10readPlin
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":133
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":177
  * 
  * 
- * def readPlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
@@ -2691,6 +3295,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_13readPlin
   PyObject *__pyx_v_iidIdxList = 0;
   PyObject *__pyx_v_snpIdxList = 0;
   PyArrayObject *__pyx_v_out = 0;
+  PyObject *__pyx_v_num_threads = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2698,12 +3303,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_13readPlin
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("readPlinkBedFile2doubleFAAA (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_fn,&__pyx_n_s_input_num_ind,&__pyx_n_s_input_num_snps,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,0};
-    PyObject* values[7] = {0,0,0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_fn,&__pyx_n_s_input_num_ind,&__pyx_n_s_input_num_snps,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,&__pyx_n_s_num_threads,0};
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    values[7] = ((PyObject *)__pyx_int_1);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
         case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
         case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
         case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
@@ -2722,47 +3329,55 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_13readPlin
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleFAAA", 1, 7, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleFAAA", 0, 7, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleFAAA", 1, 7, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleFAAA", 0, 7, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleFAAA", 1, 7, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleFAAA", 0, 7, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleFAAA", 1, 7, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleFAAA", 0, 7, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleFAAA", 1, 7, 7, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleFAAA", 0, 7, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  6:
         if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleFAAA", 1, 7, 7, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleFAAA", 0, 7, 8, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads);
+          if (value) { values[7] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFile2doubleFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFile2doubleFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
     }
     __pyx_v_bed_fn = values[0];
     __pyx_v_input_num_ind = values[1];
@@ -2771,17 +3386,18 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_13readPlin
     __pyx_v_iidIdxList = values[4];
     __pyx_v_snpIdxList = values[5];
     __pyx_v_out = ((PyArrayObject *)values[6]);
+    __pyx_v_num_threads = values[7];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleFAAA", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleFAAA", 0, 7, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedFile2doubleFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_12readPlinkBedFile2doubleFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_12readPlinkBedFile2doubleFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out, __pyx_v_num_threads);
 
   /* function exit code */
   goto __pyx_L0;
@@ -2792,9 +3408,15 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_13readPlin
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_12readPlinkBedFile2doubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_12readPlinkBedFile2doubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads) {
   std::vector<size_t>  __pyx_v_iid_idx_list;
   std::vector<int>  __pyx_v_sid_idx_list;
+  std::string __pyx_v_c_bed_fn;
+  int __pyx_v_c_input_num_ind;
+  int __pyx_v_c_input_num_snps;
+  int __pyx_v_c_num_threads;
+  bool __pyx_v_c_count_A1;
+  double *__pyx_v_c_out;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
   __Pyx_Buffer __pyx_pybuffer_out;
   PyObject *__pyx_r = NULL;
@@ -2803,8 +3425,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_12readPlin
   std::vector<int>  __pyx_t_2;
   std::string __pyx_t_3;
   int __pyx_t_4;
-  int __pyx_t_5;
-  bool __pyx_t_6;
+  bool __pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2815,59 +3436,131 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_12readPlin
   __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":135
- * def readPlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":179
+ * def readPlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
  * 	cdef vector[int] sid_idx_list = snpIdxList
- * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ * 	cdef string c_bed_fn = bed_fn
  */
-  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 135; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_iid_idx_list = __pyx_t_1;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":136
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":180
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
+ * 	cdef string c_bed_fn = bed_fn
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ */
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_sid_idx_list = __pyx_t_2;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":181
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef string c_bed_fn = bed_fn             # <<<<<<<<<<<<<<
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ */
+  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_bed_fn = __pyx_t_3;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":182
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef string c_bed_fn = bed_fn
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads             # <<<<<<<<<<<<<<
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef double* c_out = <double*> out.data
+ */
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_ind = __pyx_t_4;
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_snps = __pyx_t_4;
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_4;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":183
+ * 	cdef string c_bed_fn = bed_fn
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1             # <<<<<<<<<<<<<<
+ * 	cdef double* c_out = <double*> out.data
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ */
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_5 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_count_A1 = __pyx_t_5;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":184
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef double* c_out = <double*> out.data             # <<<<<<<<<<<<<<
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
  */
-  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_sid_idx_list = __pyx_t_2;
+  __pyx_v_c_out = ((double *)__pyx_v_out->data);
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":139
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":187
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
- * 	_readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data)             # <<<<<<<<<<<<<<
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedFiledoubleFAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":188
+ * 
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read
+ * 		_readPlinkBedFiledoubleFAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)             # <<<<<<<<<<<<<<
  * 	return out
  * 
  */
-  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_6 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  readPlinkBedFiledoubleFAAA(__pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, ((double *)__pyx_v_out->data));
+        readPlinkBedFiledoubleFAAA(__pyx_v_c_bed_fn, __pyx_v_c_input_num_ind, __pyx_v_c_input_num_snps, __pyx_v_c_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, __pyx_v_c_out, __pyx_v_c_num_threads);
+      }
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":140
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":187
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
- * 	_readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data)
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedFiledoubleFAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":189
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read
+ * 		_readPlinkBedFiledoubleFAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
  * 	return out             # <<<<<<<<<<<<<<
  * 
- * def readPlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):
+ * def readPlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(((PyObject *)__pyx_v_out));
   __pyx_r = ((PyObject *)__pyx_v_out);
   goto __pyx_L0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":133
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":177
  * 
  * 
- * def readPlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
@@ -2889,10 +3582,10 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_12readPlin
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":142
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":191
  * 	return out
  * 
- * def readPlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
@@ -2908,6 +3601,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_15readPlin
   PyObject *__pyx_v_iidIdxList = 0;
   PyObject *__pyx_v_snpIdxList = 0;
   PyArrayObject *__pyx_v_out = 0;
+  PyObject *__pyx_v_num_threads = 0;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -2915,12 +3609,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_15readPlin
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("readPlinkBedFile2doubleCAAA (wrapper)", 0);
   {
-    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_fn,&__pyx_n_s_input_num_ind,&__pyx_n_s_input_num_snps,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,0};
-    PyObject* values[7] = {0,0,0,0,0,0,0};
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_fn,&__pyx_n_s_input_num_ind,&__pyx_n_s_input_num_snps,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,&__pyx_n_s_num_threads,0};
+    PyObject* values[8] = {0,0,0,0,0,0,0,0};
+    values[7] = ((PyObject *)__pyx_int_1);
     if (unlikely(__pyx_kwds)) {
       Py_ssize_t kw_args;
       const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
       switch (pos_args) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
         case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
         case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
         case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
@@ -2939,47 +3635,55 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_15readPlin
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleCAAA", 1, 7, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleCAAA", 0, 7, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleCAAA", 1, 7, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleCAAA", 0, 7, 8, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleCAAA", 1, 7, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleCAAA", 0, 7, 8, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleCAAA", 1, 7, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleCAAA", 0, 7, 8, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleCAAA", 1, 7, 7, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleCAAA", 0, 7, 8, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  6:
         if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleCAAA", 1, 7, 7, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleCAAA", 0, 7, 8, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads);
+          if (value) { values[7] = value; kw_args--; }
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFile2doubleCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFile2doubleCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
-    } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
-      goto __pyx_L5_argtuple_error;
     } else {
-      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
     }
     __pyx_v_bed_fn = values[0];
     __pyx_v_input_num_ind = values[1];
@@ -2988,17 +3692,18 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_15readPlin
     __pyx_v_iidIdxList = values[4];
     __pyx_v_snpIdxList = values[5];
     __pyx_v_out = ((PyArrayObject *)values[6]);
+    __pyx_v_num_threads = values[7];
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleCAAA", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedFile2doubleCAAA", 0, 7, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedFile2doubleCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_14readPlinkBedFile2doubleCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_14readPlinkBedFile2doubleCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out, __pyx_v_num_threads);
 
   /* function exit code */
   goto __pyx_L0;
@@ -3009,9 +3714,15 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_15readPlin
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_14readPlinkBedFile2doubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_14readPlinkBedFile2doubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads) {
   std::vector<size_t>  __pyx_v_iid_idx_list;
   std::vector<int>  __pyx_v_sid_idx_list;
+  std::string __pyx_v_c_bed_fn;
+  int __pyx_v_c_input_num_ind;
+  int __pyx_v_c_input_num_snps;
+  int __pyx_v_c_num_threads;
+  bool __pyx_v_c_count_A1;
+  double *__pyx_v_c_out;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
   __Pyx_Buffer __pyx_pybuffer_out;
   PyObject *__pyx_r = NULL;
@@ -3020,8 +3731,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_14readPlin
   std::vector<int>  __pyx_t_2;
   std::string __pyx_t_3;
   int __pyx_t_4;
-  int __pyx_t_5;
-  bool __pyx_t_6;
+  bool __pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -3032,81 +3742,2905 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_14readPlin
   __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":144
- * def readPlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":193
+ * def readPlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
  * 	cdef vector[int] sid_idx_list = snpIdxList
- * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ * 	cdef string c_bed_fn = bed_fn
  */
-  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_iid_idx_list = __pyx_t_1;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":145
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":194
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
+ * 	cdef string c_bed_fn = bed_fn
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ */
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 194; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_sid_idx_list = __pyx_t_2;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":195
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef string c_bed_fn = bed_fn             # <<<<<<<<<<<<<<
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ */
+  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_bed_fn = __pyx_t_3;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":196
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef string c_bed_fn = bed_fn
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads             # <<<<<<<<<<<<<<
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef double* c_out = <double*> out.data
+ */
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_ind = __pyx_t_4;
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_snps = __pyx_t_4;
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_4;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":197
+ * 	cdef string c_bed_fn = bed_fn
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1             # <<<<<<<<<<<<<<
+ * 	cdef double* c_out = <double*> out.data
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ */
+  __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_5 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 197; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_count_A1 = __pyx_t_5;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":198
+ * 	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef double* c_out = <double*> out.data             # <<<<<<<<<<<<<<
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ * 
+ */
+  __pyx_v_c_out = ((double *)__pyx_v_out->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":201
+ * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+ * 
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedFiledoubleCAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":202
+ * 
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read
+ * 		_readPlinkBedFiledoubleCAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)             # <<<<<<<<<<<<<<
+ * 	return out
+ * 
+ */
+        readPlinkBedFiledoubleCAAA(__pyx_v_c_bed_fn, __pyx_v_c_input_num_ind, __pyx_v_c_input_num_snps, __pyx_v_c_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, __pyx_v_c_out, __pyx_v_c_num_threads);
+      }
+
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":201
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedFiledoubleCAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":203
+ * 	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read
+ * 		_readPlinkBedFiledoubleCAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out             # <<<<<<<<<<<<<<
+ * 
+ * #bed_bytes are the SNP records of a .bed file (everything after the 3-byte header), for example, from a np.memmap
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_out));
+  __pyx_r = ((PyObject *)__pyx_v_out);
+  goto __pyx_L0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":191
+ * 	return out
+ * 
+ * def readPlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedFile2doubleCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":206
+ * 
+ * #bed_bytes are the SNP records of a .bed file (everything after the 3-byte header), for example, from a np.memmap
+ * def readPlinkBedBytes2floatFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_17readPlinkBedBytes2floatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_17readPlinkBedBytes2floatFAAA = {"readPlinkBedBytes2floatFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_17readPlinkBedBytes2floatFAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_17readPlinkBedBytes2floatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_bed_bytes = 0;
+  PyObject *__pyx_v_input_num_ind = 0;
+  PyObject *__pyx_v_count_A1 = 0;
+  PyObject *__pyx_v_iidIdxList = 0;
+  PyObject *__pyx_v_snpIdxList = 0;
+  PyArrayObject *__pyx_v_out = 0;
+  PyObject *__pyx_v_num_threads = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("readPlinkBedBytes2floatFAAA (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_bytes,&__pyx_n_s_input_num_ind,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,&__pyx_n_s_num_threads,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
+    values[6] = ((PyObject *)__pyx_int_1);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bed_bytes)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2floatFAAA", 0, 6, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2floatFAAA", 0, 6, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2floatFAAA", 0, 6, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2floatFAAA", 0, 6, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2floatFAAA", 0, 6, 7, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads);
+          if (value) { values[6] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedBytes2floatFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_bed_bytes = ((PyArrayObject *)values[0]);
+    __pyx_v_input_num_ind = values[1];
+    __pyx_v_count_A1 = values[2];
+    __pyx_v_iidIdxList = values[3];
+    __pyx_v_snpIdxList = values[4];
+    __pyx_v_out = ((PyArrayObject *)values[5]);
+    __pyx_v_num_threads = values[6];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2floatFAAA", 0, 6, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytes2floatFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bed_bytes), __pyx_ptype_5numpy_ndarray, 1, "bed_bytes", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_16readPlinkBedBytes2floatFAAA(__pyx_self, __pyx_v_bed_bytes, __pyx_v_input_num_ind, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out, __pyx_v_num_threads);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_16readPlinkBedBytes2floatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads) {
+  std::vector<size_t>  __pyx_v_iid_idx_list;
+  std::vector<int>  __pyx_v_sid_idx_list;
+  unsigned char *__pyx_v_c_bed_bytes;
+  int __pyx_v_c_input_num_ind;
+  int __pyx_v_c_num_threads;
+  bool __pyx_v_c_count_A1;
+  float *__pyx_v_c_out;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bed_bytes;
+  __Pyx_Buffer __pyx_pybuffer_bed_bytes;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
+  __Pyx_Buffer __pyx_pybuffer_out;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  std::vector<size_t>  __pyx_t_1;
+  std::vector<int>  __pyx_t_2;
+  int __pyx_t_3;
+  bool __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("readPlinkBedBytes2floatFAAA", 0);
+  __pyx_pybuffer_bed_bytes.pybuffer.buf = NULL;
+  __pyx_pybuffer_bed_bytes.refcount = 0;
+  __pyx_pybuffernd_bed_bytes.data = NULL;
+  __pyx_pybuffernd_bed_bytes.rcbuffer = &__pyx_pybuffer_bed_bytes;
+  __pyx_pybuffer_out.pybuffer.buf = NULL;
+  __pyx_pybuffer_out.refcount = 0;
+  __pyx_pybuffernd_out.data = NULL;
+  __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer, (PyObject*)__pyx_v_bed_bytes, &__Pyx_TypeInfo_nn___pyx_t_5numpy_uint8_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_bed_bytes.diminfo[0].strides = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bed_bytes.diminfo[0].shape = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":208
+ * def readPlinkBedBytes2floatFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ */
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 208; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_iid_idx_list = __pyx_t_1;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":209
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ */
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_sid_idx_list = __pyx_t_2;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":210
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data             # <<<<<<<<<<<<<<
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ */
+  __pyx_v_c_bed_bytes = ((unsigned char *)__pyx_v_bed_bytes->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":211
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads             # <<<<<<<<<<<<<<
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef float* c_out = <float*> out.data
+ */
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_ind = __pyx_t_3;
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_3;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":212
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1             # <<<<<<<<<<<<<<
+ * 	cdef float* c_out = <float*> out.data
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 212; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_count_A1 = __pyx_t_4;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":213
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef float* c_out = <float*> out.data             # <<<<<<<<<<<<<<
+ * 
+ * 	with nogil:
+ */
+  __pyx_v_c_out = ((float *)__pyx_v_out->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":215
+ * 	cdef float* c_out = <float*> out.data
+ * 
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesfloatFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":216
+ * 
+ * 	with nogil:
+ * 		_readPlinkBedBytesfloatFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)             # <<<<<<<<<<<<<<
+ * 	return out
+ * 
+ */
+        readPlinkBedBytesfloatFAAA(__pyx_v_c_bed_bytes, __pyx_v_c_input_num_ind, __pyx_v_c_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, __pyx_v_c_out, __pyx_v_c_num_threads);
+      }
+
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":215
+ * 	cdef float* c_out = <float*> out.data
+ * 
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesfloatFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":217
+ * 	with nogil:
+ * 		_readPlinkBedBytesfloatFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out             # <<<<<<<<<<<<<<
+ * 
+ * def readPlinkBedBytes2floatCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_out));
+  __pyx_r = ((PyObject *)__pyx_v_out);
+  goto __pyx_L0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":206
+ * 
+ * #bed_bytes are the SNP records of a .bed file (everything after the 3-byte header), for example, from a np.memmap
+ * def readPlinkBedBytes2floatFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytes2floatFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":219
+ * 	return out
+ * 
+ * def readPlinkBedBytes2floatCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_19readPlinkBedBytes2floatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_19readPlinkBedBytes2floatCAAA = {"readPlinkBedBytes2floatCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_19readPlinkBedBytes2floatCAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_19readPlinkBedBytes2floatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_bed_bytes = 0;
+  PyObject *__pyx_v_input_num_ind = 0;
+  PyObject *__pyx_v_count_A1 = 0;
+  PyObject *__pyx_v_iidIdxList = 0;
+  PyObject *__pyx_v_snpIdxList = 0;
+  PyArrayObject *__pyx_v_out = 0;
+  PyObject *__pyx_v_num_threads = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("readPlinkBedBytes2floatCAAA (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_bytes,&__pyx_n_s_input_num_ind,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,&__pyx_n_s_num_threads,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
+    values[6] = ((PyObject *)__pyx_int_1);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bed_bytes)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2floatCAAA", 0, 6, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2floatCAAA", 0, 6, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2floatCAAA", 0, 6, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2floatCAAA", 0, 6, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2floatCAAA", 0, 6, 7, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads);
+          if (value) { values[6] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedBytes2floatCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_bed_bytes = ((PyArrayObject *)values[0]);
+    __pyx_v_input_num_ind = values[1];
+    __pyx_v_count_A1 = values[2];
+    __pyx_v_iidIdxList = values[3];
+    __pyx_v_snpIdxList = values[4];
+    __pyx_v_out = ((PyArrayObject *)values[5]);
+    __pyx_v_num_threads = values[6];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2floatCAAA", 0, 6, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytes2floatCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bed_bytes), __pyx_ptype_5numpy_ndarray, 1, "bed_bytes", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_18readPlinkBedBytes2floatCAAA(__pyx_self, __pyx_v_bed_bytes, __pyx_v_input_num_ind, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out, __pyx_v_num_threads);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_18readPlinkBedBytes2floatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads) {
+  std::vector<size_t>  __pyx_v_iid_idx_list;
+  std::vector<int>  __pyx_v_sid_idx_list;
+  unsigned char *__pyx_v_c_bed_bytes;
+  int __pyx_v_c_input_num_ind;
+  int __pyx_v_c_num_threads;
+  bool __pyx_v_c_count_A1;
+  float *__pyx_v_c_out;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bed_bytes;
+  __Pyx_Buffer __pyx_pybuffer_bed_bytes;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
+  __Pyx_Buffer __pyx_pybuffer_out;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  std::vector<size_t>  __pyx_t_1;
+  std::vector<int>  __pyx_t_2;
+  int __pyx_t_3;
+  bool __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("readPlinkBedBytes2floatCAAA", 0);
+  __pyx_pybuffer_bed_bytes.pybuffer.buf = NULL;
+  __pyx_pybuffer_bed_bytes.refcount = 0;
+  __pyx_pybuffernd_bed_bytes.data = NULL;
+  __pyx_pybuffernd_bed_bytes.rcbuffer = &__pyx_pybuffer_bed_bytes;
+  __pyx_pybuffer_out.pybuffer.buf = NULL;
+  __pyx_pybuffer_out.refcount = 0;
+  __pyx_pybuffernd_out.data = NULL;
+  __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer, (PyObject*)__pyx_v_bed_bytes, &__Pyx_TypeInfo_nn___pyx_t_5numpy_uint8_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_bed_bytes.diminfo[0].strides = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bed_bytes.diminfo[0].shape = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":221
+ * def readPlinkBedBytes2floatCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ */
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 221; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_iid_idx_list = __pyx_t_1;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":222
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ */
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 222; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_sid_idx_list = __pyx_t_2;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":223
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data             # <<<<<<<<<<<<<<
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ */
+  __pyx_v_c_bed_bytes = ((unsigned char *)__pyx_v_bed_bytes->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":224
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads             # <<<<<<<<<<<<<<
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef float* c_out = <float*> out.data
+ */
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_ind = __pyx_t_3;
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 224; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_3;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":225
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1             # <<<<<<<<<<<<<<
+ * 	cdef float* c_out = <float*> out.data
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_count_A1 = __pyx_t_4;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":226
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef float* c_out = <float*> out.data             # <<<<<<<<<<<<<<
+ * 
+ * 	with nogil:
+ */
+  __pyx_v_c_out = ((float *)__pyx_v_out->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":228
+ * 	cdef float* c_out = <float*> out.data
+ * 
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesfloatCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":229
+ * 
+ * 	with nogil:
+ * 		_readPlinkBedBytesfloatCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)             # <<<<<<<<<<<<<<
+ * 	return out
+ * 
+ */
+        readPlinkBedBytesfloatCAAA(__pyx_v_c_bed_bytes, __pyx_v_c_input_num_ind, __pyx_v_c_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, __pyx_v_c_out, __pyx_v_c_num_threads);
+      }
+
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":228
+ * 	cdef float* c_out = <float*> out.data
+ * 
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesfloatCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":230
+ * 	with nogil:
+ * 		_readPlinkBedBytesfloatCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out             # <<<<<<<<<<<<<<
+ * 
+ * def readPlinkBedBytes2doubleFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_out));
+  __pyx_r = ((PyObject *)__pyx_v_out);
+  goto __pyx_L0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":219
+ * 	return out
+ * 
+ * def readPlinkBedBytes2floatCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytes2floatCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":232
+ * 	return out
+ * 
+ * def readPlinkBedBytes2doubleFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_21readPlinkBedBytes2doubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_21readPlinkBedBytes2doubleFAAA = {"readPlinkBedBytes2doubleFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_21readPlinkBedBytes2doubleFAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_21readPlinkBedBytes2doubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_bed_bytes = 0;
+  PyObject *__pyx_v_input_num_ind = 0;
+  PyObject *__pyx_v_count_A1 = 0;
+  PyObject *__pyx_v_iidIdxList = 0;
+  PyObject *__pyx_v_snpIdxList = 0;
+  PyArrayObject *__pyx_v_out = 0;
+  PyObject *__pyx_v_num_threads = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("readPlinkBedBytes2doubleFAAA (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_bytes,&__pyx_n_s_input_num_ind,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,&__pyx_n_s_num_threads,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
+    values[6] = ((PyObject *)__pyx_int_1);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bed_bytes)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2doubleFAAA", 0, 6, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2doubleFAAA", 0, 6, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2doubleFAAA", 0, 6, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2doubleFAAA", 0, 6, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2doubleFAAA", 0, 6, 7, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads);
+          if (value) { values[6] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedBytes2doubleFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_bed_bytes = ((PyArrayObject *)values[0]);
+    __pyx_v_input_num_ind = values[1];
+    __pyx_v_count_A1 = values[2];
+    __pyx_v_iidIdxList = values[3];
+    __pyx_v_snpIdxList = values[4];
+    __pyx_v_out = ((PyArrayObject *)values[5]);
+    __pyx_v_num_threads = values[6];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2doubleFAAA", 0, 6, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytes2doubleFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bed_bytes), __pyx_ptype_5numpy_ndarray, 1, "bed_bytes", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_20readPlinkBedBytes2doubleFAAA(__pyx_self, __pyx_v_bed_bytes, __pyx_v_input_num_ind, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out, __pyx_v_num_threads);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_20readPlinkBedBytes2doubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads) {
+  std::vector<size_t>  __pyx_v_iid_idx_list;
+  std::vector<int>  __pyx_v_sid_idx_list;
+  unsigned char *__pyx_v_c_bed_bytes;
+  int __pyx_v_c_input_num_ind;
+  int __pyx_v_c_num_threads;
+  bool __pyx_v_c_count_A1;
+  double *__pyx_v_c_out;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bed_bytes;
+  __Pyx_Buffer __pyx_pybuffer_bed_bytes;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
+  __Pyx_Buffer __pyx_pybuffer_out;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  std::vector<size_t>  __pyx_t_1;
+  std::vector<int>  __pyx_t_2;
+  int __pyx_t_3;
+  bool __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("readPlinkBedBytes2doubleFAAA", 0);
+  __pyx_pybuffer_bed_bytes.pybuffer.buf = NULL;
+  __pyx_pybuffer_bed_bytes.refcount = 0;
+  __pyx_pybuffernd_bed_bytes.data = NULL;
+  __pyx_pybuffernd_bed_bytes.rcbuffer = &__pyx_pybuffer_bed_bytes;
+  __pyx_pybuffer_out.pybuffer.buf = NULL;
+  __pyx_pybuffer_out.refcount = 0;
+  __pyx_pybuffernd_out.data = NULL;
+  __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer, (PyObject*)__pyx_v_bed_bytes, &__Pyx_TypeInfo_nn___pyx_t_5numpy_uint8_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_bed_bytes.diminfo[0].strides = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bed_bytes.diminfo[0].shape = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":234
+ * def readPlinkBedBytes2doubleFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ */
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_iid_idx_list = __pyx_t_1;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":235
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ */
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 235; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_sid_idx_list = __pyx_t_2;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":236
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data             # <<<<<<<<<<<<<<
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ */
+  __pyx_v_c_bed_bytes = ((unsigned char *)__pyx_v_bed_bytes->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":237
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads             # <<<<<<<<<<<<<<
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef double* c_out = <double*> out.data
+ */
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_ind = __pyx_t_3;
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 237; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_3;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":238
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1             # <<<<<<<<<<<<<<
+ * 	cdef double* c_out = <double*> out.data
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 238; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_count_A1 = __pyx_t_4;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":239
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef double* c_out = <double*> out.data             # <<<<<<<<<<<<<<
+ * 
+ * 	with nogil:
+ */
+  __pyx_v_c_out = ((double *)__pyx_v_out->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":241
+ * 	cdef double* c_out = <double*> out.data
+ * 
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesdoubleFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":242
+ * 
+ * 	with nogil:
+ * 		_readPlinkBedBytesdoubleFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)             # <<<<<<<<<<<<<<
+ * 	return out
+ * 
+ */
+        readPlinkBedBytesdoubleFAAA(__pyx_v_c_bed_bytes, __pyx_v_c_input_num_ind, __pyx_v_c_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, __pyx_v_c_out, __pyx_v_c_num_threads);
+      }
+
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":241
+ * 	cdef double* c_out = <double*> out.data
+ * 
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesdoubleFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":243
+ * 	with nogil:
+ * 		_readPlinkBedBytesdoubleFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out             # <<<<<<<<<<<<<<
+ * 
+ * def readPlinkBedBytes2doubleCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_out));
+  __pyx_r = ((PyObject *)__pyx_v_out);
+  goto __pyx_L0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":232
+ * 	return out
+ * 
+ * def readPlinkBedBytes2doubleFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytes2doubleFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":245
+ * 	return out
+ * 
+ * def readPlinkBedBytes2doubleCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_23readPlinkBedBytes2doubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_23readPlinkBedBytes2doubleCAAA = {"readPlinkBedBytes2doubleCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_23readPlinkBedBytes2doubleCAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_23readPlinkBedBytes2doubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_bed_bytes = 0;
+  PyObject *__pyx_v_input_num_ind = 0;
+  PyObject *__pyx_v_count_A1 = 0;
+  PyObject *__pyx_v_iidIdxList = 0;
+  PyObject *__pyx_v_snpIdxList = 0;
+  PyArrayObject *__pyx_v_out = 0;
+  PyObject *__pyx_v_num_threads = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("readPlinkBedBytes2doubleCAAA (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_bytes,&__pyx_n_s_input_num_ind,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,&__pyx_n_s_num_threads,0};
+    PyObject* values[7] = {0,0,0,0,0,0,0};
+    values[6] = ((PyObject *)__pyx_int_1);
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bed_bytes)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2doubleCAAA", 0, 6, 7, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2doubleCAAA", 0, 6, 7, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2doubleCAAA", 0, 6, 7, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2doubleCAAA", 0, 6, 7, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2doubleCAAA", 0, 6, 7, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        if (kw_args > 0) {
+          PyObject* value = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads);
+          if (value) { values[6] = value; kw_args--; }
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedBytes2doubleCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else {
+      switch (PyTuple_GET_SIZE(__pyx_args)) {
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+    }
+    __pyx_v_bed_bytes = ((PyArrayObject *)values[0]);
+    __pyx_v_input_num_ind = values[1];
+    __pyx_v_count_A1 = values[2];
+    __pyx_v_iidIdxList = values[3];
+    __pyx_v_snpIdxList = values[4];
+    __pyx_v_out = ((PyArrayObject *)values[5]);
+    __pyx_v_num_threads = values[6];
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedBytes2doubleCAAA", 0, 6, 7, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytes2doubleCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bed_bytes), __pyx_ptype_5numpy_ndarray, 1, "bed_bytes", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_22readPlinkBedBytes2doubleCAAA(__pyx_self, __pyx_v_bed_bytes, __pyx_v_input_num_ind, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out, __pyx_v_num_threads);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_22readPlinkBedBytes2doubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads) {
+  std::vector<size_t>  __pyx_v_iid_idx_list;
+  std::vector<int>  __pyx_v_sid_idx_list;
+  unsigned char *__pyx_v_c_bed_bytes;
+  int __pyx_v_c_input_num_ind;
+  int __pyx_v_c_num_threads;
+  bool __pyx_v_c_count_A1;
+  double *__pyx_v_c_out;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bed_bytes;
+  __Pyx_Buffer __pyx_pybuffer_bed_bytes;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
+  __Pyx_Buffer __pyx_pybuffer_out;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  std::vector<size_t>  __pyx_t_1;
+  std::vector<int>  __pyx_t_2;
+  int __pyx_t_3;
+  bool __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("readPlinkBedBytes2doubleCAAA", 0);
+  __pyx_pybuffer_bed_bytes.pybuffer.buf = NULL;
+  __pyx_pybuffer_bed_bytes.refcount = 0;
+  __pyx_pybuffernd_bed_bytes.data = NULL;
+  __pyx_pybuffernd_bed_bytes.rcbuffer = &__pyx_pybuffer_bed_bytes;
+  __pyx_pybuffer_out.pybuffer.buf = NULL;
+  __pyx_pybuffer_out.refcount = 0;
+  __pyx_pybuffernd_out.data = NULL;
+  __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer, (PyObject*)__pyx_v_bed_bytes, &__Pyx_TypeInfo_nn___pyx_t_5numpy_uint8_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_bed_bytes.diminfo[0].strides = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bed_bytes.diminfo[0].shape = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":247
+ * def readPlinkBedBytes2doubleCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ */
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 247; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_iid_idx_list = __pyx_t_1;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":248
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ */
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 248; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_sid_idx_list = __pyx_t_2;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":249
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data             # <<<<<<<<<<<<<<
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ */
+  __pyx_v_c_bed_bytes = ((unsigned char *)__pyx_v_bed_bytes->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":250
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads             # <<<<<<<<<<<<<<
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef double* c_out = <double*> out.data
+ */
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 250; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_ind = __pyx_t_3;
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 250; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_3;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":251
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1             # <<<<<<<<<<<<<<
+ * 	cdef double* c_out = <double*> out.data
+ * 
+ */
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 251; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_count_A1 = __pyx_t_4;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":252
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef double* c_out = <double*> out.data             # <<<<<<<<<<<<<<
+ * 
+ * 	with nogil:
+ */
+  __pyx_v_c_out = ((double *)__pyx_v_out->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":254
+ * 	cdef double* c_out = <double*> out.data
+ * 
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesdoubleCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":255
+ * 
+ * 	with nogil:
+ * 		_readPlinkBedBytesdoubleCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)             # <<<<<<<<<<<<<<
+ * 	return out
+ * 
+ */
+        readPlinkBedBytesdoubleCAAA(__pyx_v_c_bed_bytes, __pyx_v_c_input_num_ind, __pyx_v_c_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, __pyx_v_c_out, __pyx_v_c_num_threads);
+      }
+
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":254
+ * 	cdef double* c_out = <double*> out.data
+ * 
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesdoubleCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":256
+ * 	with nogil:
+ * 		_readPlinkBedBytesdoubleCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+ * 	return out             # <<<<<<<<<<<<<<
+ * 
+ * #Like readPlinkBedBytes2*, but also unit (or beta) standardizes each SNP as it is decoded. Fills in stats unless use_stats is True.
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_out));
+  __pyx_r = ((PyObject *)__pyx_v_out);
+  goto __pyx_L0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":245
+ * 	return out
+ * 
+ * def readPlinkBedBytes2doubleCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytes2doubleCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":259
+ * 
+ * #Like readPlinkBedBytes2*, but also unit (or beta) standardizes each SNP as it is decoded. Fills in stats unless use_stats is True.
+ * def readPlinkBedBytesStandardize2floatFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads, bool betaNotUnitVariance, float betaA, float betaB, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_25readPlinkBedBytesStandardize2floatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_25readPlinkBedBytesStandardize2floatFAAA = {"readPlinkBedBytesStandardize2floatFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_25readPlinkBedBytesStandardize2floatFAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_25readPlinkBedBytesStandardize2floatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_bed_bytes = 0;
+  PyObject *__pyx_v_input_num_ind = 0;
+  PyObject *__pyx_v_count_A1 = 0;
+  PyObject *__pyx_v_iidIdxList = 0;
+  PyObject *__pyx_v_snpIdxList = 0;
+  PyArrayObject *__pyx_v_out = 0;
+  PyObject *__pyx_v_num_threads = 0;
+  bool __pyx_v_betaNotUnitVariance;
+  float __pyx_v_betaA;
+  float __pyx_v_betaB;
+  bool __pyx_v_use_stats;
+  PyArrayObject *__pyx_v_stats = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("readPlinkBedBytesStandardize2floatFAAA (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_bytes,&__pyx_n_s_input_num_ind,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,&__pyx_n_s_num_threads,&__pyx_n_s_betaNotUnitVariance,&__pyx_n_s_betaA,&__pyx_n_s_betaB,&__pyx_n_s_use_stats,&__pyx_n_s_stats,0};
+    PyObject* values[12] = {0,0,0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 12: values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bed_bytes)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatFAAA", 1, 12, 12, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatFAAA", 1, 12, 12, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatFAAA", 1, 12, 12, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatFAAA", 1, 12, 12, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatFAAA", 1, 12, 12, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatFAAA", 1, 12, 12, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (likely((values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaNotUnitVariance)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatFAAA", 1, 12, 12, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  8:
+        if (likely((values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaA)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatFAAA", 1, 12, 12, 8); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  9:
+        if (likely((values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaB)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatFAAA", 1, 12, 12, 9); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 10:
+        if (likely((values[10] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_use_stats)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatFAAA", 1, 12, 12, 10); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 11:
+        if (likely((values[11] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stats)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatFAAA", 1, 12, 12, 11); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedBytesStandardize2floatFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 12) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+      values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+      values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+    }
+    __pyx_v_bed_bytes = ((PyArrayObject *)values[0]);
+    __pyx_v_input_num_ind = values[1];
+    __pyx_v_count_A1 = values[2];
+    __pyx_v_iidIdxList = values[3];
+    __pyx_v_snpIdxList = values[4];
+    __pyx_v_out = ((PyArrayObject *)values[5]);
+    __pyx_v_num_threads = values[6];
+    __pyx_v_betaNotUnitVariance = __Pyx_PyObject_IsTrue(values[7]); if (unlikely((__pyx_v_betaNotUnitVariance == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaA = __pyx_PyFloat_AsFloat(values[8]); if (unlikely((__pyx_v_betaA == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaB = __pyx_PyFloat_AsFloat(values[9]); if (unlikely((__pyx_v_betaB == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_use_stats = __Pyx_PyObject_IsTrue(values[10]); if (unlikely((__pyx_v_use_stats == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_stats = ((PyArrayObject *)values[11]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatFAAA", 1, 12, 12, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytesStandardize2floatFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bed_bytes), __pyx_ptype_5numpy_ndarray, 1, "bed_bytes", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_stats), __pyx_ptype_5numpy_ndarray, 1, "stats", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_24readPlinkBedBytesStandardize2floatFAAA(__pyx_self, __pyx_v_bed_bytes, __pyx_v_input_num_ind, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out, __pyx_v_num_threads, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_use_stats, __pyx_v_stats);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_24readPlinkBedBytesStandardize2floatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads, bool __pyx_v_betaNotUnitVariance, float __pyx_v_betaA, float __pyx_v_betaB, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats) {
+  std::vector<size_t>  __pyx_v_iid_idx_list;
+  std::vector<int>  __pyx_v_sid_idx_list;
+  unsigned char *__pyx_v_c_bed_bytes;
+  int __pyx_v_c_input_num_ind;
+  int __pyx_v_c_num_threads;
+  bool __pyx_v_c_count_A1;
+  float *__pyx_v_c_out;
+  float *__pyx_v_c_stats;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bed_bytes;
+  __Pyx_Buffer __pyx_pybuffer_bed_bytes;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
+  __Pyx_Buffer __pyx_pybuffer_out;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_stats;
+  __Pyx_Buffer __pyx_pybuffer_stats;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  std::vector<size_t>  __pyx_t_1;
+  std::vector<int>  __pyx_t_2;
+  int __pyx_t_3;
+  bool __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("readPlinkBedBytesStandardize2floatFAAA", 0);
+  __pyx_pybuffer_bed_bytes.pybuffer.buf = NULL;
+  __pyx_pybuffer_bed_bytes.refcount = 0;
+  __pyx_pybuffernd_bed_bytes.data = NULL;
+  __pyx_pybuffernd_bed_bytes.rcbuffer = &__pyx_pybuffer_bed_bytes;
+  __pyx_pybuffer_out.pybuffer.buf = NULL;
+  __pyx_pybuffer_out.refcount = 0;
+  __pyx_pybuffernd_out.data = NULL;
+  __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
+  __pyx_pybuffer_stats.pybuffer.buf = NULL;
+  __pyx_pybuffer_stats.refcount = 0;
+  __pyx_pybuffernd_stats.data = NULL;
+  __pyx_pybuffernd_stats.rcbuffer = &__pyx_pybuffer_stats;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer, (PyObject*)__pyx_v_bed_bytes, &__Pyx_TypeInfo_nn___pyx_t_5numpy_uint8_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_bed_bytes.diminfo[0].strides = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bed_bytes.diminfo[0].shape = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_stats.rcbuffer->pybuffer, (PyObject*)__pyx_v_stats, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_stats.diminfo[0].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_stats.diminfo[0].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_stats.diminfo[1].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_stats.diminfo[1].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[1];
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":261
+ * def readPlinkBedBytesStandardize2floatFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads, bool betaNotUnitVariance, float betaA, float betaB, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ */
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 261; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_iid_idx_list = __pyx_t_1;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":262
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ */
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 262; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_sid_idx_list = __pyx_t_2;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":263
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data             # <<<<<<<<<<<<<<
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ */
+  __pyx_v_c_bed_bytes = ((unsigned char *)__pyx_v_bed_bytes->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":264
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads             # <<<<<<<<<<<<<<
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef float* c_out = <float*> out.data
+ */
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 264; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_ind = __pyx_t_3;
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 264; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_3;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":265
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1             # <<<<<<<<<<<<<<
+ * 	cdef float* c_out = <float*> out.data
+ * 	cdef float* c_stats = <float*> stats.data
+ */
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 265; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_count_A1 = __pyx_t_4;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":266
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef float* c_out = <float*> out.data             # <<<<<<<<<<<<<<
+ * 	cdef float* c_stats = <float*> stats.data
+ * 
+ */
+  __pyx_v_c_out = ((float *)__pyx_v_out->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":267
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef float* c_out = <float*> out.data
+ * 	cdef float* c_stats = <float*> stats.data             # <<<<<<<<<<<<<<
+ * 
+ * 	with nogil:
+ */
+  __pyx_v_c_stats = ((float *)__pyx_v_stats->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":269
+ * 	cdef float* c_stats = <float*> stats.data
+ * 
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesStandardizefloatFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+ * 	return out, stats
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":270
+ * 
+ * 	with nogil:
+ * 		_readPlinkBedBytesStandardizefloatFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)             # <<<<<<<<<<<<<<
+ * 	return out, stats
+ * 
+ */
+        readPlinkBedBytesStandardizefloatFAAA(__pyx_v_c_bed_bytes, __pyx_v_c_input_num_ind, __pyx_v_c_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, __pyx_v_c_out, __pyx_v_c_num_threads, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_use_stats, __pyx_v_c_stats);
+      }
+
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":269
+ * 	cdef float* c_stats = <float*> stats.data
+ * 
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesStandardizefloatFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+ * 	return out, stats
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":271
+ * 	with nogil:
+ * 		_readPlinkBedBytesStandardizefloatFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+ * 	return out, stats             # <<<<<<<<<<<<<<
+ * 
+ * def readPlinkBedBytesStandardize2floatCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads, bool betaNotUnitVariance, float betaA, float betaB, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 271; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_INCREF(((PyObject *)__pyx_v_out));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_out));
+  PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_v_out));
+  __Pyx_INCREF(((PyObject *)__pyx_v_stats));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_stats));
+  PyTuple_SET_ITEM(__pyx_t_5, 1, ((PyObject *)__pyx_v_stats));
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":259
+ * 
+ * #Like readPlinkBedBytes2*, but also unit (or beta) standardizes each SNP as it is decoded. Fills in stats unless use_stats is True.
+ * def readPlinkBedBytesStandardize2floatFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads, bool betaNotUnitVariance, float betaA, float betaB, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_stats.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytesStandardize2floatFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_stats.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":273
+ * 	return out, stats
+ * 
+ * def readPlinkBedBytesStandardize2floatCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads, bool betaNotUnitVariance, float betaA, float betaB, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_27readPlinkBedBytesStandardize2floatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_27readPlinkBedBytesStandardize2floatCAAA = {"readPlinkBedBytesStandardize2floatCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_27readPlinkBedBytesStandardize2floatCAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_27readPlinkBedBytesStandardize2floatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_bed_bytes = 0;
+  PyObject *__pyx_v_input_num_ind = 0;
+  PyObject *__pyx_v_count_A1 = 0;
+  PyObject *__pyx_v_iidIdxList = 0;
+  PyObject *__pyx_v_snpIdxList = 0;
+  PyArrayObject *__pyx_v_out = 0;
+  PyObject *__pyx_v_num_threads = 0;
+  bool __pyx_v_betaNotUnitVariance;
+  float __pyx_v_betaA;
+  float __pyx_v_betaB;
+  bool __pyx_v_use_stats;
+  PyArrayObject *__pyx_v_stats = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("readPlinkBedBytesStandardize2floatCAAA (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_bytes,&__pyx_n_s_input_num_ind,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,&__pyx_n_s_num_threads,&__pyx_n_s_betaNotUnitVariance,&__pyx_n_s_betaA,&__pyx_n_s_betaB,&__pyx_n_s_use_stats,&__pyx_n_s_stats,0};
+    PyObject* values[12] = {0,0,0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 12: values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bed_bytes)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatCAAA", 1, 12, 12, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatCAAA", 1, 12, 12, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatCAAA", 1, 12, 12, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatCAAA", 1, 12, 12, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatCAAA", 1, 12, 12, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatCAAA", 1, 12, 12, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (likely((values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaNotUnitVariance)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatCAAA", 1, 12, 12, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  8:
+        if (likely((values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaA)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatCAAA", 1, 12, 12, 8); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  9:
+        if (likely((values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaB)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatCAAA", 1, 12, 12, 9); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 10:
+        if (likely((values[10] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_use_stats)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatCAAA", 1, 12, 12, 10); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 11:
+        if (likely((values[11] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stats)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatCAAA", 1, 12, 12, 11); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedBytesStandardize2floatCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 12) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+      values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+      values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+    }
+    __pyx_v_bed_bytes = ((PyArrayObject *)values[0]);
+    __pyx_v_input_num_ind = values[1];
+    __pyx_v_count_A1 = values[2];
+    __pyx_v_iidIdxList = values[3];
+    __pyx_v_snpIdxList = values[4];
+    __pyx_v_out = ((PyArrayObject *)values[5]);
+    __pyx_v_num_threads = values[6];
+    __pyx_v_betaNotUnitVariance = __Pyx_PyObject_IsTrue(values[7]); if (unlikely((__pyx_v_betaNotUnitVariance == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaA = __pyx_PyFloat_AsFloat(values[8]); if (unlikely((__pyx_v_betaA == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaB = __pyx_PyFloat_AsFloat(values[9]); if (unlikely((__pyx_v_betaB == (float)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_use_stats = __Pyx_PyObject_IsTrue(values[10]); if (unlikely((__pyx_v_use_stats == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_stats = ((PyArrayObject *)values[11]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2floatCAAA", 1, 12, 12, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytesStandardize2floatCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bed_bytes), __pyx_ptype_5numpy_ndarray, 1, "bed_bytes", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_stats), __pyx_ptype_5numpy_ndarray, 1, "stats", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_26readPlinkBedBytesStandardize2floatCAAA(__pyx_self, __pyx_v_bed_bytes, __pyx_v_input_num_ind, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out, __pyx_v_num_threads, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_use_stats, __pyx_v_stats);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_26readPlinkBedBytesStandardize2floatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads, bool __pyx_v_betaNotUnitVariance, float __pyx_v_betaA, float __pyx_v_betaB, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats) {
+  std::vector<size_t>  __pyx_v_iid_idx_list;
+  std::vector<int>  __pyx_v_sid_idx_list;
+  unsigned char *__pyx_v_c_bed_bytes;
+  int __pyx_v_c_input_num_ind;
+  int __pyx_v_c_num_threads;
+  bool __pyx_v_c_count_A1;
+  float *__pyx_v_c_out;
+  float *__pyx_v_c_stats;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bed_bytes;
+  __Pyx_Buffer __pyx_pybuffer_bed_bytes;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
+  __Pyx_Buffer __pyx_pybuffer_out;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_stats;
+  __Pyx_Buffer __pyx_pybuffer_stats;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  std::vector<size_t>  __pyx_t_1;
+  std::vector<int>  __pyx_t_2;
+  int __pyx_t_3;
+  bool __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("readPlinkBedBytesStandardize2floatCAAA", 0);
+  __pyx_pybuffer_bed_bytes.pybuffer.buf = NULL;
+  __pyx_pybuffer_bed_bytes.refcount = 0;
+  __pyx_pybuffernd_bed_bytes.data = NULL;
+  __pyx_pybuffernd_bed_bytes.rcbuffer = &__pyx_pybuffer_bed_bytes;
+  __pyx_pybuffer_out.pybuffer.buf = NULL;
+  __pyx_pybuffer_out.refcount = 0;
+  __pyx_pybuffernd_out.data = NULL;
+  __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
+  __pyx_pybuffer_stats.pybuffer.buf = NULL;
+  __pyx_pybuffer_stats.refcount = 0;
+  __pyx_pybuffernd_stats.data = NULL;
+  __pyx_pybuffernd_stats.rcbuffer = &__pyx_pybuffer_stats;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer, (PyObject*)__pyx_v_bed_bytes, &__Pyx_TypeInfo_nn___pyx_t_5numpy_uint8_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_bed_bytes.diminfo[0].strides = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bed_bytes.diminfo[0].shape = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_stats.rcbuffer->pybuffer, (PyObject*)__pyx_v_stats, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_stats.diminfo[0].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_stats.diminfo[0].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_stats.diminfo[1].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_stats.diminfo[1].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[1];
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":275
+ * def readPlinkBedBytesStandardize2floatCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads, bool betaNotUnitVariance, float betaA, float betaB, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ */
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 275; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_iid_idx_list = __pyx_t_1;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":276
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ */
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 276; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_sid_idx_list = __pyx_t_2;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":277
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data             # <<<<<<<<<<<<<<
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ */
+  __pyx_v_c_bed_bytes = ((unsigned char *)__pyx_v_bed_bytes->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":278
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads             # <<<<<<<<<<<<<<
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef float* c_out = <float*> out.data
+ */
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_ind = __pyx_t_3;
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 278; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_3;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":279
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1             # <<<<<<<<<<<<<<
+ * 	cdef float* c_out = <float*> out.data
+ * 	cdef float* c_stats = <float*> stats.data
+ */
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 279; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_count_A1 = __pyx_t_4;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":280
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef float* c_out = <float*> out.data             # <<<<<<<<<<<<<<
+ * 	cdef float* c_stats = <float*> stats.data
+ * 
+ */
+  __pyx_v_c_out = ((float *)__pyx_v_out->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":281
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef float* c_out = <float*> out.data
+ * 	cdef float* c_stats = <float*> stats.data             # <<<<<<<<<<<<<<
+ * 
+ * 	with nogil:
+ */
+  __pyx_v_c_stats = ((float *)__pyx_v_stats->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":283
+ * 	cdef float* c_stats = <float*> stats.data
+ * 
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesStandardizefloatCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+ * 	return out, stats
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":284
+ * 
+ * 	with nogil:
+ * 		_readPlinkBedBytesStandardizefloatCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)             # <<<<<<<<<<<<<<
+ * 	return out, stats
+ * 
+ */
+        readPlinkBedBytesStandardizefloatCAAA(__pyx_v_c_bed_bytes, __pyx_v_c_input_num_ind, __pyx_v_c_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, __pyx_v_c_out, __pyx_v_c_num_threads, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_use_stats, __pyx_v_c_stats);
+      }
+
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":283
+ * 	cdef float* c_stats = <float*> stats.data
+ * 
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesStandardizefloatCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+ * 	return out, stats
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":285
+ * 	with nogil:
+ * 		_readPlinkBedBytesStandardizefloatCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+ * 	return out, stats             # <<<<<<<<<<<<<<
+ * 
+ * def readPlinkBedBytesStandardize2doubleFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 285; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_INCREF(((PyObject *)__pyx_v_out));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_out));
+  PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_v_out));
+  __Pyx_INCREF(((PyObject *)__pyx_v_stats));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_stats));
+  PyTuple_SET_ITEM(__pyx_t_5, 1, ((PyObject *)__pyx_v_stats));
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":273
+ * 	return out, stats
+ * 
+ * def readPlinkBedBytesStandardize2floatCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads, bool betaNotUnitVariance, float betaA, float betaB, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_stats.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytesStandardize2floatCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_stats.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":287
+ * 	return out, stats
+ * 
+ * def readPlinkBedBytesStandardize2doubleFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_29readPlinkBedBytesStandardize2doubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_29readPlinkBedBytesStandardize2doubleFAAA = {"readPlinkBedBytesStandardize2doubleFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_29readPlinkBedBytesStandardize2doubleFAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_29readPlinkBedBytesStandardize2doubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_bed_bytes = 0;
+  PyObject *__pyx_v_input_num_ind = 0;
+  PyObject *__pyx_v_count_A1 = 0;
+  PyObject *__pyx_v_iidIdxList = 0;
+  PyObject *__pyx_v_snpIdxList = 0;
+  PyArrayObject *__pyx_v_out = 0;
+  PyObject *__pyx_v_num_threads = 0;
+  bool __pyx_v_betaNotUnitVariance;
+  double __pyx_v_betaA;
+  double __pyx_v_betaB;
+  bool __pyx_v_use_stats;
+  PyArrayObject *__pyx_v_stats = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("readPlinkBedBytesStandardize2doubleFAAA (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_bytes,&__pyx_n_s_input_num_ind,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,&__pyx_n_s_num_threads,&__pyx_n_s_betaNotUnitVariance,&__pyx_n_s_betaA,&__pyx_n_s_betaB,&__pyx_n_s_use_stats,&__pyx_n_s_stats,0};
+    PyObject* values[12] = {0,0,0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 12: values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bed_bytes)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleFAAA", 1, 12, 12, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleFAAA", 1, 12, 12, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleFAAA", 1, 12, 12, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleFAAA", 1, 12, 12, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleFAAA", 1, 12, 12, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleFAAA", 1, 12, 12, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (likely((values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaNotUnitVariance)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleFAAA", 1, 12, 12, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  8:
+        if (likely((values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaA)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleFAAA", 1, 12, 12, 8); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  9:
+        if (likely((values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaB)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleFAAA", 1, 12, 12, 9); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 10:
+        if (likely((values[10] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_use_stats)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleFAAA", 1, 12, 12, 10); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 11:
+        if (likely((values[11] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stats)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleFAAA", 1, 12, 12, 11); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedBytesStandardize2doubleFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 12) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+      values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+      values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+    }
+    __pyx_v_bed_bytes = ((PyArrayObject *)values[0]);
+    __pyx_v_input_num_ind = values[1];
+    __pyx_v_count_A1 = values[2];
+    __pyx_v_iidIdxList = values[3];
+    __pyx_v_snpIdxList = values[4];
+    __pyx_v_out = ((PyArrayObject *)values[5]);
+    __pyx_v_num_threads = values[6];
+    __pyx_v_betaNotUnitVariance = __Pyx_PyObject_IsTrue(values[7]); if (unlikely((__pyx_v_betaNotUnitVariance == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaA = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_betaA == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaB = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_betaB == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_use_stats = __Pyx_PyObject_IsTrue(values[10]); if (unlikely((__pyx_v_use_stats == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_stats = ((PyArrayObject *)values[11]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleFAAA", 1, 12, 12, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytesStandardize2doubleFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bed_bytes), __pyx_ptype_5numpy_ndarray, 1, "bed_bytes", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_stats), __pyx_ptype_5numpy_ndarray, 1, "stats", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_28readPlinkBedBytesStandardize2doubleFAAA(__pyx_self, __pyx_v_bed_bytes, __pyx_v_input_num_ind, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out, __pyx_v_num_threads, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_use_stats, __pyx_v_stats);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_28readPlinkBedBytesStandardize2doubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads, bool __pyx_v_betaNotUnitVariance, double __pyx_v_betaA, double __pyx_v_betaB, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats) {
+  std::vector<size_t>  __pyx_v_iid_idx_list;
+  std::vector<int>  __pyx_v_sid_idx_list;
+  unsigned char *__pyx_v_c_bed_bytes;
+  int __pyx_v_c_input_num_ind;
+  int __pyx_v_c_num_threads;
+  bool __pyx_v_c_count_A1;
+  double *__pyx_v_c_out;
+  double *__pyx_v_c_stats;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bed_bytes;
+  __Pyx_Buffer __pyx_pybuffer_bed_bytes;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
+  __Pyx_Buffer __pyx_pybuffer_out;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_stats;
+  __Pyx_Buffer __pyx_pybuffer_stats;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  std::vector<size_t>  __pyx_t_1;
+  std::vector<int>  __pyx_t_2;
+  int __pyx_t_3;
+  bool __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("readPlinkBedBytesStandardize2doubleFAAA", 0);
+  __pyx_pybuffer_bed_bytes.pybuffer.buf = NULL;
+  __pyx_pybuffer_bed_bytes.refcount = 0;
+  __pyx_pybuffernd_bed_bytes.data = NULL;
+  __pyx_pybuffernd_bed_bytes.rcbuffer = &__pyx_pybuffer_bed_bytes;
+  __pyx_pybuffer_out.pybuffer.buf = NULL;
+  __pyx_pybuffer_out.refcount = 0;
+  __pyx_pybuffernd_out.data = NULL;
+  __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
+  __pyx_pybuffer_stats.pybuffer.buf = NULL;
+  __pyx_pybuffer_stats.refcount = 0;
+  __pyx_pybuffernd_stats.data = NULL;
+  __pyx_pybuffernd_stats.rcbuffer = &__pyx_pybuffer_stats;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer, (PyObject*)__pyx_v_bed_bytes, &__Pyx_TypeInfo_nn___pyx_t_5numpy_uint8_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_bed_bytes.diminfo[0].strides = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bed_bytes.diminfo[0].shape = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_stats.rcbuffer->pybuffer, (PyObject*)__pyx_v_stats, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_stats.diminfo[0].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_stats.diminfo[0].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_stats.diminfo[1].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_stats.diminfo[1].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[1];
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":289
+ * def readPlinkBedBytesStandardize2doubleFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ */
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 289; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_iid_idx_list = __pyx_t_1;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":290
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ */
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 290; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_sid_idx_list = __pyx_t_2;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":291
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data             # <<<<<<<<<<<<<<
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ */
+  __pyx_v_c_bed_bytes = ((unsigned char *)__pyx_v_bed_bytes->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":292
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads             # <<<<<<<<<<<<<<
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef double* c_out = <double*> out.data
+ */
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 292; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_ind = __pyx_t_3;
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 292; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_3;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":293
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1             # <<<<<<<<<<<<<<
+ * 	cdef double* c_out = <double*> out.data
+ * 	cdef double* c_stats = <double*> stats.data
+ */
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 293; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_count_A1 = __pyx_t_4;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":294
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef double* c_out = <double*> out.data             # <<<<<<<<<<<<<<
+ * 	cdef double* c_stats = <double*> stats.data
+ * 
+ */
+  __pyx_v_c_out = ((double *)__pyx_v_out->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":295
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef double* c_out = <double*> out.data
+ * 	cdef double* c_stats = <double*> stats.data             # <<<<<<<<<<<<<<
+ * 
+ * 	with nogil:
+ */
+  __pyx_v_c_stats = ((double *)__pyx_v_stats->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":297
+ * 	cdef double* c_stats = <double*> stats.data
+ * 
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesStandardizedoubleFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+ * 	return out, stats
+ */
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
+
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":298
+ * 
+ * 	with nogil:
+ * 		_readPlinkBedBytesStandardizedoubleFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)             # <<<<<<<<<<<<<<
+ * 	return out, stats
+ * 
+ */
+        readPlinkBedBytesStandardizedoubleFAAA(__pyx_v_c_bed_bytes, __pyx_v_c_input_num_ind, __pyx_v_c_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, __pyx_v_c_out, __pyx_v_c_num_threads, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_use_stats, __pyx_v_c_stats);
+      }
+
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":297
+ * 	cdef double* c_stats = <double*> stats.data
+ * 
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesStandardizedoubleFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+ * 	return out, stats
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":299
+ * 	with nogil:
+ * 		_readPlinkBedBytesStandardizedoubleFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+ * 	return out, stats             # <<<<<<<<<<<<<<
+ * 
+ * def readPlinkBedBytesStandardize2doubleCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 299; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_INCREF(((PyObject *)__pyx_v_out));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_out));
+  PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_v_out));
+  __Pyx_INCREF(((PyObject *)__pyx_v_stats));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_stats));
+  PyTuple_SET_ITEM(__pyx_t_5, 1, ((PyObject *)__pyx_v_stats));
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":287
+ * 	return out, stats
+ * 
+ * def readPlinkBedBytesStandardize2doubleFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_stats.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytesStandardize2doubleFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_stats.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":301
+ * 	return out, stats
+ * 
+ * def readPlinkBedBytesStandardize2doubleCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_31readPlinkBedBytesStandardize2doubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_31readPlinkBedBytesStandardize2doubleCAAA = {"readPlinkBedBytesStandardize2doubleCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_31readPlinkBedBytesStandardize2doubleCAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_31readPlinkBedBytesStandardize2doubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_bed_bytes = 0;
+  PyObject *__pyx_v_input_num_ind = 0;
+  PyObject *__pyx_v_count_A1 = 0;
+  PyObject *__pyx_v_iidIdxList = 0;
+  PyObject *__pyx_v_snpIdxList = 0;
+  PyArrayObject *__pyx_v_out = 0;
+  PyObject *__pyx_v_num_threads = 0;
+  bool __pyx_v_betaNotUnitVariance;
+  double __pyx_v_betaA;
+  double __pyx_v_betaB;
+  bool __pyx_v_use_stats;
+  PyArrayObject *__pyx_v_stats = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("readPlinkBedBytesStandardize2doubleCAAA (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_bed_bytes,&__pyx_n_s_input_num_ind,&__pyx_n_s_count_A1,&__pyx_n_s_iidIdxList,&__pyx_n_s_snpIdxList,&__pyx_n_s_out,&__pyx_n_s_num_threads,&__pyx_n_s_betaNotUnitVariance,&__pyx_n_s_betaA,&__pyx_n_s_betaB,&__pyx_n_s_use_stats,&__pyx_n_s_stats,0};
+    PyObject* values[12] = {0,0,0,0,0,0,0,0,0,0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case 12: values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+        case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+        case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+        case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+        case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+        case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+        case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+        case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+        case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_bed_bytes)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        case  1:
+        if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleCAAA", 1, 12, 12, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  2:
+        if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleCAAA", 1, 12, 12, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  3:
+        if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleCAAA", 1, 12, 12, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  4:
+        if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleCAAA", 1, 12, 12, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  5:
+        if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleCAAA", 1, 12, 12, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  6:
+        if (likely((values[6] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_num_threads)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleCAAA", 1, 12, 12, 6); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  7:
+        if (likely((values[7] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaNotUnitVariance)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleCAAA", 1, 12, 12, 7); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  8:
+        if (likely((values[8] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaA)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleCAAA", 1, 12, 12, 8); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case  9:
+        if (likely((values[9] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_betaB)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleCAAA", 1, 12, 12, 9); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 10:
+        if (likely((values[10] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_use_stats)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleCAAA", 1, 12, 12, 10); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+        case 11:
+        if (likely((values[11] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_stats)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleCAAA", 1, 12, 12, 11); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedBytesStandardize2doubleCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 12) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+      values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
+      values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
+      values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
+      values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
+      values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
+      values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
+      values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
+      values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
+      values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
+    }
+    __pyx_v_bed_bytes = ((PyArrayObject *)values[0]);
+    __pyx_v_input_num_ind = values[1];
+    __pyx_v_count_A1 = values[2];
+    __pyx_v_iidIdxList = values[3];
+    __pyx_v_snpIdxList = values[4];
+    __pyx_v_out = ((PyArrayObject *)values[5]);
+    __pyx_v_num_threads = values[6];
+    __pyx_v_betaNotUnitVariance = __Pyx_PyObject_IsTrue(values[7]); if (unlikely((__pyx_v_betaNotUnitVariance == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaA = __pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_betaA == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_betaB = __pyx_PyFloat_AsDouble(values[9]); if (unlikely((__pyx_v_betaB == (double)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_use_stats = __Pyx_PyObject_IsTrue(values[10]); if (unlikely((__pyx_v_use_stats == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+    __pyx_v_stats = ((PyArrayObject *)values[11]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedBytesStandardize2doubleCAAA", 1, 12, 12, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytesStandardize2doubleCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_bed_bytes), __pyx_ptype_5numpy_ndarray, 1, "bed_bytes", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_stats), __pyx_ptype_5numpy_ndarray, 1, "stats", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_30readPlinkBedBytesStandardize2doubleCAAA(__pyx_self, __pyx_v_bed_bytes, __pyx_v_input_num_ind, __pyx_v_count_A1, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out, __pyx_v_num_threads, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_use_stats, __pyx_v_stats);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_30readPlinkBedBytesStandardize2doubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_bed_bytes, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_count_A1, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out, PyObject *__pyx_v_num_threads, bool __pyx_v_betaNotUnitVariance, double __pyx_v_betaA, double __pyx_v_betaB, bool __pyx_v_use_stats, PyArrayObject *__pyx_v_stats) {
+  std::vector<size_t>  __pyx_v_iid_idx_list;
+  std::vector<int>  __pyx_v_sid_idx_list;
+  unsigned char *__pyx_v_c_bed_bytes;
+  int __pyx_v_c_input_num_ind;
+  int __pyx_v_c_num_threads;
+  bool __pyx_v_c_count_A1;
+  double *__pyx_v_c_out;
+  double *__pyx_v_c_stats;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_bed_bytes;
+  __Pyx_Buffer __pyx_pybuffer_bed_bytes;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_out;
+  __Pyx_Buffer __pyx_pybuffer_out;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_stats;
+  __Pyx_Buffer __pyx_pybuffer_stats;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  std::vector<size_t>  __pyx_t_1;
+  std::vector<int>  __pyx_t_2;
+  int __pyx_t_3;
+  bool __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("readPlinkBedBytesStandardize2doubleCAAA", 0);
+  __pyx_pybuffer_bed_bytes.pybuffer.buf = NULL;
+  __pyx_pybuffer_bed_bytes.refcount = 0;
+  __pyx_pybuffernd_bed_bytes.data = NULL;
+  __pyx_pybuffernd_bed_bytes.rcbuffer = &__pyx_pybuffer_bed_bytes;
+  __pyx_pybuffer_out.pybuffer.buf = NULL;
+  __pyx_pybuffer_out.refcount = 0;
+  __pyx_pybuffernd_out.data = NULL;
+  __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
+  __pyx_pybuffer_stats.pybuffer.buf = NULL;
+  __pyx_pybuffer_stats.refcount = 0;
+  __pyx_pybuffernd_stats.data = NULL;
+  __pyx_pybuffernd_stats.rcbuffer = &__pyx_pybuffer_stats;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer, (PyObject*)__pyx_v_bed_bytes, &__Pyx_TypeInfo_nn___pyx_t_5numpy_uint8_t, PyBUF_FORMAT| PyBUF_C_CONTIGUOUS, 1, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_bed_bytes.diminfo[0].strides = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_bed_bytes.diminfo[0].shape = __pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_stats.rcbuffer->pybuffer, (PyObject*)__pyx_v_stats, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  }
+  __pyx_pybuffernd_stats.diminfo[0].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_stats.diminfo[0].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_stats.diminfo[1].strides = __pyx_pybuffernd_stats.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_stats.diminfo[1].shape = __pyx_pybuffernd_stats.rcbuffer->pybuffer.shape[1];
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":303
+ * def readPlinkBedBytesStandardize2doubleCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ */
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 303; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_iid_idx_list = __pyx_t_1;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":304
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ */
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 304; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_sid_idx_list = __pyx_t_2;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":305
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data             # <<<<<<<<<<<<<<
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ */
+  __pyx_v_c_bed_bytes = ((unsigned char *)__pyx_v_bed_bytes->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":306
+ * 	cdef vector[int] sid_idx_list = snpIdxList
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads             # <<<<<<<<<<<<<<
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef double* c_out = <double*> out.data
+ */
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 306; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_input_num_ind = __pyx_t_3;
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_num_threads); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 306; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_num_threads = __pyx_t_3;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":307
+ * 	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1             # <<<<<<<<<<<<<<
+ * 	cdef double* c_out = <double*> out.data
+ * 	cdef double* c_stats = <double*> stats.data
+ */
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 307; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_v_c_count_A1 = __pyx_t_4;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":308
+ * 	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef double* c_out = <double*> out.data             # <<<<<<<<<<<<<<
+ * 	cdef double* c_stats = <double*> stats.data
+ * 
+ */
+  __pyx_v_c_out = ((double *)__pyx_v_out->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":309
+ * 	cdef bool c_count_A1 = count_A1
+ * 	cdef double* c_out = <double*> out.data
+ * 	cdef double* c_stats = <double*> stats.data             # <<<<<<<<<<<<<<
+ * 
+ * 	with nogil:
+ */
+  __pyx_v_c_stats = ((double *)__pyx_v_stats->data);
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":311
+ * 	cdef double* c_stats = <double*> stats.data
+ * 
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesStandardizedoubleCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+ * 	return out, stats
  */
-  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_v_sid_idx_list = __pyx_t_2;
+  {
+      #ifdef WITH_THREAD
+      PyThreadState *_save;
+      Py_UNBLOCK_THREADS
+      #endif
+      /*try:*/ {
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":148
- * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
+        /* "pysnptools\snpreader\wrap_plink_parser.pyx":312
  * 
- * 	_readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data)             # <<<<<<<<<<<<<<
- * 	return out
+ * 	with nogil:
+ * 		_readPlinkBedBytesStandardizedoubleCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)             # <<<<<<<<<<<<<<
+ * 	return out, stats
  * 
  */
-  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_6 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  readPlinkBedFiledoubleCAAA(__pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_t_6, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, ((double *)__pyx_v_out->data));
+        readPlinkBedBytesStandardizedoubleCAAA(__pyx_v_c_bed_bytes, __pyx_v_c_input_num_ind, __pyx_v_c_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, __pyx_v_c_out, __pyx_v_c_num_threads, __pyx_v_betaNotUnitVariance, __pyx_v_betaA, __pyx_v_betaB, __pyx_v_use_stats, __pyx_v_c_stats);
+      }
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":149
+      /* "pysnptools\snpreader\wrap_plink_parser.pyx":311
+ * 	cdef double* c_stats = <double*> stats.data
  * 
- * 	_readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data)
- * 	return out             # <<<<<<<<<<<<<<
+ * 	with nogil:             # <<<<<<<<<<<<<<
+ * 		_readPlinkBedBytesStandardizedoubleCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+ * 	return out, stats
+ */
+      /*finally:*/ {
+        /*normal exit:*/{
+          #ifdef WITH_THREAD
+          Py_BLOCK_THREADS
+          #endif
+          goto __pyx_L5;
+        }
+        __pyx_L5:;
+      }
+  }
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":313
+ * 	with nogil:
+ * 		_readPlinkBedBytesStandardizedoubleCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+ * 	return out, stats             # <<<<<<<<<<<<<<
  * 
  * 
  */
   __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 313; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_5);
   __Pyx_INCREF(((PyObject *)__pyx_v_out));
-  __pyx_r = ((PyObject *)__pyx_v_out);
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_out));
+  PyTuple_SET_ITEM(__pyx_t_5, 0, ((PyObject *)__pyx_v_out));
+  __Pyx_INCREF(((PyObject *)__pyx_v_stats));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_stats));
+  PyTuple_SET_ITEM(__pyx_t_5, 1, ((PyObject *)__pyx_v_stats));
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
   goto __pyx_L0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":142
- * 	return out
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":301
+ * 	return out, stats
  * 
- * def readPlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedBytesStandardize2doubleCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
 
   /* function exit code */
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
   { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
     __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
     __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_stats.rcbuffer->pybuffer);
   __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedFile2doubleCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedBytesStandardize2doubleCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   goto __pyx_L2;
   __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_bed_bytes.rcbuffer->pybuffer);
   __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_out.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_stats.rcbuffer->pybuffer);
   __pyx_L2:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":152
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":316
  * 
  * 
  * def writePlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -3115,9 +6649,9 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_14readPlin
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_17writePlinkBedFile2floatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_17writePlinkBedFile2floatFAAA = {"writePlinkBedFile2floatFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_17writePlinkBedFile2floatFAAA, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_17writePlinkBedFile2floatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_33writePlinkBedFile2floatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_33writePlinkBedFile2floatFAAA = {"writePlinkBedFile2floatFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_33writePlinkBedFile2floatFAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_33writePlinkBedFile2floatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_bed_fn = 0;
   PyObject *__pyx_v_input_num_ind = 0;
   PyObject *__pyx_v_input_num_snps = 0;
@@ -3152,26 +6686,26 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_17writePli
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatFAAA", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatFAAA", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatFAAA", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatFAAA", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatFAAA", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatFAAA", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_inx)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatFAAA", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatFAAA", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFile2floatFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFile2floatFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
       goto __pyx_L5_argtuple_error;
@@ -3190,14 +6724,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_17writePli
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatFAAA", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatFAAA", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.writePlinkBedFile2floatFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_16writePlinkBedFile2floatFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_inx);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_32writePlinkBedFile2floatFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_inx);
 
   /* function exit code */
   goto __pyx_L0;
@@ -3208,7 +6742,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_17writePli
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_16writePlinkBedFile2floatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_32writePlinkBedFile2floatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx) {
   __Pyx_LocalBuf_ND __pyx_pybuffernd_inx;
   __Pyx_Buffer __pyx_pybuffer_inx;
   PyObject *__pyx_r = NULL;
@@ -3227,24 +6761,24 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_16writePli
   __pyx_pybuffernd_inx.rcbuffer = &__pyx_pybuffer_inx;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_inx.diminfo[0].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_inx.diminfo[0].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_inx.diminfo[1].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_inx.diminfo[1].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":153
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":317
  * 
  * def writePlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float32_t, ndim=2] inx):
  * 	_writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)             # <<<<<<<<<<<<<<
  * 
  * def writePlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float32_t, ndim=2] inx):
  */
-  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 153; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 153; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 153; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 153; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 317; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 317; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 317; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 317; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   writePlinkBedFilefloatFAAA(__pyx_t_1, __pyx_t_2, __pyx_t_3, __pyx_t_4, ((float *)__pyx_v_inx->data));
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":152
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":316
  * 
  * 
  * def writePlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -3271,7 +6805,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_16writePli
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":155
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":319
  * 	_writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -3280,9 +6814,9 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_16writePli
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_19writePlinkBedFile2floatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_19writePlinkBedFile2floatCAAA = {"writePlinkBedFile2floatCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_19writePlinkBedFile2floatCAAA, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_19writePlinkBedFile2floatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_35writePlinkBedFile2floatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_35writePlinkBedFile2floatCAAA = {"writePlinkBedFile2floatCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_35writePlinkBedFile2floatCAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_35writePlinkBedFile2floatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_bed_fn = 0;
   PyObject *__pyx_v_input_num_ind = 0;
   PyObject *__pyx_v_input_num_snps = 0;
@@ -3317,26 +6851,26 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_19writePli
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatCAAA", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatCAAA", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatCAAA", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatCAAA", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatCAAA", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatCAAA", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_inx)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatCAAA", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatCAAA", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFile2floatCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFile2floatCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
       goto __pyx_L5_argtuple_error;
@@ -3355,14 +6889,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_19writePli
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatCAAA", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2floatCAAA", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.writePlinkBedFile2floatCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_18writePlinkBedFile2floatCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_inx);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_34writePlinkBedFile2floatCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_inx);
 
   /* function exit code */
   goto __pyx_L0;
@@ -3373,7 +6907,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_19writePli
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_18writePlinkBedFile2floatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_34writePlinkBedFile2floatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx) {
   __Pyx_LocalBuf_ND __pyx_pybuffernd_inx;
   __Pyx_Buffer __pyx_pybuffer_inx;
   PyObject *__pyx_r = NULL;
@@ -3392,24 +6926,24 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_18writePli
   __pyx_pybuffernd_inx.rcbuffer = &__pyx_pybuffer_inx;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_inx.diminfo[0].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_inx.diminfo[0].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_inx.diminfo[1].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_inx.diminfo[1].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":156
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":320
  * 
  * def writePlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float32_t, ndim=2] inx):
  * 	_writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)             # <<<<<<<<<<<<<<
  * 
  * def writePlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float64_t, ndim=2] inx):
  */
-  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 156; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 320; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   writePlinkBedFilefloatCAAA(__pyx_t_1, __pyx_t_2, __pyx_t_3, __pyx_t_4, ((float *)__pyx_v_inx->data));
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":155
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":319
  * 	_writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -3436,7 +6970,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_18writePli
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":158
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":322
  * 	_writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -3445,9 +6979,9 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_18writePli
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_21writePlinkBedFile2doubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_21writePlinkBedFile2doubleFAAA = {"writePlinkBedFile2doubleFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_21writePlinkBedFile2doubleFAAA, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_21writePlinkBedFile2doubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_37writePlinkBedFile2doubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_37writePlinkBedFile2doubleFAAA = {"writePlinkBedFile2doubleFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_37writePlinkBedFile2doubleFAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_37writePlinkBedFile2doubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_bed_fn = 0;
   PyObject *__pyx_v_input_num_ind = 0;
   PyObject *__pyx_v_input_num_snps = 0;
@@ -3482,26 +7016,26 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_21writePli
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleFAAA", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleFAAA", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleFAAA", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleFAAA", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleFAAA", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleFAAA", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_inx)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleFAAA", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleFAAA", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFile2doubleFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFile2doubleFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
       goto __pyx_L5_argtuple_error;
@@ -3520,14 +7054,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_21writePli
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleFAAA", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleFAAA", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.writePlinkBedFile2doubleFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_20writePlinkBedFile2doubleFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_inx);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_36writePlinkBedFile2doubleFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_inx);
 
   /* function exit code */
   goto __pyx_L0;
@@ -3538,7 +7072,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_21writePli
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_20writePlinkBedFile2doubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_36writePlinkBedFile2doubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx) {
   __Pyx_LocalBuf_ND __pyx_pybuffernd_inx;
   __Pyx_Buffer __pyx_pybuffer_inx;
   PyObject *__pyx_r = NULL;
@@ -3557,24 +7091,24 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_20writePli
   __pyx_pybuffernd_inx.rcbuffer = &__pyx_pybuffer_inx;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_inx.diminfo[0].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_inx.diminfo[0].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_inx.diminfo[1].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_inx.diminfo[1].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":159
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":323
  * 
  * def writePlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float64_t, ndim=2] inx):
  * 	_writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)             # <<<<<<<<<<<<<<
  * 
  * def writePlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float64_t, ndim=2] inx):
  */
-  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 159; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 159; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 159; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 159; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 323; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   writePlinkBedFiledoubleFAAA(__pyx_t_1, __pyx_t_2, __pyx_t_3, __pyx_t_4, ((double *)__pyx_v_inx->data));
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":158
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":322
  * 	_writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -3601,7 +7135,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_20writePli
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":161
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":325
  * 	_writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  * 
  * def writePlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -3610,9 +7144,9 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_20writePli
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_23writePlinkBedFile2doubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_23writePlinkBedFile2doubleCAAA = {"writePlinkBedFile2doubleCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_23writePlinkBedFile2doubleCAAA, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_23writePlinkBedFile2doubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_39writePlinkBedFile2doubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_39writePlinkBedFile2doubleCAAA = {"writePlinkBedFile2doubleCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_39writePlinkBedFile2doubleCAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_39writePlinkBedFile2doubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_bed_fn = 0;
   PyObject *__pyx_v_input_num_ind = 0;
   PyObject *__pyx_v_input_num_snps = 0;
@@ -3647,26 +7181,26 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_23writePli
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleCAAA", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleCAAA", 1, 5, 5, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleCAAA", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleCAAA", 1, 5, 5, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_count_A1)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleCAAA", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleCAAA", 1, 5, 5, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_inx)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleCAAA", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleCAAA", 1, 5, 5, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFile2doubleCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFile2doubleCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
       goto __pyx_L5_argtuple_error;
@@ -3685,14 +7219,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_23writePli
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleCAAA", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("writePlinkBedFile2doubleCAAA", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.writePlinkBedFile2doubleCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_22writePlinkBedFile2doubleCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_inx);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_38writePlinkBedFile2doubleCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_count_A1, __pyx_v_inx);
 
   /* function exit code */
   goto __pyx_L0;
@@ -3703,7 +7237,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_23writePli
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_22writePlinkBedFile2doubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_38writePlinkBedFile2doubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_count_A1, PyArrayObject *__pyx_v_inx) {
   __Pyx_LocalBuf_ND __pyx_pybuffernd_inx;
   __Pyx_Buffer __pyx_pybuffer_inx;
   PyObject *__pyx_r = NULL;
@@ -3722,24 +7256,24 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_22writePli
   __pyx_pybuffernd_inx.rcbuffer = &__pyx_pybuffer_inx;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_inx.diminfo[0].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_inx.diminfo[0].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_inx.diminfo[1].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_inx.diminfo[1].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":162
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":326
  * 
  * def writePlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float64_t, ndim=2] inx):
  * 	_writePlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)             # <<<<<<<<<<<<<<
  * 
  * #Old
  */
-  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyObject_IsTrue(__pyx_v_count_A1); if (unlikely((__pyx_t_4 == (bool)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 326; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   writePlinkBedFiledoubleCAAA(__pyx_t_1, __pyx_t_2, __pyx_t_3, __pyx_t_4, ((double *)__pyx_v_inx->data));
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":161
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":325
  * 	_writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  * 
  * def writePlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -3766,7 +7300,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_22writePli
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":165
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":329
  * 
  * #Old
  * def readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
@@ -3775,9 +7309,9 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_22writePli
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_25readPlinkBedFilefloatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_25readPlinkBedFilefloatFAAA = {"readPlinkBedFilefloatFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_25readPlinkBedFilefloatFAAA, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_25readPlinkBedFilefloatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_41readPlinkBedFilefloatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_41readPlinkBedFilefloatFAAA = {"readPlinkBedFilefloatFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_41readPlinkBedFilefloatFAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_41readPlinkBedFilefloatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_bed_fn = 0;
   PyObject *__pyx_v_input_num_ind = 0;
   PyObject *__pyx_v_input_num_snps = 0;
@@ -3814,31 +7348,31 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_25readPlin
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatFAAA", 1, 6, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatFAAA", 1, 6, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatFAAA", 1, 6, 6, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatFAAA", 1, 6, 6, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatFAAA", 1, 6, 6, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatFAAA", 1, 6, 6, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatFAAA", 1, 6, 6, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatFAAA", 1, 6, 6, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatFAAA", 1, 6, 6, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatFAAA", 1, 6, 6, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFilefloatFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFilefloatFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 6) {
       goto __pyx_L5_argtuple_error;
@@ -3859,14 +7393,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_25readPlin
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatFAAA", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatFAAA", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedFilefloatFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_24readPlinkBedFilefloatFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_40readPlinkBedFilefloatFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out);
 
   /* function exit code */
   goto __pyx_L0;
@@ -3877,7 +7411,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_25readPlin
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_24readPlinkBedFilefloatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_40readPlinkBedFilefloatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out) {
   int __pyx_v_count_A1;
   std::vector<size_t>  __pyx_v_iid_idx_list;
   std::vector<int>  __pyx_v_sid_idx_list;
@@ -3900,11 +7434,11 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_24readPlin
   __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":166
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":330
  * #Old
  * def readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):
  * 	count_A1 = False             # <<<<<<<<<<<<<<
@@ -3913,41 +7447,41 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_24readPlin
  */
   __pyx_v_count_A1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":167
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":331
  * def readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
  * 	cdef vector[int] sid_idx_list = snpIdxList
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  */
-  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 331; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_iid_idx_list = __pyx_t_1;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":168
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":332
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
  */
-  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 332; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_sid_idx_list = __pyx_t_2;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":171
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":335
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
- * 	_readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data)             # <<<<<<<<<<<<<<
+ * 	_readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data, 1)             # <<<<<<<<<<<<<<
  * 	return out
  * 
  */
-  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  readPlinkBedFilefloatFAAA(__pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, ((float *)__pyx_v_out->data));
+  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 335; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 335; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 335; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  readPlinkBedFilefloatFAAA(__pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, ((float *)__pyx_v_out->data), 1);
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":172
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":336
  * 
- * 	_readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data)
+ * 	_readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data, 1)
  * 	return out             # <<<<<<<<<<<<<<
  * 
  * def readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):
@@ -3957,7 +7491,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_24readPlin
   __pyx_r = ((PyObject *)__pyx_v_out);
   goto __pyx_L0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":165
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":329
  * 
  * #Old
  * def readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
@@ -3982,7 +7516,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_24readPlin
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":174
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":338
  * 	return out
  * 
  * def readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
@@ -3991,9 +7525,9 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_24readPlin
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_27readPlinkBedFilefloatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_27readPlinkBedFilefloatCAAA = {"readPlinkBedFilefloatCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_27readPlinkBedFilefloatCAAA, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_27readPlinkBedFilefloatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_43readPlinkBedFilefloatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_43readPlinkBedFilefloatCAAA = {"readPlinkBedFilefloatCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_43readPlinkBedFilefloatCAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_43readPlinkBedFilefloatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_bed_fn = 0;
   PyObject *__pyx_v_input_num_ind = 0;
   PyObject *__pyx_v_input_num_snps = 0;
@@ -4030,31 +7564,31 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_27readPlin
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatCAAA", 1, 6, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatCAAA", 1, 6, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatCAAA", 1, 6, 6, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatCAAA", 1, 6, 6, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatCAAA", 1, 6, 6, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatCAAA", 1, 6, 6, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatCAAA", 1, 6, 6, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatCAAA", 1, 6, 6, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatCAAA", 1, 6, 6, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatCAAA", 1, 6, 6, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFilefloatCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFilefloatCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 6) {
       goto __pyx_L5_argtuple_error;
@@ -4075,14 +7609,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_27readPlin
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatCAAA", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedFilefloatCAAA", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedFilefloatCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_26readPlinkBedFilefloatCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_42readPlinkBedFilefloatCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4093,7 +7627,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_27readPlin
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_26readPlinkBedFilefloatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_42readPlinkBedFilefloatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out) {
   int __pyx_v_count_A1;
   std::vector<size_t>  __pyx_v_iid_idx_list;
   std::vector<int>  __pyx_v_sid_idx_list;
@@ -4116,11 +7650,11 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_26readPlin
   __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":175
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":339
  * 
  * def readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):
  * 	count_A1 = False             # <<<<<<<<<<<<<<
@@ -4129,41 +7663,41 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_26readPlin
  */
   __pyx_v_count_A1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":176
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":340
  * def readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
  * 	cdef vector[int] sid_idx_list = snpIdxList
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  */
-  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 340; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_iid_idx_list = __pyx_t_1;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":177
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":341
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
  */
-  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 341; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_sid_idx_list = __pyx_t_2;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":180
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":344
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
- * 	_readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data)             # <<<<<<<<<<<<<<
+ * 	_readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data, 1)             # <<<<<<<<<<<<<<
  * 	return out
  * 
  */
-  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  readPlinkBedFilefloatCAAA(__pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, ((float *)__pyx_v_out->data));
+  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 344; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  readPlinkBedFilefloatCAAA(__pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, ((float *)__pyx_v_out->data), 1);
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":181
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":345
  * 
- * 	_readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data)
+ * 	_readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data, 1)
  * 	return out             # <<<<<<<<<<<<<<
  * 
  * 
@@ -4173,7 +7707,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_26readPlin
   __pyx_r = ((PyObject *)__pyx_v_out);
   goto __pyx_L0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":174
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":338
  * 	return out
  * 
  * def readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
@@ -4198,7 +7732,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_26readPlin
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":184
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":348
  * 
  * 
  * def readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
@@ -4207,9 +7741,9 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_26readPlin
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_29readPlinkBedFiledoubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_29readPlinkBedFiledoubleFAAA = {"readPlinkBedFiledoubleFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_29readPlinkBedFiledoubleFAAA, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_29readPlinkBedFiledoubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_45readPlinkBedFiledoubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_45readPlinkBedFiledoubleFAAA = {"readPlinkBedFiledoubleFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_45readPlinkBedFiledoubleFAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_45readPlinkBedFiledoubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_bed_fn = 0;
   PyObject *__pyx_v_input_num_ind = 0;
   PyObject *__pyx_v_input_num_snps = 0;
@@ -4246,31 +7780,31 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_29readPlin
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleFAAA", 1, 6, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleFAAA", 1, 6, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleFAAA", 1, 6, 6, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleFAAA", 1, 6, 6, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleFAAA", 1, 6, 6, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleFAAA", 1, 6, 6, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleFAAA", 1, 6, 6, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleFAAA", 1, 6, 6, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleFAAA", 1, 6, 6, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleFAAA", 1, 6, 6, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFiledoubleFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFiledoubleFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 6) {
       goto __pyx_L5_argtuple_error;
@@ -4291,14 +7825,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_29readPlin
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleFAAA", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleFAAA", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedFiledoubleFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_28readPlinkBedFiledoubleFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_44readPlinkBedFiledoubleFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4309,7 +7843,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_29readPlin
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_28readPlinkBedFiledoubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_44readPlinkBedFiledoubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out) {
   int __pyx_v_count_A1;
   std::vector<size_t>  __pyx_v_iid_idx_list;
   std::vector<int>  __pyx_v_sid_idx_list;
@@ -4332,11 +7866,11 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_28readPlin
   __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":185
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":349
  * 
  * def readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):
  * 	count_A1 = False             # <<<<<<<<<<<<<<
@@ -4345,41 +7879,41 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_28readPlin
  */
   __pyx_v_count_A1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":186
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":350
  * def readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
  * 	cdef vector[int] sid_idx_list = snpIdxList
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  */
-  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 186; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 350; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_iid_idx_list = __pyx_t_1;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":187
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":351
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
  */
-  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 187; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 351; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_sid_idx_list = __pyx_t_2;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":190
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":354
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
- * 	_readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data)             # <<<<<<<<<<<<<<
+ * 	_readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data, 1)             # <<<<<<<<<<<<<<
  * 	return out
  * 
  */
-  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 190; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  readPlinkBedFiledoubleFAAA(__pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, ((double *)__pyx_v_out->data));
+  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 354; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  readPlinkBedFiledoubleFAAA(__pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, ((double *)__pyx_v_out->data), 1);
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":191
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":355
  * 
- * 	_readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data)
+ * 	_readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data, 1)
  * 	return out             # <<<<<<<<<<<<<<
  * 
  * def readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):
@@ -4389,7 +7923,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_28readPlin
   __pyx_r = ((PyObject *)__pyx_v_out);
   goto __pyx_L0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":184
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":348
  * 
  * 
  * def readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
@@ -4414,7 +7948,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_28readPlin
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":193
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":357
  * 	return out
  * 
  * def readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
@@ -4423,9 +7957,9 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_28readPlin
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_31readPlinkBedFiledoubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_31readPlinkBedFiledoubleCAAA = {"readPlinkBedFiledoubleCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_31readPlinkBedFiledoubleCAAA, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_31readPlinkBedFiledoubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_47readPlinkBedFiledoubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_47readPlinkBedFiledoubleCAAA = {"readPlinkBedFiledoubleCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_47readPlinkBedFiledoubleCAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_47readPlinkBedFiledoubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_bed_fn = 0;
   PyObject *__pyx_v_input_num_ind = 0;
   PyObject *__pyx_v_input_num_snps = 0;
@@ -4462,31 +7996,31 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_31readPlin
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleCAAA", 1, 6, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleCAAA", 1, 6, 6, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleCAAA", 1, 6, 6, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleCAAA", 1, 6, 6, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_iidIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleCAAA", 1, 6, 6, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleCAAA", 1, 6, 6, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  4:
         if (likely((values[4] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_snpIdxList)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleCAAA", 1, 6, 6, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleCAAA", 1, 6, 6, 4); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  5:
         if (likely((values[5] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_out)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleCAAA", 1, 6, 6, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleCAAA", 1, 6, 6, 5); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFiledoubleCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "readPlinkBedFiledoubleCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 6) {
       goto __pyx_L5_argtuple_error;
@@ -4507,14 +8041,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_31readPlin
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleCAAA", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("readPlinkBedFiledoubleCAAA", 1, 6, 6, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.readPlinkBedFiledoubleCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_30readPlinkBedFiledoubleCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_out), __pyx_ptype_5numpy_ndarray, 1, "out", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_46readPlinkBedFiledoubleCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_iidIdxList, __pyx_v_snpIdxList, __pyx_v_out);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4525,7 +8059,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_31readPlin
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_30readPlinkBedFiledoubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_46readPlinkBedFiledoubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyObject *__pyx_v_iidIdxList, PyObject *__pyx_v_snpIdxList, PyArrayObject *__pyx_v_out) {
   int __pyx_v_count_A1;
   std::vector<size_t>  __pyx_v_iid_idx_list;
   std::vector<int>  __pyx_v_sid_idx_list;
@@ -4548,11 +8082,11 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_30readPlin
   __pyx_pybuffernd_out.rcbuffer = &__pyx_pybuffer_out;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_out.rcbuffer->pybuffer, (PyObject*)__pyx_v_out, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_out.diminfo[0].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_out.diminfo[0].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_out.diminfo[1].strides = __pyx_pybuffernd_out.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_out.diminfo[1].shape = __pyx_pybuffernd_out.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":194
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":358
  * 
  * def readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):
  * 	count_A1 = False             # <<<<<<<<<<<<<<
@@ -4561,41 +8095,41 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_30readPlin
  */
   __pyx_v_count_A1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":195
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":359
  * def readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList             # <<<<<<<<<<<<<<
  * 	cdef vector[int] sid_idx_list = snpIdxList
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  */
-  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_vector_from_py_size_t(__pyx_v_iidIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 359; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_iid_idx_list = __pyx_t_1;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":196
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":360
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  * 	cdef vector[int] sid_idx_list = snpIdxList             # <<<<<<<<<<<<<<
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
  */
-  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 196; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __pyx_convert_vector_from_py_int(__pyx_v_snpIdxList); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 360; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __pyx_v_sid_idx_list = __pyx_t_2;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":199
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":363
  * 	#http://wiki.cython.org/tutorials/NumpyPointerToC
  * 
- * 	_readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data)             # <<<<<<<<<<<<<<
+ * 	_readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data, 1)             # <<<<<<<<<<<<<<
  * 	return out
  * 
  */
-  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 199; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  readPlinkBedFiledoubleCAAA(__pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, ((double *)__pyx_v_out->data));
+  __pyx_t_3 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_4 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 363; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  readPlinkBedFiledoubleCAAA(__pyx_t_3, __pyx_t_4, __pyx_t_5, __pyx_v_count_A1, __pyx_v_iid_idx_list, __pyx_v_sid_idx_list, ((double *)__pyx_v_out->data), 1);
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":200
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":364
  * 
- * 	_readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data)
+ * 	_readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data, 1)
  * 	return out             # <<<<<<<<<<<<<<
  * 
  * 
@@ -4605,7 +8139,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_30readPlin
   __pyx_r = ((PyObject *)__pyx_v_out);
   goto __pyx_L0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":193
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":357
  * 	return out
  * 
  * def readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
@@ -4630,7 +8164,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_30readPlin
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":203
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":367
  * 
  * 
  * def writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -4639,9 +8173,9 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_30readPlin
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_33writePlinkBedFilefloatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_33writePlinkBedFilefloatFAAA = {"writePlinkBedFilefloatFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_33writePlinkBedFilefloatFAAA, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_33writePlinkBedFilefloatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_49writePlinkBedFilefloatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_49writePlinkBedFilefloatFAAA = {"writePlinkBedFilefloatFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_49writePlinkBedFilefloatFAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_49writePlinkBedFilefloatFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_bed_fn = 0;
   PyObject *__pyx_v_input_num_ind = 0;
   PyObject *__pyx_v_input_num_snps = 0;
@@ -4674,21 +8208,21 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_33writePli
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatFAAA", 1, 4, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatFAAA", 1, 4, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatFAAA", 1, 4, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatFAAA", 1, 4, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_inx)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatFAAA", 1, 4, 4, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatFAAA", 1, 4, 4, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFilefloatFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFilefloatFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -4705,14 +8239,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_33writePli
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatFAAA", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatFAAA", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.writePlinkBedFilefloatFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_32writePlinkBedFilefloatFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_inx);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_48writePlinkBedFilefloatFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_inx);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4723,7 +8257,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_33writePli
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_32writePlinkBedFilefloatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_48writePlinkBedFilefloatFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx) {
   int __pyx_v_count_A1;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_inx;
   __Pyx_Buffer __pyx_pybuffer_inx;
@@ -4742,11 +8276,11 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_32writePli
   __pyx_pybuffernd_inx.rcbuffer = &__pyx_pybuffer_inx;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_inx.diminfo[0].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_inx.diminfo[0].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_inx.diminfo[1].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_inx.diminfo[1].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":204
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":368
  * 
  * def writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float32_t, ndim=2] inx):
  * 	count_A1 = False             # <<<<<<<<<<<<<<
@@ -4755,19 +8289,19 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_32writePli
  */
   __pyx_v_count_A1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":205
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":369
  * def writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float32_t, ndim=2] inx):
  * 	count_A1 = False
  * 	_writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)             # <<<<<<<<<<<<<<
  * 
  * def writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float32_t, ndim=2] inx):
  */
-  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 205; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 369; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   writePlinkBedFilefloatFAAA(__pyx_t_1, __pyx_t_2, __pyx_t_3, __pyx_v_count_A1, ((float *)__pyx_v_inx->data));
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":203
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":367
  * 
  * 
  * def writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -4794,7 +8328,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_32writePli
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":207
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":371
  * 	_writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -4803,9 +8337,9 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_32writePli
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_35writePlinkBedFilefloatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_35writePlinkBedFilefloatCAAA = {"writePlinkBedFilefloatCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_35writePlinkBedFilefloatCAAA, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_35writePlinkBedFilefloatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_51writePlinkBedFilefloatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_51writePlinkBedFilefloatCAAA = {"writePlinkBedFilefloatCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_51writePlinkBedFilefloatCAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_51writePlinkBedFilefloatCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_bed_fn = 0;
   PyObject *__pyx_v_input_num_ind = 0;
   PyObject *__pyx_v_input_num_snps = 0;
@@ -4838,21 +8372,21 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_35writePli
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatCAAA", 1, 4, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatCAAA", 1, 4, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatCAAA", 1, 4, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatCAAA", 1, 4, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_inx)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatCAAA", 1, 4, 4, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatCAAA", 1, 4, 4, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFilefloatCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFilefloatCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -4869,14 +8403,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_35writePli
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatCAAA", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("writePlinkBedFilefloatCAAA", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.writePlinkBedFilefloatCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_34writePlinkBedFilefloatCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_inx);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_50writePlinkBedFilefloatCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_inx);
 
   /* function exit code */
   goto __pyx_L0;
@@ -4887,7 +8421,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_35writePli
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_34writePlinkBedFilefloatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_50writePlinkBedFilefloatCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx) {
   int __pyx_v_count_A1;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_inx;
   __Pyx_Buffer __pyx_pybuffer_inx;
@@ -4906,11 +8440,11 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_34writePli
   __pyx_pybuffernd_inx.rcbuffer = &__pyx_pybuffer_inx;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float32_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_inx.diminfo[0].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_inx.diminfo[0].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_inx.diminfo[1].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_inx.diminfo[1].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":208
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":372
  * 
  * def writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float32_t, ndim=2] inx):
  * 	count_A1 = False             # <<<<<<<<<<<<<<
@@ -4919,19 +8453,19 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_34writePli
  */
   __pyx_v_count_A1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":209
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":373
  * def writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float32_t, ndim=2] inx):
  * 	count_A1 = False
  * 	_writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)             # <<<<<<<<<<<<<<
  * 
  * def writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float64_t, ndim=2] inx):
  */
-  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 209; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 373; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   writePlinkBedFilefloatCAAA(__pyx_t_1, __pyx_t_2, __pyx_t_3, __pyx_v_count_A1, ((float *)__pyx_v_inx->data));
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":207
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":371
  * 	_writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -4958,7 +8492,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_34writePli
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":211
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":375
  * 	_writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -4967,9 +8501,9 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_34writePli
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_37writePlinkBedFiledoubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_37writePlinkBedFiledoubleFAAA = {"writePlinkBedFiledoubleFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_37writePlinkBedFiledoubleFAAA, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_37writePlinkBedFiledoubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_53writePlinkBedFiledoubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_53writePlinkBedFiledoubleFAAA = {"writePlinkBedFiledoubleFAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_53writePlinkBedFiledoubleFAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_53writePlinkBedFiledoubleFAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_bed_fn = 0;
   PyObject *__pyx_v_input_num_ind = 0;
   PyObject *__pyx_v_input_num_snps = 0;
@@ -5002,21 +8536,21 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_37writePli
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleFAAA", 1, 4, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleFAAA", 1, 4, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleFAAA", 1, 4, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleFAAA", 1, 4, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_inx)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleFAAA", 1, 4, 4, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleFAAA", 1, 4, 4, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFiledoubleFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFiledoubleFAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -5033,14 +8567,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_37writePli
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleFAAA", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleFAAA", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.writePlinkBedFiledoubleFAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_36writePlinkBedFiledoubleFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_inx);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_52writePlinkBedFiledoubleFAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_inx);
 
   /* function exit code */
   goto __pyx_L0;
@@ -5051,7 +8585,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_37writePli
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_36writePlinkBedFiledoubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_52writePlinkBedFiledoubleFAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx) {
   int __pyx_v_count_A1;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_inx;
   __Pyx_Buffer __pyx_pybuffer_inx;
@@ -5070,11 +8604,11 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_36writePli
   __pyx_pybuffernd_inx.rcbuffer = &__pyx_pybuffer_inx;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_inx.diminfo[0].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_inx.diminfo[0].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_inx.diminfo[1].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_inx.diminfo[1].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":212
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":376
  * 
  * def writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float64_t, ndim=2] inx):
  * 	count_A1 = False             # <<<<<<<<<<<<<<
@@ -5083,19 +8617,19 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_36writePli
  */
   __pyx_v_count_A1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":213
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":377
  * def writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float64_t, ndim=2] inx):
  * 	count_A1 = False
  * 	_writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)             # <<<<<<<<<<<<<<
  * 
  * def writePlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float64_t, ndim=2] inx):
  */
-  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 377; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 377; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 377; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   writePlinkBedFiledoubleFAAA(__pyx_t_1, __pyx_t_2, __pyx_t_3, __pyx_v_count_A1, ((double *)__pyx_v_inx->data));
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":211
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":375
  * 	_writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -5122,7 +8656,7 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_36writePli
   return __pyx_r;
 }
 
-/* "pysnptools\snpreader\wrap_plink_parser.pyx":215
+/* "pysnptools\snpreader\wrap_plink_parser.pyx":379
  * 	_writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  * 
  * def writePlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -5131,9 +8665,9 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_36writePli
  */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_39writePlinkBedFiledoubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_39writePlinkBedFiledoubleCAAA = {"writePlinkBedFiledoubleCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_39writePlinkBedFiledoubleCAAA, METH_VARARGS|METH_KEYWORDS, 0};
-static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_39writePlinkBedFiledoubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_55writePlinkBedFiledoubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static PyMethodDef __pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_55writePlinkBedFiledoubleCAAA = {"writePlinkBedFiledoubleCAAA", (PyCFunction)__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_55writePlinkBedFiledoubleCAAA, METH_VARARGS|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_55writePlinkBedFiledoubleCAAA(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
   PyObject *__pyx_v_bed_fn = 0;
   PyObject *__pyx_v_input_num_ind = 0;
   PyObject *__pyx_v_input_num_snps = 0;
@@ -5166,21 +8700,21 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_39writePli
         case  1:
         if (likely((values[1] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_ind)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleCAAA", 1, 4, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleCAAA", 1, 4, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  2:
         if (likely((values[2] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_input_num_snps)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleCAAA", 1, 4, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleCAAA", 1, 4, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
         case  3:
         if (likely((values[3] = PyDict_GetItem(__pyx_kwds, __pyx_n_s_inx)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleCAAA", 1, 4, 4, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+          __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleCAAA", 1, 4, 4, 3); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFiledoubleCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "writePlinkBedFiledoubleCAAA") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -5197,14 +8731,14 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_39writePli
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleCAAA", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
+  __Pyx_RaiseArgtupleInvalid("writePlinkBedFiledoubleCAAA", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
   __pyx_L3_error:;
   __Pyx_AddTraceback("pysnptools.snpreader.wrap_plink_parser.writePlinkBedFiledoubleCAAA", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_38writePlinkBedFiledoubleCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_inx);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_inx), __pyx_ptype_5numpy_ndarray, 1, "inx", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_r = __pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_54writePlinkBedFiledoubleCAAA(__pyx_self, __pyx_v_bed_fn, __pyx_v_input_num_ind, __pyx_v_input_num_snps, __pyx_v_inx);
 
   /* function exit code */
   goto __pyx_L0;
@@ -5215,7 +8749,7 @@ static PyObject *__pyx_pw_10pysnptools_9snpreader_17wrap_plink_parser_39writePli
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_38writePlinkBedFiledoubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx) {
+static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_54writePlinkBedFiledoubleCAAA(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v_bed_fn, PyObject *__pyx_v_input_num_ind, PyObject *__pyx_v_input_num_snps, PyArrayObject *__pyx_v_inx) {
   int __pyx_v_count_A1;
   __Pyx_LocalBuf_ND __pyx_pybuffernd_inx;
   __Pyx_Buffer __pyx_pybuffer_inx;
@@ -5234,11 +8768,11 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_38writePli
   __pyx_pybuffernd_inx.rcbuffer = &__pyx_pybuffer_inx;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_inx.rcbuffer->pybuffer, (PyObject*)__pyx_v_inx, &__Pyx_TypeInfo_nn___pyx_t_5numpy_float64_t, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0, __pyx_stack) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   }
   __pyx_pybuffernd_inx.diminfo[0].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_inx.diminfo[0].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[0]; __pyx_pybuffernd_inx.diminfo[1].strides = __pyx_pybuffernd_inx.rcbuffer->pybuffer.strides[1]; __pyx_pybuffernd_inx.diminfo[1].shape = __pyx_pybuffernd_inx.rcbuffer->pybuffer.shape[1];
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":216
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":380
  * 
  * def writePlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float64_t, ndim=2] inx):
  * 	count_A1 = False             # <<<<<<<<<<<<<<
@@ -5246,17 +8780,17 @@ static PyObject *__pyx_pf_10pysnptools_9snpreader_17wrap_plink_parser_38writePli
  */
   __pyx_v_count_A1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":217
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":381
  * def writePlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float64_t, ndim=2] inx):
  * 	count_A1 = False
  * 	_writePlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)             # <<<<<<<<<<<<<<
  */
-  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 217; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = __pyx_convert_string_from_py_std__in_string(__pyx_v_bed_fn); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 381; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_2 = __Pyx_PyInt_As_int(__pyx_v_input_num_ind); if (unlikely((__pyx_t_2 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 381; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_3 = __Pyx_PyInt_As_int(__pyx_v_input_num_snps); if (unlikely((__pyx_t_3 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 381; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   writePlinkBedFiledoubleCAAA(__pyx_t_1, __pyx_t_2, __pyx_t_3, __pyx_v_count_A1, ((double *)__pyx_v_inx->data));
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":215
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":379
  * 	_writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  * 
  * def writePlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
@@ -7744,11 +11278,21 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_RuntimeError, __pyx_k_RuntimeError, sizeof(__pyx_k_RuntimeError), 0, 0, 1, 1},
   {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
   {&__pyx_n_s_apply_in_place, __pyx_k_apply_in_place, sizeof(__pyx_k_apply_in_place), 0, 0, 1, 1},
+  {&__pyx_n_s_bed_bytes, __pyx_k_bed_bytes, sizeof(__pyx_k_bed_bytes), 0, 0, 1, 1},
   {&__pyx_n_s_bed_fn, __pyx_k_bed_fn, sizeof(__pyx_k_bed_fn), 0, 0, 1, 1},
   {&__pyx_n_s_betaA, __pyx_k_betaA, sizeof(__pyx_k_betaA), 0, 0, 1, 1},
   {&__pyx_n_s_betaB, __pyx_k_betaB, sizeof(__pyx_k_betaB), 0, 0, 1, 1},
   {&__pyx_n_s_betaNotUnitVariance, __pyx_k_betaNotUnitVariance, sizeof(__pyx_k_betaNotUnitVariance), 0, 0, 1, 1},
-  {&__pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_k_c_Source_carlk_pysnptools_pysnpt, sizeof(__pyx_k_c_Source_carlk_pysnptools_pysnpt), 0, 0, 1, 0},
+  {&__pyx_n_s_c_bed_bytes, __pyx_k_c_bed_bytes, sizeof(__pyx_k_c_bed_bytes), 0, 0, 1, 1},
+  {&__pyx_n_s_c_bed_fn, __pyx_k_c_bed_fn, sizeof(__pyx_k_c_bed_fn), 0, 0, 1, 1},
+  {&__pyx_n_s_c_count_A1, __pyx_k_c_count_A1, sizeof(__pyx_k_c_count_A1), 0, 0, 1, 1},
+  {&__pyx_n_s_c_input_num_ind, __pyx_k_c_input_num_ind, sizeof(__pyx_k_c_input_num_ind), 0, 0, 1, 1},
+  {&__pyx_n_s_c_input_num_snps, __pyx_k_c_input_num_snps, sizeof(__pyx_k_c_input_num_snps), 0, 0, 1, 1},
+  {&__pyx_n_s_c_num_ind, __pyx_k_c_num_ind, sizeof(__pyx_k_c_num_ind), 0, 0, 1, 1},
+  {&__pyx_n_s_c_num_snps, __pyx_k_c_num_snps, sizeof(__pyx_k_c_num_snps), 0, 0, 1, 1},
+  {&__pyx_n_s_c_num_threads, __pyx_k_c_num_threads, sizeof(__pyx_k_c_num_threads), 0, 0, 1, 1},
+  {&__pyx_n_s_c_out, __pyx_k_c_out, sizeof(__pyx_k_c_out), 0, 0, 1, 1},
+  {&__pyx_n_s_c_stats, __pyx_k_c_stats, sizeof(__pyx_k_c_stats), 0, 0, 1, 1},
   {&__pyx_n_s_count_A1, __pyx_k_count_A1, sizeof(__pyx_k_count_A1), 0, 0, 1, 1},
   {&__pyx_n_s_iidIdxList, __pyx_k_iidIdxList, sizeof(__pyx_k_iidIdxList), 0, 0, 1, 1},
   {&__pyx_n_s_iid_idx_list, __pyx_k_iid_idx_list, sizeof(__pyx_k_iid_idx_list), 0, 0, 1, 1},
@@ -7762,10 +11306,19 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
   {&__pyx_n_s_num_ind, __pyx_k_num_ind, sizeof(__pyx_k_num_ind), 0, 0, 1, 1},
   {&__pyx_n_s_num_snps, __pyx_k_num_snps, sizeof(__pyx_k_num_snps), 0, 0, 1, 1},
+  {&__pyx_n_s_num_threads, __pyx_k_num_threads, sizeof(__pyx_k_num_threads), 0, 0, 1, 1},
   {&__pyx_n_s_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 0, 0, 1, 1},
   {&__pyx_n_s_out, __pyx_k_out, sizeof(__pyx_k_out), 0, 0, 1, 1},
   {&__pyx_n_s_pysnptools_snpreader_wrap_plink, __pyx_k_pysnptools_snpreader_wrap_plink, sizeof(__pyx_k_pysnptools_snpreader_wrap_plink), 0, 0, 1, 1},
   {&__pyx_n_s_range, __pyx_k_range, sizeof(__pyx_k_range), 0, 0, 1, 1},
+  {&__pyx_n_s_readPlinkBedBytes2doubleCAAA, __pyx_k_readPlinkBedBytes2doubleCAAA, sizeof(__pyx_k_readPlinkBedBytes2doubleCAAA), 0, 0, 1, 1},
+  {&__pyx_n_s_readPlinkBedBytes2doubleFAAA, __pyx_k_readPlinkBedBytes2doubleFAAA, sizeof(__pyx_k_readPlinkBedBytes2doubleFAAA), 0, 0, 1, 1},
+  {&__pyx_n_s_readPlinkBedBytes2floatCAAA, __pyx_k_readPlinkBedBytes2floatCAAA, sizeof(__pyx_k_readPlinkBedBytes2floatCAAA), 0, 0, 1, 1},
+  {&__pyx_n_s_readPlinkBedBytes2floatFAAA, __pyx_k_readPlinkBedBytes2floatFAAA, sizeof(__pyx_k_readPlinkBedBytes2floatFAAA), 0, 0, 1, 1},
+  {&__pyx_n_s_readPlinkBedBytesStandardize2dou, __pyx_k_readPlinkBedBytesStandardize2dou, sizeof(__pyx_k_readPlinkBedBytesStandardize2dou), 0, 0, 1, 1},
+  {&__pyx_n_s_readPlinkBedBytesStandardize2dou_2, __pyx_k_readPlinkBedBytesStandardize2dou_2, sizeof(__pyx_k_readPlinkBedBytesStandardize2dou_2), 0, 0, 1, 1},
+  {&__pyx_n_s_readPlinkBedBytesStandardize2flo, __pyx_k_readPlinkBedBytesStandardize2flo, sizeof(__pyx_k_readPlinkBedBytesStandardize2flo), 0, 0, 1, 1},
+  {&__pyx_n_s_readPlinkBedBytesStandardize2flo_2, __pyx_k_readPlinkBedBytesStandardize2flo_2, sizeof(__pyx_k_readPlinkBedBytesStandardize2flo_2), 0, 0, 1, 1},
   {&__pyx_n_s_readPlinkBedFile2doubleCAAA, __pyx_k_readPlinkBedFile2doubleCAAA, sizeof(__pyx_k_readPlinkBedFile2doubleCAAA), 0, 0, 1, 1},
   {&__pyx_n_s_readPlinkBedFile2doubleFAAA, __pyx_k_readPlinkBedFile2doubleFAAA, sizeof(__pyx_k_readPlinkBedFile2doubleFAAA), 0, 0, 1, 1},
   {&__pyx_n_s_readPlinkBedFile2floatCAAA, __pyx_k_readPlinkBedFile2floatCAAA, sizeof(__pyx_k_readPlinkBedFile2floatCAAA), 0, 0, 1, 1},
@@ -7782,6 +11335,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_standardizefloatFAAA, __pyx_k_standardizefloatFAAA, sizeof(__pyx_k_standardizefloatFAAA), 0, 0, 1, 1},
   {&__pyx_n_s_stats, __pyx_k_stats, sizeof(__pyx_k_stats), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
+  {&__pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_k_c_Source_carlk_pysnptools_pysnpt, sizeof(__pyx_k_c_Source_carlk_pysnptools_pysnpt), 0, 0, 1, 0},
   {&__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_k_unknown_dtype_code_in_numpy_pxd, sizeof(__pyx_k_unknown_dtype_code_in_numpy_pxd), 0, 1, 0, 0},
   {&__pyx_n_s_use_stats, __pyx_k_use_stats, sizeof(__pyx_k_use_stats), 0, 0, 1, 1},
   {&__pyx_n_s_writePlinkBedFile2doubleCAAA, __pyx_k_writePlinkBedFile2doubleCAAA, sizeof(__pyx_k_writePlinkBedFile2doubleCAAA), 0, 0, 1, 1},
@@ -7873,245 +11427,341 @@ static int __Pyx_InitCachedConstants(void) {
   __Pyx_GOTREF(__pyx_tuple__6);
   __Pyx_GIVEREF(__pyx_tuple__6);
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":69
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":83
  * 
  * 
- * def standardizefloatFAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizefloatFAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
-  __pyx_tuple__7 = PyTuple_Pack(9, __pyx_n_s_out, __pyx_n_s_betaNotUnitVariance, __pyx_n_s_betaA, __pyx_n_s_betaB, __pyx_n_s_apply_in_place, __pyx_n_s_use_stats, __pyx_n_s_stats, __pyx_n_s_num_ind, __pyx_n_s_num_snps); if (unlikely(!__pyx_tuple__7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__7 = PyTuple_Pack(15, __pyx_n_s_out, __pyx_n_s_betaNotUnitVariance, __pyx_n_s_betaA, __pyx_n_s_betaB, __pyx_n_s_apply_in_place, __pyx_n_s_use_stats, __pyx_n_s_stats, __pyx_n_s_num_threads, __pyx_n_s_num_ind, __pyx_n_s_num_snps, __pyx_n_s_c_num_ind, __pyx_n_s_c_num_snps, __pyx_n_s_c_out, __pyx_n_s_c_stats, __pyx_n_s_c_num_threads); if (unlikely(!__pyx_tuple__7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_tuple__7);
   __Pyx_GIVEREF(__pyx_tuple__7);
-  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(7, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_standardizefloatFAAA, 69, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_codeobj__8 = (PyObject*)__Pyx_PyCode_New(8, 0, 15, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__7, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_standardizefloatFAAA, 83, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":81
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":100
  * 
  * 
- * def standardizedoubleFAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizedoubleFAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
-  __pyx_tuple__9 = PyTuple_Pack(9, __pyx_n_s_out, __pyx_n_s_betaNotUnitVariance, __pyx_n_s_betaA, __pyx_n_s_betaB, __pyx_n_s_apply_in_place, __pyx_n_s_use_stats, __pyx_n_s_stats, __pyx_n_s_num_ind, __pyx_n_s_num_snps); if (unlikely(!__pyx_tuple__9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__9 = PyTuple_Pack(15, __pyx_n_s_out, __pyx_n_s_betaNotUnitVariance, __pyx_n_s_betaA, __pyx_n_s_betaB, __pyx_n_s_apply_in_place, __pyx_n_s_use_stats, __pyx_n_s_stats, __pyx_n_s_num_threads, __pyx_n_s_num_ind, __pyx_n_s_num_snps, __pyx_n_s_c_num_ind, __pyx_n_s_c_num_snps, __pyx_n_s_c_out, __pyx_n_s_c_stats, __pyx_n_s_c_num_threads); if (unlikely(!__pyx_tuple__9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_tuple__9);
   __Pyx_GIVEREF(__pyx_tuple__9);
-  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(7, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_standardizedoubleFAAA, 81, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_codeobj__10 = (PyObject*)__Pyx_PyCode_New(8, 0, 15, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__9, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_standardizedoubleFAAA, 100, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":93
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":117
  * 
  * 
- * def standardizefloatCAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizefloatCAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
-  __pyx_tuple__11 = PyTuple_Pack(9, __pyx_n_s_out, __pyx_n_s_betaNotUnitVariance, __pyx_n_s_betaA, __pyx_n_s_betaB, __pyx_n_s_apply_in_place, __pyx_n_s_use_stats, __pyx_n_s_stats, __pyx_n_s_num_ind, __pyx_n_s_num_snps); if (unlikely(!__pyx_tuple__11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__11 = PyTuple_Pack(15, __pyx_n_s_out, __pyx_n_s_betaNotUnitVariance, __pyx_n_s_betaA, __pyx_n_s_betaB, __pyx_n_s_apply_in_place, __pyx_n_s_use_stats, __pyx_n_s_stats, __pyx_n_s_num_threads, __pyx_n_s_num_ind, __pyx_n_s_num_snps, __pyx_n_s_c_num_ind, __pyx_n_s_c_num_snps, __pyx_n_s_c_out, __pyx_n_s_c_stats, __pyx_n_s_c_num_threads); if (unlikely(!__pyx_tuple__11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_tuple__11);
   __Pyx_GIVEREF(__pyx_tuple__11);
-  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(7, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_standardizefloatCAAA, 93, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_codeobj__12 = (PyObject*)__Pyx_PyCode_New(8, 0, 15, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__11, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_standardizefloatCAAA, 117, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":103
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":132
  * 	return out, stats
  * 
- * def standardizedoubleCAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB,  bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizedoubleCAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB,  bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
-  __pyx_tuple__13 = PyTuple_Pack(9, __pyx_n_s_out, __pyx_n_s_betaNotUnitVariance, __pyx_n_s_betaA, __pyx_n_s_betaB, __pyx_n_s_apply_in_place, __pyx_n_s_use_stats, __pyx_n_s_stats, __pyx_n_s_num_ind, __pyx_n_s_num_snps); if (unlikely(!__pyx_tuple__13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__13 = PyTuple_Pack(15, __pyx_n_s_out, __pyx_n_s_betaNotUnitVariance, __pyx_n_s_betaA, __pyx_n_s_betaB, __pyx_n_s_apply_in_place, __pyx_n_s_use_stats, __pyx_n_s_stats, __pyx_n_s_num_threads, __pyx_n_s_num_ind, __pyx_n_s_num_snps, __pyx_n_s_c_num_ind, __pyx_n_s_c_num_snps, __pyx_n_s_c_out, __pyx_n_s_c_stats, __pyx_n_s_c_num_threads); if (unlikely(!__pyx_tuple__13)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_tuple__13);
   __Pyx_GIVEREF(__pyx_tuple__13);
-  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(7, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_standardizedoubleCAAA, 103, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_codeobj__14 = (PyObject*)__Pyx_PyCode_New(8, 0, 15, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__13, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_standardizedoubleCAAA, 132, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__14)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":114
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":148
  * 
  * #New
- * def readPlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_tuple__15 = PyTuple_Pack(9, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list); if (unlikely(!__pyx_tuple__15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__15 = PyTuple_Pack(16, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_num_threads, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list, __pyx_n_s_c_bed_fn, __pyx_n_s_c_input_num_ind, __pyx_n_s_c_input_num_snps, __pyx_n_s_c_num_threads, __pyx_n_s_c_count_A1, __pyx_n_s_c_out); if (unlikely(!__pyx_tuple__15)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_tuple__15);
   __Pyx_GIVEREF(__pyx_tuple__15);
-  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(7, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFile2floatFAAA, 114, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_codeobj__16 = (PyObject*)__Pyx_PyCode_New(8, 0, 16, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__15, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFile2floatFAAA, 148, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__16)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":123
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":162
  * 	return out
  * 
- * def readPlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_tuple__17 = PyTuple_Pack(9, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list); if (unlikely(!__pyx_tuple__17)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__17 = PyTuple_Pack(16, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_num_threads, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list, __pyx_n_s_c_bed_fn, __pyx_n_s_c_input_num_ind, __pyx_n_s_c_input_num_snps, __pyx_n_s_c_num_threads, __pyx_n_s_c_count_A1, __pyx_n_s_c_out); if (unlikely(!__pyx_tuple__17)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_tuple__17);
   __Pyx_GIVEREF(__pyx_tuple__17);
-  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(7, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__17, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFile2floatCAAA, 123, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_codeobj__18 = (PyObject*)__Pyx_PyCode_New(8, 0, 16, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__17, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFile2floatCAAA, 162, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__18)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":133
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":177
  * 
  * 
- * def readPlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_tuple__19 = PyTuple_Pack(9, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list); if (unlikely(!__pyx_tuple__19)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__19 = PyTuple_Pack(16, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_num_threads, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list, __pyx_n_s_c_bed_fn, __pyx_n_s_c_input_num_ind, __pyx_n_s_c_input_num_snps, __pyx_n_s_c_num_threads, __pyx_n_s_c_count_A1, __pyx_n_s_c_out); if (unlikely(!__pyx_tuple__19)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_tuple__19);
   __Pyx_GIVEREF(__pyx_tuple__19);
-  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(7, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFile2doubleFAAA, 133, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_codeobj__20 = (PyObject*)__Pyx_PyCode_New(8, 0, 16, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__19, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFile2doubleFAAA, 177, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__20)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":142
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":191
  * 	return out
  * 
- * def readPlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_tuple__21 = PyTuple_Pack(9, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list); if (unlikely(!__pyx_tuple__21)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__21 = PyTuple_Pack(16, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_num_threads, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list, __pyx_n_s_c_bed_fn, __pyx_n_s_c_input_num_ind, __pyx_n_s_c_input_num_snps, __pyx_n_s_c_num_threads, __pyx_n_s_c_count_A1, __pyx_n_s_c_out); if (unlikely(!__pyx_tuple__21)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_tuple__21);
   __Pyx_GIVEREF(__pyx_tuple__21);
-  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(7, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFile2doubleCAAA, 142, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_codeobj__22 = (PyObject*)__Pyx_PyCode_New(8, 0, 16, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__21, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFile2doubleCAAA, 191, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__22)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":152
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":206
+ * 
+ * #bed_bytes are the SNP records of a .bed file (everything after the 3-byte header), for example, from a np.memmap
+ * def readPlinkBedBytes2floatFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_tuple__23 = PyTuple_Pack(14, __pyx_n_s_bed_bytes, __pyx_n_s_input_num_ind, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_num_threads, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list, __pyx_n_s_c_bed_bytes, __pyx_n_s_c_input_num_ind, __pyx_n_s_c_num_threads, __pyx_n_s_c_count_A1, __pyx_n_s_c_out); if (unlikely(!__pyx_tuple__23)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__23);
+  __Pyx_GIVEREF(__pyx_tuple__23);
+  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(7, 0, 14, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__23, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedBytes2floatFAAA, 206, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":219
+ * 	return out
+ * 
+ * def readPlinkBedBytes2floatCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_tuple__25 = PyTuple_Pack(14, __pyx_n_s_bed_bytes, __pyx_n_s_input_num_ind, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_num_threads, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list, __pyx_n_s_c_bed_bytes, __pyx_n_s_c_input_num_ind, __pyx_n_s_c_num_threads, __pyx_n_s_c_count_A1, __pyx_n_s_c_out); if (unlikely(!__pyx_tuple__25)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__25);
+  __Pyx_GIVEREF(__pyx_tuple__25);
+  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(7, 0, 14, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedBytes2floatCAAA, 219, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":232
+ * 	return out
+ * 
+ * def readPlinkBedBytes2doubleFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_tuple__27 = PyTuple_Pack(14, __pyx_n_s_bed_bytes, __pyx_n_s_input_num_ind, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_num_threads, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list, __pyx_n_s_c_bed_bytes, __pyx_n_s_c_input_num_ind, __pyx_n_s_c_num_threads, __pyx_n_s_c_count_A1, __pyx_n_s_c_out); if (unlikely(!__pyx_tuple__27)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__27);
+  __Pyx_GIVEREF(__pyx_tuple__27);
+  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(7, 0, 14, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedBytes2doubleFAAA, 232, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":245
+ * 	return out
+ * 
+ * def readPlinkBedBytes2doubleCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_tuple__29 = PyTuple_Pack(14, __pyx_n_s_bed_bytes, __pyx_n_s_input_num_ind, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_num_threads, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list, __pyx_n_s_c_bed_bytes, __pyx_n_s_c_input_num_ind, __pyx_n_s_c_num_threads, __pyx_n_s_c_count_A1, __pyx_n_s_c_out); if (unlikely(!__pyx_tuple__29)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__29);
+  __Pyx_GIVEREF(__pyx_tuple__29);
+  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(7, 0, 14, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedBytes2doubleCAAA, 245, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":259
+ * 
+ * #Like readPlinkBedBytes2*, but also unit (or beta) standardizes each SNP as it is decoded. Fills in stats unless use_stats is True.
+ * def readPlinkBedBytesStandardize2floatFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads, bool betaNotUnitVariance, float betaA, float betaB, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_tuple__31 = PyTuple_Pack(20, __pyx_n_s_bed_bytes, __pyx_n_s_input_num_ind, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_num_threads, __pyx_n_s_betaNotUnitVariance, __pyx_n_s_betaA, __pyx_n_s_betaB, __pyx_n_s_use_stats, __pyx_n_s_stats, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list, __pyx_n_s_c_bed_bytes, __pyx_n_s_c_input_num_ind, __pyx_n_s_c_num_threads, __pyx_n_s_c_count_A1, __pyx_n_s_c_out, __pyx_n_s_c_stats); if (unlikely(!__pyx_tuple__31)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__31);
+  __Pyx_GIVEREF(__pyx_tuple__31);
+  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(12, 0, 20, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedBytesStandardize2flo, 259, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":273
+ * 	return out, stats
+ * 
+ * def readPlinkBedBytesStandardize2floatCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads, bool betaNotUnitVariance, float betaA, float betaB, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_tuple__33 = PyTuple_Pack(20, __pyx_n_s_bed_bytes, __pyx_n_s_input_num_ind, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_num_threads, __pyx_n_s_betaNotUnitVariance, __pyx_n_s_betaA, __pyx_n_s_betaB, __pyx_n_s_use_stats, __pyx_n_s_stats, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list, __pyx_n_s_c_bed_bytes, __pyx_n_s_c_input_num_ind, __pyx_n_s_c_num_threads, __pyx_n_s_c_count_A1, __pyx_n_s_c_out, __pyx_n_s_c_stats); if (unlikely(!__pyx_tuple__33)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__33);
+  __Pyx_GIVEREF(__pyx_tuple__33);
+  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(12, 0, 20, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__33, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedBytesStandardize2flo_2, 273, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":287
+ * 	return out, stats
+ * 
+ * def readPlinkBedBytesStandardize2doubleFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_tuple__35 = PyTuple_Pack(20, __pyx_n_s_bed_bytes, __pyx_n_s_input_num_ind, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_num_threads, __pyx_n_s_betaNotUnitVariance, __pyx_n_s_betaA, __pyx_n_s_betaB, __pyx_n_s_use_stats, __pyx_n_s_stats, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list, __pyx_n_s_c_bed_bytes, __pyx_n_s_c_input_num_ind, __pyx_n_s_c_num_threads, __pyx_n_s_c_count_A1, __pyx_n_s_c_out, __pyx_n_s_c_stats); if (unlikely(!__pyx_tuple__35)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__35);
+  __Pyx_GIVEREF(__pyx_tuple__35);
+  __pyx_codeobj__36 = (PyObject*)__Pyx_PyCode_New(12, 0, 20, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__35, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedBytesStandardize2dou, 287, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__36)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":301
+ * 	return out, stats
+ * 
+ * def readPlinkBedBytesStandardize2doubleCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_tuple__37 = PyTuple_Pack(20, __pyx_n_s_bed_bytes, __pyx_n_s_input_num_ind, __pyx_n_s_count_A1, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_num_threads, __pyx_n_s_betaNotUnitVariance, __pyx_n_s_betaA, __pyx_n_s_betaB, __pyx_n_s_use_stats, __pyx_n_s_stats, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list, __pyx_n_s_c_bed_bytes, __pyx_n_s_c_input_num_ind, __pyx_n_s_c_num_threads, __pyx_n_s_c_count_A1, __pyx_n_s_c_out, __pyx_n_s_c_stats); if (unlikely(!__pyx_tuple__37)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__37);
+  __Pyx_GIVEREF(__pyx_tuple__37);
+  __pyx_codeobj__38 = (PyObject*)__Pyx_PyCode_New(12, 0, 20, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__37, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedBytesStandardize2dou_2, 301, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__38)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":316
  * 
  * 
  * def writePlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	_writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  */
-  __pyx_tuple__23 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_inx); if (unlikely(!__pyx_tuple__23)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__23);
-  __Pyx_GIVEREF(__pyx_tuple__23);
-  __pyx_codeobj__24 = (PyObject*)__Pyx_PyCode_New(5, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__23, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFile2floatFAAA, 152, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__24)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__39 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_inx); if (unlikely(!__pyx_tuple__39)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__39);
+  __Pyx_GIVEREF(__pyx_tuple__39);
+  __pyx_codeobj__40 = (PyObject*)__Pyx_PyCode_New(5, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__39, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFile2floatFAAA, 316, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__40)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":155
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":319
  * 	_writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	_writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  */
-  __pyx_tuple__25 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_inx); if (unlikely(!__pyx_tuple__25)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__25);
-  __Pyx_GIVEREF(__pyx_tuple__25);
-  __pyx_codeobj__26 = (PyObject*)__Pyx_PyCode_New(5, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__25, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFile2floatCAAA, 155, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__26)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__41 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_inx); if (unlikely(!__pyx_tuple__41)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__41);
+  __Pyx_GIVEREF(__pyx_tuple__41);
+  __pyx_codeobj__42 = (PyObject*)__Pyx_PyCode_New(5, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__41, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFile2floatCAAA, 319, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__42)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":158
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":322
  * 	_writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	_writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  * 
  */
-  __pyx_tuple__27 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_inx); if (unlikely(!__pyx_tuple__27)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__27);
-  __Pyx_GIVEREF(__pyx_tuple__27);
-  __pyx_codeobj__28 = (PyObject*)__Pyx_PyCode_New(5, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__27, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFile2doubleFAAA, 158, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__28)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__43 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_inx); if (unlikely(!__pyx_tuple__43)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__43);
+  __Pyx_GIVEREF(__pyx_tuple__43);
+  __pyx_codeobj__44 = (PyObject*)__Pyx_PyCode_New(5, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__43, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFile2doubleFAAA, 322, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__44)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":161
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":325
  * 	_writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  * 
  * def writePlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	_writePlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  * 
  */
-  __pyx_tuple__29 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_inx); if (unlikely(!__pyx_tuple__29)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__29);
-  __Pyx_GIVEREF(__pyx_tuple__29);
-  __pyx_codeobj__30 = (PyObject*)__Pyx_PyCode_New(5, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__29, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFile2doubleCAAA, 161, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__30)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__45 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_count_A1, __pyx_n_s_inx); if (unlikely(!__pyx_tuple__45)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__45);
+  __Pyx_GIVEREF(__pyx_tuple__45);
+  __pyx_codeobj__46 = (PyObject*)__Pyx_PyCode_New(5, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__45, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFile2doubleCAAA, 325, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__46)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":165
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":329
  * 
  * #Old
  * def readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_tuple__31 = PyTuple_Pack(9, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_count_A1, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list); if (unlikely(!__pyx_tuple__31)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__31);
-  __Pyx_GIVEREF(__pyx_tuple__31);
-  __pyx_codeobj__32 = (PyObject*)__Pyx_PyCode_New(6, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__31, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFilefloatFAAA, 165, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__32)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__47 = PyTuple_Pack(9, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_count_A1, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list); if (unlikely(!__pyx_tuple__47)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__47);
+  __Pyx_GIVEREF(__pyx_tuple__47);
+  __pyx_codeobj__48 = (PyObject*)__Pyx_PyCode_New(6, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__47, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFilefloatFAAA, 329, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__48)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":174
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":338
  * 	return out
  * 
  * def readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_tuple__33 = PyTuple_Pack(9, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_count_A1, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list); if (unlikely(!__pyx_tuple__33)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__33);
-  __Pyx_GIVEREF(__pyx_tuple__33);
-  __pyx_codeobj__34 = (PyObject*)__Pyx_PyCode_New(6, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__33, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFilefloatCAAA, 174, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__34)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__49 = PyTuple_Pack(9, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_count_A1, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list); if (unlikely(!__pyx_tuple__49)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__49);
+  __Pyx_GIVEREF(__pyx_tuple__49);
+  __pyx_codeobj__50 = (PyObject*)__Pyx_PyCode_New(6, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__49, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFilefloatCAAA, 338, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__50)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":184
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":348
  * 
  * 
  * def readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_tuple__35 = PyTuple_Pack(9, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_count_A1, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list); if (unlikely(!__pyx_tuple__35)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__35);
-  __Pyx_GIVEREF(__pyx_tuple__35);
-  __pyx_codeobj__36 = (PyObject*)__Pyx_PyCode_New(6, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__35, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFiledoubleFAAA, 184, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__36)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__51 = PyTuple_Pack(9, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_count_A1, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list); if (unlikely(!__pyx_tuple__51)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__51);
+  __Pyx_GIVEREF(__pyx_tuple__51);
+  __pyx_codeobj__52 = (PyObject*)__Pyx_PyCode_New(6, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__51, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFiledoubleFAAA, 348, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__52)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":193
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":357
  * 	return out
  * 
  * def readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_tuple__37 = PyTuple_Pack(9, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_count_A1, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list); if (unlikely(!__pyx_tuple__37)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__37);
-  __Pyx_GIVEREF(__pyx_tuple__37);
-  __pyx_codeobj__38 = (PyObject*)__Pyx_PyCode_New(6, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__37, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFiledoubleCAAA, 193, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__38)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__53 = PyTuple_Pack(9, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_iidIdxList, __pyx_n_s_snpIdxList, __pyx_n_s_out, __pyx_n_s_count_A1, __pyx_n_s_iid_idx_list, __pyx_n_s_sid_idx_list); if (unlikely(!__pyx_tuple__53)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__53);
+  __Pyx_GIVEREF(__pyx_tuple__53);
+  __pyx_codeobj__54 = (PyObject*)__Pyx_PyCode_New(6, 0, 9, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__53, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_readPlinkBedFiledoubleCAAA, 357, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__54)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":203
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":367
  * 
  * 
  * def writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	_writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  */
-  __pyx_tuple__39 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_inx, __pyx_n_s_count_A1); if (unlikely(!__pyx_tuple__39)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__39);
-  __Pyx_GIVEREF(__pyx_tuple__39);
-  __pyx_codeobj__40 = (PyObject*)__Pyx_PyCode_New(4, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__39, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFilefloatFAAA, 203, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__40)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__55 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_inx, __pyx_n_s_count_A1); if (unlikely(!__pyx_tuple__55)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__55);
+  __Pyx_GIVEREF(__pyx_tuple__55);
+  __pyx_codeobj__56 = (PyObject*)__Pyx_PyCode_New(4, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__55, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFilefloatFAAA, 367, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__56)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":207
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":371
  * 	_writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	_writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  */
-  __pyx_tuple__41 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_inx, __pyx_n_s_count_A1); if (unlikely(!__pyx_tuple__41)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__41);
-  __Pyx_GIVEREF(__pyx_tuple__41);
-  __pyx_codeobj__42 = (PyObject*)__Pyx_PyCode_New(4, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__41, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFilefloatCAAA, 207, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__42)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__57 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_inx, __pyx_n_s_count_A1); if (unlikely(!__pyx_tuple__57)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__57);
+  __Pyx_GIVEREF(__pyx_tuple__57);
+  __pyx_codeobj__58 = (PyObject*)__Pyx_PyCode_New(4, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__57, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFilefloatCAAA, 371, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__58)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":211
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":375
  * 	_writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	_writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  */
-  __pyx_tuple__43 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_inx, __pyx_n_s_count_A1); if (unlikely(!__pyx_tuple__43)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__43);
-  __Pyx_GIVEREF(__pyx_tuple__43);
-  __pyx_codeobj__44 = (PyObject*)__Pyx_PyCode_New(4, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__43, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFiledoubleFAAA, 211, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__44)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__59 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_inx, __pyx_n_s_count_A1); if (unlikely(!__pyx_tuple__59)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__59);
+  __Pyx_GIVEREF(__pyx_tuple__59);
+  __pyx_codeobj__60 = (PyObject*)__Pyx_PyCode_New(4, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__59, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFiledoubleFAAA, 375, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__60)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":215
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":379
  * 	_writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  * 
  * def writePlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	_writePlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  */
-  __pyx_tuple__45 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_inx, __pyx_n_s_count_A1); if (unlikely(!__pyx_tuple__45)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __Pyx_GOTREF(__pyx_tuple__45);
-  __Pyx_GIVEREF(__pyx_tuple__45);
-  __pyx_codeobj__46 = (PyObject*)__Pyx_PyCode_New(4, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__45, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFiledoubleCAAA, 215, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__46)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_tuple__61 = PyTuple_Pack(5, __pyx_n_s_bed_fn, __pyx_n_s_input_num_ind, __pyx_n_s_input_num_snps, __pyx_n_s_inx, __pyx_n_s_count_A1); if (unlikely(!__pyx_tuple__61)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_tuple__61);
+  __Pyx_GIVEREF(__pyx_tuple__61);
+  __pyx_codeobj__62 = (PyObject*)__Pyx_PyCode_New(4, 0, 5, 0, 0, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__61, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_c_Source_carlk_pysnptools_pysnpt, __pyx_n_s_writePlinkBedFiledoubleCAAA, 379, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__62)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -8121,6 +11771,7 @@ static int __Pyx_InitCachedConstants(void) {
 
 static int __Pyx_InitGlobals(void) {
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
+  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -8242,244 +11893,340 @@ PyMODINIT_FUNC PyInit_wrap_plink_parser(void)
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_np, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":69
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":83
  * 
  * 
- * def standardizefloatFAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizefloatFAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_1standardizefloatFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_1standardizefloatFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_standardizefloatFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_standardizefloatFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 83; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":81
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":100
  * 
  * 
- * def standardizedoubleFAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizedoubleFAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_3standardizedoubleFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_3standardizedoubleFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_standardizedoubleFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_standardizedoubleFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 100; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":93
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":117
  * 
  * 
- * def standardizefloatCAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizefloatCAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_5standardizefloatCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_5standardizefloatCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_standardizefloatCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_standardizefloatCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 117; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":103
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":132
  * 	return out, stats
  * 
- * def standardizedoubleCAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB,  bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * def standardizedoubleCAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB,  bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	num_ind = out.shape[0]
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_7standardizedoubleCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_7standardizedoubleCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_standardizedoubleCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 103; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_standardizedoubleCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":114
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":148
  * 
  * #New
- * def readPlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_9readPlinkBedFile2floatFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_9readPlinkBedFile2floatFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFile2floatFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFile2floatFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 148; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":123
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":162
  * 	return out
  * 
- * def readPlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_11readPlinkBedFile2floatCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_11readPlinkBedFile2floatCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFile2floatCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 123; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFile2floatCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":133
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":177
  * 
  * 
- * def readPlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_13readPlinkBedFile2doubleFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_13readPlinkBedFile2doubleFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFile2doubleFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 133; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFile2doubleFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 177; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":142
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":191
  * 	return out
  * 
- * def readPlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
+ * def readPlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
  * 
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_15readPlinkBedFile2doubleCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_15readPlinkBedFile2doubleCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFile2doubleCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 142; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFile2doubleCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 191; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":152
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":206
+ * 
+ * #bed_bytes are the SNP records of a .bed file (everything after the 3-byte header), for example, from a np.memmap
+ * def readPlinkBedBytes2floatFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_17readPlinkBedBytes2floatFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedBytes2floatFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 206; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":219
+ * 	return out
+ * 
+ * def readPlinkBedBytes2floatCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_19readPlinkBedBytes2floatCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedBytes2floatCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 219; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":232
+ * 	return out
+ * 
+ * def readPlinkBedBytes2doubleFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_21readPlinkBedBytes2doubleFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedBytes2doubleFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":245
+ * 	return out
+ * 
+ * def readPlinkBedBytes2doubleCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_23readPlinkBedBytes2doubleCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedBytes2doubleCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 245; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":259
+ * 
+ * #Like readPlinkBedBytes2*, but also unit (or beta) standardizes each SNP as it is decoded. Fills in stats unless use_stats is True.
+ * def readPlinkBedBytesStandardize2floatFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads, bool betaNotUnitVariance, float betaA, float betaB, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_25readPlinkBedBytesStandardize2floatFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedBytesStandardize2flo, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 259; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":273
+ * 	return out, stats
+ * 
+ * def readPlinkBedBytesStandardize2floatCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads, bool betaNotUnitVariance, float betaA, float betaB, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_27readPlinkBedBytesStandardize2floatCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedBytesStandardize2flo_2, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 273; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":287
+ * 	return out, stats
+ * 
+ * def readPlinkBedBytesStandardize2doubleFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_29readPlinkBedBytesStandardize2doubleFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedBytesStandardize2dou, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 287; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":301
+ * 	return out, stats
+ * 
+ * def readPlinkBedBytesStandardize2doubleCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):             # <<<<<<<<<<<<<<
+ * 
+ * 	cdef vector[size_t] iid_idx_list = iidIdxList
+ */
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_31readPlinkBedBytesStandardize2doubleCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedBytesStandardize2dou_2, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 301; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":316
  * 
  * 
  * def writePlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	_writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_17writePlinkBedFile2floatFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_33writePlinkBedFile2floatFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFile2floatFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFile2floatFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 316; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":155
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":319
  * 	_writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	_writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_19writePlinkBedFile2floatCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_35writePlinkBedFile2floatCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFile2floatCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFile2floatCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 319; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":158
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":322
  * 	_writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	_writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_21writePlinkBedFile2doubleFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_37writePlinkBedFile2doubleFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFile2doubleFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFile2doubleFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 322; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":161
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":325
  * 	_writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  * 
  * def writePlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	_writePlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  * 
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_23writePlinkBedFile2doubleCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_39writePlinkBedFile2doubleCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFile2doubleCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFile2doubleCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 325; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":165
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":329
  * 
  * #Old
  * def readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_25readPlinkBedFilefloatFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_41readPlinkBedFilefloatFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFilefloatFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFilefloatFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 329; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":174
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":338
  * 	return out
  * 
  * def readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_27readPlinkBedFilefloatCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_43readPlinkBedFilefloatCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFilefloatCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFilefloatCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 338; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":184
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":348
  * 
  * 
  * def readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_29readPlinkBedFiledoubleFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_45readPlinkBedFiledoubleFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFiledoubleFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 184; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFiledoubleFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 348; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":193
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":357
  * 	return out
  * 
  * def readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	cdef vector[size_t] iid_idx_list = iidIdxList
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_31readPlinkBedFiledoubleCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_47readPlinkBedFiledoubleCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFiledoubleCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 193; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_readPlinkBedFiledoubleCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 357; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":203
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":367
  * 
  * 
  * def writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	_writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_33writePlinkBedFilefloatFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_49writePlinkBedFilefloatFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFilefloatFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 203; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFilefloatFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 367; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":207
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":371
  * 	_writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float32_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	_writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_35writePlinkBedFilefloatCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_51writePlinkBedFilefloatCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFilefloatCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 207; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFilefloatCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 371; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":211
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":375
  * 	_writePlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
  * 
  * def writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	_writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_37writePlinkBedFiledoubleFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_53writePlinkBedFiledoubleFAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFiledoubleFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 211; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFiledoubleFAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 375; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "pysnptools\snpreader\wrap_plink_parser.pyx":215
+  /* "pysnptools\snpreader\wrap_plink_parser.pyx":379
  * 	_writePlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  * 
  * def writePlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, np.ndarray[np.float64_t, ndim=2] inx):             # <<<<<<<<<<<<<<
  * 	count_A1 = False
  * 	_writePlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <double*> inx.data)
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_39writePlinkBedFiledoubleCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_10pysnptools_9snpreader_17wrap_plink_parser_55writePlinkBedFiledoubleCAAA, NULL, __pyx_n_s_pysnptools_snpreader_wrap_plink); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFiledoubleCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_writePlinkBedFiledoubleCAAA, __pyx_t_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 379; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
   /* "pysnptools\snpreader\wrap_plink_parser.pyx":1
@@ -9781,19 +13528,19 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
   #include "longintrepr.h"
 #endif
 
-static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
-    const size_t neg_one = (size_t) -1, const_zero = (size_t) 0;
+static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
+    const int neg_one = (int) -1, const_zero = (int) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        if (sizeof(size_t) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(size_t, long, PyInt_AS_LONG(x))
+        if (sizeof(int) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
         } else {
             long val = PyInt_AS_LONG(x);
             if (is_unsigned && unlikely(val < 0)) {
                 goto raise_neg_overflow;
             }
-            return (size_t) val;
+            return (int) val;
         }
     } else
 #endif
@@ -9802,32 +13549,32 @@ static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (size_t) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(size_t, digit, digits[0])
+                case  0: return (int) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
                 case 2:
-                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) >= 2 * PyLong_SHIFT) {
-                            return (size_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) >= 3 * PyLong_SHIFT) {
-                            return (size_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) >= 4 * PyLong_SHIFT) {
-                            return (size_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
                         }
                     }
                     break;
@@ -9841,83 +13588,83 @@ static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
             {
                 int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
                 if (unlikely(result < 0))
-                    return (size_t) -1;
+                    return (int) -1;
                 if (unlikely(result == 1))
                     goto raise_neg_overflow;
             }
 #endif
-            if (sizeof(size_t) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned long, PyLong_AsUnsignedLong(x))
-            } else if (sizeof(size_t) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+            if (sizeof(int) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
             }
         } else {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (size_t) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(size_t, sdigit, -(sdigit) digits[0])
-                case  1: __PYX_VERIFY_RETURN_INT(size_t,  digit, +digits[0])
+                case  0: return (int) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, -(sdigit) digits[0])
+                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
                 case -2:
-                    if (8 * sizeof(size_t) - 1 > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
-                            return (size_t) (((size_t)-1)*(((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
                         }
                     }
                     break;
                 case 2:
-                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
-                            return (size_t) ((((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
                         }
                     }
                     break;
                 case -3:
-                    if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
-                            return (size_t) (((size_t)-1)*(((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
-                            return (size_t) ((((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
                         }
                     }
                     break;
                 case -4:
-                    if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
-                            return (size_t) (((size_t)-1)*(((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
-                            return (size_t) ((((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
                         }
                     }
                     break;
             }
 #endif
-            if (sizeof(size_t) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(size_t, long, PyLong_AsLong(x))
-            } else if (sizeof(size_t) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(size_t, PY_LONG_LONG, PyLong_AsLongLong(x))
+            if (sizeof(int) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
             }
         }
         {
@@ -9925,7 +13672,7 @@ static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
             PyErr_SetString(PyExc_RuntimeError,
                             "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
 #else
-            size_t val;
+            int val;
             PyObject *v = __Pyx_PyNumber_Int(x);
  #if PY_MAJOR_VERSION < 3
             if (likely(v) && !PyLong_Check(v)) {
@@ -9945,39 +13692,39 @@ static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
                     return val;
             }
 #endif
-            return (size_t) -1;
+            return (int) -1;
         }
     } else {
-        size_t val;
+        int val;
         PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (size_t) -1;
-        val = __Pyx_PyInt_As_size_t(tmp);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyInt_As_int(tmp);
         Py_DECREF(tmp);
         return val;
     }
 raise_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to size_t");
-    return (size_t) -1;
+        "value too large to convert to int");
+    return (int) -1;
 raise_neg_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to size_t");
-    return (size_t) -1;
+        "can't convert negative value to int");
+    return (int) -1;
 }
 
-static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
-    const int neg_one = (int) -1, const_zero = (int) 0;
+static CYTHON_INLINE size_t __Pyx_PyInt_As_size_t(PyObject *x) {
+    const size_t neg_one = (size_t) -1, const_zero = (size_t) 0;
     const int is_unsigned = neg_one > const_zero;
 #if PY_MAJOR_VERSION < 3
     if (likely(PyInt_Check(x))) {
-        if (sizeof(int) < sizeof(long)) {
-            __PYX_VERIFY_RETURN_INT(int, long, PyInt_AS_LONG(x))
+        if (sizeof(size_t) < sizeof(long)) {
+            __PYX_VERIFY_RETURN_INT(size_t, long, PyInt_AS_LONG(x))
         } else {
             long val = PyInt_AS_LONG(x);
             if (is_unsigned && unlikely(val < 0)) {
                 goto raise_neg_overflow;
             }
-            return (int) val;
+            return (size_t) val;
         }
     } else
 #endif
@@ -9986,32 +13733,32 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case  1: __PYX_VERIFY_RETURN_INT(int, digit, digits[0])
+                case  0: return (size_t) 0;
+                case  1: __PYX_VERIFY_RETURN_INT(size_t, digit, digits[0])
                 case 2:
-                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 2 * PyLong_SHIFT) {
-                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 2 * PyLong_SHIFT) {
+                            return (size_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 3 * PyLong_SHIFT) {
-                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 3 * PyLong_SHIFT) {
+                            return (size_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) >= 4 * PyLong_SHIFT) {
-                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) >= 4 * PyLong_SHIFT) {
+                            return (size_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
                         }
                     }
                     break;
@@ -10025,83 +13772,83 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
             {
                 int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
                 if (unlikely(result < 0))
-                    return (int) -1;
+                    return (size_t) -1;
                 if (unlikely(result == 1))
                     goto raise_neg_overflow;
             }
 #endif
-            if (sizeof(int) <= sizeof(unsigned long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
-            } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+            if (sizeof(size_t) <= sizeof(unsigned long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned long, PyLong_AsUnsignedLong(x))
+            } else if (sizeof(size_t) <= sizeof(unsigned PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
             }
         } else {
 #if CYTHON_USE_PYLONG_INTERNALS
             const digit* digits = ((PyLongObject*)x)->ob_digit;
             switch (Py_SIZE(x)) {
-                case  0: return (int) 0;
-                case -1: __PYX_VERIFY_RETURN_INT(int, sdigit, -(sdigit) digits[0])
-                case  1: __PYX_VERIFY_RETURN_INT(int,  digit, +digits[0])
+                case  0: return (size_t) 0;
+                case -1: __PYX_VERIFY_RETURN_INT(size_t, sdigit, -(sdigit) digits[0])
+                case  1: __PYX_VERIFY_RETURN_INT(size_t,  digit, +digits[0])
                 case -2:
-                    if (8 * sizeof(int) - 1 > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) - 1 > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
                 case 2:
-                    if (8 * sizeof(int) > 1 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) > 1 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 2 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
-                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
+                            return (size_t) ((((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
                 case -3:
-                    if (8 * sizeof(int) - 1 > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) - 1 > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
                 case 3:
-                    if (8 * sizeof(int) > 2 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) > 2 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 3 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
-                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
+                            return (size_t) ((((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
                 case -4:
-                    if (8 * sizeof(int) - 1 > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) - 1 > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
-                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) (((size_t)-1)*(((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
                 case 4:
-                    if (8 * sizeof(int) > 3 * PyLong_SHIFT) {
+                    if (8 * sizeof(size_t) > 3 * PyLong_SHIFT) {
                         if (8 * sizeof(unsigned long) > 4 * PyLong_SHIFT) {
-                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
-                        } else if (8 * sizeof(int) - 1 > 4 * PyLong_SHIFT) {
-                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                            __PYX_VERIFY_RETURN_INT(size_t, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if (8 * sizeof(size_t) - 1 > 4 * PyLong_SHIFT) {
+                            return (size_t) ((((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0])));
                         }
                     }
                     break;
             }
 #endif
-            if (sizeof(int) <= sizeof(long)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
-            } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
-                __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+            if (sizeof(size_t) <= sizeof(long)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, long, PyLong_AsLong(x))
+            } else if (sizeof(size_t) <= sizeof(PY_LONG_LONG)) {
+                __PYX_VERIFY_RETURN_INT_EXC(size_t, PY_LONG_LONG, PyLong_AsLongLong(x))
             }
         }
         {
@@ -10109,7 +13856,7 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
             PyErr_SetString(PyExc_RuntimeError,
                             "_PyLong_AsByteArray() not available in PyPy, cannot convert large numbers");
 #else
-            int val;
+            size_t val;
             PyObject *v = __Pyx_PyNumber_Int(x);
  #if PY_MAJOR_VERSION < 3
             if (likely(v) && !PyLong_Check(v)) {
@@ -10129,24 +13876,24 @@ static CYTHON_INLINE int __Pyx_PyInt_As_int(PyObject *x) {
                     return val;
             }
 #endif
-            return (int) -1;
+            return (size_t) -1;
         }
     } else {
-        int val;
+        size_t val;
         PyObject *tmp = __Pyx_PyNumber_Int(x);
-        if (!tmp) return (int) -1;
-        val = __Pyx_PyInt_As_int(tmp);
+        if (!tmp) return (size_t) -1;
+        val = __Pyx_PyInt_As_size_t(tmp);
         Py_DECREF(tmp);
         return val;
     }
 raise_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "value too large to convert to int");
-    return (int) -1;
+        "value too large to convert to size_t");
+    return (size_t) -1;
 raise_neg_overflow:
     PyErr_SetString(PyExc_OverflowError,
-        "can't convert negative value to int");
-    return (int) -1;
+        "can't convert negative value to size_t");
+    return (size_t) -1;
 }
 
 #if CYTHON_CCOMPLEX
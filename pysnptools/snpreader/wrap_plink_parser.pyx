@@ -8,10 +8,20 @@ from libcpp cimport bool
 
 cdef extern from "./CPlinkBedFile.h":
 
-	void _readPlinkBedFilefloatFAAA "readPlinkBedFilefloatFAAA"(string bed_fn, int input_num_ind, int input_num_snps, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, float* out)
-	void _readPlinkBedFiledoubleFAAA "readPlinkBedFiledoubleFAAA"(string bed_fn, int input_num_ind, int input_num_snps, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, double* out)
-	void _readPlinkBedFilefloatCAAA "readPlinkBedFilefloatCAAA"(string bed_fn, int input_num_ind, int input_num_snps, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, float* out)
-	void _readPlinkBedFiledoubleCAAA "readPlinkBedFiledoubleCAAA"(string bed_fn, int input_num_ind, int input_num_snps, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, double* out)
+	void _readPlinkBedFilefloatFAAA "readPlinkBedFilefloatFAAA"(string bed_fn, int input_num_ind, int input_num_snps, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, float* out, int num_threads) nogil
+	void _readPlinkBedFiledoubleFAAA "readPlinkBedFiledoubleFAAA"(string bed_fn, int input_num_ind, int input_num_snps, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, double* out, int num_threads) nogil
+	void _readPlinkBedFilefloatCAAA "readPlinkBedFilefloatCAAA"(string bed_fn, int input_num_ind, int input_num_snps, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, float* out, int num_threads) nogil
+	void _readPlinkBedFiledoubleCAAA "readPlinkBedFiledoubleCAAA"(string bed_fn, int input_num_ind, int input_num_snps, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, double* out, int num_threads) nogil
+
+	void _readPlinkBedBytesfloatFAAA "readPlinkBedBytesfloatFAAA"(unsigned char* bed_bytes, int input_num_ind, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, float* out, int num_threads) nogil
+	void _readPlinkBedBytesdoubleFAAA "readPlinkBedBytesdoubleFAAA"(unsigned char* bed_bytes, int input_num_ind, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, double* out, int num_threads) nogil
+	void _readPlinkBedBytesfloatCAAA "readPlinkBedBytesfloatCAAA"(unsigned char* bed_bytes, int input_num_ind, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, float* out, int num_threads) nogil
+	void _readPlinkBedBytesdoubleCAAA "readPlinkBedBytesdoubleCAAA"(unsigned char* bed_bytes, int input_num_ind, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, double* out, int num_threads) nogil
+
+	void _readPlinkBedBytesStandardizefloatFAAA "readPlinkBedBytesStandardizefloatFAAA"(unsigned char* bed_bytes, int input_num_ind, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, float* out, int num_threads, bool betaNotUnitVariance, float betaA, float betaB, bool use_stats, float* stats) nogil
+	void _readPlinkBedBytesStandardizefloatCAAA "readPlinkBedBytesStandardizefloatCAAA"(unsigned char* bed_bytes, int input_num_ind, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, float* out, int num_threads, bool betaNotUnitVariance, float betaA, float betaB, bool use_stats, float* stats) nogil
+	void _readPlinkBedBytesStandardizedoubleFAAA "readPlinkBedBytesStandardizedoubleFAAA"(unsigned char* bed_bytes, int input_num_ind, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, double* out, int num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, double* stats) nogil
+	void _readPlinkBedBytesStandardizedoubleCAAA "readPlinkBedBytesStandardizedoubleCAAA"(unsigned char* bed_bytes, int input_num_ind, bool count_A1, vector[size_t] iid_idx_list, vector[int] sid_idx_list, double* out, int num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, double* stats) nogil
 
 	void _writePlinkBedFilefloatFAAA "writePlinkBedFilefloatFAAA"(string bed_fn, int input_num_ind, int input_num_snps, bool count_A1, float* inx)
 	void _writePlinkBedFiledoubleFAAA "writePlinkBedFiledoubleFAAA"(string bed_fn, int input_num_ind, int input_num_snps, bool count_A1, double* inx)
@@ -28,8 +38,9 @@ cdef extern from "./CPlinkBedFile.h":
 		const float betaB,
 		const bool apply_in_place,
 		const bool use_stats,
-		float *stats
-		)
+		float *stats,
+		int num_threads
+		) nogil
 	void _ImputeAndZeroMeanSNPsdoubleFAAA "ImputeAndZeroMeanSNPsdoubleFAAA"( 
 		double *SNPs,
 		size_t nIndividuals,
@@ -39,8 +50,9 @@ cdef extern from "./CPlinkBedFile.h":
 		const double betaB,
 		const bool apply_in_place,
 		const bool use_stats,
-		double *stats
-		)
+		double *stats,
+		int num_threads
+		) nogil
 	void _ImputeAndZeroMeanSNPsfloatCAAA "ImputeAndZeroMeanSNPsfloatCAAA"( 
 		float *SNPs,
 		size_t nIndividuals,
@@ -50,8 +62,9 @@ cdef extern from "./CPlinkBedFile.h":
 		float betaB,
 		const bool apply_in_place,
 		const bool use_stats,
-		float *stats
-		)
+		float *stats,
+		int num_threads
+		) nogil
 
 	void _ImputeAndZeroMeanSNPsdoubleCAAA "ImputeAndZeroMeanSNPsdoubleCAAA"( 
 		double *SNPs,
@@ -62,92 +75,243 @@ cdef extern from "./CPlinkBedFile.h":
 		const double betaB,
 		const bool apply_in_place,
 		const bool use_stats,
-		double *stats
-		)
+		double *stats,
+		int num_threads
+		) nogil
 
 
-def standardizefloatFAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):
+def standardizefloatFAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats, num_threads=1):
 	
 	num_ind = out.shape[0]
 	num_snps = out.shape[1]
+	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+	cdef float* c_out = <float*> out.data
+	cdef float* c_stats = <float*> stats.data
+	cdef int c_num_threads = num_threads
 
 	#http://wiki.cython.org/tutorials/NumpyPointerToC
-	_ImputeAndZeroMeanSNPsfloatFAAA(<float*> out.data, num_ind, num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, <float *> stats.data)
+	with nogil:
+		_ImputeAndZeroMeanSNPsfloatFAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
 
 	return out, stats
 
 
 
-def standardizedoubleFAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):
+def standardizedoubleFAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats, num_threads=1):
 	
 	num_ind = out.shape[0]
 	num_snps = out.shape[1]
+	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+	cdef double* c_out = <double*> out.data
+	cdef double* c_stats = <double*> stats.data
+	cdef int c_num_threads = num_threads
 
 	#http://wiki.cython.org/tutorials/NumpyPointerToC
-	_ImputeAndZeroMeanSNPsdoubleFAAA(<double*> out.data, num_ind, num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, <double *> stats.data)
+	with nogil:
+		_ImputeAndZeroMeanSNPsdoubleFAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
 
 	return out, stats
 
 
 
-def standardizefloatCAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):
+def standardizefloatCAAA(np.ndarray[np.float32_t, ndim=2] out, bool betaNotUnitVariance, float betaA, float betaB, bool apply_in_place, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats, num_threads=1):
 	
 	num_ind = out.shape[0]
 	num_snps = out.shape[1]
+	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+	cdef float* c_out = <float*> out.data
+	cdef float* c_stats = <float*> stats.data
+	cdef int c_num_threads = num_threads
 
 	#http://wiki.cython.org/tutorials/NumpyPointerToC
-	_ImputeAndZeroMeanSNPsfloatCAAA(<float*> out.data, num_ind, num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, <float *> stats.data)
+	with nogil:
+		_ImputeAndZeroMeanSNPsfloatCAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
 
 	return out, stats
 
-def standardizedoubleCAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB,  bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):
+def standardizedoubleCAAA(np.ndarray[np.float64_t, ndim=2] out, bool betaNotUnitVariance, double betaA, double betaB,  bool apply_in_place, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats, num_threads=1):
 	
 	num_ind = out.shape[0]
 	num_snps = out.shape[1]
+	cdef size_t c_num_ind = num_ind, c_num_snps = num_snps
+	cdef double* c_out = <double*> out.data
+	cdef double* c_stats = <double*> stats.data
+	cdef int c_num_threads = num_threads
 
 	#http://wiki.cython.org/tutorials/NumpyPointerToC
-	_ImputeAndZeroMeanSNPsdoubleCAAA(<double*> out.data, num_ind, num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, <double *> stats.data)
+	with nogil:
+		_ImputeAndZeroMeanSNPsdoubleCAAA(c_out, c_num_ind, c_num_snps, betaNotUnitVariance, betaA, betaB, apply_in_place, use_stats, c_stats, c_num_threads)
 
 	return out, stats
 
 #New 
-def readPlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):
+def readPlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):
 	
 	cdef vector[size_t] iid_idx_list = iidIdxList
 	cdef vector[int] sid_idx_list = snpIdxList
+	cdef string c_bed_fn = bed_fn
+	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+	cdef bool c_count_A1 = count_A1
+	cdef float* c_out = <float*> out.data
 	#http://wiki.cython.org/tutorials/NumpyPointerToC
 
-	_readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data)
+	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read
+		_readPlinkBedFilefloatFAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
 	return out
 
-def readPlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):
+def readPlinkBedFile2floatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):
 	
 	cdef vector[size_t] iid_idx_list = iidIdxList
 	cdef vector[int] sid_idx_list = snpIdxList
+	cdef string c_bed_fn = bed_fn
+	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+	cdef bool c_count_A1 = count_A1
+	cdef float* c_out = <float*> out.data
 	#http://wiki.cython.org/tutorials/NumpyPointerToC
 
-	_readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data)
+	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read
+		_readPlinkBedFilefloatCAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
 	return out
 
 
-def readPlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):
+def readPlinkBedFile2doubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):
 	
 	cdef vector[size_t] iid_idx_list = iidIdxList
 	cdef vector[int] sid_idx_list = snpIdxList
+	cdef string c_bed_fn = bed_fn
+	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+	cdef bool c_count_A1 = count_A1
+	cdef double* c_out = <double*> out.data
 	#http://wiki.cython.org/tutorials/NumpyPointerToC
 
-	_readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data)
+	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read
+		_readPlinkBedFiledoubleFAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
 	return out
 
-def readPlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):
+def readPlinkBedFile2doubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):
 	
 	cdef vector[size_t] iid_idx_list = iidIdxList
 	cdef vector[int] sid_idx_list = snpIdxList
+	cdef string c_bed_fn = bed_fn
+	cdef int c_input_num_ind = input_num_ind, c_input_num_snps = input_num_snps, c_num_threads = num_threads
+	cdef bool c_count_A1 = count_A1
+	cdef double* c_out = <double*> out.data
 	#http://wiki.cython.org/tutorials/NumpyPointerToC
 
-	_readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data)
+	with nogil: # so that other Python threads (for example, one doing a matrix multiply) can run during the read
+		_readPlinkBedFiledoubleCAAA(c_bed_fn, c_input_num_ind, c_input_num_snps, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+	return out
+
+#bed_bytes are the SNP records of a .bed file (everything after the 3-byte header), for example, from a np.memmap
+def readPlinkBedBytes2floatFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):
+	
+	cdef vector[size_t] iid_idx_list = iidIdxList
+	cdef vector[int] sid_idx_list = snpIdxList
+	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+	cdef bool c_count_A1 = count_A1
+	cdef float* c_out = <float*> out.data
+
+	with nogil:
+		_readPlinkBedBytesfloatFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+	return out
+
+def readPlinkBedBytes2floatCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads=1):
+	
+	cdef vector[size_t] iid_idx_list = iidIdxList
+	cdef vector[int] sid_idx_list = snpIdxList
+	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+	cdef bool c_count_A1 = count_A1
+	cdef float* c_out = <float*> out.data
+
+	with nogil:
+		_readPlinkBedBytesfloatCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+	return out
+
+def readPlinkBedBytes2doubleFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):
+	
+	cdef vector[size_t] iid_idx_list = iidIdxList
+	cdef vector[int] sid_idx_list = snpIdxList
+	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+	cdef bool c_count_A1 = count_A1
+	cdef double* c_out = <double*> out.data
+
+	with nogil:
+		_readPlinkBedBytesdoubleFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
+	return out
+
+def readPlinkBedBytes2doubleCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads=1):
+	
+	cdef vector[size_t] iid_idx_list = iidIdxList
+	cdef vector[int] sid_idx_list = snpIdxList
+	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+	cdef bool c_count_A1 = count_A1
+	cdef double* c_out = <double*> out.data
+
+	with nogil:
+		_readPlinkBedBytesdoubleCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads)
 	return out
 
+#Like readPlinkBedBytes2*, but also unit (or beta) standardizes each SNP as it is decoded. Fills in stats unless use_stats is True.
+def readPlinkBedBytesStandardize2floatFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads, bool betaNotUnitVariance, float betaA, float betaB, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):
+	
+	cdef vector[size_t] iid_idx_list = iidIdxList
+	cdef vector[int] sid_idx_list = snpIdxList
+	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+	cdef bool c_count_A1 = count_A1
+	cdef float* c_out = <float*> out.data
+	cdef float* c_stats = <float*> stats.data
+
+	with nogil:
+		_readPlinkBedBytesStandardizefloatFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+	return out, stats
+
+def readPlinkBedBytesStandardize2floatCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out, num_threads, bool betaNotUnitVariance, float betaA, float betaB, bool use_stats, np.ndarray[np.float32_t, ndim=2] stats):
+	
+	cdef vector[size_t] iid_idx_list = iidIdxList
+	cdef vector[int] sid_idx_list = snpIdxList
+	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+	cdef bool c_count_A1 = count_A1
+	cdef float* c_out = <float*> out.data
+	cdef float* c_stats = <float*> stats.data
+
+	with nogil:
+		_readPlinkBedBytesStandardizefloatCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+	return out, stats
+
+def readPlinkBedBytesStandardize2doubleFAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):
+	
+	cdef vector[size_t] iid_idx_list = iidIdxList
+	cdef vector[int] sid_idx_list = snpIdxList
+	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+	cdef bool c_count_A1 = count_A1
+	cdef double* c_out = <double*> out.data
+	cdef double* c_stats = <double*> stats.data
+
+	with nogil:
+		_readPlinkBedBytesStandardizedoubleFAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+	return out, stats
+
+def readPlinkBedBytesStandardize2doubleCAAA(np.ndarray[np.uint8_t, ndim=1, mode="c"] bed_bytes, input_num_ind, count_A1, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out, num_threads, bool betaNotUnitVariance, double betaA, double betaB, bool use_stats, np.ndarray[np.float64_t, ndim=2] stats):
+	
+	cdef vector[size_t] iid_idx_list = iidIdxList
+	cdef vector[int] sid_idx_list = snpIdxList
+	cdef unsigned char* c_bed_bytes = <unsigned char*> bed_bytes.data
+	cdef int c_input_num_ind = input_num_ind, c_num_threads = num_threads
+	cdef bool c_count_A1 = count_A1
+	cdef double* c_out = <double*> out.data
+	cdef double* c_stats = <double*> stats.data
+
+	with nogil:
+		_readPlinkBedBytesStandardizedoubleCAAA(c_bed_bytes, c_input_num_ind, c_count_A1, iid_idx_list, sid_idx_list, c_out, c_num_threads, betaNotUnitVariance, betaA, betaB, use_stats, c_stats)
+	return out, stats
+
 
 def writePlinkBedFile2floatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, np.ndarray[np.float32_t, ndim=2] inx):
 	_writePlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, <float*> inx.data)
@@ -168,7 +332,7 @@ def readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList,
 	cdef vector[int] sid_idx_list = snpIdxList
 	#http://wiki.cython.org/tutorials/NumpyPointerToC
 
-	_readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data)
+	_readPlinkBedFilefloatFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data, 1)
 	return out
 
 def readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float32_t, ndim=2] out):
@@ -177,7 +341,7 @@ def readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList,
 	cdef vector[int] sid_idx_list = snpIdxList
 	#http://wiki.cython.org/tutorials/NumpyPointerToC
 
-	_readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data)
+	_readPlinkBedFilefloatCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <float*> out.data, 1)
 	return out
 
 
@@ -187,7 +351,7 @@ def readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList
 	cdef vector[int] sid_idx_list = snpIdxList
 	#http://wiki.cython.org/tutorials/NumpyPointerToC
 
-	_readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data)
+	_readPlinkBedFiledoubleFAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data, 1)
 	return out
 
 def readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList, snpIdxList, np.ndarray[np.float64_t, ndim=2] out):
@@ -196,7 +360,7 @@ def readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, iidIdxList
 	cdef vector[int] sid_idx_list = snpIdxList
 	#http://wiki.cython.org/tutorials/NumpyPointerToC
 
-	_readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data)
+	_readPlinkBedFiledoubleCAAA(bed_fn, input_num_ind, input_num_snps, count_A1, iid_idx_list, sid_idx_list, <double*> out.data, 1)
 	return out
 
 
@@ -9,6 +9,7 @@ from pysnptools.standardizer.diag_K_to_N import DiagKtoN
 from pysnptools.standardizer.betatrained import BetaTrained
 from pysnptools.standardizer.unittrained import UnitTrained
 from pysnptools.standardizer.diag_K_to_N import DiagKtoNTrained
+from pysnptools.standardizer.statsaccumulator import StatsAccumulator
 
 #Deprecated
 from pysnptools.standardizer.bysqrtsidcount import BySqrtSidCount
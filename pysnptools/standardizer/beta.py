@@ -14,6 +14,8 @@ class Beta(Standardizer):
     **Constructor:**
         :Parameters: * **a** (*float*) -- The *a* parameter of the beta distribution
                      * **b** (*float*) -- The *b* parameter of the beta distribution
+                     * **num_threads** (optional, *int*) -- The number of threads the C++ standardizer uses. Each SNP is standardized independently,
+                       so the results do not depend on this setting. If not given, uses OpenMP's default (usually, the number of processors).
 
     >>> from pysnptools.standardizer import Beta
     >>> from pysnptools.snpreader import Bed
@@ -21,9 +23,12 @@ class Beta(Standardizer):
     >>> print snpdata1.val[0,0]
     0.68080194805
     '''
-    def __init__(self,a,b):
+    num_threads = None # the default for standardizers pickled before num_threads existed
+
+    def __init__(self,a,b,num_threads=None):
         self.a = a
         self.b = b
+        self.num_threads = num_threads
 
     def __repr__(self): 
         return "{0}(a={1},b={2})".format(self.__class__.__name__,self.a,self.b)
@@ -33,19 +38,39 @@ class Beta(Standardizer):
             warnings.warn("block_size is deprecated (and not needed, since standardization is in-place", DeprecationWarning)
 
         if hasattr(snpdata,"val"):
-            val = snpdata.val
+            val = self._float_val(snpdata)
         else:
             warnings.warn("standardizing an nparray instead of a SnpData is deprecated", DeprecationWarning)
             val = snpdata
 
-        stats = self._standardize_unit_and_beta(val, is_beta=True, a=self.a, b=self.b, apply_in_place=True, use_stats=False,stats=None,force_python_only=force_python_only)
+        stats = self._standardize_unit_and_beta(val, is_beta=True, a=self.a, b=self.b, apply_in_place=True, use_stats=False,stats=None,force_python_only=force_python_only,num_threads=self.num_threads)
         if return_trained:
             from pysnptools.standardizer import BetaTrained
             assert hasattr(snpdata,"val"), "return_trained=True must be used with SnpData"
-            return snpdata, BetaTrained(self.a,self.b,snpdata.sid,stats)
+            return snpdata, BetaTrained(self.a,self.b,snpdata.sid,stats,num_threads=self.num_threads)
         else:
             return snpdata
 
+    def train(self, snpreader):
+        """Returns a :class:`.BetaTrained` with the mean and stddev of each sid in the SNP data, without standardizing (or reading into memory) the data.
+
+        :param snpreader: The SNP data to train on. Its values must be 0, 1, 2, or missing.
+        :type snpreader: :class:`.SnpReader`
+
+        :rtype: :class:`.BetaTrained`
+
+        The statistics come from :meth:`.SnpReader.genotype_counts`, so for :class:`.Bed` and :class:`.PackedSnpData`, they are counted
+        directly from the packed bytes and no float values are created.
+
+        >>> from pysnptools.standardizer import Beta
+        >>> from pysnptools.snpreader import Bed
+        >>> betatrained = Beta(1,25).train(Bed('../examples/toydata',count_A1=False)[1:,:3]) # train on all but the first iid
+        >>> print betatrained.stats[:,0] # the mean of each sid
+        [ 1.21242485  1.64729459  1.59318637]
+        """
+        from pysnptools.standardizer import BetaTrained
+        return BetaTrained(self.a, self.b, snpreader.sid, self._stats_from_genotype_counts(snpreader.genotype_counts()), num_threads=self.num_threads)
+
     def _merge_trained(self, trained_list):
         from pysnptools.standardizer import BetaTrained
 
@@ -57,7 +82,14 @@ class Beta(Standardizer):
         assert len(b_set) <= 1,"Expect all BetaTrained's to have the same 'b'"
         a = list(a_set)[0] if a_set else None
         b = list(b_set)[0] if b_set else None
-        return BetaTrained(a, b, sid, stats)
+        return BetaTrained(a, b, sid, stats, num_threads=self.num_threads)
+
+    def _unit_and_beta_args(self, sid):
+        return True, self.a, self.b, False, None
+
+    def _trained_from_stats(self, sid, stats):
+        from pysnptools.standardizer import BetaTrained
+        return BetaTrained(self.a, self.b, sid, stats, num_threads=self.num_threads)
 
 
 if __name__ == "__main__":
@@ -13,6 +13,8 @@ class BetaTrained(Standardizer):
         :Parameters: * **a** (*float*) -- The *a* parameter of the beta distribution
                      * **b** (*float*) -- The *b* parameter of the beta distribution
                      * **stats** (*ndarray of float*) -- The mean and stddev of each sid
+                     * **num_threads** (optional, *int*) -- The number of threads the C++ standardizer uses. Each SNP is standardized independently,
+                       so the results do not depend on this setting. If not given, uses OpenMP's default (usually, the number of processors).
 
     >>> from pysnptools.standardizer import Beta
     >>> from pysnptools.snpreader import Bed
@@ -30,11 +32,15 @@ class BetaTrained(Standardizer):
     0.681674389547
     """
 
-    def __init__(self, a,b,sid,stats):
+    num_threads = None # the default for standardizers pickled before num_threads existed
+
+    def __init__(self, a,b,sid,stats,num_threads=None):
         self.a=a
         self.b=b
         self.sid=sid
         self.stats=stats
+        self.num_threads=num_threads
+        self.sid_to_index = None
 
     def __repr__(self): 
         return "{0}(a={1},b={2},stats={3},sid={4})".format(self.__class__.__name__,self.a,self.b,self.stats,self.sid)
@@ -43,18 +49,39 @@ class BetaTrained(Standardizer):
     def is_constant(self):
         return True        
 
+    def _stats_for_sid(self, sid):
+        '''
+        Returns the stats of these sids, which may be a subset (in any order) of the sids trained on.
+        '''
+        if len(self.sid) == len(sid) and np.array_equal(self.sid,sid):
+            return self.stats
+        if self.sid_to_index is None:
+            self.sid_to_index = {sid_i:index for index,sid_i in enumerate(self.sid)}
+        return self.stats[np.array([self.sid_to_index[sid_i] for sid_i in sid],dtype=np.intp)] #if stats is memory-mapped, reads just these rows
+
+    def _npz_fields(self):
+        return {'a': np.array(self.a), 'b': np.array(self.b), 'sid': np.array(self.sid,dtype='S'), 'stats': np.array(self.stats,dtype=np.float64,order='C')}
+
+    @classmethod
+    def _from_npz_fields(cls, fields):
+        return cls(float(fields['a']), float(fields['b']), fields['sid'], fields['stats'])
+
+    def _unit_and_beta_args(self, sid):
+        return True, self.a, self.b, True, self._stats_for_sid(sid)
+
     def standardize(self, snps, block_size=None, return_trained=False, force_python_only=False):
         if block_size is not None:
             warnings.warn("block_size is deprecated (and not needed, since standardization is in-place", DeprecationWarning)
 
         if hasattr(snps,"val"):
-            val = snps.val
-            assert np.array_equal(self.sid,snps.sid), "sid in training and use must be the same and in the same order"
+            val = self._float_val(snps)
+            stats = self._stats_for_sid(snps.sid)
         else:
             warnings.warn("standardizing an nparray instead of a SnpData is deprecated", DeprecationWarning)
             val = snps
+            stats = self.stats
 
-        self._standardize_unit_and_beta(val, is_beta=True, a=self.a, b=self.b, apply_in_place=True,use_stats=True,stats=self.stats,force_python_only=force_python_only)
+        self._standardize_unit_and_beta(val, is_beta=True, a=self.a, b=self.b, apply_in_place=True,use_stats=True,stats=stats,force_python_only=force_python_only,num_threads=self.num_threads)
         if return_trained:
             return snps, self
         else:
@@ -70,7 +70,7 @@ class DiagKtoN(Standardizer):
     def _standardize_snps(self, snps, return_trained=False, force_python_only=False):
 
         if hasattr(snps,"val"):
-            val = snps.val
+            val = self._float_val(snps)
         else:
             warnings.warn("standardizing an nparray instead of a SnpData is deprecated", DeprecationWarning)
             val = snps
@@ -89,6 +89,10 @@ class DiagKtoN(Standardizer):
         else:
             return snps
 
+    def _merge_trained(self, trained_list):
+        #Each factor is iid_count divided by a block's sum of squares, so the factor for all the blocks is one over the sum of the inverses.
+        return DiagKtoNTrained(1.0 / sum(1.0 / trained.factor for trained in trained_list))
+
     def __repr__(self): 
         return "{0}()".format(self.__class__.__name__)
 
@@ -126,7 +130,7 @@ class DiagKtoNTrained(Standardizer):
     def _standardize_snps(self, snps, return_trained=False, force_python_only=False):
     
         if hasattr(snps,"val"):
-            val = snps.val
+            val = self._float_val(snps)
         else:
             warnings.warn("standardizing an nparray instead of a SnpData is deprecated", DeprecationWarning)
             val = snps
@@ -152,6 +156,13 @@ class DiagKtoNTrained(Standardizer):
     def __repr__(self): 
         return "{0}({1})".format(self.__class__.__name__,self.factor)
 
+    def _npz_fields(self):
+        return {'factor': np.array(self.factor)}
+
+    @classmethod
+    def _from_npz_fields(cls, fields):
+        return cls(float(fields['factor']))
+
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
@@ -73,39 +73,78 @@ class Standardizer(object):
         raise NotImplementedError("subclass {0} needs to implement method '.standardize'".format(self.__class__.__name__))
 
     @staticmethod
-    #changes snps in place
-    def _standardize_unit_and_beta(snps, is_beta, a, b, apply_in_place, use_stats, stats, force_python_only=False):
-        from pysnptools.snpreader import wrap_plink_parser
+    def _float_val(snpdata):
+        '''
+        Returns snpdata.val, ready to be standardized in place. Standardized values aren't integers, so numpy.int8 values
+        are first replaced with float32 values (with NaN for :attr:`.SnpReader.int8_missing`).
+        '''
+        if snpdata.val.dtype == np.int8:
+            from pysnptools.snpreader import SnpReader
+            snpdata.val = SnpReader._astype(snpdata.val, 'A', np.float32, snpdata.int8_missing)
+        return snpdata.val
 
-        assert snps.flags["C_CONTIGUOUS"] or snps.flags["F_CONTIGUOUS"], "Expect snps to be order 'C' or order 'F'"
+    @staticmethod
+    def _stats_from_genotype_counts(counts):
+        '''
+        Given the number of 0's, 1's, 2's, and missing values of each SNP (see :meth:`.SnpReader.genotype_counts`), returns the mean and stddev
+        of each SNP, just as :meth:`_standardize_unit_python` would measure them from the values themselves.
+        '''
+        counts = np.asarray(counts,dtype=np.int64)
+        n_obs_sum = counts[:,0] + counts[:,1] + counts[:,2]
+        snp_sum = counts[:,1] + 2 * counts[:,2]
+        snp_sum_sq = counts[:,1] + 4 * counts[:,2]
+        stats = np.empty([len(counts),2],dtype=np.float64)
+        with np.errstate(invalid='ignore',divide='ignore'):
+            stats[:,0] = snp_sum * 1.0 / n_obs_sum
+            stats[:,1] = np.sqrt((n_obs_sum * snp_sum_sq - snp_sum * snp_sum) * 1.0) / n_obs_sum # the integer numerator is exact
+        if 0.0 in stats[:,1]:
+            logging.warn("A least one snps has only one value, that is, its standard deviation is zero")
+            stats[stats[:,1] == 0.0,1] = np.inf
+        return stats
 
-        #Make sure stats is the same type as snps. Because we might be creating a new array, we return it
+    @staticmethod
+    def _stats_like(snps, stats):
+        '''
+        Returns stats (or, if None, a new array for them) as a [sid_count,2] array with the dtype and order of snps, as the C++ standardizers expect.
+        '''
         if stats is None:
             stats = np.empty([snps.shape[1],2],dtype=snps.dtype,order="F" if snps.flags["F_CONTIGUOUS"] else "C")
         elif not (
              stats.dtype == snps.dtype   #stats must have the same dtype as snps
              and (stats.flags["OWNDATA"]) # stats must own its data
-             and (snps.flags["C_CONTIGUOUS"] and stats.flags["C_CONTIGUOUS"]) or (snps.flags["F_CONTIGUOUS"] and stats.flags["F_CONTIGUOUS"]) #stats must have the same order as snps
+             and ((snps.flags["C_CONTIGUOUS"] and stats.flags["C_CONTIGUOUS"]) or (snps.flags["F_CONTIGUOUS"] and stats.flags["F_CONTIGUOUS"])) #stats must have the same order as snps
              ):
             stats = np.array(stats,dtype=snps.dtype,order="F" if snps.flags["F_CONTIGUOUS"] else "C")
         assert stats.shape == (snps.shape[1],2), "stats must have size [sid_count,2]"
+        return stats
+
+    @staticmethod
+    #changes snps in place
+    def _standardize_unit_and_beta(snps, is_beta, a, b, apply_in_place, use_stats, stats, force_python_only=False, num_threads=None):
+        from pysnptools.snpreader import wrap_plink_parser
+
+        assert snps.flags["C_CONTIGUOUS"] or snps.flags["F_CONTIGUOUS"], "Expect snps to be order 'C' or order 'F'"
+
+        #Make sure stats is the same type as snps. Because we might be creating a new array, we return it
+        stats = Standardizer._stats_like(snps, stats)
 
         if not force_python_only:
+            num_threads = num_threads or 0 # 0 means use OpenMP's default
             if snps.dtype == np.float64:
                 if snps.flags['F_CONTIGUOUS'] and (snps.flags["OWNDATA"] or snps.base.nbytes == snps.nbytes): #!!create a method called is_single_segment
-                    wrap_plink_parser.standardizedoubleFAAA(snps,is_beta,a,b,apply_in_place,use_stats,stats)
+                    wrap_plink_parser.standardizedoubleFAAA(snps,is_beta,a,b,apply_in_place,use_stats,stats,num_threads)
                     return stats
                 elif snps.flags['C_CONTIGUOUS']  and (snps.flags["OWNDATA"] or snps.base.nbytes == snps.nbytes):
-                    wrap_plink_parser.standardizedoubleCAAA(snps,is_beta,a,b,apply_in_place,use_stats,stats)
+                    wrap_plink_parser.standardizedoubleCAAA(snps,is_beta,a,b,apply_in_place,use_stats,stats,num_threads)
                     return stats
                 else:
                     logging.info("Array is not contiguous, so will standardize with python only instead of C++")
             elif snps.dtype == np.float32:
                 if snps.flags['F_CONTIGUOUS'] and (snps.flags["OWNDATA"] or snps.base.nbytes == snps.nbytes):
-                    wrap_plink_parser.standardizefloatFAAA(snps,is_beta,a,b,apply_in_place,use_stats,stats)
+                    wrap_plink_parser.standardizefloatFAAA(snps,is_beta,a,b,apply_in_place,use_stats,stats,num_threads)
                     return stats
                 elif snps.flags['C_CONTIGUOUS'] and (snps.flags["OWNDATA"] or snps.base.nbytes == snps.nbytes):
-                    wrap_plink_parser.standardizefloatCAAA(snps,is_beta,a,b,apply_in_place,use_stats,stats)
+                    wrap_plink_parser.standardizefloatCAAA(snps,is_beta,a,b,apply_in_place,use_stats,stats,num_threads)
                     return stats
                 else:
                     logging.info("Array is not contiguous, so will standardize with python only instead of C++")
@@ -120,6 +159,61 @@ class Standardizer(object):
             Standardizer._standardize_unit_python(snps, apply_in_place, use_stats=use_stats, stats=stats)
             return stats
 
+    _python_chunk_size = 2**20 # The pure python standardizers work on at most this many values at a time, so their extra memory is bounded by it
+
+    @staticmethod
+    def _python_chunks(snps):
+        '''
+        Yields (row_start, row_stop, col_start, col_stop) for chunks of snps with at most Standardizer._python_chunk_size values, a block of columns
+        at a time, top to bottom. Chunks follow the memory order of snps, so 'F' arrays are cut into whole columns and 'C' arrays into whole rows, when practical.
+        '''
+        row_count, col_count = snps.shape
+        chunk_size = max(1,Standardizer._python_chunk_size)
+        if snps.flags['F_CONTIGUOUS']:
+            col_step = max(1,chunk_size // max(1,row_count))
+            row_step = max(1,chunk_size // col_step)
+        else:
+            row_step = max(1,chunk_size // max(1,col_count))
+            col_step = max(1,chunk_size // row_step)
+        for col_start in xrange(0,col_count,col_step):
+            col_stop = min(col_start+col_step,col_count)
+            for row_start in xrange(0,row_count,row_step):
+                yield row_start, min(row_start+row_step,row_count), col_start, col_stop
+
+    @staticmethod
+    def _mean_and_std_python(snps):
+        '''
+        Returns the mean and stddev of each column of snps, ignoring NaN's, in one pass. Each chunk's count, mean, and sum of squared deviations are
+        merged into the column totals with Chan et al.'s pairwise update (the batched form of Welford's method), so no temporary is larger than a chunk.
+        '''
+        col_count = snps.shape[1]
+        n_obs = np.zeros(col_count)
+        snp_mean = np.zeros(col_count)
+        snp_m2 = np.zeros(col_count)
+        with np.errstate(invalid='ignore',divide='ignore'):
+            for row_start, row_stop, col_start, col_stop in Standardizer._python_chunks(snps):
+                chunk = snps[row_start:row_stop,col_start:col_stop]
+                imiss = np.isnan(chunk)
+                chunk_n = (row_stop-row_start) - imiss.sum(0)
+                deviation = np.where(imiss,0.0,chunk)
+                chunk_mean = deviation.sum(0,dtype=np.float64) / chunk_n
+                deviation -= chunk_mean
+                deviation[imiss] = 0.0
+                chunk_m2 = np.einsum('ij,ij->j',deviation,deviation,dtype=np.float64)
+
+                n = n_obs[col_start:col_stop]
+                mean = snp_mean[col_start:col_stop]
+                total_n = n + chunk_n
+                has_obs = chunk_n > 0
+                delta = np.where(has_obs,chunk_mean - mean,0.0)
+                fraction = np.where(has_obs,chunk_n / total_n,0.0)
+                snp_m2[col_start:col_stop] += np.where(has_obs,chunk_m2,0.0) + delta * delta * n * fraction
+                mean += delta * fraction
+                n_obs[col_start:col_stop] = total_n
+            snp_mean[n_obs==0] = np.nan
+            snp_std = np.sqrt(snp_m2 / n_obs)
+        return snp_mean, snp_std
+
     @staticmethod
     def _standardize_unit_python(snps,apply_in_place,use_stats,stats):
         '''
@@ -127,16 +221,11 @@ class Standardizer(object):
         '''
         assert snps.dtype in [np.float64,np.float32], "snps must be a float in order to standardize in place."
 
-        imissX = np.isnan(snps)
-        snp_sum =  np.nansum(snps,axis=0)
-        n_obs_sum = (~imissX).sum(0)
-    
         if use_stats:
             snp_mean = stats[:,0]
             snp_std = stats[:,1]
         else:
-            snp_mean = (snp_sum*1.0)/n_obs_sum
-            snp_std = np.sqrt(np.nansum((snps-snp_mean)**2, axis=0)/n_obs_sum)
+            snp_mean, snp_std = Standardizer._mean_and_std_python(snps)
             # avoid div by 0 when standardizing
             if 0.0 in snp_std:
                 logging.warn("A least one snps has only one value, that is, its standard deviation is zero")
@@ -145,9 +234,12 @@ class Standardizer(object):
             stats[:,1] = snp_std
 
         if apply_in_place:
-            snps -= snp_mean
-            snps /= snp_std
-            snps[imissX] = 0
+            for row_start, row_stop, col_start, col_stop in Standardizer._python_chunks(snps):
+                chunk = snps[row_start:row_stop,col_start:col_stop]
+                imiss = np.isnan(chunk)
+                chunk -= snp_mean[col_start:col_stop]
+                chunk /= snp_std[col_start:col_stop]
+                chunk[imiss] = 0
     
 
     @property
@@ -167,16 +259,11 @@ class Standardizer(object):
         '''
         assert snps.dtype in [np.float64,np.float32], "snps must be a float in order to standardize in place."
 
-        imissX = np.isnan(snps)
-        snp_sum =  np.nansum(snps,axis=0)
-        n_obs_sum = (~imissX).sum(0)
-    
         if use_stats:
             snp_mean = stats[:,0]
             snp_std = stats[:,1]
         else:
-            snp_mean = (snp_sum*1.0)/n_obs_sum
-            snp_std = np.sqrt(np.nansum((snps-snp_mean)**2, axis=0)/n_obs_sum)
+            snp_mean, snp_std = Standardizer._mean_and_std_python(snps)
             if 0.0 in snp_std:
                 logging.warn("A least one snps has only one value, that is, its standard deviation is zero")
                 snp_std[snp_std==0] = np.inf
@@ -191,15 +278,125 @@ class Standardizer(object):
             import scipy.stats as st
             maf_beta = st.beta.pdf(maf, betaA, betaB)
             #print "BetaPdf[{0},{1},{2}]={3}".format(maf,betaA,betaB,maf_beta)
-            snps -= snp_mean
-            snps*=maf_beta
-            snps[imissX] = 0.0
-            if use_stats: #If we're applying to test data, set any variables with to 0 if they have no variation in the training data.
-                snps[:,snp_std==np.inf] = 0.0
+            maf_beta[snp_std==np.inf] = 0.0 #Set any variables with no variation (in the training data, if use_stats) to 0.
+            for row_start, row_stop, col_start, col_stop in Standardizer._python_chunks(snps):
+                chunk = snps[row_start:row_stop,col_start:col_stop]
+                imiss = np.isnan(chunk)
+                chunk -= snp_mean[col_start:col_stop]
+                chunk *= maf_beta[col_start:col_stop]
+                chunk[imiss] = 0.0
 
     def _merge_trained(self, trained_list):
         raise Exception("Not defined")
 
+    def _unit_and_beta_args(self, sid):
+        '''
+        If this standardizer is one that :meth:`_standardize_unit_and_beta` can apply, returns (is_beta, a, b, use_stats, stats) for SNP data with
+        these sids, so that a reader, such as :class:`.Bed`, can standardize values as it decodes them. Otherwise, returns None.
+        '''
+        return None
+
+    def _trained_from_stats(self, sid, stats):
+        '''
+        Returns the constant standardizer for SNP data with these sids that was standardized (via :meth:`_unit_and_beta_args`) with these stats.
+        '''
+        return self
+
+    def _npz_fields(self):
+        '''
+        If this standardizer can be written with :meth:`write`, returns a dictionary of the arrays that describe it. Otherwise, returns None.
+        '''
+        return None
+
+    @staticmethod
+    def write(filename, standardizer):
+        '''
+        Writes a trained standardizer, such as :class:`.UnitTrained`, :class:`.BetaTrained`, or :class:`.DiagKtoNTrained`, to a (uncompressed) \*.npz file,
+        so that it can later be read back with :meth:`load` instead of being retrained.
+
+        :param filename: the name of the file to create
+        :type filename: string
+        :param standardizer: The trained standardizer to write
+        :type standardizer: :class:`.Standardizer`
+
+        >>> from pysnptools.standardizer import Standardizer, Unit
+        >>> from pysnptools.snpreader import Bed
+        >>> import pysnptools.util as pstutil
+        >>> _, unittrained = Bed('../../tests/datasets/all_chr.maf0.001.N300',count_A1=False).read().standardize(Unit(),return_trained=True)
+        >>> pstutil.create_directory_if_necessary("tempdir/unittrained.npz")
+        >>> Standardizer.write("tempdir/unittrained.npz",unittrained)
+        '''
+        fields = standardizer._npz_fields()
+        if fields is None:
+            raise Exception("Standardizer '{0}' can't be written. Only trained standardizers, such as UnitTrained, BetaTrained, and DiagKtoNTrained, can be".format(standardizer))
+        #Use np.savez (not np.savez_compressed) so that load can memory-map the stats
+        np.savez(filename, kind=np.array(standardizer.__class__.__name__), **fields)
+        logging.debug("Done writing " + filename)
+
+    @staticmethod
+    def load(filename, mmap=True):
+        '''
+        Reads a trained standardizer written by :meth:`write`.
+
+        :param filename: the name of the file to read
+        :type filename: string
+        :param mmap: optional -- If True (default), the stats of a :class:`.UnitTrained` or :class:`.BetaTrained` are memory-mapped, rather than read,
+            so that only the stats of the sids actually standardized are ever read from disk.
+        :type mmap: bool
+
+        :rtype: :class:`.Standardizer`
+
+        The loaded standardizer can standardize SNP data with any subset of its sids, in any order. The sids are matched to the stats only when first needed.
+
+        >>> from pysnptools.standardizer import Standardizer, Unit
+        >>> from pysnptools.snpreader import Bed
+        >>> import pysnptools.util as pstutil
+        >>> snp_on_disk = Bed('../../tests/datasets/all_chr.maf0.001.N300',count_A1=False)
+        >>> _, unittrained = snp_on_disk.read().standardize(Unit(),return_trained=True)
+        >>> pstutil.create_directory_if_necessary("tempdir/unittrained.npz")
+        >>> Standardizer.write("tempdir/unittrained.npz",unittrained)
+        >>> unittrained = Standardizer.load("tempdir/unittrained.npz")
+        >>> print unittrained.stats[0,:] #The mean and stddev of the 1st SNP
+        [ 1.95        0.21794495]
+        >>> print "{0:.6f}".format(snp_on_disk[:,::-1].read(standardizer=unittrained).val[0,-1]) # sids in a different order
+        0.229416
+        '''
+        import pysnptools.standardizer as stdizer
+        with np.load(filename) as data:
+            stats = Standardizer._npz_memmap(filename, 'stats') if mmap and 'stats' in data.keys() else None
+            #np.load reads a member only when it is accessed, so if stats is memory-mapped, it is never read here
+            fields = {name:data[name] for name in data.keys() if stats is None or name != 'stats'}
+        if stats is not None:
+            fields['stats'] = stats
+        kind = str(fields.pop('kind'))
+        if kind not in ('UnitTrained','BetaTrained','DiagKtoNTrained'):
+            raise Exception("Don't know how to load a standardizer of kind '{0}' from '{1}'".format(kind,filename))
+        return getattr(stdizer,kind)._from_npz_fields(fields)
+
+    @staticmethod
+    def _npz_memmap(filename, name):
+        '''
+        Returns a read-only np.memmap of an array stored (uncompressed) in a \*.npz file, or None if the array is compressed.
+        '''
+        import zipfile
+        import struct
+        with zipfile.ZipFile(filename) as zf:
+            info = zf.getinfo(name + '.npy')
+        if info.compress_type != zipfile.ZIP_STORED:
+            return None
+        with open(filename,'rb') as fp:
+            #The array's .npy bytes follow the member's local zip header, whose size is 30 bytes plus its name and extra fields
+            fp.seek(info.header_offset)
+            name_length, extra_length = struct.unpack('<HH', fp.read(30)[26:30])
+            fp.seek(info.header_offset + 30 + name_length + extra_length)
+            version = np.lib.format.read_magic(fp)
+            if version == (1,0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fp)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fp)
+            offset = fp.tell()
+        return np.memmap(filename, dtype=dtype, mode='r', offset=offset, shape=shape, order='F' if fortran_order else 'C')
+
 class _CannotBeTrained(Standardizer):
 
     def __init__(self, name):
@@ -0,0 +1,132 @@
+import numpy as np
+import logging
+
+class StatsAccumulator(object):
+    '''
+    Accumulates, for each sid, the number, sum, and sum of squares of the non-missing SNP values, one block of iids at a time. When done, it gives
+    the trained version of a :class:`.Unit` or :class:`.Beta` standardizer. This lets a standardizer be trained on more iids than fit in memory.
+    Accumulators filled from different iids (for example, in different processes) can be merged.
+
+    **Constructor:**
+        :Parameters: * **sid** (an array of strings) -- The sids of the SNP data that will be added
+
+        :Example:
+
+        >>> from pysnptools.snpreader import Bed
+        >>> from pysnptools.standardizer import Unit, StatsAccumulator
+        >>> snp_on_disk = Bed('../examples/toydata',count_A1=False)
+        >>> accumulator = StatsAccumulator(snp_on_disk.sid).add_reader(snp_on_disk, block_size=100) # reads 100 iids at a time
+        >>> unittrained = accumulator.trained(Unit())
+        >>> print ["{0:.6f}".format(mean) for mean in unittrained.stats[:3,0]] # the mean of the first three sids
+        ['1.212000', '1.648000', '1.594000']
+        >>> first = StatsAccumulator(snp_on_disk.sid).add(snp_on_disk[:300,:].read()) # The first 300 iids
+        >>> second = StatsAccumulator(snp_on_disk.sid).add(snp_on_disk[300:,:].read()) # The rest
+        >>> print "{0:.6f}".format(first.merge(second).trained(Unit()).stats[0,1]) # the stddev of the first sid
+        0.695022
+    '''
+    def __init__(self, sid):
+        self.sid = sid
+        self.count = np.zeros(len(sid),dtype=np.int64)
+        self.sum = np.zeros(len(sid),dtype=np.float64)
+        self.sum_sq = np.zeros(len(sid),dtype=np.float64)
+
+    def __repr__(self):
+        return "{0}(sid_count={1})".format(self.__class__.__name__,len(self.sid))
+
+    def add(self, snpdata):
+        '''
+        Adds the values of some iids.
+
+        :param snpdata: SNP values for some iids and for all the accumulator's sids, in the same order
+        :type snpdata: :class:`.SnpData`
+
+        :rtype: this :class:`StatsAccumulator` (for convenience)
+        '''
+        if not np.array_equal(snpdata.sid, self.sid):
+            raise Exception("Expect the sids of the SNP data to be the sids of the accumulator")
+        val = snpdata.val
+        if val.dtype == np.int8:
+            from pysnptools.snpreader import SnpReader
+            val = SnpReader._astype(val, 'A', np.float32, snpdata.int8_missing)
+        imiss = np.isnan(val)
+        filled = np.where(imiss, 0.0, val)
+        self.count += val.shape[0] - imiss.sum(axis=0)
+        self.sum += filled.sum(axis=0,dtype=np.float64)
+        self.sum_sq += np.einsum('ij,ij->j',filled,filled,dtype=np.float64)
+        return self
+
+    def add_reader(self, snpreader, block_size=10000, dtype=np.float64, force_python_only=False):
+        '''
+        Adds the values of all the iids of a :class:`.SnpReader`, reading just **block_size** iids at a time.
+
+        :param snpreader: SNP data with the accumulator's sids, in the same order
+        :type snpreader: :class:`.SnpReader`
+
+        :param block_size: optional -- The number of iids to read at once. Defaults to 10000.
+        :type block_size: int
+
+        :param dtype: {scipy.float64 (default), scipy.float32}, optional -- The data-type in which to read values.
+        :type dtype: data-type
+
+        :param force_python_only: optional -- If False (default), may use outside library code. If True, requests that the read
+            be done without outside library code.
+        :type force_python_only: bool
+
+        :rtype: this :class:`StatsAccumulator` (for convenience)
+        '''
+        if block_size < 1:
+            raise Exception("block_size must be at least 1")
+        for start in xrange(0, snpreader.iid_count, block_size):
+            self.add(snpreader[start:start+block_size,:].read(dtype=dtype,force_python_only=force_python_only))
+        return self
+
+    def merge(self, other):
+        '''
+        Adds the values accumulated by another :class:`StatsAccumulator` (for different iids) with the same sids.
+
+        :param other: The accumulator to merge into this one
+        :type other: :class:`StatsAccumulator`
+
+        :rtype: this :class:`StatsAccumulator` (for convenience)
+        '''
+        if not np.array_equal(other.sid, self.sid):
+            raise Exception("Expect the accumulators to have the same sids")
+        self.count += other.count
+        self.sum += other.sum
+        self.sum_sq += other.sum_sq
+        return self
+
+    @property
+    def stats(self):
+        '''
+        The mean and stddev of each sid, as an ndarray of size :attr:`sid` count x 2. As with the other standardizers, a stddev of zero is
+        given as infinity, so that the sid's standardized values are zero.
+        '''
+        stats = np.empty([len(self.sid),2],dtype=np.float64)
+        with np.errstate(invalid='ignore',divide='ignore'):
+            stats[:,0] = self.sum / self.count
+            stats[:,1] = np.sqrt(np.maximum(self.count * self.sum_sq - self.sum * self.sum,0.0)) / self.count
+        if 0.0 in stats[:,1]:
+            logging.warn("A least one snps has only one value, that is, its standard deviation is zero")
+            stats[stats[:,1] == 0.0,1] = np.inf
+        return stats
+
+    def trained(self, standardizer):
+        '''
+        Returns the constant standardizer that results from training **standardizer** on all the values added.
+
+        :param standardizer: A :class:`.Unit` or :class:`.Beta` standardizer
+        :type standardizer: :class:`.Standardizer`
+
+        :rtype: :class:`.UnitTrained` or :class:`.BetaTrained`
+        '''
+        args = standardizer._unit_and_beta_args(self.sid)
+        if args is None or args[3]: #The standardizer must be one, such as Unit or Beta, that learns its stats
+            raise Exception("Can only train Unit and Beta standardizers, not '{0}'".format(standardizer))
+        return standardizer._trained_from_stats(self.sid, self.stats)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
+    import doctest
+    doctest.testmod()
@@ -11,14 +11,20 @@ class Unit(Standardizer):
 
     See :class:`.Standardizer` for more information about standardization.
 
+    **Constructor:**
+        :Parameters: * **num_threads** (optional, *int*) -- The number of threads the C++ standardizer uses. Each SNP is standardized independently,
+                       so the results do not depend on this setting. If not given, uses OpenMP's default (usually, the number of processors).
+
     >>> from pysnptools.standardizer import Unit
     >>> from pysnptools.snpreader import Bed
     >>> snpdata1 = Bed('../../tests/datasets/all_chr.maf0.001.N300',count_A1=False).read().standardize(Unit())
     >>> print snpdata1.val[0,0]
     0.229415733871
     """
-    def __init__(self):
-        pass
+    num_threads = None # the default for standardizers pickled before num_threads existed
+
+    def __init__(self, num_threads=None):
+        self.num_threads = num_threads
 
     def __repr__(self):
         return "{0}()".format(self.__class__.__name__)
@@ -28,23 +34,48 @@ class Unit(Standardizer):
             warnings.warn("block_size is deprecated (and not needed, since standardization is in-place", DeprecationWarning)
 
         if hasattr(snps,"val"):
-            val = snps.val
+            val = self._float_val(snps)
         else:
             warnings.warn("standardizing an nparray instead of a SnpData is deprecated", DeprecationWarning)
             val = snps
 
-        stats = self._standardize_unit_and_beta(val, is_beta=False, a=np.nan, b=np.nan, apply_in_place=True,use_stats=False,stats=None,force_python_only=force_python_only,)
+        stats = self._standardize_unit_and_beta(val, is_beta=False, a=np.nan, b=np.nan, apply_in_place=True,use_stats=False,stats=None,force_python_only=force_python_only,num_threads=self.num_threads)
 
         if return_trained:
             assert hasattr(snps,"val"), "return_trained=True requires that snps be a SnpData"
-            return snps, UnitTrained(snps.sid, stats)
+            return snps, UnitTrained(snps.sid, stats, num_threads=self.num_threads)
         else:
             return snps
 
+    def train(self, snpreader):
+        """Returns a :class:`.UnitTrained` with the mean and stddev of each sid in the SNP data, without standardizing (or reading into memory) the data.
+
+        :param snpreader: The SNP data to train on. Its values must be 0, 1, 2, or missing.
+        :type snpreader: :class:`.SnpReader`
+
+        :rtype: :class:`.UnitTrained`
+
+        The statistics come from :meth:`.SnpReader.genotype_counts`, so for :class:`.Bed` and :class:`.PackedSnpData`, they are counted
+        directly from the packed bytes and no float values are created.
+
+        >>> from pysnptools.standardizer import Unit
+        >>> from pysnptools.snpreader import Bed
+        >>> unittrained = Unit().train(Bed('../examples/toydata',count_A1=False)[1:,:3]) # train on all but the first iid
+        >>> print unittrained.stats[:,0] # the mean of each sid
+        [ 1.21242485  1.64729459  1.59318637]
+        """
+        return UnitTrained(snpreader.sid, self._stats_from_genotype_counts(snpreader.genotype_counts()), num_threads=self.num_threads)
+
     def _merge_trained(self, trained_list):
         sid = np.concatenate([trained.sid for trained in trained_list])
         stats = np.concatenate([trained.stats for trained in trained_list])
-        return UnitTrained(sid, stats)
+        return UnitTrained(sid, stats, num_threads=self.num_threads)
+
+    def _unit_and_beta_args(self, sid):
+        return False, np.nan, np.nan, False, None
+
+    def _trained_from_stats(self, sid, stats):
+        return UnitTrained(sid, stats, num_threads=self.num_threads)
 
         
 if __name__ == "__main__":
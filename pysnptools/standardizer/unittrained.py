@@ -12,6 +12,8 @@ class UnitTrained(Standardizer):
 
     **Constructor:**
         :Parameters: * **stats** (*ndarray of float*) -- The mean and stddev of each sid
+                     * **num_threads** (optional, *int*) -- The number of threads the C++ standardizer uses. Each SNP is standardized independently,
+                       so the results do not depend on this setting. If not given, uses OpenMP's default (usually, the number of processors).
 
     >>> from pysnptools.standardizer import Unit
     >>> from pysnptools.snpreader import Bed
@@ -29,10 +31,13 @@ class UnitTrained(Standardizer):
     0.229819279888
     """
 
+    num_threads = None # the default for standardizers pickled before num_threads existed
+
     #!!might want to add code so that can check that sids are in the same order for both test and train
-    def __init__(self, sid, stats):
+    def __init__(self, sid, stats, num_threads=None):
         self.sid = sid
         self.stats = stats
+        self.num_threads = num_threads
         self.sid_to_index = None
 
     def __repr__(self): 
@@ -42,24 +47,39 @@ class UnitTrained(Standardizer):
     def is_constant(self):
         return True        
 
+    def _stats_for_sid(self, sid):
+        '''
+        Returns the stats of these sids, which may be a subset (in any order) of the sids trained on.
+        '''
+        if len(self.sid) == len(sid) and np.array_equal(self.sid,sid):
+            return self.stats
+        if self.sid_to_index is None:
+            self.sid_to_index = {sid_i:index for index,sid_i in enumerate(self.sid)}
+        return self.stats[np.array([self.sid_to_index[sid_i] for sid_i in sid],dtype=np.intp)] #if stats is memory-mapped, reads just these rows
+
+    def _npz_fields(self):
+        return {'sid': np.array(self.sid,dtype='S'), 'stats': np.array(self.stats,dtype=np.float64,order='C')}
+
+    @classmethod
+    def _from_npz_fields(cls, fields):
+        return cls(fields['sid'], fields['stats'])
+
+    def _unit_and_beta_args(self, sid):
+        return False, np.nan, np.nan, True, self._stats_for_sid(sid)
+
     def standardize(self, snps, block_size=None, return_trained=False, force_python_only=False):
         if block_size is not None:
             warnings.warn("block_size is deprecated (and not needed, since standardization is in-place", DeprecationWarning)
 
         if hasattr(snps,"val"):
-            val = snps.val
-            if len(self.sid) == len(snps.sid) and np.array_equal(self.sid,snps.sid):
-                stats = self.stats
-            else:
-                if self.sid_to_index is None:
-                    self.sid_to_index = {sid:index for index,sid in enumerate(self.sid)}
-                stats = np.array([self.stats[self.sid_to_index[sid]] for sid in snps.sid])
+            val = self._float_val(snps)
+            stats = self._stats_for_sid(snps.sid)
         else:
             warnings.warn("standardizing an nparray instead of a SnpData is deprecated", DeprecationWarning)
             val = snps
             stats = self.stats
 
-        self._standardize_unit_and_beta(val, is_beta=False, a=np.nan, b=np.nan, apply_in_place=True,use_stats=True,stats=stats,force_python_only=force_python_only)
+        self._standardize_unit_and_beta(val, is_beta=False, a=np.nan, b=np.nan, apply_in_place=True,use_stats=True,stats=stats,force_python_only=force_python_only,num_threads=self.num_threads)
 
         if return_trained:
             return snps, self
@@ -105,6 +105,476 @@ class TestLoader(unittest.TestCase):
         snpdata.val = 2 - snpdata.val
         self.c_reader(snpdata)
 
+    def test_c_reader_bed_mmap(self):
+        import cPickle as pickle
+        snpreader = Bed(self.currentFolder + "/examples/toydata",count_A1=False)
+        iid_index = range(snpreader.iid_count-1,0,-3)
+        sid_index = range(0,snpreader.sid_count,7)
+        for order in ['F','C']:
+            for dtype in [np.float32,np.float64]:
+                snpdata = snpreader[iid_index,sid_index].read(order=order,dtype=dtype)
+                mmap = snpreader._mmap
+                assert mmap is not None
+                snpdata2 = snpreader[iid_index,sid_index].read(order=order,dtype=dtype)
+                assert snpreader._mmap is mmap #The mapping is reused across reads
+                np.testing.assert_array_equal(snpdata.val, snpdata2.val)
+                np.testing.assert_array_equal(snpdata.val, self.snps[iid_index,:][:,sid_index].astype(dtype))
+        snpreader2 = pickle.loads(pickle.dumps(snpreader))
+        np.testing.assert_array_equal(snpreader2.read().val, self.snps)
+
+    def test_c_reader_bed_num_threads(self):
+        from pysnptools.snpreader import wrap_plink_parser
+        bed_fn = self.currentFolder + "/examples/toydata.bed"
+        iid_index = range(0,self.snpdata.iid_count,2)
+        sid_index = range(self.snpdata.sid_count-1,0,-3)
+        for num_threads in [1,3,None]:
+            snpreader = Bed(self.currentFolder + "/examples/toydata",count_A1=False,num_threads=num_threads)
+            for order in ['F','C']:
+                snpdata = snpreader[iid_index,sid_index].read(order=order)
+                np.testing.assert_array_equal(snpdata.val, self.snps[iid_index,:][:,sid_index])
+                val = np.zeros((len(iid_index),len(sid_index)),order=order)
+                reader = wrap_plink_parser.readPlinkBedFile2doubleFAAA if order=='F' else wrap_plink_parser.readPlinkBedFile2doubleCAAA
+                reader(bed_fn, snpreader.iid_count, snpreader.sid_count, False, iid_index, sid_index, val, num_threads or 0)
+                np.testing.assert_array_equal(snpdata.val, val)
+
+    def test_bed_byte_lookup(self):
+        for count_A1 in [False,True]:
+            code_to_value = [2,np.nan,1,0] if count_A1 else [0,np.nan,1,2]
+            for dtype in [np.float32,np.float64]:
+                byte_lookup = Bed._byte_lookup(count_A1,dtype)
+                assert byte_lookup.shape == (256,4) and byte_lookup.dtype == dtype
+                for byte in xrange(256):
+                    expected = [code_to_value[(byte >> (2*j)) & 3] for j in xrange(4)]
+                    np.testing.assert_array_equal(byte_lookup[byte], expected)
+            snpreader = Bed(self.currentFolder + "/examples/toydata",count_A1=count_A1)
+            for order in ['F','C']:
+                for dtype in [np.float32,np.float64]:
+                    np.testing.assert_array_equal(snpreader.read(order=order,dtype=dtype,force_python_only=True).val,
+                                                  snpreader.read(order=order,dtype=dtype).val)
+
+    def test_p_reader_bed_runs(self):
+        snpreader = Bed(self.currentFolder + "/examples/toydata",count_A1=False)
+        snpreader._python_block_bytes = 100 # Force long runs of SNPs to be split
+        sid_index = range(5,40) + [2,3,1000] + range(snpreader.sid_count-1,snpreader.sid_count-30,-1) + range(100,400)
+        iid_index = range(snpreader.iid_count-1,0,-2)
+        for order in ['F','C']:
+            for dtype in [np.float32,np.float64]:
+                snpdata = snpreader[iid_index,sid_index].read(order=order,dtype=dtype,force_python_only=True)
+                assert snpdata.val.flags[order+"_CONTIGUOUS"]
+                np.testing.assert_array_equal(snpdata.val, self.snps[iid_index,:][:,sid_index].astype(dtype))
+        np.testing.assert_array_equal(snpreader[:,[]].read(force_python_only=True).val.shape, (snpreader.iid_count,0))
+
+    def test_bed_scattered_sids(self):
+        from pysnptools.snpreader import wrap_plink_parser
+        snpreader = Bed(self.currentFolder + "/examples/toydata",count_A1=False)
+        snpreader._python_block_bytes = 1000
+        np.random.seed(0)
+        sid_index = list(np.random.permutation(snpreader.sid_count)[:300]) + range(50,90) + [7,7,3,8,6] + range(200,100,-1)
+        iid_index = range(0,snpreader.iid_count,3)
+        expected = self.snps[iid_index,:][:,sid_index]
+        for order in ['F','C']:
+            np.testing.assert_array_equal(snpreader[iid_index,sid_index].read(order=order).val, expected)
+            np.testing.assert_array_equal(snpreader[iid_index,sid_index].read(order=order,force_python_only=True).val, expected)
+            val = np.zeros((len(iid_index),len(sid_index)),order=order)
+            reader = wrap_plink_parser.readPlinkBedFile2doubleFAAA if order=='F' else wrap_plink_parser.readPlinkBedFile2doubleCAAA
+            reader(self.currentFolder + "/examples/toydata.bed", snpreader.iid_count, snpreader.sid_count, False, iid_index, sid_index, val, 2)
+            np.testing.assert_array_equal(val, expected)
+
+    def test_bed_few_iids(self):
+        snpreader = Bed(self.currentFolder + "/examples/toydata",count_A1=True)
+        iid_index = [401,3,2,400,77,3]
+        sid_index = range(snpreader.sid_count-1,-1,-5)
+        expected = 2-self.snps[iid_index,:][:,sid_index]
+        for order in ['F','C']:
+            for dtype in [np.float32,np.float64]:
+                snpdata = snpreader[iid_index,sid_index].read(order=order,dtype=dtype,force_python_only=True)
+                assert snpreader._mmap is not None # only the needed bytes were fetched, via the memory map
+                np.testing.assert_array_equal(snpdata.val, expected.astype(dtype))
+                np.testing.assert_array_equal(snpreader[iid_index,sid_index].read(order=order,dtype=dtype).val, expected.astype(dtype))
+
+    def test_int8(self):
+        import pysnptools.util as pstutil
+        from pysnptools.snpreader import SnpData
+        snpreader = Bed(self.currentFolder + "/examples/toydata",count_A1=False)
+        expected = self.snps.copy()
+        expected[0,:5] = np.nan
+        snpdata_float = SnpData(iid=snpreader.iid,sid=snpreader.sid,val=expected)
+        expected_int8 = np.where(np.isnan(expected),-127,expected).astype(np.int8)
+
+        iid_index = range(snpreader.iid_count-1,-1,-2)
+        sid_index = range(0,snpreader.sid_count,3)
+        for force_python_only in [False,True]:
+            for order in ['F','C']:
+                snpdata = snpreader[iid_index,sid_index].read(order=order,dtype=np.int8,force_python_only=force_python_only)
+                assert snpdata.val.dtype == np.int8 and snpdata.val.flags[order+"_CONTIGUOUS"]
+                np.testing.assert_array_equal(snpdata.val, self.snps[iid_index,:][:,sid_index])
+
+                snpdata_int8 = snpdata_float[iid_index,sid_index].read(order=order,dtype=np.int8,force_python_only=force_python_only) #from float to int8
+                np.testing.assert_array_equal(snpdata_int8.val, expected_int8[iid_index,:][:,sid_index])
+                subset = snpdata_int8[::2,::2].read(order=order,dtype=np.int8,force_python_only=force_python_only) #int8 to int8
+                np.testing.assert_array_equal(subset.val, snpdata_int8.val[::2,::2])
+                snpdata_float2 = snpdata_int8.read(order=order,dtype=np.float32,force_python_only=force_python_only) #int8 to float
+                np.testing.assert_array_equal(snpdata_float2.val, expected[iid_index,:][:,sid_index].astype(np.float32))
+
+        sub_val = pstutil.sub_matrix(expected_int8,[3,0],[5,4,6],order='C',dtype=np.int8)
+        np.testing.assert_array_equal(sub_val, expected_int8[[3,0],:][:,[5,4,6]])
+
+        snpdata = snpdata_float.read(dtype=np.int8)
+        assert snpdata.val[0,0] == -127
+        snpdata.int8_missing = -1 # the missing value can be changed
+        snpdata.val[snpdata.val==-127] = -1
+        _, unittrained = Unit().standardize(snpdata,return_trained=True) #Standardizers consume int8 values by first converting to float32
+        assert snpdata.val.dtype == np.float32
+        _, unittrained2 = Unit().standardize(SnpData(iid=snpreader.iid,sid=snpreader.sid,val=expected.astype(np.float32)),return_trained=True)
+        np.testing.assert_array_almost_equal(unittrained.stats, unittrained2.stats)
+
+    def test_packed_snp_data(self):
+        from pysnptools.snpreader import PackedSnpData
+        snpreader = Bed(self.currentFolder + "/examples/toydata",count_A1=False)
+        packed = snpreader.read_packed()
+        assert isinstance(packed, PackedSnpData) and packed.packed.dtype == np.uint8
+        np.testing.assert_array_equal(packed.iid, snpreader.iid)
+        np.testing.assert_array_equal(packed.pos, snpreader.pos)
+
+        iid_index = range(packed.iid_count-1,-1,-3)
+        sid_index = [7,3,3,1000,2]
+        for force_python_only in [False,True]:
+            for order in ['F','C']:
+                for dtype in [np.float32,np.float64]:
+                    np.testing.assert_array_equal(packed.read(order=order,dtype=dtype,force_python_only=force_python_only).val, self.snps.astype(dtype))
+                    snpdata = packed[iid_index,sid_index][::2,1:].read(order=order,dtype=dtype,force_python_only=force_python_only)
+                    assert snpdata.val.flags[order+"_CONTIGUOUS"]
+                    np.testing.assert_array_equal(snpdata.val, self.snps[iid_index[::2],:][:,sid_index[1:]].astype(dtype))
+            np.testing.assert_array_equal(packed[:,sid_index].read(dtype=np.int8,force_python_only=force_python_only).val, self.snps[:,sid_index])
+
+        packed_count_A1 = Bed(self.currentFolder + "/examples/toydata",count_A1=True).read_packed()
+        np.testing.assert_array_equal(packed_count_A1[:,sid_index].read().val, 2-self.snps[:,sid_index])
+
+        kerneldata = packed.read_kernel(Unit(),block_size=1000)
+        np.testing.assert_array_almost_equal(kerneldata.val, snpreader.read_kernel(Unit()).val)
+
+        packed_threads = Bed(self.currentFolder + "/examples/toydata",count_A1=False,num_threads=2).read_packed()
+        assert packed_threads.num_threads == 2 and packed_threads._sids_reader(sid_index).num_threads == 2
+        for num_threads in [1,2,None]:
+            packed_threads.num_threads = num_threads
+            np.testing.assert_array_equal(packed_threads[iid_index,sid_index].read().val, self.snps[iid_index,:][:,sid_index])
+
+        with self.assertRaises(Exception):
+            PackedSnpData(iid=snpreader.iid, sid=snpreader.sid, packed=packed.packed[:,1:])
+
+    def test_genotype_counts(self):
+        from pysnptools.snpreader import SnpData
+        from pysnptools.standardizer import UnitTrained
+        val = self.snps[:,:200].copy()
+        val[[0,3,498],5] = np.nan
+        val[:,7] = 2 # no variation
+        snpdata = SnpData(iid=self.snpdata.iid,sid=self.snpdata.sid[:200],val=val)
+        output = "tempdir/toydata.counts"
+        create_directory_if_necessary(output)
+        Bed.write(output,snpdata,count_A1=False)
+
+        def expected_counts(val):
+            return np.column_stack([(val==0).sum(axis=0),(val==1).sum(axis=0),(val==2).sum(axis=0),np.isnan(val).sum(axis=0)])
+
+        iid_index = range(snpdata.iid_count-1,-1,-3)
+        sid_index = [7,5,5,199,0]
+        for count_A1 in [False,True]:
+            bed = Bed(output,count_A1=count_A1)
+            bed_val = val if not count_A1 else 2-val
+            for snpreader in [bed, bed.read_packed(), bed.read()]:
+                np.testing.assert_array_equal(snpreader.genotype_counts(), expected_counts(bed_val))
+                np.testing.assert_array_equal(snpreader[iid_index,sid_index].genotype_counts(), expected_counts(bed_val[iid_index,:][:,sid_index]))
+                np.testing.assert_array_equal(snpreader[[3,1,3],::-2][:,1:].genotype_counts(), expected_counts(bed_val[[3,1,3],:][:,::-2][:,1:])) #an iid counted twice
+
+        for standardizer in [Unit(),Beta(1,25)]:
+            trained = standardizer.train(Bed(output,count_A1=False)[iid_index,:])
+            _, trained2 = snpdata[iid_index,:].read().standardize(standardizer,return_trained=True,force_python_only=True)
+            assert type(trained) == type(trained2)
+            np.testing.assert_array_equal(trained.sid, trained2.sid)
+            np.testing.assert_array_almost_equal(trained.stats, trained2.stats)
+            assert trained.stats[7,1] == np.inf
+
+    def test_iter_blocks(self):
+        from pysnptools.snpreader import SnpData
+        bed = Bed(self.currentFolder + "/examples/toydata",count_A1=False)
+        iid_index = range(bed.iid_count-1,-1,-2)
+        for snpreader in [bed, bed[iid_index,::3], bed.read_packed()[iid_index,::3], self.snpdata[iid_index,::3]]:
+            for force_python_only in [False,True]:
+                for order, dtype in [('F',np.float64),('C',np.float32),('C',np.int8)]:
+                    expected = snpreader.read(order=order,dtype=dtype,force_python_only=force_python_only)
+                    val_list = []
+                    for snpdata in snpreader.iter_blocks(1500,order=order,dtype=dtype,force_python_only=force_python_only):
+                        assert snpdata.val.dtype == dtype and snpdata.val.flags[order+"_CONTIGUOUS"]
+                        if val_list:
+                            assert np.may_share_memory(snpdata.val, last_val) # every block reuses the same buffer
+                        last_val = snpdata.val
+                        np.testing.assert_array_equal(snpdata.sid, expected.sid[len(val_list)*1500:][:snpdata.sid_count])
+                        val_list.append(snpdata.val.copy())
+                    np.testing.assert_array_equal(np.hstack(val_list), expected.val)
+
+        val_list = [snpdata.val.copy() for snpdata in bed.iter_blocks(3000,standardizer=Unit())]
+        np.testing.assert_array_almost_equal(np.hstack(val_list)[:,:3000], bed[:,:3000].read().standardize(Unit()).val)
+
+    def test_read_standardizer(self):
+        bed = Bed(self.currentFolder + "/examples/toydata",count_A1=False)
+        _, unittrained = bed[::2,:].read().standardize(Unit(),return_trained=True)
+        _, betatrained = bed[::2,:].read().standardize(Beta(1,25),return_trained=True)
+        for snpreader in [bed, bed[::-3,[7,5,5,199,0]], Bed(self.currentFolder + "/examples/toydata",count_A1=True)[:,::7], self.snpdata[::-3,::7]]:
+            for standardizer in [Unit(),Beta(1,25),unittrained,betatrained]:
+                for order, dtype in [('F',np.float64),('C',np.float64),('F',np.float32),('C',np.float32)]:
+                    for force_python_only in [False,True]:
+                        snpdata, trained = snpreader._read_standardized(standardizer,order=order,dtype=dtype,force_python_only=force_python_only) #Bed decodes and standardizes in one pass
+                        expected, expected_trained = snpreader.read(order=order,dtype=dtype).standardize(standardizer,return_trained=True,force_python_only=True)
+                        assert snpdata.val.dtype == dtype and snpdata.val.flags[order+"_CONTIGUOUS"]
+                        assert str(snpdata) == str(expected)
+                        tolerance = 1e-4 if dtype==np.float32 else 1e-10
+                        np.testing.assert_allclose(snpdata.val, expected.val, rtol=tolerance, atol=tolerance)
+                        assert type(trained) == type(expected_trained)
+                        np.testing.assert_array_equal(trained.sid, expected_trained.sid)
+                        np.testing.assert_allclose(trained.stats, expected_trained.stats, rtol=tolerance, atol=tolerance)
+                np.testing.assert_array_equal(snpreader.read(standardizer=standardizer).val, snpreader._read_standardized(standardizer)[0].val)
+
+        #Decoding and standardizing in one pass reports SNPs with no observed values, as standardizing after a read does
+        from pysnptools.snpreader import SnpData
+        val = self.snps[:,:10].copy()
+        val[:,3] = np.nan
+        output = "tempdir/toydata.missing"
+        create_directory_if_necessary(output)
+        Bed.write(output,SnpData(iid=self.snpdata.iid,sid=self.snpdata.sid[:10],val=val),count_A1=False)
+        class _Recorder(logging.Handler):
+            def __init__(self):
+                logging.Handler.__init__(self,level=logging.WARN)
+                self.message_list = []
+            def emit(self, record):
+                self.message_list.append(record.getMessage())
+        recorder = _Recorder()
+        logging.getLogger().addHandler(recorder)
+        try:
+            for standardizer in [Unit(),Beta(1,25)]:
+                snpdata = Bed(output,count_A1=False).read(standardizer=standardizer)
+                assert np.all(snpdata.val[:,3] == 0)
+        finally:
+            logging.getLogger().removeHandler(recorder)
+        assert len([message for message in recorder.message_list if "No individual observed" in message and "SNPs[:][3]" in message]) == 2
+        assert len([message for message in recorder.message_list if "Illegal SNP mean: nan for SNPs[:][3]" in message]) == 2
+
+    def test_standardize_num_threads(self):
+        from pysnptools.snpreader import SnpData
+        snpdata = self.snpdata[:,::5].read()
+        snpdata.val[::7,::3] = np.nan
+        for order, dtype in [('F',np.float64),('C',np.float64),('F',np.float32),('C',np.float32)]:
+            for standardizer_maker in [lambda num_threads: Unit(num_threads=num_threads), lambda num_threads: Beta(1,25,num_threads=num_threads)]:
+                expected, expected_trained = snpdata.read(order=order,dtype=dtype).standardize(standardizer_maker(1),return_trained=True)
+                for num_threads in [2,5,None]:
+                    result, trained = snpdata.read(order=order,dtype=dtype).standardize(standardizer_maker(num_threads),return_trained=True)
+                    np.testing.assert_array_equal(result.val, expected.val) #each SNP is standardized independently, so the thread count can't change the values
+                    np.testing.assert_array_equal(trained.stats, expected_trained.stats)
+                    assert trained.num_threads == num_threads
+                    np.testing.assert_array_equal(snpdata.read(order=order,dtype=dtype).standardize(trained).val, expected.val)
+
+                #A trained standardizer pickled before num_threads existed has no such instance attribute
+                import cPickle as pickle
+                del expected_trained.__dict__['num_threads']
+                old_trained = pickle.loads(pickle.dumps(expected_trained,pickle.HIGHEST_PROTOCOL))
+                assert old_trained.num_threads is None
+                np.testing.assert_array_equal(snpdata.read(order=order,dtype=dtype).standardize(old_trained).val, expected.val)
+                np.testing.assert_array_equal(snpdata.read(order=order,dtype=dtype,standardizer=old_trained).val, expected.val)
+
+    def test_standardize_python_chunks(self):
+        from pysnptools.standardizer import Standardizer
+        snpdata = self.snpdata[:,::40].read()
+        snpdata.val[::7,::3] = np.nan
+        snpdata.val[:,5] = 1.0
+        chunk_size = Standardizer._python_chunk_size
+        try:
+            for Standardizer._python_chunk_size in [37,300,4000,chunk_size]: # Force the values to be split into many chunks, including ones smaller than a column or row
+                for order, dtype in [('F',np.float64),('C',np.float64),('F',np.float32),('C',np.float32)]:
+                    decimal = 4 if dtype==np.float32 else 10
+                    for standardizer in [Unit(),Beta(1,25)]:
+                        expected, expected_trained = snpdata.read(order=order,dtype=dtype).standardize(standardizer,return_trained=True)
+                        result, trained = snpdata.read(order=order,dtype=dtype).standardize(standardizer,return_trained=True,force_python_only=True)
+                        np.testing.assert_array_almost_equal(result.val, expected.val, decimal=decimal)
+                        np.testing.assert_array_almost_equal(trained.stats, expected_trained.stats, decimal=decimal)
+                        result = snpdata.read(order=order,dtype=dtype).standardize(expected_trained,force_python_only=True)
+                        np.testing.assert_array_almost_equal(result.val, expected.val, decimal=decimal)
+        finally:
+            Standardizer._python_chunk_size = chunk_size
+
+    def test_write_load_trained(self):
+        from pysnptools.standardizer import Standardizer, DiagKtoN, DiagKtoNTrained
+        snpdata = self.snpdata[:,::20].read()
+        output = "tempdir/standardizer/trained.npz"
+        create_directory_if_necessary(output)
+        sid_index = range(snpdata.sid_count-1,-1,-2) #a subset, in a different order
+        for standardizer in [Unit(),Beta(1,25),DiagKtoN()]:
+            _, trained = snpdata.read().standardize(standardizer,return_trained=True)
+            Standardizer.write(output,trained)
+            for mmap in [True,False]:
+                loaded = Standardizer.load(output,mmap=mmap)
+                assert type(loaded) == type(trained)
+                if isinstance(loaded, DiagKtoNTrained):
+                    assert loaded.factor == trained.factor
+                else:
+                    assert isinstance(loaded.stats,np.memmap) == mmap
+                    np.testing.assert_array_equal(loaded.sid, trained.sid)
+                    np.testing.assert_array_equal(loaded.stats, trained.stats)
+                    assert loaded.sid_to_index is None
+                for force_python_only in [False,True]:
+                    expected = snpdata[:,sid_index].read().standardize(trained,force_python_only=force_python_only)
+                    actual = snpdata[:,sid_index].read().standardize(loaded,force_python_only=force_python_only)
+                    np.testing.assert_array_almost_equal(actual.val, expected.val)
+                del loaded #release the memory-mapped file before it is overwritten
+        with self.assertRaises(Exception):
+            Standardizer.write(output,Unit()) #not trained
+
+        #When memory-mapped, the stats member is never read from the zip. If the file is compressed, the stats are read instead.
+        _, trained = snpdata.read().standardize(Unit(),return_trained=True)
+        Standardizer.write(output,trained)
+        member_list = []
+        getitem = np.lib.npyio.NpzFile.__getitem__
+        def logging_getitem(npzfile, key):
+            member_list.append(key)
+            return getitem(npzfile, key)
+        np.lib.npyio.NpzFile.__getitem__ = logging_getitem
+        try:
+            loaded = Standardizer.load(output)
+        finally:
+            np.lib.npyio.NpzFile.__getitem__ = getitem
+        assert isinstance(loaded.stats,np.memmap) and 'stats' not in member_list
+        np.testing.assert_array_equal(loaded.stats, trained.stats)
+        del loaded
+        compressed_output = "tempdir/standardizer/trained_compressed.npz"
+        np.savez_compressed(compressed_output, **dict(trained._npz_fields(),kind=np.array('UnitTrained')))
+        loaded = Standardizer.load(compressed_output)
+        assert not isinstance(loaded.stats,np.memmap)
+        np.testing.assert_array_equal(loaded.stats, trained.stats)
+
+    def test_stats_accumulator(self):
+        from pysnptools.standardizer import StatsAccumulator
+        snpdata = self.snpdata[:,::20].read()
+        snpdata.val[::7,::3] = np.nan
+        snpdata.val[:,5] = 1.0
+        for standardizer in [Unit(),Beta(1,25)]:
+            _, expected = snpdata.read().standardize(standardizer,return_trained=True,force_python_only=True)
+            accumulator_list = [StatsAccumulator(snpdata.sid).add_reader(snpdata[start:start+90,:],block_size=40) for start in xrange(0,snpdata.iid_count,90)]
+            accumulator = accumulator_list[0]
+            for other in accumulator_list[1:]:
+                accumulator.merge(other)
+            assert accumulator.count.sum() == (~np.isnan(snpdata.val)).sum()
+            trained = accumulator.trained(standardizer)
+            assert type(trained) == type(expected)
+            np.testing.assert_array_equal(trained.sid, expected.sid)
+            np.testing.assert_array_almost_equal(trained.stats, expected.stats)
+            assert trained.stats[5,1] == np.inf
+            np.testing.assert_array_almost_equal(snpdata.read().standardize(trained).val, snpdata.read().standardize(expected).val)
+
+        int8_accumulator = StatsAccumulator(snpdata.sid).add_reader(snpdata,block_size=100,dtype=np.int8)
+        np.testing.assert_array_almost_equal(int8_accumulator.stats, accumulator.stats)
+        with self.assertRaises(Exception):
+            accumulator.trained(expected) #already trained
+        with self.assertRaises(Exception):
+            accumulator.add(snpdata[:,::-1].read()) #sids in a different order
+
+    def test_read_kernel_prefetch(self):
+        import threading
+        snpreader = Bed(self.currentFolder + "/examples/toydata",count_A1=False)
+        thread_count = threading.active_count()
+        for dtype in [np.float64,np.float32]:
+            for standardizer in [Unit(),Beta(1,25)]:
+                kernel, trained = snpreader._read_kernel(standardizer,block_size=700,dtype=dtype,return_trained=True) #blocks are read in a background thread
+                expected = self.snpdata.read_kernel(standardizer).val
+                scale = np.abs(expected).max()
+                np.testing.assert_array_almost_equal(kernel/scale, expected/scale, decimal=5 if dtype==np.float32 else 10)
+                _, trained2 = self.snpdata.read().standardize(standardizer,return_trained=True)
+                np.testing.assert_array_almost_equal(trained.stats, trained2.stats, decimal=5)
+        assert threading.active_count() == thread_count
+
+        class _FailingBed(Bed): #fails while reading the third block
+            def _read_into(self, iid_index_or_none, sid_index_or_none, val, force_python_only):
+                if sid_index_or_none[0] >= 1400:
+                    raise Exception("can't read")
+                Bed._read_into(self, iid_index_or_none, sid_index_or_none, val, force_python_only)
+            def _read_standardized_into(self, iid_index_or_none, sid_index_or_none, val, standardizer, force_python_only):
+                if sid_index_or_none[0] >= 1400:
+                    raise Exception("can't read")
+                return Bed._read_standardized_into(self, iid_index_or_none, sid_index_or_none, val, standardizer, force_python_only)
+        with self.assertRaises(Exception):
+            _FailingBed(self.currentFolder + "/examples/toydata",count_A1=False).read_kernel(Unit(),block_size=700)
+        assert threading.active_count() == thread_count
+
+    def test_syrk_kernel(self):
+        from pysnptools.snpreader import SnpData
+        from pysnptools.standardizer import Identity
+        for val_order in ['F','C']:
+            for dtype in [np.float64,np.float32]:
+                val = np.array(self.snps[::3,:1000],dtype=dtype,order=val_order)
+                snpdata = SnpData(iid=self.snpdata.iid[::3],sid=self.snpdata.sid[:1000],val=val)
+                expected = val.astype(np.float64).dot(val.T.astype(np.float64))
+                for order in ['F','C','A']:
+                    K = snpdata.read_kernel(Identity(),order=order,dtype=dtype).val
+                    assert K.dtype == dtype and (order=='A' or K.flags[order+"_CONTIGUOUS"])
+                    np.testing.assert_array_equal(K, K.T) #exactly symmetric
+                    np.testing.assert_array_almost_equal(K/expected.max(), expected/expected.max(), decimal=5 if dtype==np.float32 else 10)
+
+        empty = SnpData(iid=np.empty([0,2],dtype=str),sid=self.snpdata.sid[:3],val=np.empty([0,3]))
+        assert empty.read_kernel(Identity()).val.shape == (0,0)
+
+    def test_blocked_kernel_in_place(self):
+        from pysnptools.snpreader import SnpReader
+        snpreader = Bed(self.currentFolder + "/examples/toydata",count_A1=False)
+        expected = self.snpdata.read_kernel(Unit()).val
+        for order in ['F','C','A']:
+            for dtype in [np.float64,np.float32]:
+                K = snpreader.read_kernel(Unit(),block_size=600,order=order,dtype=dtype).val
+                assert K.dtype == dtype and (order=='A' or K.flags[order+"_CONTIGUOUS"])
+                np.testing.assert_array_equal(K, K.T)
+                np.testing.assert_array_almost_equal(K/expected.max(), expected/expected.max(), decimal=5 if dtype==np.float32 else 10)
+
+        val = np.array(self.snps[:,:50],order='C')
+        K = np.ones((self.snps.shape[0],self.snps.shape[0]),order='F')
+        assert SnpReader._syrk(val, K) is K #accumulates in place
+        np.testing.assert_array_almost_equal(SnpReader._mirror_upper(K), 1+val.dot(val.T), decimal=10)
+
+    def test_read_kernel_processes(self):
+        snpreader = Bed(self.currentFolder + "/examples/toydata",count_A1=False)[:,:2000]
+        for standardizer in [Unit(),Beta(1,25)]:
+            expected, expected_trained = snpreader._read_kernel(standardizer,return_trained=True)
+            for block_size in [None,300]:
+                for order in ['F','C']:
+                    K, trained = snpreader._read_kernel(standardizer,block_size=block_size,order=order,return_trained=True,num_processes=3)
+                    assert K.flags[order+"_CONTIGUOUS"]
+                    np.testing.assert_array_almost_equal(K/expected.max(), expected/expected.max(), decimal=10)
+                    assert np.array_equal(trained.sid,snpreader.sid)
+                    np.testing.assert_array_almost_equal(trained.stats, expected_trained.stats, decimal=10)
+
+        kerneldata = snpreader.read_kernel(Unit(),block_size=500,num_processes=2,dtype=np.float32)
+        np.testing.assert_array_almost_equal(kerneldata.val/kerneldata.val.max(), snpreader.read_kernel(Unit()).val/kerneldata.val.max(), decimal=5)
+
+        #In-memory data, including subsets of it, sends each worker just its range of sids. DiagKtoN depends on all the sids.
+        import cPickle as pickle
+        from pysnptools.standardizer import DiagKtoN
+        snpdata = snpreader.read()
+        packed = Bed(self.currentFolder + "/examples/toydata",count_A1=False).read_packed()
+        for reader in [snpdata, packed[::-1,:2000], snpdata[:,::2][10:,:]]:
+            sids_reader = reader._sids_reader(slice(0,10))
+            np.testing.assert_array_equal(sids_reader.read().val, reader[:,:10].read().val)
+            assert len(pickle.dumps(sids_reader,pickle.HIGHEST_PROTOCOL)) < len(pickle.dumps(reader,pickle.HIGHEST_PROTOCOL)) / 10
+            for standardizer in [Unit(),DiagKtoN()]:
+                expected = reader.read_kernel(standardizer).val
+                K = reader.read_kernel(standardizer,block_size=300,num_processes=3).val
+                np.testing.assert_array_almost_equal(K/expected.max(), expected/expected.max(), decimal=10)
+
+        #Unit is trained by the workers, each on its own range, not first by this process
+        def fail(*args,**kwargs):
+            raise Exception("the standardizer should not be trained before the workers start")
+        snpdata._train_standardizer = fail
+        K, trained = snpdata._read_kernel(Unit(),block_size=300,return_trained=True,num_processes=3)
+        expected, expected_trained = snpreader._read_kernel(Unit(),return_trained=True)
+        np.testing.assert_array_almost_equal(K/expected.max(), expected/expected.max(), decimal=10)
+        np.testing.assert_array_almost_equal(trained.stats, expected_trained.stats, decimal=10)
+        K = snpdata[:3,:].read_kernel(Unit(),num_processes=2).val #fewer iids than stripes
+        np.testing.assert_array_almost_equal(K, snpdata[:3,:].read_kernel(Unit()).val, decimal=10)
+
     def test_p_reader_bed(self):
         snpreader = Bed(self.currentFolder + "/examples/toydata",count_A1=False).read(force_python_only=True)
         self.c_reader(snpreader)
@@ -634,6 +1104,14 @@ class TestDocStrings(unittest.TestCase):
         os.chdir(old_dir)
         assert result.failed == 0, "failed doc test: " + __file__
 
+    def test_packedsnpdata(self):
+        import pysnptools.snpreader.packedsnpdata
+        old_dir = os.getcwd()
+        os.chdir(os.path.dirname(os.path.realpath(__file__))+"/snpreader")
+        result = doctest.testmod(pysnptools.snpreader.packedsnpdata)
+        os.chdir(old_dir)
+        assert result.failed == 0, "failed doc test: " + __file__
+
     def test_snpdata(self):
         import pysnptools.snpreader.snpdata
         old_dir = os.getcwd()
@@ -718,6 +1196,7 @@ class TestDocStrings(unittest.TestCase):
                     pysnptools.standardizer.diag_K_to_N,
                     pysnptools.standardizer.identity,
                     pysnptools.standardizer.standardizer,
+                    pysnptools.standardizer.statsaccumulator,
                     pysnptools.standardizer.unit,
                     pysnptools.standardizer.unittrained]:
             result = doctest.testmod(mod)
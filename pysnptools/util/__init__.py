@@ -240,7 +240,7 @@ def sub_matrix(val, row_index_list, col_index_list, order='A', dtype=sp.float64)
         If order is 'F', then the array will be in F-contiguous order (second index varies the fastest).
         If order is 'A', then sub-matrix may be in any order F or C.
     :type order: string or None
-    :param dtype: {scipy.float64 (default), scipy.float32}, optional -- The data-type for sub-matrix created.
+    :param dtype: {scipy.float64 (default), scipy.float32}, optional -- The data-type for sub-matrix created. Other data-types, for example, numpy.int8, are handled with NumPy.
     :type dtype: data-type
 
     :rtype: ndarray
@@ -267,6 +267,11 @@ def sub_matrix(val, row_index_list, col_index_list, order='A', dtype=sp.float64)
     else:
         effective_order = order
 
+    if val.dtype not in (sp.float64, sp.float32) or np.dtype(dtype) not in (sp.float64, sp.float32): #The C++ helpers only know float64 and float32
+        row_index_list = np.asarray(row_index_list,dtype=np.intp)
+        col_index_list = np.asarray(col_index_list,dtype=np.intp)
+        return np.array(val[np.ix_(row_index_list,col_index_list)],dtype=dtype,order=effective_order)
+
     sub_val = sp.empty((len(row_index_list), len(col_index_list)),dtype=dtype,order=effective_order)
 
     logging.debug("About to call cython matrixSubset")
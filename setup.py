@@ -41,13 +41,19 @@ class CleanCommand(Clean):
                     print "removing", tmp_fn
                     os.unlink(tmp_fn)
 
-# set up macro
+# set up macro and OpenMP flags (Apple's default compiler doesn't support OpenMP, so the C++ code runs single-threaded there)
 if platform.system() == "Darwin":
     macros = [("__APPLE__", "1")]
+    openmp_compile_args = []
+    openmp_link_args = []
 elif "win" in platform.system().lower():
     macros = [("_WIN32", "1")]
+    openmp_compile_args = ["/openmp"]
+    openmp_link_args = []
 else:
     macros = [("_UNIX", "1")]
+    openmp_compile_args = ["-fopenmp"]
+    openmp_link_args = ["-fopenmp"]
 
 
 #see http://stackoverflow.com/questions/4505747/how-should-i-structure-a-python-package-that-contains-cython-code
@@ -56,7 +62,9 @@ if use_cython:
                              language="c++",
                              sources=["pysnptools/snpreader/wrap_plink_parser.pyx", "pysnptools/snpreader/CPlinkBedFile.cpp"],
                              include_dirs = [numpy.get_include()],
-                             define_macros=macros),
+                             define_macros=macros,
+                             extra_compile_args=openmp_compile_args,
+                             extra_link_args=openmp_link_args),
                    Extension(name="pysnptools.snpreader.wrap_matrix_subset",
                             language="c++",
                             sources=["pysnptools/snpreader/wrap_matrix_subset.pyx", "pysnptools/snpreader/MatrixSubset.cpp"],
@@ -68,7 +76,9 @@ else:
                              language="c++",
                              sources=["pysnptools/snpreader/wrap_plink_parser.cpp", "pysnptools/snpreader/CPlinkBedFile.cpp"],
                              include_dirs = [numpy.get_include()],
-                             define_macros=macros),
+                             define_macros=macros,
+                             extra_compile_args=openmp_compile_args,
+                             extra_link_args=openmp_link_args),
                    Extension(name="pysnptools.snpreader.wrap_matrix_subset",
                             language="c++",
                             sources=["pysnptools/snpreader/wrap_matrix_subset.cpp", "pysnptools/snpreader/MatrixSubset.cpp"],